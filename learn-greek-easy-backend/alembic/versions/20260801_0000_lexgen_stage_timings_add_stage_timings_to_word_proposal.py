@@ -0,0 +1,45 @@
+"""lexgen_stage_timings add stage_timings to word_proposal
+
+Add a nullable JSONB column ``stage_timings`` to ``public.word_proposal``.
+
+The pipeline (``LexgenPipelineService.run_for_lemma``) records the wall time
+of each stage it runs — assemble, generate, verify, reconcile, judge — as ``{"<stage>_ms": <int>}`` so slow
+proposals can be attributed to a stage. Purely diagnostic: nothing reads the
+column to make routing decisions, and it is never serialized by the inbox API.
+
+Revision ID: lexgen_stage_timings
+Revises: rls_lexgen13_review_tables
+Create Date: 2026-08-01 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "lexgen_stage_timings"
+down_revision: Union[str, Sequence[str], None] = "rls_lexgen13_review_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable JSONB column stage_timings to word_proposal."""
+    op.add_column(
+        "word_proposal",
+        sa.Column(
+            "stage_timings",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Per-stage pipeline wall time in ms, e.g. {'judge_ms': 2140}",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove stage_timings column from word_proposal."""
+    op.drop_column("word_proposal", "stage_timings")
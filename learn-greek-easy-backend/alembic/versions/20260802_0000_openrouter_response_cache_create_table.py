@@ -0,0 +1,73 @@
+"""openrouter_response_cache create table
+
+Persistent, opt-in response cache for OpenRouterService.complete (see
+``src/services/openrouter_cache.py``). Keyed by a sha256 of the canonical
+request (model, messages, temperature, max_tokens, response_format, reasoning);
+the value is the serialized ``OpenRouterResponse``.
+
+RLS is enabled with no policy (deny-all) at creation time, matching the other
+backend-only tables — the backend role bypasses RLS, PostgREST roles are denied.
+
+Revision ID: openrouter_response_cache
+Revises: lexgen_stage_timings
+Create Date: 2026-08-02 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "openrouter_response_cache"
+down_revision: Union[str, Sequence[str], None] = "lexgen_stage_timings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create public.openrouter_response_cache (RLS deny-all)."""
+    op.create_table(
+        "openrouter_response_cache",
+        sa.Column(
+            "cache_key",
+            sa.String(length=64),
+            nullable=False,
+            comment="sha256 hex digest of the canonical request",
+        ),
+        sa.Column(
+            "model",
+            sa.Text(),
+            nullable=False,
+            comment="Effective OpenRouter model slug (for inspection / purges)",
+        ),
+        sa.Column(
+            "response",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Serialized OpenRouterResponse",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Row creation timestamp",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Entry expiry; NULL = never expires",
+        ),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.execute("ALTER TABLE public.openrouter_response_cache ENABLE ROW LEVEL SECURITY;")
+
+
+def downgrade() -> None:
+    """Drop public.openrouter_response_cache."""
+    op.drop_table("openrouter_response_cache")
@@ -0,0 +1,62 @@
+"""reference_dataset_stamp create table
+
+Hand-written (NOT autogenerated): the ``reference`` schema is excluded from
+Alembic autogenerate in ``alembic/env.py``, same convention as frequency_rank /
+cefr_lemma / translations.
+
+Creates ``reference.dataset_stamp`` — one row per reference dataset, bumped by
+the ``load_*`` scripts in the same transaction as the rows they write. The
+process-wide reference snapshots (``src/services/reference_snapshot.py``)
+reload a dataset only when its ``version`` changes. Existing datasets start
+without a row; the snapshots treat a missing stamp as version 0.
+
+Revision ID: reference_dataset_stamp
+Revises: openrouter_response_cache
+Create Date: 2026-08-03 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "reference_dataset_stamp"
+down_revision: Union[str, Sequence[str], None] = "openrouter_response_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create reference.dataset_stamp."""
+    op.create_table(
+        "dataset_stamp",
+        sa.Column(
+            "dataset",
+            sa.Text(),
+            nullable=False,
+            comment="Reference table name, e.g. 'frequency_rank'",
+        ),
+        sa.Column(
+            "version",
+            sa.Integer(),
+            nullable=False,
+            comment="Monotonic load counter, incremented by every loader run",
+        ),
+        sa.Column(
+            "loaded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="Commit time of the most recent load",
+        ),
+        sa.PrimaryKeyConstraint("dataset"),
+        schema="reference",
+    )
+
+
+def downgrade() -> None:
+    """Drop reference.dataset_stamp."""
+    op.drop_table("dataset_stamp", schema="reference")
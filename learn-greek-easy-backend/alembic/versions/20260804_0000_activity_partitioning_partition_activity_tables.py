@@ -0,0 +1,194 @@
+"""activity_partitioning partition activity tables by month
+
+Hand-written (NOT autogenerated): Alembic cannot express declarative
+partitioning. Converts ``card_record_reviews``, ``exercise_reviews`` (on
+``reviewed_at``), ``culture_answer_history`` and ``notifications`` (on
+``created_at``) into ``PARTITION BY RANGE`` tables with one partition per month
+in the ``partitions`` schema, plus a default partition each. See
+``src/db/partitioning.py`` for the layout and the scheduled maintenance.
+
+Per table: the existing table is renamed aside, the partitioned parent is
+created ``LIKE`` it, partitions are created from the month of the oldest row
+through ``MONTHS_AHEAD`` months from now, rows are copied, the old table is
+dropped and its primary key (now ``(id, <timestamp>)``), indexes and foreign
+keys are recreated on the parent under their original names. Index and FK
+definitions are read from the catalog rather than restated here, so the
+result matches whatever the earlier migrations built.
+
+Also creates ``public.activity_month_rollups`` (per-user monthly aggregates
+written before a partition is dropped by retention). RLS is enabled with no
+policy (deny-all) on every new table, matching the other backend-only tables.
+
+The copy rewrites each table under an ACCESS EXCLUSIVE lock: run during a
+maintenance window on large databases.
+
+Revision ID: activity_partitioning
+Revises: reference_dataset_stamp
+Create Date: 2026-08-04 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from src.db.partitioning import (
+    PARTITION_SCHEMA,
+    PARTITIONED_TABLES,
+    ROLLUP_TABLE,
+    PartitionedTable,
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    month_start,
+)
+
+revision: str = "activity_partitioning"
+down_revision: Union[str, Sequence[str], None] = "reference_dataset_stamp"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _definitions(table: str) -> tuple[str, list[tuple[str, str]], list[str]]:
+    """Primary key name, (name, definition) of each FK, and index DDL for ``table``."""
+    bind = op.get_bind()
+    params = {"table": f"public.{table}"}
+    pk_name = bind.execute(
+        sa.text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:table) AND contype = 'p'"
+        ),
+        params,
+    ).scalar_one()
+    foreign_keys = bind.execute(
+        sa.text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:table) AND contype = 'f' ORDER BY conname"
+        ),
+        params,
+    ).fetchall()
+    indexes = (
+        bind.execute(
+            sa.text(
+                "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+                "WHERE indrelid = to_regclass(:table) AND NOT indisprimary"
+            ),
+            params,
+        )
+        .scalars()
+        .all()
+    )
+    # Partitioned parents report "ON ONLY"; plain CREATE INDEX is wanted either way.
+    return (
+        pk_name,
+        [(name, ddl) for name, ddl in foreign_keys],
+        [ddl.replace(" ON ONLY ", " ON ") for ddl in indexes],
+    )
+
+
+def _restore_definitions(
+    table: str,
+    pk_name: str,
+    pk_columns: str,
+    foreign_keys: list[tuple[str, str]],
+    indexes: list[str],
+) -> None:
+    op.execute(f"ALTER TABLE public.{table} ADD CONSTRAINT {pk_name} PRIMARY KEY ({pk_columns})")
+    for ddl in indexes:
+        op.execute(ddl)
+    for name, ddl in foreign_keys:
+        op.execute(f"ALTER TABLE public.{table} ADD CONSTRAINT {name} {ddl}")
+    op.execute(f"ALTER TABLE public.{table} ENABLE ROW LEVEL SECURITY")
+
+
+def _partition(table: PartitionedTable, current: datetime) -> None:
+    name, column = table.name, table.column
+    pk_name, foreign_keys, indexes = _definitions(name)
+
+    op.execute(f"ALTER TABLE public.{name} RENAME TO {name}_unpartitioned")
+    op.execute(
+        f"CREATE TABLE public.{name} (LIKE public.{name}_unpartitioned "
+        "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) "
+        f"PARTITION BY RANGE ({column})"
+    )
+    for statement in create_default_partition_sql(table):
+        op.execute(statement)
+
+    oldest = (
+        op.get_bind()
+        .execute(sa.text(f"SELECT min({column}) FROM public.{name}_unpartitioned"))
+        .scalar()
+    )
+    this_month = month_start(current.date())
+    month = month_start(oldest.astimezone(timezone.utc).date()) if oldest else this_month
+    while month <= add_months(this_month, MONTHS_AHEAD):
+        for statement in create_partition_sql(table, month):
+            op.execute(statement)
+        month = add_months(month, 1)
+
+    op.execute(f"INSERT INTO public.{name} SELECT * FROM public.{name}_unpartitioned")
+    op.execute(f"DROP TABLE public.{name}_unpartitioned")
+    _restore_definitions(name, pk_name, f"id, {column}", foreign_keys, indexes)
+
+
+def _unpartition(table: PartitionedTable) -> None:
+    name = table.name
+    pk_name, foreign_keys, indexes = _definitions(name)
+
+    op.execute(f"ALTER TABLE public.{name} RENAME TO {name}_partitioned")
+    op.execute(
+        f"CREATE TABLE public.{name} (LIKE public.{name}_partitioned "
+        "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS)"
+    )
+    op.execute(f"INSERT INTO public.{name} SELECT * FROM public.{name}_partitioned")
+    op.execute(f"DROP TABLE public.{name}_partitioned")
+    _restore_definitions(name, pk_name, "id", foreign_keys, indexes)
+
+
+def upgrade() -> None:
+    """Partition the activity tables by month and create activity_month_rollups."""
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {PARTITION_SCHEMA}")
+    now = datetime.now(timezone.utc)
+    for table in PARTITIONED_TABLES:
+        _partition(table, now)
+
+    op.create_table(
+        ROLLUP_TABLE,
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "source",
+            sa.String(length=50),
+            nullable=False,
+            comment="Partitioned table the rows came from",
+        ),
+        sa.Column(
+            "month",
+            sa.Date(),
+            nullable=False,
+            comment="First day of the rolled-up month (UTC)",
+        ),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "correct_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Reviews with quality >= 3, or correct culture answers",
+        ),
+        sa.Column("time_seconds", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "source", "month"),
+    )
+    op.execute(f"ALTER TABLE public.{ROLLUP_TABLE} ENABLE ROW LEVEL SECURITY;")
+
+
+def downgrade() -> None:
+    """Drop activity_month_rollups and convert the activity tables back to plain tables."""
+    op.drop_table(ROLLUP_TABLE)
+    for table in reversed(PARTITIONED_TABLES):
+        _unpartition(table)
+    op.execute(f"DROP SCHEMA IF EXISTS {PARTITION_SCHEMA}")
@@ -0,0 +1,54 @@
+"""unread_notification_count add users column
+
+Adds ``users.unread_notification_count``, the denormalized unread counter
+maintained by ``NotificationRepository`` on every notification write (and
+repaired daily by ``notification_counter_repair_task``), and backfills it from
+the existing notifications.
+
+Revision ID: unread_notification_count
+Revises: activity_partitioning
+Create Date: 2026-08-05 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "unread_notification_count"
+down_revision: Union[str, Sequence[str], None] = "activity_partitioning"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add and backfill users.unread_notification_count."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "unread_notification_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Unread notifications; kept by NotificationRepository, repaired daily",
+        ),
+    )
+    op.execute("""
+        UPDATE users
+        SET unread_notification_count = unread.n
+        FROM (
+            SELECT user_id, count(*) AS n
+            FROM notifications
+            WHERE read = false
+            GROUP BY user_id
+        ) AS unread
+        WHERE users.id = unread.user_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop users.unread_notification_count."""
+    op.drop_column("users", "unread_notification_count")
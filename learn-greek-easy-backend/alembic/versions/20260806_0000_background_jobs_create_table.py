@@ -0,0 +1,104 @@
+"""background_jobs create table
+
+Creates ``background_jobs``, the durable job queue consumed by the job worker
+(``python -m src.worker_main``). See ``src.tasks.queue``.
+
+Revision ID: background_jobs
+Revises: unread_notification_count
+Create Date: 2026-08-06 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "background_jobs"
+down_revision: Union[str, Sequence[str], None] = "unread_notification_count"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create background_jobs with its claim and coalescing indexes."""
+    op.create_table(
+        "background_jobs",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("uuid_generate_v4()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "task",
+            sa.String(length=100),
+            nullable=False,
+            comment="Registered task name (src.tasks.queue.JOB_TASKS)",
+        ),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Task keyword arguments (type-tagged JSON)",
+        ),
+        sa.Column(
+            "coalesce_key",
+            sa.String(length=255),
+            nullable=True,
+            comment="Jobs sharing a key collapse into one pending row",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            server_default=sa.text("'pending'"),
+            nullable=False,
+            comment="pending | running | dead",
+        ),
+        sa.Column("attempts", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Earliest time a worker may claim the job",
+        ),
+        sa.Column(
+            "locked_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When a worker claimed the job (status running)",
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_background_jobs_pending_coalesce_key",
+        "background_jobs",
+        ["coalesce_key"],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending' AND coalesce_key IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_background_jobs_status_run_after",
+        "background_jobs",
+        ["status", "run_after"],
+    )
+    op.execute("ALTER TABLE public.background_jobs ENABLE ROW LEVEL SECURITY;")
+
+
+def downgrade() -> None:
+    """Drop background_jobs."""
+    op.drop_index("ix_background_jobs_status_run_after", table_name="background_jobs")
+    op.drop_index("uq_background_jobs_pending_coalesce_key", table_name="background_jobs")
+    op.drop_table("background_jobs")
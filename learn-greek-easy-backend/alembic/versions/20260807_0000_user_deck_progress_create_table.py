@@ -0,0 +1,126 @@
+"""user_deck_progress create table
+
+Creates ``user_deck_progress``, the per-user, per-deck counters behind the
+deck progress endpoints (see ``src.repositories.user_deck_progress``), and
+backfills it from ``card_record_statistics`` and ``card_record_reviews``.
+``python -m src.scripts.rebuild_deck_progress`` runs the same recount later.
+
+Revision ID: user_deck_progress
+Revises: background_jobs
+Create Date: 2026-08-07 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "user_deck_progress"
+down_revision: Union[str, Sequence[str], None] = "background_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BACKFILL = """
+INSERT INTO user_deck_progress (
+    user_id, deck_id, cards_new, cards_learning, cards_review, cards_mastered,
+    easiness_factor_sum, total_reviews, quality_sum, total_study_time_seconds,
+    first_studied_at, last_studied_at
+)
+SELECT
+    COALESCE(s.user_id, r.user_id),
+    COALESCE(s.deck_id, r.deck_id),
+    COALESCE(s.cards_new, 0),
+    COALESCE(s.cards_learning, 0),
+    COALESCE(s.cards_review, 0),
+    COALESCE(s.cards_mastered, 0),
+    COALESCE(s.easiness_factor_sum, 0),
+    COALESCE(r.total_reviews, 0),
+    COALESCE(r.quality_sum, 0),
+    COALESCE(r.total_study_time_seconds, 0),
+    r.first_studied_at,
+    r.last_studied_at
+FROM (
+    SELECT
+        crs.user_id,
+        cr.deck_id,
+        count(*) FILTER (WHERE crs.status = 'NEW') AS cards_new,
+        count(*) FILTER (WHERE crs.status = 'LEARNING') AS cards_learning,
+        count(*) FILTER (WHERE crs.status = 'REVIEW') AS cards_review,
+        count(*) FILTER (WHERE crs.status = 'MASTERED') AS cards_mastered,
+        sum(crs.easiness_factor) AS easiness_factor_sum
+    FROM card_record_statistics crs
+    JOIN card_records cr ON cr.id = crs.card_record_id
+    WHERE cr.is_active
+    GROUP BY crs.user_id, cr.deck_id
+) s
+FULL OUTER JOIN (
+    SELECT
+        crr.user_id,
+        cr.deck_id,
+        count(*) AS total_reviews,
+        sum(crr.quality) AS quality_sum,
+        sum(crr.time_taken) AS total_study_time_seconds,
+        min(crr.reviewed_at) AS first_studied_at,
+        max(crr.reviewed_at) AS last_studied_at
+    FROM card_record_reviews crr
+    JOIN card_records cr ON cr.id = crr.card_record_id
+    GROUP BY crr.user_id, cr.deck_id
+) r ON r.user_id = s.user_id AND r.deck_id = s.deck_id
+"""
+
+
+def upgrade() -> None:
+    """Create user_deck_progress and backfill it."""
+    op.create_table(
+        "user_deck_progress",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("deck_id", sa.UUID(), nullable=False),
+        sa.Column("cards_new", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("cards_learning", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("cards_review", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("cards_mastered", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "easiness_factor_sum",
+            sa.Float(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Sum of easiness_factor over the counted statistics rows",
+        ),
+        sa.Column("total_reviews", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("quality_sum", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "total_study_time_seconds",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column("first_studied_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_studied_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["deck_id"], ["decks.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "deck_id"),
+    )
+    op.create_index(
+        "ix_user_deck_progress_user_last_studied",
+        "user_deck_progress",
+        ["user_id", "last_studied_at"],
+    )
+    op.create_index("ix_user_deck_progress_deck", "user_deck_progress", ["deck_id"])
+    op.execute("ALTER TABLE public.user_deck_progress ENABLE ROW LEVEL SECURITY;")
+    op.execute(_BACKFILL)
+
+
+def downgrade() -> None:
+    """Drop user_deck_progress."""
+    op.drop_index("ix_user_deck_progress_deck", table_name="user_deck_progress")
+    op.drop_index("ix_user_deck_progress_user_last_studied", table_name="user_deck_progress")
+    op.drop_table("user_deck_progress")
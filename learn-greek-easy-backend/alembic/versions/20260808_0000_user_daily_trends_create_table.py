@@ -0,0 +1,123 @@
+"""user_daily_trends create table
+
+Creates ``user_daily_trends``, the per-user daily series behind the learning
+trends endpoint (see ``src.repositories.user_daily_trends``), and backfills it
+from the review, answer and statistics tables.
+``python -m src.scripts.rebuild_daily_trends`` runs the same recount later.
+
+Revision ID: user_daily_trends
+Revises: user_deck_progress
+Create Date: 2026-08-08 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "user_daily_trends"
+down_revision: Union[str, Sequence[str], None] = "user_deck_progress"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTERS = (
+    "vocab_reviews",
+    "vocab_correct",
+    "vocab_quality_sum",
+    "vocab_study_time_seconds",
+    "vocab_learning",
+    "vocab_mastered",
+    "culture_answers",
+    "culture_correct",
+    "culture_learning",
+    "culture_mastered",
+)
+
+_BACKFILL = """
+INSERT INTO user_daily_trends (
+    user_id, day, vocab_reviews, vocab_correct, vocab_quality_sum, vocab_study_time_seconds,
+    vocab_learning, vocab_mastered, culture_answers, culture_correct, culture_learning,
+    culture_mastered
+)
+SELECT
+    user_id, day,
+    sum(vocab_reviews), sum(vocab_correct), sum(vocab_quality_sum),
+    sum(vocab_study_time_seconds), sum(vocab_learning), sum(vocab_mastered),
+    sum(culture_answers), sum(culture_correct), sum(culture_learning), sum(culture_mastered)
+FROM (
+    SELECT
+        user_id, reviewed_at::date AS day,
+        count(*) AS vocab_reviews,
+        count(*) FILTER (WHERE quality >= 3) AS vocab_correct,
+        sum(quality) AS vocab_quality_sum,
+        coalesce(sum(time_taken), 0) AS vocab_study_time_seconds,
+        0 AS vocab_learning, 0 AS vocab_mastered,
+        0 AS culture_answers, 0 AS culture_correct, 0 AS culture_learning, 0 AS culture_mastered
+    FROM card_record_reviews
+    GROUP BY user_id, reviewed_at::date
+    UNION ALL
+    SELECT
+        user_id, updated_at::date,
+        0, 0, 0, 0,
+        count(*) FILTER (WHERE status IN ('LEARNING', 'REVIEW')),
+        count(*) FILTER (WHERE status = 'MASTERED'),
+        0, 0, 0, 0
+    FROM card_record_statistics
+    GROUP BY user_id, updated_at::date
+    UNION ALL
+    SELECT
+        user_id, created_at::date,
+        0, 0, 0, 0, 0, 0,
+        count(*),
+        count(*) FILTER (WHERE is_correct),
+        0, 0
+    FROM culture_answer_history
+    GROUP BY user_id, created_at::date
+    UNION ALL
+    SELECT
+        user_id, updated_at::date,
+        0, 0, 0, 0, 0, 0, 0, 0,
+        count(*) FILTER (WHERE status IN ('LEARNING', 'REVIEW')),
+        count(*) FILTER (WHERE status = 'MASTERED')
+    FROM culture_question_stats
+    GROUP BY user_id, updated_at::date
+) sources
+GROUP BY user_id, day
+"""
+
+
+def upgrade() -> None:
+    """Create user_daily_trends and backfill it."""
+    op.create_table(
+        "user_daily_trends",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        *(
+            sa.Column(column, sa.Integer(), server_default=sa.text("0"), nullable=False)
+            for column in _COUNTERS
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+    op.create_index(
+        "ix_user_daily_trends_user_updated",
+        "user_daily_trends",
+        ["user_id", "updated_at"],
+    )
+    op.execute("ALTER TABLE public.user_daily_trends ENABLE ROW LEVEL SECURITY;")
+    op.execute(_BACKFILL)
+
+
+def downgrade() -> None:
+    """Drop user_daily_trends."""
+    op.drop_index("ix_user_daily_trends_user_updated", table_name="user_daily_trends")
+    op.drop_table("user_daily_trends")
@@ -0,0 +1,49 @@
+"""user_due_histograms create table
+
+Creates ``user_due_histograms``, the per-user due-date histogram behind the
+review forecast and the dashboard's due count (see
+``src.repositories.user_due_histogram``). No backfill: a user's row is built
+on first read.
+
+Revision ID: user_due_histograms
+Revises: user_daily_trends
+Create Date: 2026-08-09 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "user_due_histograms"
+down_revision: Union[str, Sequence[str], None] = "user_daily_trends"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create user_due_histograms."""
+    op.create_table(
+        "user_due_histograms",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("base_date", sa.Date(), nullable=False),
+        sa.Column("counts", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute("ALTER TABLE public.user_due_histograms ENABLE ROW LEVEL SECURITY;")
+
+
+def downgrade() -> None:
+    """Drop user_due_histograms."""
+    op.drop_table("user_due_histograms")
@@ -0,0 +1,53 @@
+"""Gunicorn configuration for multi-worker serving (WEB_CONCURRENCY > 1).
+
+Usage (the Dockerfile CMD switches to this when WEB_CONCURRENCY > 1):
+    gunicorn src.main:app -c gunicorn.conf.py
+
+``preload_app`` imports ``src.main`` in the master; ``on_starting`` then loads
+the spaCy and Hunspell models and freezes the GC so the forked workers share
+those pages copy-on-write. ``post_fork`` resets in-process state in each
+worker, and the FastAPI lifespan (run per worker, after fork) opens the DB
+pool, Redis and httpx clients. See src/core/workers.py.
+"""
+
+import gc
+import os
+
+from src.config import settings
+
+bind = f"0.0.0.0:{os.environ.get('PORT', settings.port)}"
+workers = settings.web_concurrency
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Matches uvicorn --timeout-graceful-shutdown 25 on the single-worker path:
+# must stay below RAILWAY_DEPLOYMENT_DRAINING_SECONDS (see docs/deploy-safety.md).
+graceful_timeout = 25
+timeout = 120
+keepalive = 5
+
+accesslog = None
+errorlog = "-"
+loglevel = settings.log_level.lower()
+
+
+def on_starting(server):  # noqa: ANN001, ANN201 - gunicorn hook signature
+    from src.core.logging import get_logger
+    from src.core.workers import warm_shared_models, worker_memory
+
+    logger = get_logger("gunicorn.conf")
+    report = warm_shared_models()
+    gc.freeze()
+    logger.info(
+        "Shared models preloaded before fork",
+        workers=workers,
+        frozen_objects=gc.get_freeze_count(),
+        **report,
+        **worker_memory(),
+    )
+
+
+def post_fork(server, worker):  # noqa: ANN001, ANN201 - gunicorn hook signature
+    from src.core.workers import reset_worker_state
+
+    reset_worker_state()
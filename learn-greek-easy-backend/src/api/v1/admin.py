@@ -11,6 +11,7 @@ All endpoints require superuser authentication.
 import asyncio
 import hashlib
 import json
+import time
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 from typing import Any, Literal, Optional
@@ -47,7 +48,7 @@ from src.core.exceptions import (
     NotFoundException,
 )
 from src.core.logging import get_logger
-from src.db.dependencies import get_db
+from src.db.dependencies import get_db, get_read_db
 from src.db.models import (
     AudioStatus,
     CardErrorCardType,
@@ -91,6 +92,7 @@ from src.db.models import (
 from src.db.session import get_session_factory
 from src.repositories.deck import DeckRepository
 from src.repositories.exercise import ExerciseRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
 from src.repositories.word_entry import WordEntryRepository
 from src.schemas.admin import (
     AdminCultureQuestionItem,
@@ -105,6 +107,8 @@ from src.schemas.admin import (
     GenerateCardsResponse,
     LexgenApproveRequest,
     LexgenApproveResponse,
+    LexgenBulkSubmitRequest,
+    LexgenBulkSubmitResponse,
     LexgenEditRequest,
     LexgenProposalContentField,
     LexgenProposalDetailResponse,
@@ -188,6 +192,8 @@ from src.schemas.situation import (
 from src.schemas.word_entry import (
     AdminWordEntryCreateRequest,
     AdminWordEntryCreateResponse,
+    DeckImportRequest,
+    DeckImportResponse,
     WordEntryResponse,
 )
 from src.services.admin_counts_service import AdminCountsService, count_active_decks
@@ -196,6 +202,7 @@ from src.services.audio_generation_service import DialogInput, get_audio_generat
 from src.services.card_error_admin_service import CardErrorAdminService
 from src.services.card_generator_service import CardGeneratorService
 from src.services.changelog_service import ChangelogService
+from src.services.deck_import_service import DeckImportService
 from src.services.description_audio_service import (
     DescriptionAudioError,
     _versioned_description_key,
@@ -206,6 +213,7 @@ from src.services.description_audio_service import (
 from src.services.feedback_admin_service import FeedbackAdminService
 from src.services.gamification import ReconcileMode
 from src.services.gamification.reconciler import GamificationReconciler
+from src.services.lexgen_bulk_service import dedupe_lemmas, is_bulk_run_active, run_bulk_lexgen
 from src.services.lexgen_pipeline_service import LexgenPipelineService
 from src.services.lexgen_review_service import LexgenReviewService
 from src.services.news_item_service import NewsItemService
@@ -227,7 +235,11 @@ from src.services.situation_picture_service import (
     upload_picture_to_s3,
 )
 from src.services.word_entry_response import word_entry_to_response
-from src.tasks import create_announcement_notifications_task, invalidate_cache_task
+from src.tasks import (
+    create_announcement_notifications_task,
+    dispatch_task,
+    invalidate_cache_task,
+)
 from src.tasks.description_audio import generate_description_audio_task
 from src.tasks.picture_generation import generate_picture_task
 from src.utils.greek_text import resolve_tts_text
@@ -307,8 +319,8 @@ def _recompose_image_prompt(scene_en: str | None, style_en: str | None) -> str |
     },
 )
 async def get_admin_stats(
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser),
+    db: AsyncSession = Depends(get_read_db),
 ) -> AdminStatsResponse:
     """Get admin dashboard statistics.
 
@@ -321,8 +333,8 @@ async def get_admin_stats(
     Only approved (non-pending) culture questions are counted.
 
     Args:
-        db: Database session (injected)
         current_user: Authenticated superuser (injected)
+        db: Read-only database session (replica when usable)
 
     Returns:
         AdminStatsResponse with deck and card counts
@@ -876,8 +888,10 @@ async def upload_deck_cover_image(
     # appears on the site after that window expires (the admin drawer reads the
     # fresh response below, but the public list keeps serving the stale cache).
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -929,8 +943,10 @@ async def delete_deck_cover_image(
     # Bust the public deck-list cache so the removal propagates to the site
     # immediately rather than only after the cache_deck_list_ttl window expires.
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -1596,6 +1612,44 @@ async def submit_lexgen_proposal(
     )
 
 
+@router.post(
+    "/lexgen/proposals/bulk",
+    response_model=LexgenBulkSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Run a lemma list through the LEXGEN pipeline in the background",
+    responses={
+        202: {"description": "Bulk run scheduled; proposals land in the review queue"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not authorized (requires superuser)"},
+        409: {"description": "A bulk run is already in progress"},
+    },
+)
+async def submit_lexgen_bulk(
+    body: LexgenBulkSubmitRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_superuser),
+) -> LexgenBulkSubmitResponse:
+    """Schedule a bulk LEXGEN run (batched evidence reads, bounded concurrency).
+
+    The run resumes from committed proposals: lemmas that already have a proposal
+    for ``pos`` are skipped, so re-submitting the same list after a crash only
+    processes what is left.
+    """
+    if is_bulk_run_active():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="A bulk LEXGEN run is already in progress"
+        )
+    lemmas = dedupe_lemmas(body.lemmas)
+    background_tasks.add_task(
+        run_bulk_lexgen,
+        lemmas,
+        pos=body.pos,
+        requested_by=current_user.id,
+        concurrency=body.concurrency,
+    )
+    return LexgenBulkSubmitResponse(accepted=len(lemmas))
+
+
 @router.get(
     "/culture/questions/pending",
     response_model=PendingQuestionsResponse,
@@ -2125,8 +2179,10 @@ async def create_announcement(
     await db.commit()
 
     # Schedule background task to create notifications for all users
-    background_tasks.add_task(
+    await dispatch_task(
+        background_tasks,
         create_announcement_notifications_task,
+        session=db,
         campaign_id=campaign.id,
         campaign_title=campaign.title,
         campaign_message=campaign.message,
@@ -3430,8 +3486,10 @@ async def generate_word_entry_cards(
     await db.commit()
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=resolved_deck_id,
         )
@@ -3526,8 +3584,10 @@ async def create_and_link_word_entry(
     await db.refresh(word_entry)
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=body.deck_id,
         )
@@ -3539,6 +3599,61 @@ async def create_and_link_word_entry(
     )
 
 
+# ============================================================================
+# Deck Manifest Import Endpoint
+# ============================================================================
+
+
+@router.post(
+    "/decks/{deck_id}/import",
+    response_model=DeckImportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Import a deck manifest of word entries",
+    description=(
+        "Upsert every word entry in the manifest, link them all to the deck and "
+        "generate the requested card types, set-wise and in one transaction. "
+        "The response carries per-phase timings."
+    ),
+    responses={
+        200: {"description": "Manifest imported"},
+        404: {"description": "Deck not found"},
+        409: {"description": "Deck inactive, or a manifest lemma clashes with a linked entry"},
+    },
+)
+async def import_deck_manifest(
+    deck_id: UUID,
+    body: DeckImportRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser),
+) -> DeckImportResponse:
+    """Import a whole deck manifest instead of one create-and-link call per word."""
+    result = await DeckImportService(db).import_manifest(deck_id, body)
+
+    commit_start = time.monotonic()
+    await db.commit()
+    result.timings["commit_ms"] = round((time.monotonic() - commit_start) * 1000)
+
+    if settings.feature_background_tasks:
+        await dispatch_task(
+            background_tasks,
+            invalidate_cache_task,
+            session=db,
+            cache_type="deck",
+            entity_id=deck_id,
+        )
+
+    logger.info(
+        "Deck manifest import committed",
+        extra={
+            "deck_id": str(deck_id),
+            "timings": result.timings,
+            "triggered_by": str(current_user.id),
+        },
+    )
+    return result
+
+
 # ============================================================================
 # Word Entry Link/Unlink Endpoints
 # ============================================================================
@@ -3634,8 +3749,10 @@ async def link_word_entry_to_deck(
     await db.refresh(word_entry)
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -3685,11 +3802,16 @@ async def unlink_word_entry_from_deck(
     # Remove junction row
     await word_entry_repo.unlink_from_deck(word_entry_id, deck_id)
 
+    # Deleted cards took their statistics with them; recount the deck's counters
+    await UserDeckProgressRepository(db).refresh(deck_id=deck_id)
+
     await db.commit()
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -3759,7 +3881,13 @@ async def delete_word_entry(
                 extra={"s3_key": key, "word_entry_id": str(word_entry_id)},
             )
 
+    deck_ids = await WordEntryRepository(db).get_decks_for_word_entry(word_entry_id)
     await db.delete(word_entry)
+    await db.flush()
+    # Cascade-deleted cards took their statistics with them; recount those decks
+    progress_repo = UserDeckProgressRepository(db)
+    for deck_id in deck_ids:
+        await progress_repo.refresh(deck_id=deck_id)
     await db.commit()
 
 
@@ -5947,13 +6075,55 @@ async def list_admin_exercises(
 # EXR-55 + EXR-60: Regenerate exercise endpoint
 # ============================================================================
 
-# EXR-60: in-process idempotency cache for regenerate.
-# Maps (exercise_id, idempotency_key) -> (cached_at, AdminExerciseListItem).
-# Note: in-process only; single-replica OK for admin routes.
-# Multi-replica would require Redis. Deferred.
+# EXR-60: idempotency cache for regenerate.
+# Stored in Redis (``regenerate:idempotency:{exercise_id}:{key}``) so a retry
+# landing on another worker/replica still hits; when Redis is unavailable it
+# falls back to this in-process map of
+# (exercise_id, idempotency_key) -> (cached_at, AdminExerciseListItem).
 _REGENERATE_IDEMPOTENCY_CACHE: dict[tuple[UUID, str], tuple[datetime, "AdminExerciseListItem"]] = {}
 _REGENERATE_IDEMPOTENCY_TTL_SECONDS = 60
 
+
+def reset_regenerate_idempotency_cache() -> None:
+    """Clear the in-process fallback (per worker, after fork)."""
+    _REGENERATE_IDEMPOTENCY_CACHE.clear()
+
+
+def _regenerate_idempotency_key(exercise_id: UUID, idempotency_key: str) -> str:
+    return f"regenerate:idempotency:{exercise_id}:{idempotency_key}"
+
+
+async def _get_regenerate_idempotency(
+    exercise_id: UUID, idempotency_key: str
+) -> AdminExerciseListItem | None:
+    cache = get_cache()
+    if cache.enabled:
+        data = await cache.get(_regenerate_idempotency_key(exercise_id, idempotency_key))
+        return AdminExerciseListItem.model_validate(data) if data is not None else None
+    cached = _REGENERATE_IDEMPOTENCY_CACHE.get((exercise_id, idempotency_key))
+    if cached is None:
+        return None
+    cached_at, cached_item = cached
+    age = (datetime.now(timezone.utc) - cached_at).total_seconds()
+    return cached_item if age < _REGENERATE_IDEMPOTENCY_TTL_SECONDS else None
+
+
+async def _put_regenerate_idempotency(
+    exercise_id: UUID, idempotency_key: str, item: AdminExerciseListItem
+) -> None:
+    cache = get_cache()
+    if cache.enabled and await cache.set(
+        _regenerate_idempotency_key(exercise_id, idempotency_key),
+        item.model_dump(mode="json"),
+        ttl=_REGENERATE_IDEMPOTENCY_TTL_SECONDS,
+    ):
+        return
+    _REGENERATE_IDEMPOTENCY_CACHE[(exercise_id, idempotency_key)] = (
+        datetime.now(timezone.utc),
+        item,
+    )
+
+
 # Union of all sibling exercise types for type annotations.
 _SiblingExercise = DescriptionExercise | DialogExercise | PictureExercise | WordOrderExercise
 
@@ -6137,17 +6307,13 @@ async def regenerate_exercise(
 ) -> AdminExerciseListItem:
     # EXR-60: check idempotency cache before any DB work
     if idempotency_key is not None:
-        cache_key = (exercise_id, idempotency_key)
-        cached = _REGENERATE_IDEMPOTENCY_CACHE.get(cache_key)
-        if cached is not None:
-            cached_at, cached_item = cached
-            age = (datetime.now(timezone.utc) - cached_at).total_seconds()
-            if age < _REGENERATE_IDEMPOTENCY_TTL_SECONDS:
-                logger.bind(
-                    admin_user_id=str(current_user.id),
-                    exercise_id=str(exercise_id),
-                ).info("admin_exercise_regenerate_idempotency_hit")
-                return cached_item
+        cached_item = await _get_regenerate_idempotency(exercise_id, idempotency_key)
+        if cached_item is not None:
+            logger.bind(
+                admin_user_id=str(current_user.id),
+                exercise_id=str(exercise_id),
+            ).info("admin_exercise_regenerate_idempotency_hit")
+            return cached_item
 
     # Resolve sibling (404 if not found)
     sibling, source_type = await _resolve_exercise_by_id(db, exercise_id)
@@ -6183,10 +6349,7 @@ async def regenerate_exercise(
 
     # EXR-60: store result in idempotency cache
     if idempotency_key is not None:
-        _REGENERATE_IDEMPOTENCY_CACHE[(exercise_id, idempotency_key)] = (
-            datetime.now(timezone.utc),
-            result,
-        )
+        await _put_regenerate_idempotency(exercise_id, idempotency_key, result)
 
     # EXR-60: audit log — no Greek/English content, no PII
     logger.bind(
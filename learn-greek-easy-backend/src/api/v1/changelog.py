@@ -6,22 +6,32 @@ This module provides endpoints for changelog entries:
 Requires authentication.
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.dependencies import get_current_user, get_locale_from_header
+from src.core.http_cache import conditional_get, version_statement
 from src.db.dependencies import get_db
-from src.db.models import User
+from src.db.models import ChangelogEntry, User
 from src.schemas.changelog import ChangelogListResponse
 from src.services import ChangelogService
 
 router = APIRouter()
 
 
+async def _changelog_version(request: Request, db: AsyncSession, user: User) -> tuple:
+    """Content version of the changelog: entry count and latest update."""
+    result = await db.execute(version_statement((ChangelogEntry,)))
+    return tuple(result.one())
+
+
 @router.get(
     "",
     response_model=ChangelogListResponse,
     summary="Get changelog entries",
+    dependencies=[
+        Depends(conditional_get(_changelog_version, cache_control="private, max-age=300"))
+    ],
     description="""
 Get a paginated list of changelog entries with localized content.
 
@@ -41,7 +41,7 @@ from src.schemas.mock_exam import (
 from src.services import MockExamService
 from src.services.culture_coverage_service import CultureCoverageService
 from src.services.s3_service import IMAGE_PRESIGN_EXPIRY_SECONDS
-from src.tasks import invalidate_cache_task
+from src.tasks import dispatch_task, invalidate_cache_task
 
 router = APIRouter(
     prefix="/mock-exam",
@@ -517,8 +517,10 @@ async def submit_all_mock_exam_answers(
     ]
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="progress",
             entity_id=None,
             user_id=current_user.id,
@@ -34,20 +34,29 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
     Response,
     UploadFile,
     status,
 )
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.culture.mock_exam import router as mock_exam_router
 from src.config import settings
 from src.core.culture_topic import CultureTopic
-from src.core.dependencies import get_current_superuser, get_current_user, get_locale_from_header
+from src.core.dependencies import (
+    get_current_principal,
+    get_current_superuser,
+    get_current_user,
+    get_locale_from_header,
+)
 from src.core.exceptions import ValidationException
+from src.core.http_cache import conditional_get, version_columns
 from src.core.logging import get_logger
-from src.db.dependencies import get_db
-from src.db.models import User
+from src.core.principal import Principal
+from src.db.dependencies import get_db, get_read_db
+from src.db.models import CultureDeck, CultureQuestion, CultureQuestionStats, User
 from src.repositories.culture_deck import CultureDeckRepository
 from src.schemas.culture import (
     CultureAnswerRequest,
@@ -77,6 +86,7 @@ from src.services.s3_service import (
     maybe_generate_derivatives,
 )
 from src.tasks import (
+    dispatch_task,
     invalidate_cache_task,
     is_background_tasks_enabled,
     persist_culture_answer_task,
@@ -94,10 +104,29 @@ router = APIRouter(
 )
 
 
+async def _culture_catalog_version(request: Request, db: AsyncSession, user: User) -> tuple:
+    """Content version of the culture deck list, including the user's progress."""
+    result = await db.execute(
+        select(
+            *version_columns(CultureDeck),
+            *version_columns(CultureQuestion),
+            *version_columns(CultureQuestionStats, CultureQuestionStats.user_id == user.id),
+        )
+    )
+    return tuple(result.one())
+
+
 @router.get(
     "/decks",
     response_model=CultureDeckListResponse,
     summary="List culture decks",
+    dependencies=[
+        Depends(
+            conditional_get(
+                _culture_catalog_version, cache_control="private, max-age=60", per_user=True
+            )
+        )
+    ],
     description="""
     Get a paginated list of all active culture decks with optional category filtering.
 
@@ -608,8 +637,10 @@ async def submit_answer(
             )
 
             # Queue background task to persist pre-computed SM-2 values
-            background_tasks.add_task(
+            await dispatch_task(
+                background_tasks,
                 persist_culture_answer_task,
+                session=db,
                 user_id=current_user.id,
                 question_id=question_id,
                 selected_option=request.selected_option,
@@ -625,8 +656,10 @@ async def submit_answer(
                 sm2_next_review_date=context["sm2_next_review_date"],
                 stats_previous_status=context["stats_previous_status"],
             )
-            background_tasks.add_task(
+            await dispatch_task(
+                background_tasks,
                 invalidate_cache_task,
+                session=db,
                 cache_type="progress",
                 entity_id=None,
                 user_id=current_user.id,
@@ -741,8 +774,8 @@ async def get_culture_progress(
     },
 )
 async def get_culture_readiness(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CultureReadinessResponse:
     """Get the user's culture exam readiness assessment."""
     service = CultureQuestionService(db)
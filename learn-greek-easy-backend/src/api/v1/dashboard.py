@@ -23,9 +23,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
 from src.core.cache import get_cache
-from src.core.dependencies import get_current_user
-from src.db.dependencies import get_db
-from src.db.models import User
+from src.core.dependencies import get_current_principal
+from src.core.principal import Principal
+from src.db.dependencies import get_read_db
 from src.schemas.dashboard import DashboardSummaryResponse
 from src.services.dashboard_summary_service import DashboardSummaryService
 
@@ -38,8 +38,8 @@ router = APIRouter()
     summary="Get composed dashboard summary",
 )
 async def get_dashboard_summary(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ) -> DashboardSummaryResponse:
     """Cached, single-composed-call replacement for the dashboard's eight
     separate requests. Cache-aside: hit returns the validated cached
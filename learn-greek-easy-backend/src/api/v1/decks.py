@@ -9,7 +9,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
 from pydantic import ValidationError
 from sqlalchemy import delete, select
 from sqlalchemy.exc import IntegrityError
@@ -25,6 +25,13 @@ from src.core.exceptions import (
     NotFoundException,
     PremiumRequiredException,
 )
+from src.core.http_cache import (
+    conditional_get,
+    content_etag,
+    path_uuid,
+    version_columns,
+    version_statement,
+)
 from src.core.localization import get_localized_deck_content
 from src.core.posthog import capture_event
 from src.core.subscription import get_effective_access_level
@@ -44,6 +51,7 @@ from src.db.models import (
 from src.repositories.card_record_review import CardRecordReviewRepository
 from src.repositories.card_record_statistics import CardRecordStatisticsRepository
 from src.repositories.deck import DeckRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
 from src.repositories.word_entry import WordEntryRepository
 from src.schemas.deck import (
     CardTypeMastery,
@@ -63,6 +71,7 @@ from src.services.card_generator_service import CardGeneratorService
 from src.services.s3_service import get_s3_service
 from src.services.word_entry_response import word_entry_to_response
 from src.tasks.background import invalidate_cache_task
+from src.tasks.queue import dispatch_task
 from src.utils.deck_cover import deck_cover_url, deck_cover_variants
 from src.utils.heatmap import bucket_heatmap_intensity
 
@@ -112,10 +121,39 @@ def _map_trilingual_create_fields(create_data: dict) -> None:
         create_data["description_ru"] = description
 
 
+async def _deck_catalog_version(request: Request, db: AsyncSession, user: User) -> tuple:
+    """Content version of the system deck list: decks, links and word entries."""
+    result = await db.execute(version_statement((Deck, DeckWordEntry, WordEntry)))
+    return tuple(result.one())
+
+
+async def _deck_detail_version(request: Request, db: AsyncSession, user: User) -> tuple | None:
+    """Content version of one deck, or None when the user cannot read it."""
+    deck_id = path_uuid(request, "deck_id")
+    if deck_id is None:
+        return None
+    linked = select(DeckWordEntry.word_entry_id).where(DeckWordEntry.deck_id == deck_id)
+    result = await db.execute(
+        select(
+            Deck.updated_at,
+            Deck.is_active,
+            Deck.owner_id,
+            *version_columns(WordEntry, WordEntry.is_active.is_(True), WordEntry.id.in_(linked)),
+        ).where(Deck.id == deck_id)
+    )
+    row = result.one_or_none()
+    if row is None or not row.is_active or row.owner_id not in (None, user.id):
+        return None
+    return tuple(row)
+
+
 @router.get(
     "",
     response_model=DeckListResponse,
     summary="List active decks",
+    dependencies=[
+        Depends(conditional_get(_deck_catalog_version, cache_control="private, max-age=60"))
+    ],
     description="""Get a paginated list of all active decks with optional level filtering.
 
 **Localization**: Content is returned in the language specified by the
@@ -149,6 +187,7 @@ Falls back to English if the requested language is not supported.
     },
 )
 async def list_decks(
+    request: Request,
     page: int = Query(default=1, ge=1, description="Page number (starting from 1)"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page (max 100)"),
     level: Optional[DeckLevel] = Query(
@@ -165,6 +204,7 @@ async def list_decks(
     Use the level parameter to filter by CEFR proficiency level.
 
     Args:
+        request: The request; carries the ETag the cached body is keyed by
         page: Page number starting from 1
         page_size: Number of items per page (1-100)
         level: Optional CEFR level filter
@@ -230,6 +270,10 @@ async def list_decks(
     cache = get_cache()
     level_key = level.value if level else "all"
     key = f"decks:list:{locale}:{level_key}:{page}:{page_size}"
+    etag = content_etag(request)
+    if etag is not None:
+        # Keyed by the catalog version, so the body always matches its ETag
+        key = f"{key}:" + etag.strip('"')
 
     async def _factory() -> dict:
         return (await _compute()).model_dump(mode="json")
@@ -335,8 +379,10 @@ async def create_deck(
 
     # Schedule background tasks if enabled
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck.id,
         )
@@ -604,6 +650,13 @@ async def list_my_decks(
     "/{deck_id}",
     response_model=DeckDetailResponse,
     summary="Get deck by ID",
+    dependencies=[
+        Depends(
+            conditional_get(
+                _deck_detail_version, cache_control="private, max-age=60", per_user=True
+            )
+        )
+    ],
     description="""Get a single deck by its UUID, including the card count.
 
 **Localization**: Content is returned in the language specified by the
@@ -989,8 +1042,10 @@ async def add_word_entry_to_my_deck(
     await db.refresh(word_entry)
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -1042,11 +1097,16 @@ async def remove_word_entry_from_my_deck(
     # Remove junction row
     await word_entry_repo.unlink_from_deck(word_entry_id, deck_id)
 
+    # Deleted cards took their statistics with them; recount the deck's counters
+    await UserDeckProgressRepository(db).refresh(deck_id=deck_id)
+
     await db.commit()
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -1233,8 +1293,10 @@ async def update_deck(
 
     # Schedule background tasks if enabled
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -1329,8 +1391,10 @@ async def delete_deck(
 
     # Schedule background tasks if enabled
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="deck",
             entity_id=deck_id,
         )
@@ -34,7 +34,7 @@ from src.services.picture_match_service import (
     assemble_picture_match_payload,
     load_distractor_pool,
 )
-from src.tasks import invalidate_cache_task
+from src.tasks import dispatch_task, invalidate_cache_task
 
 router = APIRouter(
     tags=["Exercises"],
@@ -119,8 +119,10 @@ async def submit_exercise_review(
         raise HTTPException(status_code=404, detail=str(e)) from e
 
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="progress",
             entity_id=None,
             user_id=current_user.id,
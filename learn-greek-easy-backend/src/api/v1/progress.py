@@ -5,14 +5,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.dependencies import get_current_user
-from src.db.dependencies import get_db
-from src.db.models import User
+from src.core.dependencies import get_current_principal
+from src.core.principal import Principal
+from src.db.dependencies import get_read_db
 from src.schemas.progress import (
     DashboardStatsResponse,
     DeckProgressDetailResponse,
     DeckProgressListResponse,
     LearningTrendsResponse,
+    ReviewForecastResponse,
 )
 from src.services.progress_service import ProgressService
 
@@ -25,8 +26,8 @@ router = APIRouter()
     summary="Get dashboard stats",
 )
 async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ) -> DashboardStatsResponse:
     service = ProgressService(db)
     return await service.get_dashboard_stats(current_user.id)
@@ -40,13 +41,27 @@ async def get_dashboard_stats(
 async def get_learning_trends(
     period: str = Query(default="week", pattern="^(week|month|quarter)$"),
     deck_id: UUID | None = Query(default=None),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ) -> LearningTrendsResponse:
     service = ProgressService(db)
     return await service.get_learning_trends(current_user.id, period=period, deck_id=deck_id)
 
 
+@router.get(
+    "/forecast",
+    response_model=ReviewForecastResponse,
+    summary="Get review forecast",
+)
+async def get_review_forecast(
+    days: int = Query(default=30, ge=1, le=90),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
+) -> ReviewForecastResponse:
+    service = ProgressService(db)
+    return await service.get_review_forecast(current_user.id, days=days)
+
+
 @router.get(
     "/decks",
     response_model=DeckProgressListResponse,
@@ -55,8 +70,8 @@ async def get_learning_trends(
 async def get_deck_progress_list(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ) -> DeckProgressListResponse:
     service = ProgressService(db)
     return await service.get_deck_progress_list(current_user.id, page=page, page_size=page_size)
@@ -69,8 +84,8 @@ async def get_deck_progress_list(
 )
 async def get_deck_progress_detail(
     deck_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
 ) -> DeckProgressDetailResponse:
     service = ProgressService(db)
     return await service.get_deck_progress_detail(current_user.id, deck_id=deck_id)
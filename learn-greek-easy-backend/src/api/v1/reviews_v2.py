@@ -12,8 +12,14 @@ from src.db.models import User
 from src.repositories.card_record import CardRecordRepository
 from src.repositories.card_record_review import CardRecordReviewRepository
 from src.schemas.v2_sm2 import V2ReviewRequest, V2ReviewResult
+from src.services.review_pipeline import ReviewPipeline
 from src.services.v2_sm2_service import V2SM2Service
-from src.tasks.background import invalidate_cache_task, persist_deck_review_task
+from src.tasks.background import (
+    check_achievements_task,
+    invalidate_cache_task,
+    persist_deck_review_task,
+)
+from src.tasks.queue import dispatch_task
 
 logger = get_logger(__name__)
 
@@ -37,6 +43,9 @@ async def submit_v2_review(
     current_user: User = Depends(get_current_user),
 ) -> V2ReviewResult:
     """Submit a single card review using the SM2 V2 algorithm."""
+    if settings.review_fused_write_path:
+        return await _submit_fused(review, background_tasks, db, current_user)
+
     # Step 1: Fetch card record
     card_record = await CardRecordRepository(db).get(review.card_record_id)
     if card_record is None:
@@ -60,14 +69,18 @@ async def submit_v2_review(
 
     # Step 5: Persist review — background or synchronous fallback
     if settings.feature_background_tasks:
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             persist_deck_review_task,
+            session=db,
             **context,
             reviews_before=reviews_before,
             user_email=current_user.email,
         )
-        background_tasks.add_task(
+        await dispatch_task(
+            background_tasks,
             invalidate_cache_task,
+            session=db,
             cache_type="progress",
             entity_id=UUID(context["deck_id"]),
             user_id=current_user.id,
@@ -76,3 +89,38 @@ async def submit_v2_review(
         await service.persist_review(context)
 
     return result
+
+
+async def _submit_fused(
+    review: V2ReviewRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession,
+    current_user: User,
+) -> V2ReviewResult:
+    """Single-transaction path: SM2, XP and daily goal written with the request."""
+    result, state = await ReviewPipeline(db).submit(
+        current_user,
+        review.card_record_id,
+        quality=review.quality,
+        time_taken=review.time_taken,
+    )
+
+    if settings.feature_background_tasks:
+        await dispatch_task(
+            background_tasks,
+            check_achievements_task,
+            session=db,
+            coalesce_key=f"check_achievements:{current_user.id}",
+            delay_seconds=settings.job_queue_coalesce_seconds,
+            user_id=current_user.id,
+        )
+        await dispatch_task(
+            background_tasks,
+            invalidate_cache_task,
+            session=db,
+            cache_type="progress",
+            entity_id=state.deck_id,
+            user_id=current_user.id,
+        )
+
+    return result
@@ -1,7 +1,7 @@
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -9,10 +9,13 @@ from sqlalchemy.orm import selectinload
 from src.core.dependencies import get_current_user
 from src.core.exceptions import NotFoundException
 from src.core.exercise_topic import ExerciseTopic, derive_exercise_topic
+from src.core.http_cache import conditional_get, version_columns
 from src.db.dependencies import get_db
 from src.db.models import (
     CardStatus,
     DescriptionExercise,
+    DialogLine,
+    DialogSpeaker,
     Exercise,
     ExerciseRecord,
     ExerciseSourceType,
@@ -21,6 +24,7 @@ from src.db.models import (
     PictureStatus,
     Situation,
     SituationDescription,
+    SituationPicture,
     SituationStatus,
     User,
 )
@@ -45,8 +49,38 @@ router = APIRouter(
     },
 )
 
+# Tables behind the learner situation list and detail payloads.
+_SITUATION_CONTENT = (
+    Situation,
+    SituationDescription,
+    SituationPicture,
+    ListeningDialog,
+    DialogSpeaker,
+    DialogLine,
+    DescriptionExercise,
+    Exercise,
+)
+
+
+async def _situation_content_version(request: Request, db: AsyncSession, user: User) -> tuple:
+    """Content version of the situations catalog plus the user's exercise records."""
+    columns = [column for model in _SITUATION_CONTENT for column in version_columns(model)]
+    result = await db.execute(
+        select(*columns, *version_columns(ExerciseRecord, ExerciseRecord.user_id == user.id))
+    )
+    return tuple(result.one())
+
+
+_situation_conditional_get = conditional_get(
+    _situation_content_version, cache_control="private, no-cache", per_user=True
+)
+
 
-@router.get("", response_model=LearnerSituationListResponse)
+@router.get(
+    "",
+    response_model=LearnerSituationListResponse,
+    dependencies=[Depends(_situation_conditional_get)],
+)
 async def list_situations(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
@@ -78,7 +112,11 @@ async def get_situation_comprehension(
     return await service.get_overview(user_id=current_user.id)
 
 
-@router.get("/{situation_id}", response_model=LearnerSituationDetailResponse)
+@router.get(
+    "/{situation_id}",
+    response_model=LearnerSituationDetailResponse,
+    dependencies=[Depends(_situation_conditional_get)],
+)
 async def get_situation(
     situation_id: UUID,
     db: AsyncSession = Depends(get_db),
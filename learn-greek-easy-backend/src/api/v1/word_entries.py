@@ -6,14 +6,15 @@ This module provides HTTP endpoints for word entry operations including:
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.dependencies import get_current_user
 from src.core.exceptions import ForbiddenException, NotFoundException
+from src.core.http_cache import conditional_get, path_uuid
 from src.db.dependencies import get_db
-from src.db.models import Deck, DeckWordEntry, User, Visibility
+from src.db.models import Deck, DeckWordEntry, User, Visibility, WordEntry
 from src.repositories.card_record import CardRecordRepository
 from src.repositories.word_entry import WordEntryRepository
 from src.schemas.card_record import CardRecordResponse
@@ -32,10 +33,36 @@ router = APIRouter(
 )
 
 
+async def _word_entry_version(request: Request, db: AsyncSession, user: User) -> tuple | None:
+    """Content version of one word entry, or None when the user cannot read it.
+
+    Includes the readable linked decks: the response's deck_id is chosen from them.
+    """
+    word_entry_id = path_uuid(request, "word_entry_id")
+    if word_entry_id is None:
+        return None
+    result = await db.execute(
+        select(WordEntry.updated_at, WordEntry.is_active, Deck.id, Deck.owner_id)
+        .join(DeckWordEntry, DeckWordEntry.word_entry_id == WordEntry.id)
+        .join(Deck, Deck.id == DeckWordEntry.deck_id)
+        .where(WordEntry.id == word_entry_id)
+    )
+    rows = result.all()
+    readable = sorted(f"{row.id}:{row.owner_id}" for row in rows if row.owner_id in (None, user.id))
+    if not readable or not rows[0].is_active:
+        return None
+    return (rows[0].updated_at, *readable)
+
+
 @router.get(
     "/{word_entry_id}",
     response_model=WordEntryResponse,
     summary="Get word entry by ID",
+    dependencies=[
+        Depends(
+            conditional_get(_word_entry_version, cache_control="private, max-age=60", per_user=True)
+        )
+    ],
     description="Retrieve a word entry by its ID. "
     "User must be authenticated and have access to the deck (owner or system deck).",
     responses={
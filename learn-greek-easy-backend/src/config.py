@@ -3,7 +3,7 @@
 import json
 import logging
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -36,6 +36,14 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, description="Server port")
     reload: bool = Field(default=False, description="Auto-reload on code changes")
+    web_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "API worker processes. 1 runs plain uvicorn; >1 runs gunicorn with "
+            "preloaded (copy-on-write shared) NLP models, see gunicorn.conf.py"
+        ),
+    )
 
     # =========================================================================
     # Database
@@ -50,6 +58,28 @@ class Settings(BaseSettings):
         default=5,
         description="Minimum number of DB connections to pre-open (warm) at startup",
     )
+    database_read_replica_url: str | None = Field(
+        default=None,
+        description="Read-replica URL for get_read_db; unset routes every read to the primary",
+    )
+    database_replica_max_lag_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Replica replay lag above which reads fall back to the primary",
+    )
+    database_replica_lag_check_seconds: int = Field(
+        default=10,
+        gt=0,
+        description="Interval between replica lag measurements",
+    )
+    database_read_your_writes_seconds: int = Field(
+        default=10,
+        ge=0,
+        description=(
+            "After a user's write request, that user's get_read_db reads go to "
+            "the primary for this many seconds"
+        ),
+    )
 
     # =========================================================================
     # Redis
@@ -108,6 +138,13 @@ class Settings(BaseSettings):
         default=60,
         description="User progress cache TTL in seconds (1 minute)",
     )
+    cache_learning_trends_ttl: int = Field(
+        default=3600,
+        description=(
+            "Learning trends series cache TTL in seconds; keys carry the series' last "
+            "update, so writes never serve a stale entry"
+        ),
+    )
     cache_due_cards_ttl: int = Field(
         default=30,
         description="Due cards cache TTL in seconds (30 seconds - must be fresh)",
@@ -139,6 +176,14 @@ class Settings(BaseSettings):
         gt=0,
         description="get_or_set single-flight follower poll interval in ms (PERF-16)",
     )
+    exercise_content_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        description=(
+            "Seconds between content-version checks of the in-process exercise "
+            "content cache used by the study queue; 0 disables the cache"
+        ),
+    )
 
     # =========================================================================
     # Authentication & Security
@@ -200,6 +245,22 @@ class Settings(BaseSettings):
         default=3600,
         description="JWKS cache TTL in seconds for Supabase JWT verification",
     )
+    supabase_verified_token_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        description=(
+            "Per-process LRU of verified access tokens (keyed by SHA-256, expiring at "
+            "the token's exp); repeat tokens skip signature verification. 0 disables"
+        ),
+    )
+    auth_principal_snapshot_ttl: int = Field(
+        default=30,
+        ge=0,
+        description=(
+            "Seconds a resolved user's principal is reused by read-only endpoints "
+            "(get_current_principal) without fetching the user row. 0 disables"
+        ),
+    )
 
     # =========================================================================
     # Email (Resend)
@@ -337,6 +398,45 @@ class Settings(BaseSettings):
     log_file: str = Field(default="logs/app.log", description="Log file path")
     log_max_bytes: int = Field(default=10485760, description="Max log file size")
     log_backup_count: int = Field(default=5, description="Number of log backups")
+    log_async_pipeline: bool = Field(
+        default=True,
+        description=(
+            "Production JSON logs go through a bounded queue drained by a writer thread "
+            "(src.core.log_pipeline); false restores the synchronous stdout sink"
+        ),
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Records the async log queue holds before new records are dropped",
+    )
+    log_level_sample_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            'Keep rate per level below WARNING, e.g. {"DEBUG": 0.1, "INFO": 0.5}; '
+            "unlisted levels are kept"
+        ),
+    )
+    log_route_sample_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Keep rate of sub-WARNING records per request path prefix (longest prefix "
+            'wins), decided once per request, e.g. {"/api/v1/study": 0.2}'
+        ),
+    )
+    log_dedup_window_seconds: float = Field(
+        default=10.0,
+        description="Window for rate-limiting identical log records (call site, text, extras)",
+    )
+    log_dedup_burst: int = Field(
+        default=20,
+        ge=0,
+        description="Identical records written per dedup window before suppression (0 disables)",
+    )
+    log_pipeline_report_seconds: float = Field(
+        default=60.0,
+        description="Interval at which the log writer reports its drop counters (0 disables)",
+    )
 
     # Sentry
     sentry_dsn: Optional[str] = Field(default=None, description="Sentry DSN")
@@ -372,6 +472,95 @@ class Settings(BaseSettings):
     )
     feature_rate_limiting: bool = Field(default=True, description="Enable rate limiting")
     feature_background_tasks: bool = Field(default=False, description="Enable background tasks")
+    # Durable job queue (src/tasks/queue.py), consumed by `python -m src.worker_main`
+    job_queue_enabled: bool = Field(
+        default=False,
+        description=(
+            "Enqueue background work to the durable job queue instead of in-process "
+            "BackgroundTasks (requires the job worker service)"
+        ),
+    )
+    job_queue_backend: Literal["postgres", "memory"] = Field(
+        default="postgres",
+        description="Job queue store: postgres (SKIP LOCKED) or memory (tests/local only)",
+    )
+    job_queue_max_attempts: int = Field(
+        default=5, ge=1, description="Attempts before a job is dead-lettered"
+    )
+    job_queue_retry_base_seconds: float = Field(
+        default=5.0, ge=0, description="Retry backoff base (doubles per attempt)"
+    )
+    job_queue_coalesce_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Debounce window for coalesced jobs (e.g. achievement checks per user)",
+    )
+    job_queue_batch_size: int = Field(
+        default=10, ge=1, description="Jobs claimed (and run concurrently) per worker poll"
+    )
+    job_queue_poll_seconds: float = Field(
+        default=1.0, gt=0, description="Worker sleep when no job is due"
+    )
+    job_queue_stale_seconds: int = Field(
+        default=300,
+        ge=30,
+        description="Running jobs locked longer than this are returned to pending",
+    )
+    job_queue_metrics_seconds: int = Field(
+        default=60, ge=1, description="Interval between queue-depth metric logs"
+    )
+    review_fused_write_path: bool = Field(
+        default=False,
+        description=(
+            "Write V2 reviews (SM2, XP, daily goal) in the request's transaction via "
+            "ReviewPipeline; false keeps the background persist_deck_review_task path"
+        ),
+    )
+    deck_progress_counters: bool = Field(
+        default=True,
+        description=(
+            "Serve vocabulary deck progress (list and detail) from the user_deck_progress "
+            "counter table; false restores the per-request GROUP BY aggregates"
+        ),
+    )
+    daily_trends_series: bool = Field(
+        default=True,
+        description=(
+            "Serve learning trends from the user_daily_trends series; false restores the "
+            "per-request grouped range queries"
+        ),
+    )
+    due_histogram: bool = Field(
+        default=True,
+        description=(
+            "Serve the review forecast and the dashboard due count from the "
+            "user_due_histograms index; false recounts the statistics tables per request"
+        ),
+    )
+    due_histogram_horizon_days: int = Field(
+        default=180,
+        ge=90,
+        le=3650,
+        description=(
+            "Days counted one slot each in a due histogram; a row is re-anchored once a "
+            "forecast window runs past its horizon"
+        ),
+    )
+    http_conditional_get: bool = Field(
+        default=True,
+        description=(
+            "Answer If-None-Match on catalog endpoints with 304 from a content-version "
+            "ETag before the endpoint body runs; false always serves the full body"
+        ),
+    )
+    http_etag_rotation_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description=(
+            "Catalog ETags change at least this often so clients refetch payloads whose "
+            "presigned URLs would otherwise outlive their signatures"
+        ),
+    )
     # =========================================================================
     # E2E Test Seeding
     # =========================================================================
@@ -397,6 +586,13 @@ class Settings(BaseSettings):
         default=False,
         description="Auto-seed database on application startup (for local dev only)",
     )
+    seed_snapshot_enabled: bool = Field(
+        default=False,
+        description=(
+            "Restore seed_all from an in-database snapshot (seed_snapshot schema) when the "
+            "seed code, schema revision, PR namespace and date are unchanged"
+        ),
+    )
 
     # =========================================================================
     # Health Checks
@@ -599,6 +795,37 @@ class Settings(BaseSettings):
         default="https://openrouter.ai/api/v1",
         description="OpenRouter API base URL",
     )
+    openrouter_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            "Process-wide cap on in-flight OpenRouter requests. Shared by every "
+            "OpenRouterService instance so concurrent judges / pipelines cannot "
+            "exceed the account's rate limit or the HTTP connection pool."
+        ),
+    )
+    openrouter_cache_mode: Literal["off", "read_write", "record", "replay"] = Field(
+        default="off",
+        description=(
+            "Persistent response cache for OpenRouterService.complete. 'off' disables it; "
+            "'read_write' serves hits and stores misses; 'record' always calls the API and "
+            "stores the result; 'replay' serves hits only and raises on a miss (offline "
+            "benchmarking). Wired at the lexgen _get_openrouter() seams."
+        ),
+    )
+    openrouter_cache_backend: Literal["postgres", "disk"] = Field(
+        default="postgres",
+        description="Where cached responses live: the openrouter_response_cache table or files",
+    )
+    openrouter_cache_dir: str = Field(
+        default=".cache/openrouter",
+        description="Directory for the disk cache backend (one JSON file per request hash)",
+    )
+    openrouter_cache_ttl_seconds: int = Field(
+        default=30 * 24 * 3600,
+        ge=0,
+        description="Cache entry lifetime in seconds; 0 keeps entries forever",
+    )
 
     # =========================================================================
     # LEXGEN Ensemble Judge (Stage 5 — LEXGEN-11)
@@ -654,6 +881,75 @@ class Settings(BaseSettings):
             )
         return stripped
 
+    # =========================================================================
+    # LEXGEN Bulk Runner
+    # =========================================================================
+    lexgen_bulk_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description=(
+            "Upper bound on pipelines in flight during a bulk lexgen run. The runner "
+            "halves its live limit on OpenRouter rate limits and grows it back one "
+            "slot at a time on success; it never exceeds this value."
+        ),
+    )
+    lexgen_bulk_batch_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description=(
+            "Lemmas per bulk-run batch. Each batch prefetches its evidence with one "
+            "IN query per reference source before its pipelines start."
+        ),
+    )
+    lexgen_bulk_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts per lemma in a bulk run before a rate-limited lemma is failed.",
+    )
+
+    # =========================================================================
+    # Deck Import
+    # =========================================================================
+    deck_import_chunk_size: int = Field(
+        default=100,
+        ge=1,
+        le=500,
+        description=(
+            "Word entries per set-wise write in a deck manifest import. A chunk's card "
+            "upsert carries every card of every entry in it, so this bounds the bind "
+            "parameters per statement."
+        ),
+    )
+    reference_snapshots_enabled: bool = Field(
+        default=False,
+        description=(
+            "Serve FrequencyService, CefrVocabularyService.allowed_lemmas, "
+            "TranslationLookupService and ReverseLookupService from process-wide "
+            "in-memory snapshots of the reference tables instead of querying them per "
+            "call. Snapshots are loaded lazily (and warmed at startup) and reloaded "
+            "when a loader bumps reference.dataset_stamp."
+        ),
+    )
+    lexicon_index_path: Optional[str] = Field(
+        default=None,
+        description=(
+            "Path to the memory-mapped greek_lexicon index written by "
+            "src.scripts.build_lexicon_index. When set, LexiconService reads it instead "
+            "of Postgres; a missing file or one built before the last lexicon load "
+            "falls back to the database."
+        ),
+    )
+    reference_snapshot_check_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description=(
+            "Minimum interval between reference.dataset_stamp checks per snapshot; "
+            "0 checks the stamp on every lookup."
+        ),
+    )
+
     # =========================================================================
     # Picture Generation (SIT-08, SCENE-01)
     # =========================================================================
@@ -723,6 +1019,31 @@ class Settings(BaseSettings):
         description="Background task timeout in seconds",
     )
 
+    # =========================================================================
+    # Activity Table Partitions (see src/db/partitioning.py)
+    # =========================================================================
+    partition_months_ahead: int = Field(
+        default=3,
+        ge=1,
+        description="Monthly partitions created ahead of the current month by the scheduler",
+    )
+    notification_retention_months: int = Field(
+        default=3,
+        ge=0,
+        description="Whole months of notification partitions kept before the current one "
+        "(0 = keep forever)",
+    )
+    activity_retention_months: int = Field(
+        default=0,
+        ge=0,
+        description="Whole months of review/answer history partitions kept before the "
+        "current one (0 = keep forever)",
+    )
+    partition_rollup_on_drop: bool = Field(
+        default=True,
+        description="Roll dropped review/answer partitions into activity_month_rollups",
+    )
+
     # =========================================================================
     # Helper Properties
     # =========================================================================
@@ -8,6 +8,7 @@ It supports:
 - Cache-aside pattern (get_or_set)
 - Domain-specific invalidation methods for decks, cards, and user progress
 - A @cached decorator for easy method caching
+- ExpiringLRU, a bounded in-process cache for per-request hot paths
 
 The cache service operates independently from session storage and uses
 a separate key prefix to avoid collisions.
@@ -20,7 +21,9 @@ import asyncio
 import functools
 import json
 import secrets
-from typing import Any, Awaitable, Callable, Optional, TypeVar, Union, cast
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar, Union, cast
 from uuid import UUID
 
 from redis.asyncio import Redis
@@ -537,6 +540,9 @@ class CacheService:
         each delete is individually guarded and logged rather than allowed
         to propagate.
         """
+        from src.core.principal import forget_principal
+
+        forget_principal(supabase_id)
         try:
             await self.delete(f"user:identity:{supabase_id}")
         except Exception as e:
@@ -647,3 +653,50 @@ def cached(
         return cast(Callable[..., Any], wrapper)
 
     return decorator
+
+
+# =============================================================================
+# In-Process Expiring LRU
+# =============================================================================
+
+
+class ExpiringLRU(Generic[T]):
+    """Bounded in-process LRU whose entries expire at a per-entry deadline.
+
+    For hot-path state that must not cost a Redis round-trip (verified JWTs,
+    principal snapshots). Per-process: entries are never shared or invalidated
+    across workers, so keep deadlines short or tied to an external expiry.
+    ``max_size=0`` disables the cache (``set`` is a no-op).
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[T, float]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[T]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: T, expires_at: float) -> None:
+        if self.max_size <= 0 or expires_at <= time.time():
+            return
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
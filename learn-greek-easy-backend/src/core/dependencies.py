@@ -2,6 +2,7 @@
 
 This module provides dependency injection functions for authentication:
 - get_current_user: Main auth dependency that validates Supabase token and loads/creates user
+- get_current_principal: Read-only auth that reuses a short-lived principal snapshot
 - get_current_superuser: Admin-only dependency requiring is_superuser=True
 - get_current_user_optional: Optional auth for mixed authenticated/anonymous endpoints
 - get_or_create_user: Auto-provision users from Supabase JWT claims
@@ -43,11 +44,12 @@ from src.core.exceptions import (
 )
 from src.core.logging import bind_log_context, get_logger
 from src.core.posthog import capture_event
+from src.core.principal import Principal, get_principal_snapshot, remember_principal
 from src.core.sentry import set_user_context
 from src.core.supabase_auth import SupabaseUserClaims, verify_supabase_token
 from src.db.dependencies import get_db
 from src.db.models import SubscriptionStatus, User, UserSettings
-from src.db.session import get_session_factory
+from src.db.session import get_session_factory, mark_recent_write
 
 # HTTPBearer security scheme with auto_error=False
 # This allows us to handle missing auth gracefully for optional auth endpoints
@@ -55,6 +57,8 @@ security_scheme = HTTPBearer(auto_error=False)
 
 logger = get_logger(__name__)
 
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 @dataclass
 class SSEAuthResult:
@@ -135,6 +139,37 @@ async def _reconcile_email(
     return user
 
 
+async def _verify_credentials(
+    request: Request, credentials: Optional[HTTPAuthorizationCredentials]
+) -> SupabaseUserClaims:
+    """Verify the Bearer token and store its claims on request.state (401 on failure)."""
+    if not credentials:
+        raise UnauthorizedException(
+            detail="Authentication required. Please provide a valid access token."
+        )
+
+    try:
+        claims = await verify_supabase_token(credentials.credentials)
+    except TokenExpiredException:
+        raise UnauthorizedException(detail="Access token has expired. Please refresh your token.")
+    except TokenInvalidException as e:
+        raise UnauthorizedException(detail=f"Invalid access token: {e.detail}")
+
+    request.state.supabase_claims = claims
+    return claims
+
+
+def _bind_principal_context(request: Request, principal: Principal) -> None:
+    """Sentry user context, log context and request.state.user_email for ``principal``."""
+    set_user_context(
+        user_id=str(principal.id),
+        email=principal.email,
+        username=principal.full_name,
+    )
+    bind_log_context(user_id=str(principal.id))
+    request.state.user_email = principal.email
+
+
 async def get_or_create_user(db: AsyncSession, claims: SupabaseUserClaims) -> User:  # noqa: C901
     """Get or create a user based on Supabase JWT claims.
 
@@ -310,24 +345,8 @@ async def get_current_user(
     if cached is not None:
         return cached
 
-    # 1. Extract Bearer token
-    if not credentials:
-        raise UnauthorizedException(
-            detail="Authentication required. Please provide a valid access token."
-        )
-
-    token = credentials.credentials
-
-    # 2. Verify Supabase token and extract claims
-    try:
-        claims = await verify_supabase_token(token)
-    except TokenExpiredException:
-        raise UnauthorizedException(detail="Access token has expired. Please refresh your token.")
-    except TokenInvalidException as e:
-        raise UnauthorizedException(detail=f"Invalid access token: {e.detail}")
-
-    # 2a. Store claims on request.state for use in endpoints
-    request.state.supabase_claims = claims
+    # 1-2. Extract Bearer token, verify it and store claims on request.state
+    claims = await _verify_credentials(request, credentials)
 
     # 3. Get or create user (auto-provisioning)
     user = await get_or_create_user(db, claims)
@@ -336,26 +355,58 @@ async def get_current_user(
     if not user.is_active:
         raise UnauthorizedException(detail="User account has been deactivated.")
 
-    # 5. Set Sentry user context for error tracking
-    set_user_context(
-        user_id=str(user.id),
-        email=user.email,
-        username=user.full_name,
-    )
-
-    # 6. Bind user context for logging - all subsequent logs will include user_id
-    bind_log_context(user_id=str(user.id))
-
-    # 7. Store user email in request state for exception handlers
-    request.state.user_email = user.email
+    # 5-7. Sentry user context, logging context and request.state.user_email
+    principal = Principal.from_user(user)
+    _bind_principal_context(request, principal)
 
     # 8. Memoize the fully-resolved user (with settings loaded via selectinload
-    #    in get_or_create_user) for the lifetime of this request.
+    #    in get_or_create_user) for the lifetime of this request, and snapshot
+    #    its principal for get_current_principal on later read-only requests.
     request.state.current_user = user
+    request.state.current_principal = principal
+    remember_principal(principal)
+
+    # 9. A mutating request opens the user's read-your-writes window so the
+    #    next few reads skip the (possibly lagging) read replica.
+    if settings.database_read_replica_url and request.method not in _READ_ONLY_METHODS:
+        await mark_recent_write(user.id)
 
     return user
 
 
+async def get_current_principal(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """Get the current user's principal, skipping the user row when possible.
+
+    For read-only endpoints that only need the user's identity (id, flags).
+    A principal snapshotted by a full get_current_user resolution within the
+    last settings.auth_principal_snapshot_ttl seconds is reused without the
+    identity-cache lookup or ``db.get(User)``; otherwise this falls back to
+    get_current_user (which auto-provisions and refreshes the snapshot).
+    The ``db`` session is only used on that fallback, so a snapshot hit never
+    checks out a connection.
+
+    Raises:
+        UnauthorizedException (401): Same conditions as get_current_user
+    """
+    cached: Principal | None = getattr(request.state, "current_principal", None)
+    if cached is not None:
+        return cached
+
+    claims = await _verify_credentials(request, credentials)
+    principal = get_principal_snapshot(claims.supabase_id)
+    if principal is None:
+        await get_current_user(request, credentials, db)
+        return request.state.current_principal
+
+    _bind_principal_context(request, principal)
+    request.state.current_principal = principal
+    return principal
+
+
 async def get_current_superuser(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -608,6 +659,7 @@ def get_locale_from_header(
 
 __all__ = [
     "SSEAuthResult",
+    "get_current_principal",
     "get_current_user",
     "get_current_superuser",
     "get_current_user_optional",
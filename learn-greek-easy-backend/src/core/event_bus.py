@@ -18,19 +18,33 @@ Pattern:
         user_id,
         NotificationEvent(event_type="unread_count", user_id=user_id, payload={"count": 5}),
     )
+
+Multiple workers:
+    Subscribers live in the worker that holds the SSE connection, while the
+    signal may come from any worker. With ``start_relay(redis)`` (the lifespan
+    calls it when ``WEB_CONCURRENCY`` > 1) every signal is also published on
+    the ``events:notifications`` Redis channel, and each worker delivers
+    events published by the others to its local subscribers.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 from dataclasses import dataclass
-from typing import Any
-from uuid import UUID
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
 
 from src.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.client import PubSub
+
 logger = get_logger(__name__)
 
+RELAY_CHANNEL = "events:notifications"
+
 
 # ============================================================
 # Event type
@@ -70,6 +84,19 @@ class NotificationEventBus:
     def __init__(self) -> None:
         self._subscribers: dict[UUID, set[asyncio.Queue[NotificationEvent]]] = {}
         self._lock: asyncio.Lock = asyncio.Lock()
+        self._relay_redis: Redis | None = None
+        self._relay_pubsub: PubSub | None = None
+        self._relay_task: asyncio.Task[None] | None = None
+        self._origin = uuid4().hex
+
+    def reset(self) -> None:
+        """Forget subscribers, lock and relay (a forked worker starts clean)."""
+        self._subscribers = {}
+        self._lock = asyncio.Lock()
+        self._relay_redis = None
+        self._relay_pubsub = None
+        self._relay_task = None
+        self._origin = uuid4().hex
 
     async def subscribe(self, user_id: UUID) -> asyncio.Queue[NotificationEvent]:
         """Register a new queue for user_id and return it.
@@ -110,11 +137,27 @@ class NotificationEventBus:
         Uses put_nowait() — if a queue is full (maxsize=100), the event is
         dropped with a warning log rather than blocking. Different users are
         fully isolated: a signal for user A never reaches user B's queues.
+        With the relay running the event is also published for other workers.
 
         Args:
             user_id: The target user ID.
             event: The event to deliver.
         """
+        await self._deliver(user_id, event)
+        if self._relay_redis is None:
+            return
+        message = {
+            "origin": self._origin,
+            "event_type": event.event_type,
+            "user_id": str(user_id),
+            "payload": event.payload,
+        }
+        try:
+            await self._relay_redis.publish(RELAY_CHANNEL, json.dumps(message, default=str))
+        except Exception as exc:
+            logger.warning("Event bus relay publish failed", extra={"error": str(exc)})
+
+    async def _deliver(self, user_id: UUID, event: NotificationEvent) -> None:
         async with self._lock:
             queues = self._subscribers.get(user_id)
             if not queues:
@@ -131,6 +174,59 @@ class NotificationEventBus:
                         },
                     )
 
+    async def start_relay(self, redis: Redis) -> None:
+        """Publish signals on Redis and deliver other workers' signals locally."""
+        if self._relay_task is not None:
+            return
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(RELAY_CHANNEL)
+        self._relay_redis = redis
+        self._relay_pubsub = pubsub
+        self._relay_task = asyncio.create_task(self._relay_loop(pubsub))
+        logger.info("Event bus relay started", extra={"channel": RELAY_CHANNEL})
+
+    async def stop_relay(self) -> None:
+        task, pubsub = self._relay_task, self._relay_pubsub
+        self._relay_redis = None
+        self._relay_pubsub = None
+        self._relay_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if pubsub is not None:
+            try:
+                await pubsub.unsubscribe(RELAY_CHANNEL)
+                await pubsub.aclose()
+            except Exception as exc:
+                logger.warning("Event bus relay close failed", extra={"error": str(exc)})
+
+    async def _relay_loop(self, pubsub: PubSub) -> None:
+        async for message in pubsub.listen():
+            try:
+                await self.handle_relay_message(message.get("data"))
+            except Exception as exc:
+                logger.warning("Event bus relay message dropped", extra={"error": str(exc)})
+
+    async def handle_relay_message(self, data: str | bytes | None) -> None:
+        """Deliver one relayed event unless this worker published it."""
+        if not data:
+            return
+        message = json.loads(data)
+        if message.get("origin") == self._origin:
+            return
+        user_id = UUID(message["user_id"])
+        await self._deliver(
+            user_id,
+            NotificationEvent(
+                event_type=message["event_type"],
+                user_id=user_id,
+                payload=message["payload"],
+            ),
+        )
+
 
 # ============================================================
 # Module-level singleton
@@ -570,6 +570,15 @@ class OpenRouterTimeoutError(OpenRouterError):
         super().__init__(detail)
 
 
+class OpenRouterCacheMissError(OpenRouterError):
+    """Replay-mode response cache has no entry for the request."""
+
+    def __init__(self, cache_key: str) -> None:
+        self.cache_key = cache_key
+        self.detail = f"No cached OpenRouter response for request {cache_key[:12]}"
+        super().__init__(self.detail)
+
+
 class OpenRouterNoImageError(OpenRouterError):
     """Raised when OpenRouter image generation returns no image part (likely content-policy refusal)."""
 
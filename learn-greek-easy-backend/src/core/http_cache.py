@@ -0,0 +1,151 @@
+"""Conditional GET for catalog endpoints.
+
+A route opts in with ``dependencies=[Depends(conditional_get(loader, ...))]``.
+The dependency asks ``loader`` for a cheap content version (row counts and the
+latest ``updated_at`` of the tables behind the payload) and derives a strong
+ETag from it and from everything else the payload depends on: path, query
+string, Accept-Language, the rotation epoch and, for personalised payloads,
+the user. When ``If-None-Match`` matches it raises ``NotModified`` before the
+endpoint body runs, so the response is neither rebuilt nor serialized; the
+handler in ``src.main`` turns it into an empty 304. Otherwise ETag,
+Cache-Control and Vary are set on the route's response.
+
+An endpoint that serves its body from a shared cache (Redis) must key that
+entry by ``content_etag(request)``. The body is then always built after the
+version behind its ETag was read; a cache entry filled before a write can no
+longer be served under the new ETag and then revalidated as current.
+
+The rotation epoch (``settings.http_etag_rotation_seconds``) makes every ETag
+change periodically, so a client never keeps revalidating a payload whose
+presigned S3 URLs have expired.
+
+Usage:
+    _CONDITIONAL = conditional_get(_catalog_version, cache_control="private, max-age=60")
+
+    @router.get("", dependencies=[Depends(_CONDITIONAL)])
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+from uuid import UUID
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.dependencies import get_current_user
+from src.db.dependencies import get_db
+from src.db.models import User
+
+VersionLoader = Callable[[Request, AsyncSession, User], Awaitable[Sequence[Any] | None]]
+
+
+class NotModified(Exception):
+    """Raised by a conditional GET dependency when the client's copy is current."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("Not Modified")
+        self.headers = headers
+
+
+def version_columns(model: type, *where: Any) -> tuple[Any, Any]:
+    """Row count and latest timestamp of ``model`` rows matching ``where``.
+
+    The timestamp is ``updated_at``, or ``created_at`` for tables without it.
+    Both are scalar subqueries, to be combined into one SELECT.
+    """
+    stamp = model.updated_at if hasattr(model, "updated_at") else model.created_at  # type: ignore[attr-defined]
+    return (
+        select(func.count()).select_from(model).where(*where).scalar_subquery(),
+        select(func.max(stamp)).where(*where).scalar_subquery(),
+    )
+
+
+def version_statement(models: Sequence[type]) -> Any:
+    """One SELECT of ``version_columns`` for every model, in order."""
+    columns: list[Any] = []
+    for model in models:
+        columns.extend(version_columns(model))
+    return select(*columns)
+
+
+def path_uuid(request: Request, name: str) -> UUID | None:
+    """Path parameter ``name`` as a UUID, or None when it does not parse."""
+    try:
+        return UUID(str(request.path_params[name]))
+    except (KeyError, ValueError):
+        return None
+
+
+def compute_etag(request: Request, version: Sequence[Any], user_id: UUID | None = None) -> str:
+    """Strong ETag for ``request`` given its content ``version``."""
+    epoch = int(time.time()) // settings.http_etag_rotation_seconds
+    payload = json.dumps(
+        [
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            request.headers.get("accept-language", ""),
+            str(user_id) if user_id else None,
+            epoch,
+            list(version),
+        ],
+        default=str,
+        separators=(",", ":"),
+    )
+    return f'"{hashlib.sha1(payload.encode()).hexdigest()}"'
+
+
+def content_etag(request: Request) -> str | None:
+    """ETag the conditional GET dependency computed for ``request``, if any."""
+    etag = getattr(request.state, "content_etag", None)
+    return etag if isinstance(etag, str) else None
+
+
+def if_none_match(header: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag`` (weak comparison)."""
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_get(
+    loader: VersionLoader,
+    *,
+    cache_control: str,
+    per_user: bool = False,
+) -> Callable[..., Awaitable[None]]:
+    """Build a route dependency answering If-None-Match from ``loader``'s version.
+
+    Args:
+        loader: Returns the content version for the request, or None to skip
+            conditional handling (missing or inaccessible resource: the
+            endpoint body then raises its usual 403/404).
+        cache_control: Cache-Control value for the 200 and 304 responses.
+        per_user: Key the ETag by user, for payloads with per-user fields.
+            ``loader`` must then include the user's own state in the version.
+    """
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+    ) -> None:
+        if not settings.http_conditional_get:
+            return
+        version = await loader(request, db, current_user)
+        if version is None:
+            return
+        etag = compute_etag(request, version, current_user.id if per_user else None)
+        request.state.content_etag = etag
+        headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Language"}
+        if if_none_match(request.headers.get("if-none-match"), etag):
+            raise NotModified(headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -0,0 +1,362 @@
+"""Bounded, sampled, asynchronous sink for production JSON logs.
+
+``setup_logging`` installs a ``LogPipeline`` in place of loguru's synchronous
+``serialize=True`` stdout sink. On the logging thread (usually the event
+loop) a record only goes through ``admit`` (route and level sampling, then
+rate-limited dedup) and is put on a bounded queue. A daemon writer thread
+serializes queued records in loguru's ``serialize`` shape and writes them to
+the stream in batches. When the queue is full the record is dropped instead
+of blocking the caller.
+
+Every drop is counted in ``LogPipelineStats``. The writer emits the counters
+as one JSON line every ``log_pipeline_report_seconds`` while new drops
+happened, and ``get_log_pipeline_stats()`` returns them in-process.
+
+Sampling never applies at WARNING and above. The route decision is taken
+once per request by ``RequestLoggingMiddleware`` (``begin_request_sampling``)
+so a request's records are kept or dropped together. Dedup is per request
+too: it collapses a record repeated inside one request (or outside any
+request), never the same access log line across requests. Records are only
+identical when their call site, text and extras all match, so structured
+events with constant text (``ANALYTICS: ...``) are never collapsed while
+their extras differ.
+"""
+
+import atexit
+import itertools
+import json
+import queue
+import random
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Optional, TextIO
+
+from src.config import settings
+
+_WARNING_NO = 30
+_MAX_BATCH = 256
+_IDLE_WAIT_SECONDS = 0.5
+_MAX_DEDUP_KEYS = 4096
+_STOP = object()
+
+# (keep sub-WARNING records, dedup scope) of the current request; scope 0 is
+# everything outside a request (startup, background tasks, worker threads).
+_request_scope: ContextVar[tuple[bool, int]] = ContextVar("log_request_scope", default=(True, 0))
+_scope_ids = itertools.count(1)
+
+_pipeline: Optional["LogPipeline"] = None
+
+
+@dataclass
+class LogPipelineStats:
+    """Counters of one pipeline since it started (or since the last fork)."""
+
+    enqueued: int = 0
+    written: int = 0
+    dropped_queue_full: int = 0
+    dropped_sampled: int = 0
+    suppressed_duplicates: int = 0
+    write_errors: int = 0
+
+    @property
+    def dropped(self) -> int:
+        """Records that were logged but will never be written."""
+        return self.dropped_queue_full + self.dropped_sampled + self.suppressed_duplicates
+
+
+def serialize_message(message: Any) -> str:
+    """One JSON line for a loguru message, in loguru's ``serialize=True`` shape.
+
+    The sink is registered with ``format="{message}"``, so ``message`` holds the
+    message (plus any formatted exception); the header of loguru's default
+    format is rebuilt here, on the writer thread.
+    """
+    record = message.record
+    exception = record["exception"]
+    if exception is not None:
+        exception = {
+            "type": None if exception.type is None else exception.type.__name__,
+            "value": exception.value,
+            "traceback": bool(exception.traceback),
+        }
+    text = (
+        f"{record['time']:%Y-%m-%d %H:%M:%S.%f}"[:-3]
+        + f" | {record['level'].name: <8} | {record['name']}:{record['function']}:"
+        + f"{record['line']} - {message}"
+    )
+    serializable = {
+        "text": text,
+        "record": {
+            "elapsed": {
+                "repr": record["elapsed"],
+                "seconds": record["elapsed"].total_seconds(),
+            },
+            "exception": exception,
+            "extra": record["extra"],
+            "file": {"name": record["file"].name, "path": record["file"].path},
+            "function": record["function"],
+            "level": {
+                "icon": record["level"].icon,
+                "name": record["level"].name,
+                "no": record["level"].no,
+            },
+            "line": record["line"],
+            "message": record["message"],
+            "module": record["module"],
+            "name": record["name"],
+            "process": {"id": record["process"].id, "name": record["process"].name},
+            "thread": {"id": record["thread"].id, "name": record["thread"].name},
+            "time": {"repr": record["time"], "timestamp": record["time"].timestamp()},
+        },
+    }
+    return json.dumps(serializable, default=str, ensure_ascii=False) + "\n"
+
+
+def _extras_fingerprint(extra: dict[str, Any]) -> int:
+    """Hash of a record's extras (values may be unhashable, e.g. dicts)."""
+    if not extra:
+        return 0
+    return hash(json.dumps(extra, sort_keys=True, default=str))
+
+
+class LogPipeline:
+    """Loguru filter + sink pair backed by a bounded queue and a writer thread.
+
+    Register with ``logger.add(pipeline.enqueue, filter=pipeline.admit,
+    format="{message}")`` and call ``start()``.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        queue_size: int,
+        level_rates: dict[str, float] | None = None,
+        route_rates: dict[str, float] | None = None,
+        dedup_window_seconds: float = 0.0,
+        dedup_burst: int = 0,
+        report_seconds: float = 0.0,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._stream = stream
+        self._queue_size = queue_size
+        self._level_rates = {name.upper(): rate for name, rate in (level_rates or {}).items()}
+        # Longest prefix first, so the most specific route wins.
+        self._route_rates = sorted((route_rates or {}).items(), key=lambda kv: -len(kv[0]))
+        self._dedup_window = dedup_window_seconds
+        self._dedup_burst = dedup_burst
+        self._report_seconds = report_seconds
+        self._rng = rng
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: dict[tuple[Any, ...], list[float]] = {}
+        self._stats = LogPipelineStats()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+
+    # -- logging thread -----------------------------------------------------
+
+    def route_rate(self, path: str) -> float:
+        """Sampling rate configured for the longest matching route prefix."""
+        for prefix, rate in self._route_rates:
+            if path.startswith(prefix):
+                return rate
+        return 1.0
+
+    def begin_request(self, path: str) -> Token[tuple[bool, int]]:
+        """Open a request's log scope, sampling it at the route's rate."""
+        rate = self.route_rate(path)
+        sampled = rate >= 1.0 or self._rng() < rate
+        return _request_scope.set((sampled, next(_scope_ids)))
+
+    def admit(self, record: dict[str, Any]) -> bool:
+        """Loguru filter: sampling, then dedup. Counts what it rejects."""
+        if record["level"].no < _WARNING_NO:
+            rate = self._level_rates.get(record["level"].name, 1.0)
+            if not _request_scope.get()[0] or (rate < 1.0 and self._rng() >= rate):
+                with self._lock:
+                    self._stats.dropped_sampled += 1
+                return False
+        if self._dedup_burst > 0:
+            return self._within_burst(record)
+        return True
+
+    def _within_burst(self, record: dict[str, Any]) -> bool:
+        # Keyed by request scope: identical records of different requests (access
+        # logs of a polled endpoint) are never collapsed, a loop within one is.
+        key = (
+            _request_scope.get()[1],
+            record["name"],
+            record["line"],
+            record["message"],
+            _extras_fingerprint(record["extra"]),
+        )
+        now = self._clock()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self._dedup_window:
+                if window is None and len(self._windows) >= _MAX_DEDUP_KEYS:
+                    self._windows.clear()
+                suppressed = int(window[1]) - self._dedup_burst if window else 0
+                self._windows[key] = [now, 1]
+                if suppressed > 0:
+                    record["extra"]["suppressed_duplicates"] = suppressed
+                return True
+            window[1] += 1
+            if window[1] > self._dedup_burst:
+                self._stats.suppressed_duplicates += 1
+                return False
+            return True
+
+    def enqueue(self, message: Any) -> None:
+        """Loguru sink: hand the message to the writer, or drop it when full."""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            with self._lock:
+                self._stats.dropped_queue_full += 1
+            return
+        with self._lock:
+            self._stats.enqueued += 1
+
+    # -- writer thread ------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the writer thread (no-op if it is running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Write what is queued, then stop the writer thread."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def after_fork(self) -> None:
+        """Give a forked worker its own queue, counters and writer thread.
+
+        Threads do not survive ``fork``; the inherited queue may hold records
+        (and lock state) from the parent.
+        """
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._stats = LogPipelineStats()
+        self._queue = queue.Queue(maxsize=self._queue_size)
+        self._thread = None
+        self.start()
+
+    def stats(self) -> LogPipelineStats:
+        """Snapshot of the counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def _drain(self) -> None:
+        reported = 0
+        next_report = self._clock() + self._report_seconds
+        while True:
+            lines, stopping = self._next_batch()
+            if lines:
+                self._write(lines)
+            if self._report_seconds and (stopping or self._clock() >= next_report):
+                next_report = self._clock() + self._report_seconds
+                stats = self.stats()
+                if stats.dropped != reported:
+                    reported = stats.dropped
+                    self._write([json.dumps({"log_pipeline": asdict(stats)}) + "\n"], count=False)
+            if stopping:
+                return
+
+    def _next_batch(self) -> tuple[list[str], bool]:
+        try:
+            item = self._queue.get(timeout=_IDLE_WAIT_SECONDS)
+        except queue.Empty:
+            return [], False
+        lines: list[str] = []
+        while True:
+            if item is _STOP:
+                return lines, True
+            try:
+                lines.append(serialize_message(item))
+            except Exception:  # noqa: BLE001 - one bad record must not stop the writer
+                with self._lock:
+                    self._stats.write_errors += 1
+            if len(lines) >= _MAX_BATCH:
+                return lines, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return lines, False
+
+    def _write(self, lines: list[str], *, count: bool = True) -> None:
+        try:
+            self._stream.write("".join(lines))
+            self._stream.flush()
+        except (OSError, ValueError):
+            with self._lock:
+                self._stats.write_errors += len(lines)
+            return
+        if count:
+            with self._lock:
+                self._stats.written += len(lines)
+
+
+def install_log_pipeline(stream: TextIO) -> LogPipeline:
+    """Build the pipeline from settings, start it and make it current.
+
+    Replaces (and stops) a previously installed pipeline.
+    """
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.stop()
+    else:
+        atexit.register(shutdown_log_pipeline)
+    _pipeline = LogPipeline(
+        stream,
+        queue_size=settings.log_queue_size,
+        level_rates=settings.log_level_sample_rates,
+        route_rates=settings.log_route_sample_rates,
+        dedup_window_seconds=settings.log_dedup_window_seconds,
+        dedup_burst=settings.log_dedup_burst,
+        report_seconds=settings.log_pipeline_report_seconds,
+    )
+    _pipeline.start()
+    return _pipeline
+
+
+def shutdown_log_pipeline() -> None:
+    """Flush and stop the current pipeline, if any."""
+    if _pipeline is not None:
+        _pipeline.stop()
+
+
+def restart_log_pipeline_after_fork() -> None:
+    """Re-arm the current pipeline in a forked worker (no-op when none)."""
+    if _pipeline is not None:
+        _pipeline.after_fork()
+
+
+def get_log_pipeline_stats() -> LogPipelineStats | None:
+    """Counters of the current pipeline, or None when logging is synchronous."""
+    return _pipeline.stats() if _pipeline is not None else None
+
+
+def begin_request_sampling(path: str) -> Token[tuple[bool, int]] | None:
+    """Open a request's log scope: decide once whether its sub-WARNING records are kept."""
+    if _pipeline is None:
+        return None
+    return _pipeline.begin_request(path)
+
+
+def end_request_sampling(token: Token[tuple[bool, int]] | None) -> None:
+    """Close the scope opened by ``begin_request_sampling``."""
+    if token is not None:
+        _request_scope.reset(token)
@@ -5,6 +5,7 @@ This module provides:
 - Context propagation for request-scoped data (request_id, user_id)
 - Automatic routing of stdlib logging to loguru
 - JSON format for production, colorized format for development
+- A bounded, sampled, asynchronous writer for production logs (log_pipeline)
 - Integration with Sentry Logs for centralized observability
 
 Example:
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from loguru import Logger
 
 from src.config import settings
+from src.core.log_pipeline import install_log_pipeline
 
 # Request-scoped logging context using contextvars
 # This ensures context is properly propagated through async operations
@@ -132,7 +134,8 @@ def intercept_standard_logging(loggers: list[str] | None = None) -> None:
 def setup_logging() -> None:
     """Configure loguru based on environment.
 
-    Production: JSON format for structured log parsing (Railway, etc.)
+    Production: JSON format for structured log parsing (Railway, etc.),
+        written by the async log pipeline unless log_async_pipeline is off
     Development: Colorized human-readable format for console debugging
 
     Uses settings.log_level for filtering and settings.is_production
@@ -141,7 +144,17 @@ def setup_logging() -> None:
     # Remove default handler to avoid duplicate logs
     logger.remove()
 
-    if settings.is_production:
+    if settings.is_production and settings.log_async_pipeline:
+        # JSON format for production, serialized and written off the event loop
+        # by the log pipeline's writer thread (same shape as serialize=True)
+        pipeline = install_log_pipeline(sys.stdout)
+        logger.add(
+            pipeline.enqueue,
+            filter=pipeline.admit,
+            format="{message}",
+            level=settings.log_level.upper(),
+        )
+    elif settings.is_production:
         # JSON format for production (Railway log parsing)
         # serialize=True outputs each log as a JSON object with all metadata
         logger.add(
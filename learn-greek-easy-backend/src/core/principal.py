@@ -0,0 +1,73 @@
+"""Short-lived principal snapshots for read-only authenticated endpoints.
+
+A ``Principal`` is the identity subset of ``User`` that read-only routes need
+(id, active/superuser flags, email for logging context). After a full
+``get_current_user`` resolution the principal is remembered in-process for
+``settings.auth_principal_snapshot_ttl`` seconds, keyed by Supabase id, so
+``get_current_principal`` can serve the next requests from the same user
+without the identity-cache lookup and user row fetch.
+
+Snapshots are per process. ``CacheService.invalidate_user_identity`` drops
+the local entry; other workers converge when the short TTL lapses, which
+bounds how long a deactivated user can keep reading.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from src.config import settings
+from src.core.cache import ExpiringLRU
+from src.db.models import User
+
+_MAX_SNAPSHOTS = 10_000
+
+_snapshots: ExpiringLRU["Principal"] = ExpiringLRU(max_size=_MAX_SNAPSHOTS)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Identity of the authenticated user, detached from any DB session."""
+
+    id: UUID
+    supabase_id: Optional[str]
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            supabase_id=user.supabase_id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+        )
+
+
+def get_principal_snapshot(supabase_id: str) -> Optional[Principal]:
+    """Return the remembered principal for ``supabase_id`` if still fresh."""
+    return _snapshots.get(supabase_id)
+
+
+def remember_principal(principal: Principal) -> None:
+    """Snapshot an active principal for settings.auth_principal_snapshot_ttl seconds."""
+    ttl = settings.auth_principal_snapshot_ttl
+    if ttl <= 0 or not principal.supabase_id or not principal.is_active:
+        return
+    _snapshots.set(principal.supabase_id, principal, time.time() + ttl)
+
+
+def forget_principal(supabase_id: Optional[str]) -> None:
+    """Drop this process's snapshot (identity changed or user deleted)."""
+    if supabase_id:
+        _snapshots.pop(supabase_id)
+
+
+def clear_principal_snapshots() -> None:
+    """Drop every snapshot (tests, or after a bulk identity change)."""
+    _snapshots.clear()
@@ -0,0 +1,245 @@
+"""Vectorized SM-2 scheduling for bulk recomputation.
+
+:func:`calculate_sm2_batch` is :func:`src.core.sm2.calculate_sm2` over NumPy
+arrays: one call advances every card in the batch by one review.
+:func:`replay_reviews` replays whole review histories on top of it, in
+lockstep: step ``k`` applies the ``k``-th review of every card that has one,
+so the Python loop runs once per review *position* (the longest history), not
+once per review.
+
+Results are identical to the scalar functions, not just close: the EF update
+and ``interval * EF`` use the same float64 operations in the same order, and
+``np.rint`` rounds half to even exactly like Python's ``round``.
+
+Statuses are returned as int8 codes; :data:`STATUS_BY_CODE` maps them back to
+:class:`CardStatus`. Cards with no review keep their initial state and the
+``NEW`` code.
+
+Requires NumPy, a direct dependency in ``pyproject.toml``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.sm2 import (
+    DEFAULT_EASINESS_FACTOR,
+    LEARNING_REPETITIONS_THRESHOLD,
+    MASTERY_EF_THRESHOLD,
+    MASTERY_INTERVAL_THRESHOLD,
+    MIN_EASINESS_FACTOR,
+)
+from src.db.models import CardStatus
+
+# ============================================================================
+# Status codes
+# ============================================================================
+
+STATUS_NEW = 0
+STATUS_LEARNING = 1
+STATUS_REVIEW = 2
+STATUS_MASTERED = 3
+
+STATUS_BY_CODE: tuple[CardStatus, ...] = (
+    CardStatus.NEW,
+    CardStatus.LEARNING,
+    CardStatus.REVIEW,
+    CardStatus.MASTERED,
+)
+"""Index with a status code to get its CardStatus."""
+
+
+# ============================================================================
+# Data Structures
+# ============================================================================
+
+
+@dataclass
+class SM2BatchState:
+    """SM-2 state of a batch of cards, one array element per card.
+
+    Attributes:
+        easiness_factor: float64 EF per card.
+        interval: int64 interval in days per card.
+        repetitions: int64 consecutive successful reviews per card.
+        status: int8 status code per card (see :data:`STATUS_BY_CODE`).
+        last_review_day: int64 day ordinal (``date.toordinal()``) of the last
+            replayed review, or -1 when the card has none.
+    """
+
+    easiness_factor: np.ndarray
+    interval: np.ndarray
+    repetitions: np.ndarray
+    status: np.ndarray
+    last_review_day: np.ndarray
+
+    @classmethod
+    def new(cls, size: int) -> SM2BatchState:
+        """State of ``size`` never-reviewed cards (the get_or_create defaults)."""
+        return cls(
+            easiness_factor=np.full(size, DEFAULT_EASINESS_FACTOR, dtype=np.float64),
+            interval=np.zeros(size, dtype=np.int64),
+            repetitions=np.zeros(size, dtype=np.int64),
+            status=np.full(size, STATUS_NEW, dtype=np.int8),
+            last_review_day=np.full(size, -1, dtype=np.int64),
+        )
+
+    def statuses(self) -> list[CardStatus]:
+        """Status codes as CardStatus values."""
+        return [STATUS_BY_CODE[code] for code in self.status.tolist()]
+
+
+# ============================================================================
+# Core Algorithm Functions
+# ============================================================================
+
+
+def calculate_easiness_factor_batch(current_ef: np.ndarray, quality: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`src.core.sm2.calculate_easiness_factor`."""
+    new_ef = current_ef + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return np.maximum(MIN_EASINESS_FACTOR, new_ef)
+
+
+def calculate_interval_batch(
+    current_interval: np.ndarray,
+    current_repetitions: np.ndarray,
+    easiness_factor: np.ndarray,
+    quality: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`src.core.sm2.calculate_interval`."""
+    grown = np.rint(current_interval * easiness_factor).astype(np.int64)
+    passed = np.where(current_repetitions == 0, 1, np.where(current_repetitions == 1, 6, grown))
+    failed = quality < 3
+    new_interval = np.where(failed, 1, passed).astype(np.int64)
+    new_repetitions = np.where(failed, 0, current_repetitions + 1).astype(np.int64)
+    return new_interval, new_repetitions
+
+
+def determine_status_batch(
+    repetitions: np.ndarray,
+    easiness_factor: np.ndarray,
+    interval: np.ndarray,
+    quality: np.ndarray,
+) -> np.ndarray:
+    """Vectorized :func:`src.core.sm2.determine_status`, as status codes."""
+    mastered = (easiness_factor >= MASTERY_EF_THRESHOLD) & (interval >= MASTERY_INTERVAL_THRESHOLD)
+    learning = (quality < 3) | (repetitions < LEARNING_REPETITIONS_THRESHOLD)
+    return np.where(
+        learning, STATUS_LEARNING, np.where(mastered, STATUS_MASTERED, STATUS_REVIEW)
+    ).astype(np.int8)
+
+
+def calculate_sm2_batch(
+    current_ef: np.ndarray,
+    current_interval: np.ndarray,
+    current_repetitions: np.ndarray,
+    quality: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized :func:`src.core.sm2.calculate_sm2`.
+
+    Returns:
+        Tuple of (new_ef, new_interval, new_repetitions, status_codes).
+
+    Raises:
+        ValueError: If any quality is not in range 0-5 inclusive.
+    """
+    quality = np.asarray(quality, dtype=np.int64)
+    if quality.size and (quality.min() < 0 or quality.max() > 5):
+        bad = quality[(quality < 0) | (quality > 5)][0]
+        raise ValueError(f"Quality must be 0-5, got {bad}")
+
+    new_ef = calculate_easiness_factor_batch(np.asarray(current_ef, dtype=np.float64), quality)
+    new_interval, new_repetitions = calculate_interval_batch(
+        np.asarray(current_interval, dtype=np.int64),
+        np.asarray(current_repetitions, dtype=np.int64),
+        new_ef,
+        quality,
+    )
+    status = determine_status_batch(new_repetitions, new_ef, new_interval, quality)
+    return new_ef, new_interval, new_repetitions, status
+
+
+def replay_reviews(
+    card_index: np.ndarray,
+    quality: np.ndarray,
+    review_day: np.ndarray,
+    num_cards: int,
+    initial: SM2BatchState | None = None,
+) -> SM2BatchState:
+    """Replay review histories for ``num_cards`` cards.
+
+    Args:
+        card_index: int array, the card (0..num_cards-1) of each review.
+        quality: int array, quality of each review.
+        review_day: int array, ``date.toordinal()`` of each review.
+        num_cards: Number of cards in the batch.
+        initial: Starting state (default: :meth:`SM2BatchState.new`). Not
+            modified.
+
+    Reviews must be ordered by review time within each card; cards may be
+    interleaved. Returns the state after every review has been applied.
+    """
+    card_index = np.asarray(card_index, dtype=np.int64)
+    quality = np.asarray(quality, dtype=np.int64)
+    review_day = np.asarray(review_day, dtype=np.int64)
+    if initial is None:
+        state = SM2BatchState.new(num_cards)
+    else:
+        state = SM2BatchState(
+            easiness_factor=initial.easiness_factor.copy(),
+            interval=initial.interval.copy(),
+            repetitions=initial.repetitions.copy(),
+            status=initial.status.copy(),
+            last_review_day=initial.last_review_day.copy(),
+        )
+    if card_index.size == 0:
+        return state
+
+    # Position of each review within its card's history. A stable sort by card
+    # keeps the per-card time order; the position is the offset from the
+    # card's first review in that sorted order.
+    order = np.argsort(card_index, kind="stable")
+    sorted_cards = card_index[order]
+    starts = np.flatnonzero(np.r_[True, sorted_cards[1:] != sorted_cards[:-1]])
+    run_lengths = np.diff(np.r_[starts, sorted_cards.size])
+    position = np.empty_like(order)
+    position[order] = np.arange(sorted_cards.size) - np.repeat(starts, run_lengths)
+
+    by_position = np.argsort(position, kind="stable")
+    bounds = np.flatnonzero(np.r_[True, np.diff(position[by_position]) != 0, True])
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        step = by_position[lo:hi]
+        cards = card_index[step]
+        new_ef, new_interval, new_reps, status = calculate_sm2_batch(
+            state.easiness_factor[cards],
+            state.interval[cards],
+            state.repetitions[cards],
+            quality[step],
+        )
+        state.easiness_factor[cards] = new_ef
+        state.interval[cards] = new_interval
+        state.repetitions[cards] = new_reps
+        state.status[cards] = status
+        state.last_review_day[cards] = review_day[step]
+    return state
+
+
+# ============================================================================
+# Module Exports
+# ============================================================================
+
+__all__ = [
+    "SM2BatchState",
+    "STATUS_BY_CODE",
+    "STATUS_NEW",
+    "STATUS_LEARNING",
+    "STATUS_REVIEW",
+    "STATUS_MASTERED",
+    "calculate_easiness_factor_batch",
+    "calculate_interval_batch",
+    "determine_status_batch",
+    "calculate_sm2_batch",
+    "replay_reviews",
+]
@@ -4,6 +4,11 @@ This module provides functionality for validating Supabase access tokens using J
 (JSON Web Key Set). It includes caching for JWKS to reduce API calls and improve
 performance, with key rotation retry logic for resilience.
 
+Hot path: JWKS key objects are imported once per refresh and looked up by
+``kid``, and verified tokens are remembered in a bounded per-process LRU
+(keyed by the token's SHA-256, expiring at its ``exp``) so repeat requests
+with the same access token skip signature verification entirely.
+
 Usage:
     from src.core.supabase_auth import verify_supabase_token
 
@@ -11,6 +16,7 @@ Usage:
     # user_claims.supabase_id, user_claims.email, user_claims.full_name
 """
 
+import hashlib
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, cast
@@ -24,8 +30,10 @@ from authlib.jose.errors import (
     InvalidClaimError,
     MissingClaimError,
 )
+from authlib.jose.rfc7517 import Key
 
 from src.config import settings
+from src.core.cache import ExpiringLRU
 from src.core.exceptions import TokenExpiredException, TokenInvalidException, UnauthorizedException
 from src.core.logging import get_logger
 
@@ -40,6 +48,7 @@ class SupabaseUserClaims:
         supabase_id: Supabase user identifier (sub claim, UUID format)
         email: User's email address (if present in token)
         full_name: User's full name from user_metadata (if present)
+        expires_at: Token ``exp`` (epoch seconds); bounds the verified-token cache
 
     Note: Frozen dataclass ensures immutability after verification.
     """
@@ -48,6 +57,7 @@ class SupabaseUserClaims:
     email: Optional[str] = None
     full_name: Optional[str] = None
     auth_provider: Optional[str] = None  # from app_metadata.provider
+    expires_at: Optional[int] = None
 
 
 class JWKSCache:
@@ -58,6 +68,7 @@ class JWKSCache:
 
     Attributes:
         _keys: Cached JWKS keys
+        _keys_by_kid: Imported key objects by ``kid`` (parsed once per refresh)
         _fetched_at: Timestamp when keys were last fetched
         _ttl: Cache time-to-live in seconds
     """
@@ -69,6 +80,7 @@ class JWKSCache:
             ttl: Cache time-to-live in seconds (default: 1 hour)
         """
         self._keys: Optional[Dict[str, Any]] = None
+        self._keys_by_kid: Dict[Optional[str], Key] = {}
         self._fetched_at: float = 0
         self._ttl = ttl
 
@@ -87,23 +99,54 @@ class JWKSCache:
         return self._keys
 
     def set(self, keys: Dict[str, Any]) -> None:
-        """Update cache with new JWKS.
+        """Update cache with new JWKS, importing the key objects once.
 
         Args:
             keys: JWKS response from Supabase
         """
+        key_set = JsonWebKey.import_key_set(keys)
+        self._keys_by_kid = {key.kid: key for key in key_set.keys}
         self._keys = keys
         self._fetched_at = time.time()
 
+    def key_for(self, kid: Optional[str]) -> Optional[Key]:
+        """Return the imported key for ``kid`` (or the only key when ``kid`` is absent)."""
+        if kid is None and len(self._keys_by_kid) == 1:
+            return next(iter(self._keys_by_kid.values()))
+        return self._keys_by_kid.get(kid)
+
     def invalidate(self) -> None:
         """Invalidate the cache, forcing a refresh on next get."""
         self._keys = None
+        self._keys_by_kid = {}
         self._fetched_at = 0
 
 
 # Global JWKS cache instance
 _jwks_cache = JWKSCache(ttl=settings.supabase_jwks_cache_ttl)
 
+# Verified tokens by SHA-256 digest (the raw token is never kept)
+_verified_tokens: ExpiringLRU[SupabaseUserClaims] = ExpiringLRU(
+    max_size=settings.supabase_verified_token_cache_size
+)
+
+
+def _token_digest(token: str | bytes) -> str:
+    raw = token if isinstance(token, bytes) else token.encode()
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _load_key(header: Dict[str, Any], payload: Any) -> Key:
+    """authlib key loader: pick the pre-imported JWKS key by the token's ``kid``.
+
+    An unknown ``kid`` is treated like a bad signature so the caller's
+    key-rotation retry refreshes the JWKS once.
+    """
+    key = _jwks_cache.key_for(header.get("kid"))
+    if key is None:
+        raise BadSignatureError(result=None)
+    return key
+
 
 async def _fetch_jwks(jwks_url: str) -> Dict[str, Any]:
     """Fetch JWKS from Supabase.
@@ -160,12 +203,11 @@ async def _fetch_jwks(jwks_url: str) -> Dict[str, Any]:
         raise TokenInvalidException(detail="Unable to verify token: JWKS error")
 
 
-def _decode_token(token: str, jwks_data: Dict[str, Any], issuer: str) -> SupabaseUserClaims:
-    """Decode and validate a Supabase JWT (internal helper).
+def _decode_token(token: str, issuer: str) -> SupabaseUserClaims:
+    """Decode and validate a Supabase JWT against the cached JWKS (internal helper).
 
     Args:
         token: JWT access token
-        jwks_data: JWKS response containing public keys
         issuer: Expected issuer claim value
 
     Returns:
@@ -178,13 +220,10 @@ def _decode_token(token: str, jwks_data: Dict[str, Any], issuer: str) -> Supabas
         InvalidClaimError: If iss/aud don't match
         MissingClaimError: If required claim is missing
     """
-    # Import keys from JWKS
-    key_set = JsonWebKey.import_key_set(jwks_data)
-
-    # Decode and verify the token
+    # Decode and verify the token (key objects were imported on JWKS refresh)
     claims = jwt.decode(
         token,
-        key_set,
+        _load_key,
         claims_options={
             "iss": {"essential": True, "value": issuer},
             "aud": {"essential": True, "value": "authenticated"},
@@ -217,6 +256,7 @@ def _decode_token(token: str, jwks_data: Dict[str, Any], issuer: str) -> Supabas
         email=email,
         full_name=full_name,
         auth_provider=auth_provider,
+        expires_at=claims.get("exp"),
     )
 
 
@@ -238,8 +278,8 @@ async def _verify_with_retry(
         TokenInvalidException: If verification fails after retry
     """
     try:
-        jwks_data = await _fetch_jwks(jwks_url)
-        result = _decode_token(token, jwks_data, issuer)
+        await _fetch_jwks(jwks_url)
+        result = _decode_token(token, issuer)
 
         logger.info(
             "Supabase token verified successfully",
@@ -258,8 +298,8 @@ async def _verify_with_retry(
         _jwks_cache.invalidate()
 
         try:
-            jwks_data = await _fetch_jwks(jwks_url)
-            result = _decode_token(token, jwks_data, issuer)
+            await _fetch_jwks(jwks_url)
+            result = _decode_token(token, issuer)
 
             logger.info(
                 "Supabase token verified after JWKS refresh",
@@ -277,10 +317,11 @@ async def verify_supabase_token(token: str) -> SupabaseUserClaims:
 
     This function:
     1. Checks that Supabase is configured
-    2. Fetches/uses cached JWKS for signature verification
-    3. Validates the token signature, expiration, issuer, and audience
-    4. Extracts user claims from the token
-    5. On signature failure with cached keys, retries once with fresh JWKS (key rotation)
+    2. Returns the remembered claims for a token verified earlier (until its exp)
+    3. Fetches/uses cached JWKS for signature verification
+    4. Validates the token signature, expiration, issuer, and audience
+    5. Extracts user claims from the token
+    6. On signature failure with cached keys, retries once with fresh JWKS (key rotation)
 
     Args:
         token: Supabase JWT access token
@@ -304,6 +345,19 @@ async def verify_supabase_token(token: str) -> SupabaseUserClaims:
     if not settings.supabase_configured:
         raise UnauthorizedException(detail="Supabase authentication is not enabled")
 
+    digest = _token_digest(token)
+    remembered = _verified_tokens.get(digest)
+    if remembered is not None:
+        return remembered
+
+    result = await _verify_uncached(token)
+    if result.expires_at is not None:
+        _verified_tokens.set(digest, result, float(result.expires_at))
+    return result
+
+
+async def _verify_uncached(token: str) -> SupabaseUserClaims:
+    """Verify ``token`` against the JWKS, mapping every failure to a 401 exception."""
     jwks_url = settings.supabase_jwks_url
     issuer = settings.supabase_issuer
 
@@ -352,7 +406,9 @@ def invalidate_jwks_cache() -> None:
     """Invalidate the JWKS cache.
 
     This can be used when you suspect the cached keys are stale,
-    for example after a key rotation at Supabase.
+    for example after a key rotation at Supabase. Tokens verified against
+    the old keys are forgotten too.
     """
     _jwks_cache.invalidate()
+    _verified_tokens.clear()
     logger.info("JWKS cache invalidated")
@@ -0,0 +1,111 @@
+"""Pre-fork multi-worker support.
+
+With ``WEB_CONCURRENCY`` > 1 the API runs under gunicorn with uvicorn workers
+and ``preload_app`` (see ``gunicorn.conf.py``):
+
+    master:  import src.main -> warm_shared_models() -> gc.freeze() -> fork N
+    worker:  reset_worker_state() -> lifespan (DB pool, Redis, httpx clients)
+
+The spaCy ``el_core_news_md`` pipeline and the Hunspell ``el_GR`` dictionary
+are loaded once in the master, so every worker shares those pages
+copy-on-write; ``gc.freeze()`` moves them out of the collector's reach so
+later collections do not touch (and copy) them. Everything that owns a
+socket or an event-loop object is created in the lifespan, i.e. after fork.
+
+With a single worker nothing here changes behaviour: the lifespan warms the
+models itself, as before.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def warm_shared_models() -> dict[str, Any]:
+    """Load the NLP singletons (spaCy + Hunspell) and report timings.
+
+    Idempotent: once loaded (in the gunicorn master, or by an earlier call)
+    the getters return the cached instances and the timings are ~0.
+    """
+    report: dict[str, Any] = {
+        "morphology_ms": 0.0,
+        "spellcheck_ms": 0.0,
+        "morphology_ok": False,
+        "spellcheck_ok": False,
+    }
+    try:
+        from src.services.morphology_service import get_morphology_service
+
+        t0 = time.perf_counter()
+        get_morphology_service()
+        report["morphology_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        report["morphology_ok"] = True
+    except Exception as exc:
+        logger.warning("Morphology service warmup failed: {error}", error=str(exc))
+
+    try:
+        from src.services.spellcheck_service import get_spellcheck_service
+
+        t0 = time.perf_counter()
+        get_spellcheck_service()
+        report["spellcheck_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        report["spellcheck_ok"] = True
+    except Exception as exc:
+        logger.warning("Spellcheck service warmup failed: {error}", error=str(exc))
+
+    return report
+
+
+def reset_worker_state() -> None:
+    """Drop in-process state a forked worker must not inherit from the master.
+
+    Called from gunicorn's ``post_fork`` hook. The master never serves
+    requests, so these are normally empty; resetting keeps each worker's
+    caches, locks and singletons its own regardless of what ran pre-fork.
+    The log pipeline's writer thread did not survive the fork and is restarted.
+    """
+    from src.api.v1.admin import reset_regenerate_idempotency_cache
+    from src.core.event_bus import notification_event_bus
+    from src.core.log_pipeline import restart_log_pipeline_after_fork
+    from src.services.exercise_content_cache import reset_exercise_content_cache
+    from src.services.health_service import _reset_health_caches
+    from src.services.s3_service import reset_s3_service
+
+    restart_log_pipeline_after_fork()
+    reset_regenerate_idempotency_cache()
+    notification_event_bus.reset()
+    reset_exercise_content_cache()
+    _reset_health_caches()
+    reset_s3_service()
+
+
+def worker_memory() -> dict[str, Any]:
+    """Resident memory of this process in MB: total, shared with the master, private.
+
+    ``shared_mb`` is the resident memory backed by pages also mapped by other
+    processes (the preloaded models after fork); ``private_mb`` (USS) is what
+    this worker alone costs. Empty values where the platform cannot report.
+    """
+    import psutil
+
+    process = psutil.Process()
+    info = process.memory_info()
+    memory: dict[str, Any] = {
+        "pid": os.getpid(),
+        "rss_mb": round(info.rss / _BYTES_PER_MB, 1),
+        "shared_mb": round(getattr(info, "shared", 0) / _BYTES_PER_MB, 1),
+        "private_mb": None,
+    }
+    try:
+        memory["private_mb"] = round(process.memory_full_info().uss / _BYTES_PER_MB, 1)
+    except (psutil.AccessDenied, AttributeError):
+        pass
+    return memory
@@ -1,7 +1,7 @@
 """Database package exports."""
 
 from src.db.base import Base, SoftDeleteMixin, TimestampMixin
-from src.db.dependencies import get_db, get_db_transactional
+from src.db.dependencies import get_db, get_db_transactional, get_read_db
 from src.db.models import (
     CardStatus,
     Deck,
@@ -12,7 +12,13 @@ from src.db.models import (
     UserSettings,
     WordEntry,
 )
-from src.db.session import close_db, get_session, get_session_factory, init_db
+from src.db.session import (
+    close_db,
+    get_read_session_factory,
+    get_session,
+    get_session_factory,
+    init_db,
+)
 
 __all__ = [
     # Session management
@@ -20,6 +26,7 @@ __all__ = [
     "close_db",
     "get_session",
     "get_session_factory",
+    "get_read_session_factory",
     # Base classes
     "Base",
     "TimestampMixin",
@@ -27,6 +34,7 @@ __all__ = [
     # Dependencies
     "get_db",
     "get_db_transactional",
+    "get_read_db",
     # Enums
     "DeckLevel",
     "PartOfSpeech",
@@ -3,10 +3,11 @@
 import logging
 from typing import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_session_factory
+from src.db.session import get_read_session_factory, get_session_factory, has_recent_write
 
 # Note: Using stdlib logging here to avoid circular import.
 # src.core.logging triggers src.core.__init__.py which imports
@@ -97,3 +98,39 @@ async def get_db_transactional() -> AsyncGenerator[AsyncSession, None]:
 
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-only database session, served by the read replica when it is usable.
+
+    Falls back to the primary when no replica is configured, replica lag is
+    unknown or above settings.database_replica_max_lag_seconds, or the
+    authenticated user wrote within settings.database_read_your_writes_seconds.
+    The user is taken from ``request.state.current_principal`` (set by both
+    get_current_user and get_current_principal), so declare the auth
+    dependency before ``db`` in the route signature.
+
+    Never commits: the replica engine opens READ ONLY transactions, and any
+    write attempted through this session fails.
+
+    Usage in routes:
+        @router.get("/progress/dashboard")
+        async def dashboard(
+            current_user: Principal = Depends(get_current_principal),
+            db: AsyncSession = Depends(get_read_db),
+        ): ...
+
+    Yields:
+        AsyncSession: Read-only database session for the request
+    """
+    principal = getattr(request.state, "current_principal", None)
+    recent_write = principal is not None and await has_recent_write(principal.id)
+    factory = get_read_session_factory(recent_write=recent_write)
+
+    async with factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
@@ -48,7 +48,7 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base, TimestampMixin
@@ -424,6 +424,15 @@ class User(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    # Denormalized counters (maintained on write)
+    unread_notification_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Unread notifications; kept by NotificationRepository, repaired daily",
+    )
+
     # Supabase Auth
     supabase_id: Mapped[str | None] = mapped_column(
         String(255),
@@ -1020,6 +1029,13 @@ class WordProposal(Base, TimestampMixin):
         "overwritten) — see LEXGEN-09 D2.",
     )
 
+    # Per-stage wall time written by the pipeline / regenerate path — diagnostic only.
+    stage_timings: Mapped[dict | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Per-stage pipeline wall time in ms, e.g. {'judge_ms': 2140}",
+    )
+
     # INERT in v1 — Decision Record §3: no numeric trust score pre-calibration,
     # log only. Stays NULL; no code in v1 writes or reads this column.
     trust_score: Mapped[float | None] = mapped_column(
@@ -1426,7 +1442,10 @@ class CardRecordStatistics(Base, TimestampMixin):
 
 
 class CardRecordReview(Base, TimestampMixin):
-    """Individual review session record for V2 card system analytics."""
+    """Individual review session record for V2 card system analytics.
+
+    Range-partitioned by month on ``reviewed_at`` (see ``src.db.partitioning``).
+    """
 
     __tablename__ = "card_record_reviews"
     __table_args__ = (
@@ -1491,6 +1510,149 @@ class CardRecordReview(Base, TimestampMixin):
         )
 
 
+class UserDeckProgress(Base):
+    """Per-user, per-deck progress counters for the V2 card system.
+
+    Maintained on write by ``src.repositories.user_deck_progress``: the fused
+    review path applies a status delta, other writers recompute the affected
+    rows. Status counts and ``easiness_factor_sum`` cover the user's statistics
+    rows on ACTIVE card records; review totals cover every review of the deck's
+    cards. Rebuild with ``python -m src.scripts.rebuild_deck_progress``.
+    """
+
+    __tablename__ = "user_deck_progress"
+    __table_args__ = (
+        Index("ix_user_deck_progress_user_last_studied", "user_id", "last_studied_at"),
+        Index("ix_user_deck_progress_deck", "deck_id"),
+    )
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    deck_id: Mapped[UUID] = mapped_column(
+        ForeignKey("decks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    cards_new: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    cards_learning: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    cards_review: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    cards_mastered: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    easiness_factor_sum: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        server_default=text("0"),
+        comment="Sum of easiness_factor over the counted statistics rows",
+    )
+    total_reviews: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    quality_sum: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    total_study_time_seconds: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    first_studied_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_studied_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    @property
+    def cards_tracked(self) -> int:
+        """Statistics rows counted (every status, including new)."""
+        return self.cards_new + self.cards_learning + self.cards_review + self.cards_mastered
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserDeckProgress(user_id={self.user_id}, deck_id={self.deck_id}, "
+            f"mastered={self.cards_mastered})>"
+        )
+
+
+class UserDailyTrends(Base):
+    """Per-user, per-day counters behind the learning trends endpoint.
+
+    One row per (user, day) with activity. Review and answer counters are
+    appended on write; the status buckets count the user's statistics rows
+    last updated that day, by current status (the same definition as the
+    ``count_cards_by_status_per_day`` repository methods), so a review also
+    moves a card out of the bucket of the day it was previously updated.
+    Maintained by ``src.repositories.user_daily_trends``; rebuild with
+    ``python -m src.scripts.rebuild_daily_trends``.
+    """
+
+    __tablename__ = "user_daily_trends"
+    __table_args__ = (Index("ix_user_daily_trends_user_updated", "user_id", "updated_at"),)
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    vocab_reviews: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    vocab_correct: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    vocab_quality_sum: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    vocab_study_time_seconds: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    vocab_learning: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    vocab_mastered: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    culture_answers: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    culture_correct: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    culture_learning: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    culture_mastered: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserDailyTrends(user_id={self.user_id}, day={self.day}, "
+            f"vocab_reviews={self.vocab_reviews}, culture_answers={self.culture_answers})>"
+        )
+
+
+class UserDueHistogram(Base):
+    """Per-user count of due vocabulary and culture cards by next review date.
+
+    ``counts`` is a dense array of day slots anchored at ``base_date``: slot 0
+    holds every card due before ``base_date``, slot ``k`` the cards due
+    ``k - 1`` days after it, and the last slot every card due at or after the
+    end of the horizon. Vocabulary cards count only while their card record is
+    active, culture cards always (the same rules as the ``count_by_status``
+    due counts). Writes that move a ``next_review_date`` shift one card
+    between slots; a missing, short or negative row is rebuilt on read and a
+    drifted one dropped by the daily repair. Maintained by
+    ``src.repositories.user_due_histogram``.
+    """
+
+    __tablename__ = "user_due_histograms"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    base_date: Mapped[date] = mapped_column(Date, nullable=False)
+    counts: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserDueHistogram(user_id={self.user_id}, base_date={self.base_date}, "
+            f"slots={len(self.counts)})>"
+        )
+
+
 # ============================================================================
 # Feedback Models
 # ============================================================================
@@ -1934,6 +2096,7 @@ class Notification(Base, TimestampMixin):
     """User notification record.
 
     Stores in-app notifications for achievements, daily goals, level ups, etc.
+    Range-partitioned by month on ``created_at`` (see ``src.db.partitioning``).
     """
 
     __tablename__ = "notifications"
@@ -2380,6 +2543,8 @@ class CultureAnswerHistory(Base, TimestampMixin):
     - Language diversity achievements (answer in all 3 languages)
     - Consecutive streak tracking per category
     - Analytics on language preferences
+
+    Range-partitioned by month on ``created_at`` (see ``src.db.partitioning``).
     """
 
     __tablename__ = "culture_answer_history"
@@ -3515,7 +3680,10 @@ class ExerciseRecord(Base, TimestampMixin):
 
 
 class ExerciseReview(Base):
-    """Immutable per-review audit log for exercise SM-2. No TimestampMixin."""
+    """Immutable per-review audit log for exercise SM-2. No TimestampMixin.
+
+    Range-partitioned by month on ``reviewed_at`` (see ``src.db.partitioning``).
+    """
 
     __tablename__ = "exercise_reviews"
     __table_args__ = (
@@ -4048,3 +4216,188 @@ class FrequencyRank(Base):
 
     def __repr__(self) -> str:
         return f"<FrequencyRank(id={self.id}, lemma={self.lemma!r}, rank={self.rank!r})>"
+
+
+class ReferenceDatasetStamp(Base):
+    """Load stamp for one reference dataset (frequency_rank, cefr_lemma, translations).
+
+    Bumped by the ``load_*`` scripts in the same transaction as their data, so a
+    stamp change means the dataset's rows changed. The process-wide snapshots in
+    ``src.services.reference_snapshot`` compare ``version`` to decide when to reload.
+    """
+
+    __tablename__ = "dataset_stamp"
+    __table_args__ = {"schema": "reference"}
+
+    dataset: Mapped[str] = mapped_column(
+        Text,
+        primary_key=True,
+        comment="Reference table name, e.g. 'frequency_rank'",
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Monotonic load counter, incremented by every loader run",
+    )
+    loaded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="Commit time of the most recent load",
+    )
+
+    def __repr__(self) -> str:
+        return f"<ReferenceDatasetStamp(dataset={self.dataset!r}, version={self.version!r})>"
+
+
+class OpenRouterResponseCache(Base):
+    """Persistent OpenRouter chat-completion response cache (opt-in).
+
+    One row per request hash — sha256 over model, messages, temperature,
+    max_tokens, response_format (the schema) and reasoning — written by
+    ``src.services.openrouter_cache.PostgresResponseStore``. ``expires_at`` is
+    NULL when the cache runs without a TTL; expired rows are ignored on read
+    and overwritten on the next write.
+    """
+
+    __tablename__ = "openrouter_response_cache"
+
+    cache_key: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="sha256 hex digest of the canonical request",
+    )
+    model: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Effective OpenRouter model slug (for inspection / purges)",
+    )
+    response: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Serialized OpenRouterResponse",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="Row creation timestamp",
+    )
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Entry expiry; NULL = never expires",
+    )
+
+    def __repr__(self) -> str:
+        return f"<OpenRouterResponseCache(cache_key={self.cache_key!r}, model={self.model!r})>"
+
+
+class ActivityMonthRollup(Base):
+    """Per-user monthly aggregate of an activity partition dropped by retention.
+
+    Written by ``src.db.partitioning.drop_partition_sql`` just before a monthly
+    partition of ``card_record_reviews``, ``exercise_reviews`` or
+    ``culture_answer_history`` is dropped, so lifetime totals survive archival.
+    """
+
+    __tablename__ = "activity_month_rollups"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    source: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        comment="Partitioned table the rows came from",
+    )
+    month: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        comment="First day of the rolled-up month (UTC)",
+    )
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    correct_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Reviews with quality >= 3, or correct culture answers",
+    )
+    time_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ActivityMonthRollup(user_id={self.user_id}, source={self.source!r}, "
+            f"month={self.month})>"
+        )
+
+
+class BackgroundJob(Base):
+    """Durable background job, consumed by the job worker (``src.worker_main``).
+
+    Written by ``src.tasks.queue.PostgresJobQueue``. Workers claim due
+    ``pending`` rows with ``FOR UPDATE SKIP LOCKED``; a finished job is
+    deleted, a failed one is retried with backoff until ``max_attempts`` and
+    then kept with status ``dead`` (the dead-letter set). At most one
+    ``pending`` row exists per ``coalesce_key``: enqueueing a duplicate while
+    one is waiting is a no-op.
+    """
+
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        Index(
+            "uq_background_jobs_pending_coalesce_key",
+            "coalesce_key",
+            unique=True,
+            postgresql_where=text("status = 'pending' AND coalesce_key IS NOT NULL"),
+        ),
+        Index("ix_background_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.uuid_generate_v4(),
+    )
+    task: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Registered task name (src.tasks.queue.JOB_TASKS)",
+    )
+    payload: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Task keyword arguments (type-tagged JSON)",
+    )
+    coalesce_key: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="Jobs sharing a key collapse into one pending row",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default=text("'pending'"),
+        comment="pending | running | dead",
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="Earliest time a worker may claim the job",
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When a worker claimed the job (status running)",
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(id={self.id}, task={self.task!r}, status={self.status!r})>"
@@ -0,0 +1,243 @@
+"""Monthly range partitions for the append-only activity tables.
+
+``card_record_reviews``, ``exercise_reviews``, ``culture_answer_history`` and
+``notifications`` are declaratively partitioned by month on their timestamp
+column (migration ``activity_partitioning``). Partitions live in the
+``partitions`` schema, which PostgREST does not expose and Alembic autogenerate
+does not compare; the parents keep their ``public`` names, so the ORM and every
+query are unchanged. Queries filtering on the timestamp (``reviewed_at >= ...``,
+``created_at < ...``) prune to the matching months.
+
+Each table also has a ``<table>_default`` partition as a safety net: a row for
+a month without a partition lands there instead of failing the INSERT, and
+:func:`create_partition_sql` moves such rows into the new month's partition
+before attaching it.
+
+Maintenance (``partition_maintenance_task``, daily):
+    - create partitions for the current month and ``partition_months_ahead``
+      months ahead;
+    - drop whole partitions older than the table's retention, optionally
+      rolling their rows into ``activity_month_rollups`` first.
+
+The ORM keeps ``id`` as the mapped primary key; in the database the primary
+key is ``(id, <timestamp column>)`` because a partitioned table's unique
+constraints must include the partition key. Test databases built with
+``Base.metadata.create_all`` get ordinary tables, and every helper here is a
+no-op for a table that is not partitioned.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PARTITION_SCHEMA = "partitions"
+ROLLUP_TABLE = "activity_month_rollups"
+
+_MONTH_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """One partitioned parent table.
+
+    ``rollup`` is the aggregate SELECT list (event_count, correct_count,
+    time_seconds) evaluated per user over a partition before it is dropped;
+    None means the table's rows are not worth keeping in aggregate.
+    """
+
+    name: str
+    column: str
+    rollup: str | None = None
+
+
+CARD_RECORD_REVIEWS = PartitionedTable(
+    "card_record_reviews",
+    "reviewed_at",
+    rollup="count(*), count(*) FILTER (WHERE quality >= 3), COALESCE(sum(time_taken), 0)",
+)
+EXERCISE_REVIEWS = PartitionedTable(
+    "exercise_reviews",
+    "reviewed_at",
+    rollup="count(*), count(*) FILTER (WHERE quality >= 3), 0",
+)
+CULTURE_ANSWER_HISTORY = PartitionedTable(
+    "culture_answer_history",
+    "created_at",
+    rollup="count(*), count(*) FILTER (WHERE is_correct), COALESCE(sum(time_taken_seconds), 0)",
+)
+NOTIFICATIONS = PartitionedTable("notifications", "created_at")
+
+PARTITIONED_TABLES: tuple[PartitionedTable, ...] = (
+    CARD_RECORD_REVIEWS,
+    EXERCISE_REVIEWS,
+    CULTURE_ANSWER_HISTORY,
+    NOTIFICATIONS,
+)
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: PartitionedTable, month: date) -> str:
+    """Schema-qualified partition for ``month`` (``partitions.notifications_p202610``)."""
+    return f"{PARTITION_SCHEMA}.{table.name}_p{month:%Y%m}"
+
+
+def default_partition_name(table: PartitionedTable) -> str:
+    return f"{PARTITION_SCHEMA}.{table.name}_default"
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def create_default_partition_sql(table: PartitionedTable) -> list[str]:
+    part = default_partition_name(table)
+    return [
+        f"CREATE TABLE {part} PARTITION OF public.{table.name} DEFAULT",
+        f"ALTER TABLE {part} ENABLE ROW LEVEL SECURITY",
+    ]
+
+
+def create_partition_sql(table: PartitionedTable, month: date) -> list[str]:
+    """Statements that create and attach the partition for ``month``.
+
+    The partition is built detached, takes over any of its rows that landed in
+    the default partition, then is attached (ATTACH validates the range and
+    builds the parent's indexes, primary key and foreign keys on it).
+    """
+    part = partition_name(table, month)
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+    return [
+        f"CREATE TABLE {part} (LIKE public.{table.name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"WITH moved AS (DELETE FROM {default_partition_name(table)} "
+        f"WHERE {table.column} >= {lower} AND {table.column} < {upper} RETURNING *) "
+        f"INSERT INTO {part} SELECT * FROM moved",
+        f"ALTER TABLE public.{table.name} ATTACH PARTITION {part} "
+        f"FOR VALUES FROM ({lower}) TO ({upper})",
+        f"ALTER TABLE {part} ENABLE ROW LEVEL SECURITY",
+    ]
+
+
+def drop_partition_sql(table: PartitionedTable, month: date, *, rollup: bool) -> list[str]:
+    """Statements that (optionally) roll up and then drop the partition for ``month``."""
+    part = partition_name(table, month)
+    statements = []
+    if rollup and table.rollup:
+        statements.append(
+            f"INSERT INTO public.{ROLLUP_TABLE} "
+            "(user_id, source, month, event_count, correct_count, time_seconds) "
+            f"SELECT user_id, '{table.name}', DATE '{month.isoformat()}', {table.rollup} "
+            f"FROM {part} GROUP BY user_id "
+            "ON CONFLICT (user_id, source, month) DO UPDATE SET "
+            f"event_count = {ROLLUP_TABLE}.event_count + EXCLUDED.event_count, "
+            f"correct_count = {ROLLUP_TABLE}.correct_count + EXCLUDED.correct_count, "
+            f"time_seconds = {ROLLUP_TABLE}.time_seconds + EXCLUDED.time_seconds"
+        )
+    statements.append(f"DROP TABLE {part}")
+    return statements
+
+
+async def monthly_partitions(db: AsyncSession, table: PartitionedTable) -> list[date] | None:
+    """Months with an attached partition, oldest first; None if not partitioned."""
+    partitioned = await db.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.oid = to_regclass(:parent)"
+        ),
+        {"parent": f"public.{table.name}"},
+    )
+    if partitioned.scalar() is None:
+        return None
+    rows = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": f"public.{table.name}"},
+    )
+    months = []
+    for (relname,) in rows.fetchall():
+        match = _MONTH_SUFFIX.search(relname)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+async def ensure_partitions(
+    db: AsyncSession, table: PartitionedTable, today: date, months_ahead: int
+) -> list[date]:
+    """Create missing partitions from the current month through ``months_ahead``."""
+    existing = await monthly_partitions(db, table)
+    if existing is None:
+        return []
+    current = month_start(today)
+    wanted = [add_months(current, n) for n in range(months_ahead + 1)]
+    created = [month for month in wanted if month not in existing]
+    for month in created:
+        for statement in create_partition_sql(table, month):
+            await db.execute(text(statement))
+    return created
+
+
+async def drop_partitions_before(
+    db: AsyncSession, table: PartitionedTable, cutoff: date, *, rollup: bool
+) -> list[date]:
+    """Drop every partition whose whole month is before ``cutoff``'s month."""
+    existing = await monthly_partitions(db, table)
+    if existing is None:
+        return []
+    expired = [month for month in existing if month < month_start(cutoff)]
+    for month in expired:
+        for statement in drop_partition_sql(table, month, rollup=rollup):
+            await db.execute(text(statement))
+    return expired
+
+
+async def maintain_partitions(
+    db: AsyncSession,
+    today: date,
+    *,
+    months_ahead: int,
+    retention_months: dict[str, int],
+    rollup: bool,
+) -> dict[str, Any]:
+    """Create upcoming and drop expired partitions for every partitioned table.
+
+    ``retention_months`` maps table name to the number of whole months kept
+    before the current one; tables missing from it (or mapped to 0) are kept
+    forever. Does not commit.
+    """
+    summary: dict[str, Any] = {}
+    for table in PARTITIONED_TABLES:
+        created = await ensure_partitions(db, table, today, months_ahead)
+        dropped: list[date] = []
+        keep = retention_months.get(table.name, 0)
+        if keep > 0:
+            cutoff = add_months(month_start(today), -keep)
+            dropped = await drop_partitions_before(db, table, cutoff, rollup=rollup)
+        if created or dropped:
+            logger.info(
+                "Partitions maintained",
+                table=table.name,
+                created=[m.isoformat() for m in created],
+                dropped=[m.isoformat() for m in dropped],
+            )
+        summary[table.name] = {"created": len(created), "dropped": len(dropped)}
+    return summary
@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+import time
 from typing import AsyncGenerator
+from uuid import UUID
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -26,10 +28,27 @@ logger = logging.getLogger(__name__)
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 _keepalive_task: asyncio.Task | None = None
+
+# Read replica (optional, settings.database_read_replica_url)
+_read_engine: AsyncEngine | None = None
+_read_session_factory: async_sessionmaker[AsyncSession] | None = None
+_replica_lag_task: asyncio.Task | None = None
+_replica_lag_seconds: float | None = None  # None = unknown / unreachable -> primary
+# user_id -> monotonic deadline of the read-your-writes window (this process)
+_recent_writes: dict[UUID, float] = {}
+
+# 0 on a server that is not in recovery (a plain second instance, handy locally),
+# 0 when everything received is replayed, otherwise the age of the last replayed
+# transaction.
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
 _KEEPALIVE_INTERVAL_SECONDS = 300  # refresh warmed connections well inside pool_recycle=3600; keeps them hot against network/Postgres-side drops (Supavisor session mode does not idle-reap: client_idle_timeout defaults to 0)
 
 
-def create_engine() -> AsyncEngine:
+def create_engine(database_url: str | None = None, *, read_only: bool = False) -> AsyncEngine:
     """
     Create async SQLAlchemy engine with connection pooling.
 
@@ -39,9 +58,18 @@ def create_engine() -> AsyncEngine:
     - NullPool for testing (no connection pooling)
     - Connection pool size configurable via settings
 
+    Args:
+        database_url: Connection URL; defaults to settings.database_url.
+        read_only: Open every transaction READ ONLY (replica engine), so a
+            write routed to it by mistake fails loudly instead of silently.
+
     Returns:
         AsyncEngine: Configured SQLAlchemy async engine
     """
+    url = database_url or settings.database_url
+    server_settings = {"jit": "off"}  # Disable JIT for better performance
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
     # Build engine kwargs based on environment
     engine_kwargs = {
         "echo": settings.debug,  # Log SQL queries in debug mode
@@ -49,7 +77,7 @@ def create_engine() -> AsyncEngine:
         "pool_pre_ping": True,  # Verify connections before using
         "pool_recycle": 3600,  # Recycle connections after 1 hour
         "connect_args": {
-            "server_settings": {"jit": "off"},  # Disable JIT for better performance
+            "server_settings": server_settings,
             "command_timeout": 60,  # Command timeout in seconds
             **({"ssl": "require"} if settings.is_production else {}),
         },
@@ -65,14 +93,13 @@ def create_engine() -> AsyncEngine:
         engine_kwargs["pool_timeout"] = settings.database_pool_timeout
 
     # Engine configuration
-    engine = create_async_engine(settings.database_url, **engine_kwargs)
+    engine = create_async_engine(url, **engine_kwargs)
 
     logger.info(
         "Database engine created",
         extra={
-            "url": (
-                settings.database_url.split("@")[1] if "@" in settings.database_url else "unknown"
-            ),  # Hide credentials
+            "url": url.split("@")[1] if "@" in url else "unknown",  # Hide credentials
+            "read_only": read_only,
             "pool_size": settings.database_pool_size,
             "max_overflow": settings.database_max_overflow,
         },
@@ -173,6 +200,9 @@ async def init_db(warm_min: int | None = None) -> None:
             logger.warning("Pool warm-up connection failed", extra={"error": str(e)})
         _keepalive_task = asyncio.create_task(_keepalive_loop(effective_warm_min))
 
+    if settings.database_read_replica_url:
+        await _init_read_replica()
+
 
 async def close_db() -> None:
     """
@@ -195,6 +225,8 @@ async def close_db() -> None:
             pass
         _keepalive_task = None
 
+    await _close_read_replica()
+
     await _engine.dispose()
     _engine = None
     _session_factory = None
@@ -202,6 +234,137 @@ async def close_db() -> None:
     logger.info("Database connection closed")
 
 
+async def _init_read_replica() -> None:
+    """Create the replica engine and start lag tracking; non-fatal on failure.
+
+    Until the first successful lag measurement (and whenever one fails) the
+    lag is unknown and get_read_session_factory() returns the primary.
+    """
+    global _read_engine, _read_session_factory, _replica_lag_task
+
+    _read_engine = create_engine(settings.database_read_replica_url, read_only=True)
+    _read_session_factory = create_session_factory(_read_engine)
+    await refresh_replica_lag()
+    _replica_lag_task = asyncio.create_task(_replica_lag_loop())
+
+
+async def _close_read_replica() -> None:
+    global _read_engine, _read_session_factory, _replica_lag_task, _replica_lag_seconds
+
+    if _replica_lag_task is not None:
+        _replica_lag_task.cancel()
+        try:
+            await _replica_lag_task
+        except asyncio.CancelledError:
+            pass
+        _replica_lag_task = None
+    if _read_engine is not None:
+        await _read_engine.dispose()
+    _read_engine = None
+    _read_session_factory = None
+    _replica_lag_seconds = None
+    _recent_writes.clear()
+
+
+async def refresh_replica_lag() -> float | None:
+    """Measure replica replay lag in seconds; None (route to primary) on failure."""
+    global _replica_lag_seconds
+
+    if _read_engine is None:
+        return None
+    previous = _replica_lag_seconds
+    try:
+        async with _read_engine.connect() as conn:
+            lag = (await conn.execute(_REPLICA_LAG_SQL)).scalar()
+        _replica_lag_seconds = float(lag or 0)
+    except Exception as e:
+        _replica_lag_seconds = None
+        if previous is not None:
+            logger.warning("Read replica unreachable, reads use primary", extra={"error": str(e)})
+        return None
+
+    usable = _replica_lag_seconds <= settings.database_replica_max_lag_seconds
+    was_usable = previous is not None and previous <= settings.database_replica_max_lag_seconds
+    if usable != was_usable:
+        logger.info(
+            "Read replica usable" if usable else "Read replica lagging, reads use primary",
+            extra={"lag_seconds": round(_replica_lag_seconds, 3)},
+        )
+    return _replica_lag_seconds
+
+
+async def _replica_lag_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.database_replica_lag_check_seconds)
+        await refresh_replica_lag()
+
+
+def replica_lag_seconds() -> float | None:
+    """Last measured replica lag (None when no replica or unknown)."""
+    return _replica_lag_seconds
+
+
+def replica_usable() -> bool:
+    return (
+        _read_session_factory is not None
+        and _replica_lag_seconds is not None
+        and _replica_lag_seconds <= settings.database_replica_max_lag_seconds
+    )
+
+
+def _recent_write_key(user_id: UUID) -> str:
+    return f"ryw:{user_id}"
+
+
+async def mark_recent_write(user_id: UUID) -> None:
+    """Open this user's read-your-writes window.
+
+    Stored in Redis (shared by every worker) when the cache is enabled, in
+    this process otherwise. Reads inside the window go to the primary.
+    """
+    window = settings.database_read_your_writes_seconds
+    if window <= 0:
+        return
+    from src.core.cache import get_cache  # local import: src.core imports src.db
+
+    cache = get_cache()
+    if cache.enabled and await cache.set(_recent_write_key(user_id), 1, ttl=window):
+        return
+    now = time.monotonic()
+    _recent_writes[user_id] = now + window
+    if len(_recent_writes) > 10_000:
+        for uid, deadline in list(_recent_writes.items()):
+            if deadline <= now:
+                del _recent_writes[uid]
+
+
+async def has_recent_write(user_id: UUID) -> bool:
+    deadline = _recent_writes.get(user_id)
+    if deadline is not None and deadline > time.monotonic():
+        return True
+    from src.core.cache import get_cache
+
+    cache = get_cache()
+    return cache.enabled and await cache.exists(_recent_write_key(user_id))
+
+
+def get_read_session_factory(*, recent_write: bool = False) -> async_sessionmaker[AsyncSession]:
+    """
+    Session factory for read-only work: the replica when it is usable.
+
+    Falls back to the primary when no replica is configured, its lag is
+    unknown or above settings.database_replica_max_lag_seconds, or the
+    caller is inside its read-your-writes window (``recent_write``).
+
+    Raises:
+        RuntimeError: If database not initialized
+    """
+    if not recent_write and replica_usable():
+        assert _read_session_factory is not None
+        return _read_session_factory
+    return get_session_factory()
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Get the global session factory.
@@ -1,7 +1,6 @@
 """FastAPI application entry point."""
 
 import os
-import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import AsyncGenerator, Sequence
@@ -9,22 +8,25 @@ from typing import AsyncGenerator, Sequence
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.api.health import router as health_router
 from src.api.v1 import v1_router
 from src.config import settings
+from src.core.event_bus import notification_event_bus
 from src.core.exceptions import BaseAPIException
+from src.core.http_cache import NotModified
 from src.core.logging import get_logger, setup_logging
 from src.core.posthog import init_posthog, shutdown_posthog
-from src.core.redis import close_redis, init_redis
+from src.core.redis import close_redis, get_redis, init_redis
 from src.core.sentry import (
     capture_exception_if_needed,
     init_sentry,
     is_sentry_enabled,
     shutdown_sentry,
 )
+from src.core.workers import warm_shared_models, worker_memory
 from src.db import close_db, init_db
 from src.middleware import (
     AuthLoggingMiddleware,
@@ -81,6 +83,31 @@ async def _close_elevenlabs_client() -> None:
         logger.warning("ElevenLabs client shutdown failed: {error}", error=str(exc))
 
 
+async def _start_event_bus_relay() -> None:
+    """Relay SSE notification events between workers through Redis."""
+    redis = get_redis()
+    if redis is None:
+        logger.warning("Event bus relay not started: Redis unavailable")
+        return
+    try:
+        await notification_event_bus.start_relay(redis)
+    except Exception as exc:
+        logger.warning("Event bus relay start failed: {error}", error=str(exc))
+
+
+async def _warm_reference_snapshots() -> None:
+    """Pre-load reference-data snapshots so the first lexgen/admin lookup is a memory read."""
+    if not settings.reference_snapshots_enabled:
+        return
+    try:
+        from src.db import get_session_factory
+        from src.services.reference_snapshot import warm_reference_snapshots
+
+        await warm_reference_snapshots(get_session_factory())
+    except Exception as exc:
+        logger.warning("Reference snapshot warmup failed: {error}", error=str(exc))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
@@ -109,42 +136,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize Sentry error tracking
     init_sentry()
 
-    # Warm up NLP services (spaCy + Hunspell) to eliminate cold-start penalty
-    morphology_ms = 0.0
-    spellcheck_ms = 0.0
-    morphology_ok = False
-    spellcheck_ok = False
-    try:
-        from src.services.morphology_service import get_morphology_service
-
-        t0 = time.perf_counter()
-        get_morphology_service()
-        morphology_ms = (time.perf_counter() - t0) * 1000
-        morphology_ok = True
-    except Exception as exc:
-        logger.warning("Morphology service warmup failed: {error}", error=str(exc))
-
-    try:
-        from src.services.spellcheck_service import get_spellcheck_service
-
-        t0 = time.perf_counter()
-        get_spellcheck_service()
-        spellcheck_ms = (time.perf_counter() - t0) * 1000
-        spellcheck_ok = True
-    except Exception as exc:
-        logger.warning("Spellcheck service warmup failed: {error}", error=str(exc))
-
-    all_ok = morphology_ok and spellcheck_ok
+    # Warm up NLP services (spaCy + Hunspell) to eliminate cold-start penalty.
+    # Under gunicorn (WEB_CONCURRENCY > 1) the master already loaded them
+    # before fork, so this is a no-op that returns ~0 ms timings.
+    nlp = warm_shared_models()
+    all_ok = nlp["morphology_ok"] and nlp["spellcheck_ok"]
     logger.info(
         "NLP services warmed up" if all_ok else "NLP services partially warmed up (some failures)",
-        morphology_ms=round(morphology_ms, 1),
-        spellcheck_ms=round(spellcheck_ms, 1),
-        morphology_ok=morphology_ok,
-        spellcheck_ok=spellcheck_ok,
+        **nlp,
     )
 
     await _start_openrouter_client()
     await _start_elevenlabs_client()
+    await _warm_reference_snapshots()
+
+    if settings.web_concurrency > 1:
+        await _start_event_bus_relay()
+    logger.info("Worker started", workers=settings.web_concurrency, **worker_memory())
 
     # Auto-seed on deploy (local dev only)
     if settings.seed_on_deploy and settings.can_seed_database():
@@ -179,6 +187,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await _close_openrouter_client()
     await _close_elevenlabs_client()
+    await notification_event_bus.stop_relay()
 
     # Close Redis connection
     await close_redis()
@@ -244,6 +253,15 @@ app.add_middleware(
 # ============================================================================
 
 
+@app.exception_handler(NotModified)
+async def not_modified_handler(
+    request: Request,
+    exc: NotModified,
+) -> Response:
+    """Answer a matched conditional GET with an empty 304."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
+
 @app.exception_handler(BaseAPIException)
 async def base_api_exception_handler(
     request: Request,
@@ -23,6 +23,7 @@ from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.log_pipeline import begin_request_sampling, end_request_sampling
 from src.core.logging import bind_log_context, clear_log_context
 from src.core.sentry import set_request_context
 
@@ -206,6 +207,8 @@ class RequestLoggingMiddleware:
         # Bind request context for all logs in this request
         # Using contextvars ensures proper propagation through async operations
         bind_log_context(request_id=request_id)
+        # Route sampling is decided once, so a request's logs are kept or dropped together
+        sampling = begin_request_sampling(request.url.path)
         try:
             # Log request start
             start_time = time.perf_counter()
@@ -253,6 +256,7 @@ class RequestLoggingMiddleware:
         finally:
             # Clear context at end of request to prevent leakage
             clear_log_context()
+            end_request_sampling(sampling)
 
     def _should_skip(self, path: str) -> bool:
         """Check if path should be excluded from logging.
@@ -9,6 +9,7 @@ from sqlalchemy.orm import load_only
 
 from src.db.models import CardRecord, CardType
 from src.repositories.base import BaseRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
 
 # ---------------------------------------------------------------------------
 # Columns projected by get_by_deck (admin/list path only — not the hot V2 path)
@@ -199,27 +200,34 @@ class CardRecordRepository(BaseRepository[CardRecord]):
 
         Note:
             Does NOT commit. Caller must call db.commit() after.
+            Decks where an existing record is activated or deactivated get
+            their user_deck_progress counters recounted.
         """
         if not card_records_data:
             return [], 0, 0
 
         # Get existing keys to determine created vs updated count
         existing_query = select(
-            CardRecord.word_entry_id, CardRecord.card_type, CardRecord.variant_key
+            CardRecord.word_entry_id,
+            CardRecord.card_type,
+            CardRecord.variant_key,
+            CardRecord.deck_id,
+            CardRecord.is_active,
         ).where(CardRecord.word_entry_id.in_([d["word_entry_id"] for d in card_records_data]))
         existing_result = await self.db.execute(existing_query)
-        existing_keys = {
+        existing = {
             (
                 row.word_entry_id,
                 (row.card_type.value if hasattr(row.card_type, "value") else row.card_type),
                 row.variant_key,
-            )
+            ): row
             for row in existing_result.all()
         }
 
         # Count created vs updated
         created_count = 0
         updated_count = 0
+        toggled_deck_ids: set[UUID] = set()
 
         for entry in card_records_data:
             card_type_value = entry["card_type"]
@@ -227,8 +235,10 @@ class CardRecordRepository(BaseRepository[CardRecord]):
                 card_type_value = card_type_value.value
 
             key = (entry["word_entry_id"], card_type_value, entry["variant_key"])
-            if key in existing_keys:
+            if key in existing:
                 updated_count += 1
+                if existing[key].is_active != entry.get("is_active", True):
+                    toggled_deck_ids.update((existing[key].deck_id, entry["deck_id"]))
             else:
                 created_count += 1
 
@@ -256,15 +266,14 @@ class CardRecordRepository(BaseRepository[CardRecord]):
         record_ids = [row[0] for row in result.all()]
 
         await self.db.flush()
+        await self._refresh_deck_progress(toggled_deck_ids)
 
-        # Expire cached instances to avoid stale data
-        for record_id in record_ids:
-            existing = await self.db.get(CardRecord, record_id)
-            if existing:
-                self.db.expire(existing)
-
-        # Fetch fresh data
-        fetch_query = select(CardRecord).where(CardRecord.id.in_(record_ids))
+        # Fetch fresh data; populate_existing refreshes cached instances in place
+        fetch_query = (
+            select(CardRecord)
+            .where(CardRecord.id.in_(record_ids))
+            .execution_options(populate_existing=True)
+        )
         fetch_result = await self.db.execute(fetch_query)
         records = list(fetch_result.scalars().all())
 
@@ -273,7 +282,8 @@ class CardRecordRepository(BaseRepository[CardRecord]):
     async def deactivate_by_word_entry(self, word_entry_id: UUID) -> int:
         """Soft-delete all card records for a word entry.
 
-        Sets is_active=False and updates updated_at for all matching records.
+        Sets is_active=False and updates updated_at for all matching records,
+        then recounts the user_deck_progress counters of their decks.
 
         Args:
             word_entry_id: WordEntry UUID
@@ -291,6 +301,17 @@ class CardRecordRepository(BaseRepository[CardRecord]):
                 CardRecord.is_active.is_(True),
             )
             .values(is_active=False, updated_at=func.now())
+            .returning(CardRecord.deck_id)
         )
+        deck_ids = list(result.scalars().all())
         await self.db.flush()
-        return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
+        await self._refresh_deck_progress(set(deck_ids))
+        return len(deck_ids)
+
+    async def _refresh_deck_progress(self, deck_ids: set[UUID]) -> None:
+        """Recount the user_deck_progress counters, which only cover active records."""
+        if not deck_ids:
+            return
+        progress_repo = UserDeckProgressRepository(self.db)
+        for deck_id in deck_ids:
+            await progress_repo.refresh(deck_id=deck_id)
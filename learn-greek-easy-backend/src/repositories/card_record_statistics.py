@@ -9,6 +9,7 @@ from sqlalchemy.orm import selectinload
 
 from src.db.models import CardRecord, CardRecordStatistics, CardStatus, CardType, Deck, DeckLevel
 from src.repositories.base import BaseRepository
+from src.repositories.user_due_histogram import UserDueHistogramRepository
 
 
 class CardRecordStatisticsRepository(BaseRepository[CardRecordStatistics]):
@@ -54,6 +55,9 @@ class CardRecordStatisticsRepository(BaseRepository[CardRecordStatistics]):
             )
             self.db.add(stats)
             await self.db.flush()
+            await UserDueHistogramRepository(self.db).shift(
+                user_id, None, stats.next_review_date, card_record_id=card_record_id
+            )
 
         return stats
 
@@ -224,10 +228,14 @@ class CardRecordStatisticsRepository(BaseRepository[CardRecordStatistics]):
             next_review_date: Next scheduled review date.
             status: New card status.
 
+        Moves the card in the user's due histogram when the date changes and
+        the card record is active (inactive ones are not counted there).
+
         Returns:
             Updated statistics (flushed but not committed).
         """
         stats = await self.get_or_404(stats_id)
+        previous_review_date = stats.next_review_date
         stats.easiness_factor = easiness_factor
         stats.interval = interval
         stats.repetitions = repetitions
@@ -236,6 +244,12 @@ class CardRecordStatisticsRepository(BaseRepository[CardRecordStatistics]):
 
         self.db.add(stats)
         await self.db.flush()
+        await UserDueHistogramRepository(self.db).shift(
+            stats.user_id,
+            previous_review_date,
+            next_review_date,
+            card_record_id=stats.card_record_id,
+        )
         return stats
 
     async def count_by_status(
@@ -712,3 +726,41 @@ class CardRecordStatisticsRepository(BaseRepository[CardRecordStatistics]):
             }
             for row in rows
         ]
+
+    async def count_due_by_decks(
+        self,
+        user_id: UUID,
+        deck_ids: list[UUID],
+        *,
+        exclude_statuses: tuple[CardStatus, ...] = (),
+    ) -> dict[UUID, int]:
+        """Count the user's due active cards per deck (``next_review_date <= today``).
+
+        The date-dependent companion to the ``user_deck_progress`` counters,
+        which cannot store a due count. Served by ``ix_crs_user_next_review``.
+
+        Args:
+            user_id: User UUID.
+            deck_ids: Decks to count; decks with nothing due are omitted.
+            exclude_statuses: Statuses not counted as due.
+
+        Returns:
+            Dict mapping deck_id to its due count.
+        """
+        if not deck_ids:
+            return {}
+        query = (
+            select(CardRecord.deck_id, func.count().label("due"))
+            .join(CardRecord, CardRecordStatistics.card_record_id == CardRecord.id)
+            .where(
+                CardRecordStatistics.user_id == user_id,
+                CardRecordStatistics.next_review_date <= date.today(),
+                CardRecord.deck_id.in_(deck_ids),
+                CardRecord.is_active.is_(True),
+            )
+            .group_by(CardRecord.deck_id)
+        )
+        if exclude_statuses:
+            query = query.where(CardRecordStatistics.status.not_in(exclude_statuses))
+        result = await self.db.execute(query)
+        return {row.deck_id: int(row.due) for row in result.all()}
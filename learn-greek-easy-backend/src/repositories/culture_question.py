@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
 
@@ -112,11 +112,18 @@ class CultureQuestionRepository(BaseRepository[CultureQuestion]):
 
         Use Case:
             Deck import, bulk question creation
+
+        Note:
+            One ORM bulk ``INSERT ... RETURNING`` (batched multi-row VALUES)
+            instead of flushing one pending object per question.
         """
-        questions = [CultureQuestion(**question_data) for question_data in questions_data]
-        self.db.add_all(questions)
-        await self.db.flush()
-        return questions
+        if not questions_data:
+            return []
+        result = await self.db.scalars(
+            insert(CultureQuestion).returning(CultureQuestion, sort_by_parameter_order=True),
+            questions_data,
+        )
+        return list(result.all())
 
     async def count_by_deck(self, deck_id: UUID) -> int:
         """Count total questions in a deck.
@@ -1,12 +1,23 @@
-"""Notification repository for database operations."""
+"""Notification repository for database operations.
+
+Unread counts are denormalized into ``users.unread_notification_count``. Every
+write method here adjusts that counter in the same transaction as the rows it
+touches, so ``get_unread_count`` is a primary-key read instead of a COUNT over
+the user's notifications. Counts returned by a write (``UPDATE ... RETURNING``)
+are remembered in ``unread_counts`` so the service can push them to SSE
+streams without another query. Writes that bypass this repository (seeding,
+partition drops) are corrected by ``repair_unread_counts``, which the
+scheduler runs daily.
+"""
 
 from datetime import UTC, datetime, timedelta
+from typing import Iterable
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models import Notification
+from src.db.models import Notification, User
 from src.repositories.base import BaseRepository
 
 
@@ -15,6 +26,8 @@ class NotificationRepository(BaseRepository[Notification]):
 
     def __init__(self, db: AsyncSession):
         super().__init__(Notification, db)
+        # user_id -> unread count as of this repository's latest counter write
+        self.unread_counts: dict[UUID, int] = {}
 
     async def get_by_user(
         self,
@@ -52,8 +65,70 @@ class NotificationRepository(BaseRepository[Notification]):
         return result.scalar() or 0
 
     async def get_unread_count(self, user_id: UUID) -> int:
-        """Get count of unread notifications."""
-        return await self.count_by_user(user_id, include_read=False)
+        """Get count of unread notifications (the denormalized counter)."""
+        result = await self.db.execute(
+            select(User.unread_notification_count).where(User.id == user_id)
+        )
+        return result.scalar() or 0
+
+    async def adjust_unread_count(self, user_id: UUID, delta: int) -> int:
+        """Add ``delta`` to the user's unread counter (floored at 0); returns the new value."""
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                unread_notification_count=func.greatest(User.unread_notification_count + delta, 0)
+            )
+            .returning(User.unread_notification_count)
+        )
+        count = result.scalar() or 0
+        self.unread_counts[user_id] = count
+        return count
+
+    async def reset_unread_count(self, user_id: UUID) -> None:
+        """Set the user's unread counter to 0."""
+        await self.db.execute(
+            update(User).where(User.id == user_id).values(unread_notification_count=0)
+        )
+        self.unread_counts[user_id] = 0
+
+    async def increment_unread_counts(self, user_ids: Iterable[UUID]) -> None:
+        """Add one unread notification to each user (bulk fan-out)."""
+        ids = list(user_ids)
+        if not ids:
+            return
+        await self.db.execute(
+            update(User)
+            .where(User.id.in_(ids))
+            .values(unread_notification_count=User.unread_notification_count + 1)
+        )
+
+    async def repair_unread_counts(self, user_ids: Iterable[UUID] | None = None) -> int:
+        """Recount unread notifications and fix drifted counters.
+
+        Limited to ``user_ids`` when given. Returns the number of users whose
+        counter was wrong.
+        """
+        ids = None if user_ids is None else list(user_ids)
+        scope = "" if ids is None else "WHERE u.id = ANY(:ids)"
+        result = await self.db.execute(
+            text(f"""
+                WITH actual AS (
+                    SELECT u.id, count(n.id) AS unread
+                    FROM users u
+                    LEFT JOIN notifications n ON n.user_id = u.id AND n.read = false
+                    {scope}
+                    GROUP BY u.id
+                )
+                UPDATE users
+                SET unread_notification_count = actual.unread
+                FROM actual
+                WHERE users.id = actual.id
+                  AND users.unread_notification_count <> actual.unread
+            """),
+            {} if ids is None else {"ids": ids},
+        )
+        return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
 
     async def mark_as_read(self, notification_id: UUID, user_id: UUID) -> bool:
         """Mark a notification as read. Returns True if updated."""
@@ -67,7 +142,10 @@ class NotificationRepository(BaseRepository[Notification]):
             .values(read=True, read_at=func.now())
         )
         # CursorResult from UPDATE has rowcount, but Result[Any] type doesn't expose it
-        return bool(result.rowcount > 0)  # type: ignore[attr-defined]
+        updated = bool(result.rowcount > 0)  # type: ignore[attr-defined]
+        if updated:
+            await self.adjust_unread_count(user_id, -1)
+        return updated
 
     async def mark_all_as_read(self, user_id: UUID) -> int:
         """Mark all notifications as read. Returns count updated."""
@@ -79,29 +157,61 @@ class NotificationRepository(BaseRepository[Notification]):
             )
             .values(read=True, read_at=func.now())
         )
+        await self.reset_unread_count(user_id)
         # CursorResult from UPDATE has rowcount, but Result[Any] type doesn't expose it
         return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
 
     async def delete_by_id(self, notification_id: UUID, user_id: UUID) -> bool:
         """Delete a notification. Returns True if deleted."""
         result = await self.db.execute(
-            delete(Notification).where(
+            delete(Notification)
+            .where(
                 Notification.id == notification_id,
                 Notification.user_id == user_id,
             )
+            .returning(Notification.read)
         )
-        # CursorResult from DELETE has rowcount, but Result[Any] type doesn't expose it
-        return bool(result.rowcount > 0)  # type: ignore[attr-defined]
+        deleted = result.first()
+        if deleted is None:
+            return False
+        if not deleted.read:
+            await self.adjust_unread_count(user_id, -1)
+        return True
 
     async def delete_all_by_user(self, user_id: UUID) -> int:
         """Delete all notifications for a user. Returns count deleted."""
         result = await self.db.execute(delete(Notification).where(Notification.user_id == user_id))
+        await self.reset_unread_count(user_id)
         # CursorResult from DELETE has rowcount, but Result[Any] type doesn't expose it
         return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
 
     async def delete_older_than(self, days: int) -> int:
-        """Delete notifications older than N days. Returns count deleted."""
+        """Delete notifications older than N days. Returns count deleted.
+
+        Decrements each affected user's unread counter by the unread rows
+        removed, in the same statement.
+        """
         cutoff = datetime.now(UTC) - timedelta(days=days)
-        result = await self.db.execute(delete(Notification).where(Notification.created_at < cutoff))
-        # CursorResult from DELETE has rowcount, but Result[Any] type doesn't expose it
-        return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
+        result = await self.db.execute(
+            text("""
+                WITH deleted AS (
+                    DELETE FROM notifications WHERE created_at < :cutoff
+                    RETURNING user_id, read
+                ),
+                unread AS (
+                    SELECT user_id, count(*) AS removed
+                    FROM deleted WHERE NOT read
+                    GROUP BY user_id
+                ),
+                adjusted AS (
+                    UPDATE users
+                    SET unread_notification_count =
+                        GREATEST(users.unread_notification_count - unread.removed, 0)
+                    FROM unread
+                    WHERE users.id = unread.user_id
+                )
+                SELECT count(*) FROM deleted
+            """),
+            {"cutoff": cutoff},
+        )
+        return int(result.scalar() or 0)
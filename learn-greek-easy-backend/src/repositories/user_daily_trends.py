@@ -0,0 +1,339 @@
+"""UserDailyTrends repository: the per-user daily series behind learning trends.
+
+Two ways to keep the series current:
+
+- ``vocab_review_deltas`` / ``culture_answer_deltas`` describe what one review
+  or answer adds to the series (its counters on the review day, and the card
+  moving from the status bucket of the day its statistics row was previously
+  updated). ``delta_upserts`` turns them into upserts: the fused review path
+  embeds them as CTEs in its single write statement, the other write paths
+  run them with ``UserDailyTrendsRepository.apply``.
+- ``UserDailyTrendsRepository.refresh`` recomputes rows from the review,
+  answer and statistics tables. It is used by the rebuild script.
+"""
+
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Date, cast, delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    CardRecordReview,
+    CardRecordStatistics,
+    CardStatus,
+    CultureAnswerHistory,
+    CultureQuestionStats,
+    UserDailyTrends,
+)
+from src.repositories.base import BaseRepository
+
+SeriesDeltas = dict[date, dict[str, int]]
+
+COUNTER_COLUMNS = (
+    "vocab_reviews",
+    "vocab_correct",
+    "vocab_quality_sum",
+    "vocab_study_time_seconds",
+    "vocab_learning",
+    "vocab_mastered",
+    "culture_answers",
+    "culture_correct",
+    "culture_learning",
+    "culture_mastered",
+)
+
+# Same grouping as the count_cards_by_status_per_day repository methods.
+_BUCKETS: dict[CardStatus, str] = {
+    CardStatus.LEARNING: "learning",
+    CardStatus.REVIEW: "learning",
+    CardStatus.MASTERED: "mastered",
+}
+
+
+def _move_bucket(
+    deltas: SeriesDeltas,
+    prefix: str,
+    *,
+    day: date,
+    previous_status: CardStatus | None,
+    previous_day: date | None,
+    new_status: CardStatus,
+) -> None:
+    previous_bucket = _BUCKETS.get(previous_status) if previous_status is not None else None
+    if previous_bucket is not None and previous_day is not None:
+        counters = deltas.setdefault(previous_day, {})
+        column = f"{prefix}_{previous_bucket}"
+        counters[column] = counters.get(column, 0) - 1
+    new_bucket = _BUCKETS.get(new_status)
+    if new_bucket is not None:
+        counters = deltas.setdefault(day, {})
+        column = f"{prefix}_{new_bucket}"
+        counters[column] = counters.get(column, 0) + 1
+
+
+def vocab_review_deltas(
+    *,
+    day: date,
+    quality: int,
+    time_taken: int,
+    previous_status: CardStatus | None,
+    previous_day: date | None,
+    new_status: CardStatus,
+) -> SeriesDeltas:
+    """Series changes of one vocabulary review.
+
+    Args:
+        day: Day of the review (and of the statistics row's new ``updated_at``).
+        previous_status: Status before the review, or None when the review
+            creates the statistics row.
+        previous_day: Day of the statistics row's ``updated_at`` before the
+            review, or None when unknown or the row is new.
+    """
+    deltas: SeriesDeltas = {
+        day: {
+            "vocab_reviews": 1,
+            "vocab_correct": 1 if quality >= 3 else 0,
+            "vocab_quality_sum": quality,
+            "vocab_study_time_seconds": time_taken,
+        }
+    }
+    _move_bucket(
+        deltas,
+        "vocab",
+        day=day,
+        previous_status=previous_status,
+        previous_day=previous_day,
+        new_status=new_status,
+    )
+    return deltas
+
+
+def culture_answer_deltas(
+    *,
+    day: date,
+    is_correct: bool | None,
+    previous_status: CardStatus | None,
+    previous_day: date | None,
+    new_status: CardStatus | None,
+) -> SeriesDeltas:
+    """Series changes of one culture answer.
+
+    ``is_correct`` is None when the caller does not record the answer history
+    row; ``new_status`` is None when it does not update the statistics row.
+    """
+    deltas: SeriesDeltas = {}
+    if is_correct is not None:
+        deltas[day] = {"culture_answers": 1, "culture_correct": 1 if is_correct else 0}
+    if new_status is not None:
+        _move_bucket(
+            deltas,
+            "culture",
+            day=day,
+            previous_status=previous_status,
+            previous_day=previous_day,
+            new_status=new_status,
+        )
+    return deltas
+
+
+def delta_upserts(user_id: UUID, deltas: SeriesDeltas) -> list[Insert]:
+    """One upsert per day adding ``deltas`` to the user's series rows.
+
+    Days are distinct, so the statements can share one SQL statement as CTEs.
+    Decrements never take a counter below zero.
+    """
+    table = UserDailyTrends.__table__.c
+    statements = []
+    for day, counters in sorted(deltas.items()):
+        changed = {column: delta for column, delta in counters.items() if delta}
+        if not changed:
+            continue
+        stmt = pg_insert(UserDailyTrends).values(
+            user_id=user_id,
+            day=day,
+            **{column: max(delta, 0) for column, delta in changed.items()},
+        )
+        statements.append(
+            stmt.on_conflict_do_update(
+                index_elements=[UserDailyTrends.user_id, UserDailyTrends.day],
+                set_={
+                    **{
+                        column: (
+                            table[column] + delta
+                            if delta > 0
+                            else func.greatest(table[column] + delta, 0)
+                        )
+                        for column, delta in changed.items()
+                    },
+                    "updated_at": func.now(),
+                },
+            )
+        )
+    return statements
+
+
+class UserDailyTrendsRepository(BaseRepository[UserDailyTrends]):
+    """Repository for the per-user daily trends series."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(UserDailyTrends, db)
+
+    async def get_range(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> list[UserDailyTrends]:
+        """Return the user's rows between two days (inclusive), oldest first."""
+        query = (
+            select(UserDailyTrends)
+            .where(
+                UserDailyTrends.user_id == user_id,
+                UserDailyTrends.day >= start_date,
+                UserDailyTrends.day <= end_date,
+            )
+            .order_by(UserDailyTrends.day)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def latest_update(self, user_id: UUID) -> datetime | None:
+        """When any of the user's rows last changed (one probe of the index)."""
+        query = select(func.max(UserDailyTrends.updated_at)).where(
+            UserDailyTrends.user_id == user_id
+        )
+        return (await self.db.execute(query)).scalar_one_or_none()
+
+    async def apply(self, user_id: UUID, deltas: SeriesDeltas) -> None:
+        """Add ``deltas`` to the user's series."""
+        for statement in delta_upserts(user_id, deltas):
+            await self.db.execute(statement)
+
+    async def delete_all_by_user_id(self, user_id: UUID) -> int:
+        """Delete the user's whole series; returns the number of rows."""
+        result = await self.db.execute(
+            delete(UserDailyTrends).where(UserDailyTrends.user_id == user_id)
+        )
+        return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
+
+    async def refresh(
+        self,
+        *,
+        user_ids: Sequence[UUID] | None = None,
+        days: Sequence[date] | None = None,
+    ) -> int:
+        """Recompute the series rows in scope from the source tables.
+
+        With no arguments every row is rebuilt. Rows in scope with no activity
+        left are deleted.
+
+        Returns:
+            Number of rows written.
+        """
+
+        def _scoped(query: Any, user_column: Any, day_column: Any) -> Any:
+            if user_ids is not None:
+                query = query.where(user_column.in_(user_ids))
+            if days is not None:
+                query = query.where(day_column.in_(days))
+            return query.group_by(user_column, day_column)
+
+        review_day = cast(CardRecordReview.reviewed_at, Date)
+        vocab_reviews = _scoped(
+            select(
+                CardRecordReview.user_id.label("user_id"),
+                review_day.label("day"),
+                *self._counters(
+                    vocab_reviews=func.count(),
+                    vocab_correct=func.count().filter(CardRecordReview.quality >= 3),
+                    vocab_quality_sum=func.sum(CardRecordReview.quality),
+                    vocab_study_time_seconds=func.coalesce(
+                        func.sum(CardRecordReview.time_taken), 0
+                    ),
+                ),
+            ),
+            CardRecordReview.user_id,
+            review_day,
+        )
+        stats_day = cast(CardRecordStatistics.updated_at, Date)
+        vocab_status = _scoped(
+            select(
+                CardRecordStatistics.user_id.label("user_id"),
+                stats_day.label("day"),
+                *self._counters(
+                    vocab_learning=func.count().filter(
+                        CardRecordStatistics.status.in_([CardStatus.LEARNING, CardStatus.REVIEW])
+                    ),
+                    vocab_mastered=func.count().filter(
+                        CardRecordStatistics.status == CardStatus.MASTERED
+                    ),
+                ),
+            ),
+            CardRecordStatistics.user_id,
+            stats_day,
+        )
+        answer_day = cast(CultureAnswerHistory.created_at, Date)
+        culture_answers = _scoped(
+            select(
+                CultureAnswerHistory.user_id.label("user_id"),
+                answer_day.label("day"),
+                *self._counters(
+                    culture_answers=func.count(),
+                    culture_correct=func.count().filter(CultureAnswerHistory.is_correct.is_(True)),
+                ),
+            ),
+            CultureAnswerHistory.user_id,
+            answer_day,
+        )
+        culture_day = cast(CultureQuestionStats.updated_at, Date)
+        culture_status = _scoped(
+            select(
+                CultureQuestionStats.user_id.label("user_id"),
+                culture_day.label("day"),
+                *self._counters(
+                    culture_learning=func.count().filter(
+                        CultureQuestionStats.status.in_([CardStatus.LEARNING, CardStatus.REVIEW])
+                    ),
+                    culture_mastered=func.count().filter(
+                        CultureQuestionStats.status == CardStatus.MASTERED
+                    ),
+                ),
+            ),
+            CultureQuestionStats.user_id,
+            culture_day,
+        )
+        sources = union_all(vocab_reviews, vocab_status, culture_answers, culture_status).subquery(
+            "daily_sources"
+        )
+        rebuilt = select(
+            sources.c.user_id,
+            sources.c.day,
+            *(func.sum(sources.c[column]).label(column) for column in COUNTER_COLUMNS),
+        ).group_by(sources.c.user_id, sources.c.day)
+
+        scope: list[Any] = []
+        if user_ids is not None:
+            scope.append(UserDailyTrends.user_id.in_(user_ids))
+        if days is not None:
+            scope.append(UserDailyTrends.day.in_(days))
+        await self.db.execute(delete(UserDailyTrends).where(*scope))
+        insert_stmt = pg_insert(UserDailyTrends).from_select(
+            ["user_id", "day", *COUNTER_COLUMNS], rebuilt
+        )
+        result = await self.db.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[UserDailyTrends.user_id, UserDailyTrends.day],
+                set_={
+                    **{column: insert_stmt.excluded[column] for column in COUNTER_COLUMNS},
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        return result.rowcount or 0
+
+    @staticmethod
+    def _counters(**present: Any) -> list[Any]:
+        """Every counter column in table order: ``present`` ones, zero for the rest."""
+        return [present.get(column, literal(0)).label(column) for column in COUNTER_COLUMNS]
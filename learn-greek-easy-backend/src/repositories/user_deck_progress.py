@@ -0,0 +1,220 @@
+"""UserDeckProgress repository: per-user, per-deck counters for the V2 card system.
+
+Two ways to keep a row current:
+
+- ``review_delta_upsert`` builds an upsert that moves one card between status
+  buckets and adds one review. The fused review path embeds it as a CTE in its
+  single write statement.
+- ``UserDeckProgressRepository.refresh`` recomputes rows from
+  ``card_record_statistics`` and ``card_record_reviews``. It is used by the
+  legacy review path, by deck membership changes and by the rebuild script.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    CardRecord,
+    CardRecordReview,
+    CardRecordStatistics,
+    CardStatus,
+    UserDeckProgress,
+)
+from src.repositories.base import BaseRepository
+
+_STATUS_COLUMNS: dict[CardStatus, str] = {
+    CardStatus.NEW: "cards_new",
+    CardStatus.LEARNING: "cards_learning",
+    CardStatus.REVIEW: "cards_review",
+    CardStatus.MASTERED: "cards_mastered",
+}
+
+_COUNTER_COLUMNS = (
+    *_STATUS_COLUMNS.values(),
+    "easiness_factor_sum",
+    "total_reviews",
+    "quality_sum",
+    "total_study_time_seconds",
+    "first_studied_at",
+    "last_studied_at",
+)
+
+
+def review_delta_upsert(
+    *,
+    user_id: UUID,
+    deck_id: UUID,
+    previous_status: CardStatus | None,
+    new_status: CardStatus,
+    easiness_factor_delta: float,
+    quality: int,
+    time_taken: int,
+    reviewed_at: datetime,
+    counts_status: bool = True,
+) -> Insert:
+    """Upsert applying one review to the (user, deck) counters.
+
+    Args:
+        previous_status: The card's status before the review, or None when the
+            review creates the statistics row.
+        easiness_factor_delta: New EF minus the previous EF (the new EF when
+            the statistics row is created).
+        counts_status: False for a card record that is not active; its review
+            still counts towards the totals but not towards the status buckets.
+    """
+    deltas: dict[str, Any] = {column: 0 for column in _STATUS_COLUMNS.values()}
+    deltas["easiness_factor_sum"] = 0.0
+    if counts_status:
+        if previous_status is not None:
+            deltas[_STATUS_COLUMNS[previous_status]] -= 1
+        deltas[_STATUS_COLUMNS[new_status]] += 1
+        deltas["easiness_factor_sum"] = easiness_factor_delta
+    deltas.update(total_reviews=1, quality_sum=quality, total_study_time_seconds=time_taken)
+
+    stmt = pg_insert(UserDeckProgress).values(
+        user_id=user_id,
+        deck_id=deck_id,
+        first_studied_at=reviewed_at,
+        last_studied_at=reviewed_at,
+        **{column: max(delta, 0) for column, delta in deltas.items()},
+    )
+    table = UserDeckProgress.__table__.c
+    return stmt.on_conflict_do_update(
+        index_elements=[UserDeckProgress.user_id, UserDeckProgress.deck_id],
+        set_={
+            **{column: table[column] + delta for column, delta in deltas.items() if delta},
+            "first_studied_at": func.coalesce(table.first_studied_at, reviewed_at),
+            "last_studied_at": func.greatest(table.last_studied_at, reviewed_at),
+            "updated_at": func.now(),
+        },
+    )
+
+
+class UserDeckProgressRepository(BaseRepository[UserDeckProgress]):
+    """Repository for UserDeckProgress counters."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(UserDeckProgress, db)
+
+    async def get_for_deck(self, user_id: UUID, deck_id: UUID) -> UserDeckProgress | None:
+        """Return the user's counters for one deck, or None if never studied."""
+        return await self.db.get(UserDeckProgress, (user_id, deck_id))
+
+    async def get_by_decks(
+        self, user_id: UUID, deck_ids: Sequence[UUID]
+    ) -> dict[UUID, UserDeckProgress]:
+        """Return the user's counters for ``deck_ids``, keyed by deck id."""
+        if not deck_ids:
+            return {}
+        query = select(UserDeckProgress).where(
+            UserDeckProgress.user_id == user_id,
+            UserDeckProgress.deck_id.in_(deck_ids),
+        )
+        result = await self.db.execute(query)
+        return {row.deck_id: row for row in result.scalars().all()}
+
+    async def delete_all_by_user_id(self, user_id: UUID) -> int:
+        """Delete all of the user's deck counters; returns the number of rows."""
+        result = await self.db.execute(
+            delete(UserDeckProgress).where(UserDeckProgress.user_id == user_id)
+        )
+        return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
+
+    async def refresh(
+        self,
+        *,
+        user_ids: Sequence[UUID] | None = None,
+        deck_id: UUID | None = None,
+    ) -> int:
+        """Recompute the counters in scope from the statistics and review tables.
+
+        With no arguments every row is rebuilt. Rows in scope whose user no
+        longer has statistics or reviews for the deck are deleted.
+
+        Returns:
+            Number of rows written.
+        """
+        stats_filters: list[Any] = [CardRecord.is_active.is_(True)]
+        review_filters: list[Any] = []
+        scope: list[Any] = []
+        if user_ids is not None:
+            stats_filters.append(CardRecordStatistics.user_id.in_(user_ids))
+            review_filters.append(CardRecordReview.user_id.in_(user_ids))
+            scope.append(UserDeckProgress.user_id.in_(user_ids))
+        if deck_id is not None:
+            stats_filters.append(CardRecord.deck_id == deck_id)
+            review_filters.append(CardRecord.deck_id == deck_id)
+            scope.append(UserDeckProgress.deck_id == deck_id)
+
+        stats = (
+            select(
+                CardRecordStatistics.user_id,
+                CardRecord.deck_id,
+                *(
+                    func.count().filter(CardRecordStatistics.status == status).label(column)
+                    for status, column in _STATUS_COLUMNS.items()
+                ),
+                func.sum(CardRecordStatistics.easiness_factor).label("easiness_factor_sum"),
+            )
+            .join(CardRecord, CardRecordStatistics.card_record_id == CardRecord.id)
+            .where(*stats_filters)
+            .group_by(CardRecordStatistics.user_id, CardRecord.deck_id)
+            .subquery("deck_stats")
+        )
+        reviews = (
+            select(
+                CardRecordReview.user_id,
+                CardRecord.deck_id,
+                func.count().label("total_reviews"),
+                func.sum(CardRecordReview.quality).label("quality_sum"),
+                func.sum(CardRecordReview.time_taken).label("total_study_time_seconds"),
+                func.min(CardRecordReview.reviewed_at).label("first_studied_at"),
+                func.max(CardRecordReview.reviewed_at).label("last_studied_at"),
+            )
+            .join(CardRecord, CardRecordReview.card_record_id == CardRecord.id)
+            .where(*review_filters)
+            .group_by(CardRecordReview.user_id, CardRecord.deck_id)
+            .subquery("deck_reviews")
+        )
+        counters = [
+            func.coalesce(stats.c[column], 0).label(column)
+            for column in (*_STATUS_COLUMNS.values(), "easiness_factor_sum")
+        ] + [
+            func.coalesce(reviews.c[column], 0).label(column)
+            for column in ("total_reviews", "quality_sum", "total_study_time_seconds")
+        ]
+        rebuilt = select(
+            func.coalesce(stats.c.user_id, reviews.c.user_id).label("user_id"),
+            func.coalesce(stats.c.deck_id, reviews.c.deck_id).label("deck_id"),
+            *counters,
+            reviews.c.first_studied_at,
+            reviews.c.last_studied_at,
+        ).select_from(
+            stats.join(
+                reviews,
+                and_(stats.c.user_id == reviews.c.user_id, stats.c.deck_id == reviews.c.deck_id),
+                full=True,
+            )
+        )
+
+        await self.db.execute(delete(UserDeckProgress).where(*scope))
+        insert_stmt = pg_insert(UserDeckProgress).from_select(
+            ["user_id", "deck_id", *_COUNTER_COLUMNS], rebuilt
+        )
+        result = await self.db.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[UserDeckProgress.user_id, UserDeckProgress.deck_id],
+                set_={
+                    **{column: insert_stmt.excluded[column] for column in _COUNTER_COLUMNS},
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        return result.rowcount or 0
@@ -0,0 +1,217 @@
+"""UserDueHistogram repository: per-user due-date histograms.
+
+A histogram is a dense array of day slots anchored at ``base_date``:
+
+- slot 0: cards due before ``base_date``
+- slot ``k`` (1..horizon): cards due on ``base_date + k - 1``
+- last slot: cards due on or after ``base_date + horizon``
+
+Writes keep it current with ``due_shift_update``, which moves one card from
+the slot of its old next review date to the slot of its new one in place
+(the fused review path embeds it as a CTE; the other write paths run it with
+``UserDueHistogramRepository.shift``). It only touches an existing row, so a
+user without one costs nothing until the first read builds it.
+
+Reads use ``due_window`` and trust the stored row: readers only call
+``UserDueHistogramRepository.rebuild`` on signals visible in the row itself
+(missing, no longer covering the requested window, or a negative slot, which
+means a decrement found nothing to move). Drift the write hooks cannot see
+(deactivated cards, deleted statistics) is found off the request path by
+``UserDueHistogramRepository.invalidate_drifted``, which the daily
+``due_histogram_repair_task`` runs; dropped rows are rebuilt on their next read.
+"""
+
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Update,
+    and_,
+    delete,
+    exists,
+    func,
+    literal,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import CardRecord, CardRecordStatistics, CultureQuestionStats, UserDueHistogram
+from src.repositories.base import BaseRepository
+
+
+def build_counts(due_by_date: dict[date, int], base_date: date, horizon: int) -> list[int]:
+    """Dense slot array for ``due_by_date`` anchored at ``base_date``."""
+    counts = [0] * (horizon + 2)
+    for due_date, count in due_by_date.items():
+        slot = min(max((due_date - base_date).days + 1, 0), horizon + 1)
+        counts[slot] += count
+    return counts
+
+
+def due_window(
+    counts: Sequence[int], base_date: date, start: date, days: int
+) -> tuple[int, list[int]] | None:
+    """Cards due before ``start`` and on each of the ``days`` days from ``start``.
+
+    Returns None when the histogram cannot answer exactly: ``start`` is
+    before ``base_date``, or the window runs past the horizon.
+    """
+    horizon = len(counts) - 2
+    offset = (start - base_date).days + 1
+    if offset < 1 or offset + days - 1 > horizon:
+        return None
+    return sum(counts[:offset]), list(counts[offset : offset + days])
+
+
+def _slot(due_date: date) -> Any:
+    """1-based array index of ``due_date`` in the stored row's slots."""
+    horizon = func.cardinality(UserDueHistogram.counts) - 2
+    days = literal(due_date) - UserDueHistogram.base_date
+    return func.least(func.greatest(days + 1, 0), horizon + 1) + 1
+
+
+def due_shift_update(
+    user_id: UUID,
+    old_date: date | None,
+    new_date: date,
+    *,
+    card_record_id: UUID | None = None,
+) -> Update | None:
+    """Move one card from ``old_date``'s slot to ``new_date``'s.
+
+    ``old_date`` is None when the write creates the statistics row. Returns
+    None when the date does not change. Rows where both dates fall in the
+    same slot are left alone. A decrement is not floored: a slot below zero
+    tells readers the row missed a write and must be rebuilt.
+    With ``card_record_id`` (a vocabulary card) nothing moves unless that card
+    record is active, matching the scope of ``due_by_date``.
+    """
+    if old_date == new_date:
+        return None
+    counts = UserDueHistogram.counts
+    new_slot = _slot(new_date)
+    values: dict[Any, Any] = {counts[new_slot]: counts[new_slot] + 1, "updated_at": func.now()}
+    criteria = [UserDueHistogram.user_id == user_id]
+    if old_date is not None:
+        old_slot = _slot(old_date)
+        values[counts[old_slot]] = counts[old_slot] - 1
+        criteria.append(old_slot != new_slot)
+    if card_record_id is not None:
+        criteria.append(
+            exists().where(CardRecord.id == card_record_id, CardRecord.is_active.is_(True))
+        )
+    return update(UserDueHistogram).where(and_(*criteria)).values(values)
+
+
+class UserDueHistogramRepository(BaseRepository[UserDueHistogram]):
+    """Repository for per-user due-date histograms."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(UserDueHistogram, db)
+
+    async def shift(
+        self,
+        user_id: UUID,
+        old_date: date | None,
+        new_date: date,
+        *,
+        card_record_id: UUID | None = None,
+    ) -> None:
+        """Record a card's next review date moving from ``old_date`` to ``new_date``."""
+        statement = due_shift_update(user_id, old_date, new_date, card_record_id=card_record_id)
+        if statement is not None:
+            await self.db.execute(statement)
+
+    async def due_by_date(self, user_id: UUID) -> dict[date, int]:
+        """Due cards per next review date, from the statistics tables.
+
+        Same scope as the dashboard's due counts: active vocabulary card
+        records and every culture statistics row.
+        """
+        vocab = (
+            select(
+                CardRecordStatistics.next_review_date.label("due_date"),
+                func.count().label("count"),
+            )
+            .join(CardRecord, CardRecordStatistics.card_record_id == CardRecord.id)
+            .where(CardRecordStatistics.user_id == user_id)
+            .where(CardRecord.is_active.is_(True))
+            .group_by(CardRecordStatistics.next_review_date)
+        )
+        culture = (
+            select(
+                CultureQuestionStats.next_review_date.label("due_date"),
+                func.count().label("count"),
+            )
+            .where(CultureQuestionStats.user_id == user_id)
+            .group_by(CultureQuestionStats.next_review_date)
+        )
+        due: dict[date, int] = {}
+        for due_date, count in (await self.db.execute(union_all(vocab, culture))).all():
+            due[due_date] = due.get(due_date, 0) + count
+        return due
+
+    async def rebuild(self, user_id: UUID, base_date: date, horizon: int) -> list[int]:
+        """Recount the user's histogram, anchored at ``base_date``, and store it.
+
+        Returns:
+            The stored slot counts.
+        """
+        counts = build_counts(await self.due_by_date(user_id), base_date, horizon)
+        stmt = pg_insert(UserDueHistogram).values(
+            user_id=user_id, base_date=base_date, counts=counts
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserDueHistogram.user_id],
+                set_={
+                    "base_date": stmt.excluded.base_date,
+                    "counts": stmt.excluded.counts,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        return counts
+
+    async def invalidate_drifted(self) -> int:
+        """Drop every histogram whose slots no longer add up to the user's cards.
+
+        Compares each row's slot total with the user's card count in the scope
+        of ``due_by_date``, for all users in one statement. Meant for the daily
+        repair task, not the request path.
+
+        Returns:
+            Number of histograms dropped (rebuilt on their next read).
+        """
+        result = await self.db.execute(text("""
+                WITH tracked AS (
+                    SELECT h.user_id,
+                           (SELECT coalesce(sum(c), 0) FROM unnest(h.counts) AS c) AS stored,
+                           (SELECT count(*)
+                              FROM card_record_statistics s
+                              JOIN card_records r ON r.id = s.card_record_id
+                             WHERE s.user_id = h.user_id AND r.is_active)
+                         + (SELECT count(*)
+                              FROM culture_question_stats q
+                             WHERE q.user_id = h.user_id) AS actual
+                    FROM user_due_histograms h
+                )
+                DELETE FROM user_due_histograms
+                USING tracked
+                WHERE user_due_histograms.user_id = tracked.user_id
+                  AND tracked.stored <> tracked.actual
+            """))
+        return int(result.rowcount) if result.rowcount else 0  # type: ignore[attr-defined]
+
+    async def invalidate(self, user_ids: Sequence[UUID] | None = None) -> None:
+        """Drop histograms (default: every user's) so the next read rebuilds them."""
+        statement = delete(UserDueHistogram)
+        if user_ids is not None:
+            statement = statement.where(UserDueHistogram.user_id.in_(user_ids))
+        await self.db.execute(statement)
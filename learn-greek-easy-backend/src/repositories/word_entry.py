@@ -293,6 +293,7 @@ class WordEntryRepository(BaseRepository[WordEntry]):
             WordEntry.lemma, WordEntry.part_of_speech, WordEntry.gender, WordEntry.examples
         ).where(
             WordEntry.owner_id == owner_id,
+            WordEntry.lemma.in_({entry["lemma"] for entry in entries_data}),
         )
         existing_result = await self.db.execute(existing_query)
         existing_rows = existing_result.all()
@@ -363,14 +364,13 @@ class WordEntryRepository(BaseRepository[WordEntry]):
 
         await self.db.flush()
 
-        # Expire any cached instances and re-fetch with fresh data
-        for entry_id in entry_ids:
-            existing = await self.db.get(WordEntry, entry_id)
-            if existing:
-                self.db.expire(existing)
-
-        # Fetch fresh data for all upserted entries
-        fetch_query = select(WordEntry).where(WordEntry.id.in_(entry_ids))
+        # Fetch fresh data for all upserted entries; populate_existing overwrites
+        # any instances already in the identity map in the same round-trip.
+        fetch_query = (
+            select(WordEntry)
+            .where(WordEntry.id.in_(entry_ids))
+            .execution_options(populate_existing=True)
+        )
         fetch_result = await self.db.execute(fetch_query)
         entries = list(fetch_result.scalars().all())
 
@@ -385,6 +385,23 @@ class WordEntryRepository(BaseRepository[WordEntry]):
         )
         await self.db.execute(stmt)
 
+    async def link_many_to_deck(self, word_entry_ids: Sequence[UUID], deck_id: UUID) -> int:
+        """Link word entries to a deck in one multi-row insert. Idempotent.
+
+        Returns:
+            Number of new links (already linked entries are skipped).
+        """
+        if not word_entry_ids:
+            return 0
+        stmt = (
+            insert(DeckWordEntry)
+            .values([{"word_entry_id": we_id, "deck_id": deck_id} for we_id in word_entry_ids])
+            .on_conflict_do_nothing()
+            .returning(DeckWordEntry.word_entry_id)
+        )
+        result = await self.db.execute(stmt)
+        return len(result.all())
+
     async def unlink_from_deck(self, word_entry_id: UUID, deck_id: UUID) -> None:
         """Remove a word entry from a deck."""
         stmt = delete(DeckWordEntry).where(
@@ -141,11 +141,13 @@ from src.schemas.progress import (  # Existing; Dashboard schemas; Deck Progress
     DeckProgressSummary,
     DeckStatistics,
     DeckTimeline,
+    ForecastDay,
     LearningTrendsResponse,
     NextMilestone,
     OverviewStats,
     ProgressSummaryResponse,
     RecentActivity,
+    ReviewForecastResponse,
     StreakStats,
     StudySessionStatsResponse,
     TodayStats,
@@ -187,6 +189,8 @@ from src.schemas.user import (
 
 # Word Entry schemas
 from src.schemas.word_entry import (
+    DeckImportRequest,
+    DeckImportResponse,
     ExampleSentence,
     GrammarData,
     WordEntryBase,
@@ -254,6 +258,9 @@ __all__ = [
     "DailyStats",
     "TrendsSummary",
     "LearningTrendsResponse",
+    # Review Forecast
+    "ForecastDay",
+    "ReviewForecastResponse",
     # Achievements
     "Achievement",
     "NextMilestone",
@@ -358,6 +365,8 @@ __all__ = [
     "MockExamHistoryItem",
     "MockExamStatisticsResponse",
     # Word Entry
+    "DeckImportRequest",
+    "DeckImportResponse",
     "ExampleSentence",
     "GrammarData",
     "WordEntryBase",
@@ -607,3 +607,28 @@ class LexgenSubmitResponse(BaseModel):
     id: UUID
     status: Literal["needs_review", "rejected"]
     rejection_reason: str | None = None
+
+
+class LexgenBulkSubmitRequest(BaseModel):
+    """Request body for POST /lexgen/proposals/bulk — run a lemma list through the pipeline."""
+
+    lemmas: list[str] = Field(
+        ..., min_length=1, max_length=2000, description="Greek lemmas to process (deduplicated)"
+    )
+    pos: str = Field("noun", description="Part of speech shared by every lemma (default: noun)")
+    concurrency: int | None = Field(
+        None,
+        ge=1,
+        le=32,
+        description="Max pipelines in flight (default: LEXGEN_BULK_CONCURRENCY)",
+    )
+
+
+class LexgenBulkSubmitResponse(BaseModel):
+    """Response body for POST /lexgen/proposals/bulk.
+
+    The run continues in the background; proposals appear in the review queue
+    as each pipeline commits. Lemmas that already have a proposal are skipped.
+    """
+
+    accepted: int = Field(..., description="Distinct lemmas scheduled for the run")
@@ -227,6 +227,28 @@ class LearningTrendsResponse(BaseModel):
     summary: TrendsSummary
 
 
+# ============================================================================
+# Review Forecast Schemas
+# ============================================================================
+
+
+class ForecastDay(BaseModel):
+    """Cards (vocabulary and culture) scheduled for one day."""
+
+    date: date
+    due_count: int = Field(..., ge=0)
+
+
+class ReviewForecastResponse(BaseModel):
+    """Reviews due per day, starting today."""
+
+    start_date: date
+    end_date: date
+    overdue_count: int = Field(..., ge=0)
+    days: list[ForecastDay]
+    total_due: int = Field(..., ge=0)
+
+
 # ============================================================================
 # Achievements Schemas (Stretch Goal)
 # ============================================================================
@@ -50,7 +50,7 @@ For ADVERB:
 """
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -674,6 +674,63 @@ class WordEntryBulkResponse(BaseModel):
     )
 
 
+DeckImportCardType = Literal[
+    "meaning", "plural_form", "article", "sentence_translation", "declension"
+]
+
+
+class DeckImportRequest(BaseModel):
+    """Schema for a whole-deck import manifest.
+
+    Word entries are upserted (matching owner + lemma + part_of_speech + gender),
+    linked to the deck, and the requested card types are generated set-wise,
+    all in one transaction.
+    """
+
+    word_entries: list[WordEntryBulkCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=2000,
+        description="Word entries to create or update (1-2000 entries)",
+    )
+    card_types: list[DeckImportCardType] = Field(
+        default=["meaning", "plural_form", "sentence_translation", "article", "declension"],
+        min_length=1,
+        description="Card types to generate; entries without the data for a type are skipped",
+    )
+
+    @model_validator(mode="after")
+    def check_no_duplicate_lemma_pos_gender(self) -> "DeckImportRequest":
+        """Ensure no duplicate lemma + part_of_speech + gender combinations in the manifest."""
+        seen = set()
+        for entry in self.word_entries:
+            key = (entry.lemma, entry.part_of_speech, entry.gender)
+            if key in seen:
+                raise ValueError(
+                    f"Duplicate entry for lemma '{entry.lemma}' with "
+                    f"part_of_speech '{entry.part_of_speech.value}'"
+                )
+            seen.add(key)
+        return self
+
+
+class DeckImportResponse(BaseModel):
+    """Schema for a deck import result with a per-phase timing report."""
+
+    deck_id: UUID = Field(..., description="UUID of the deck entries were imported into")
+    created_count: int = Field(..., ge=0, description="Number of new word entries created")
+    updated_count: int = Field(..., ge=0, description="Number of existing word entries updated")
+    linked_count: int = Field(
+        ..., ge=0, description="Number of word entries newly linked to the deck"
+    )
+    cards_created: int = Field(default=0, ge=0, description="Number of card records created")
+    cards_updated: int = Field(default=0, ge=0, description="Number of card records updated")
+    timings: dict[str, int] = Field(
+        default_factory=dict,
+        description="Wall time per phase in milliseconds ({'<phase>_ms': int})",
+    )
+
+
 class WordEntryMyDecksResponse(BaseModel):
     """Schema for listing the current user's decks that contain a word entry."""
 
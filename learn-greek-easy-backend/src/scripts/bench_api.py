@@ -0,0 +1,320 @@
+"""Async load harness for the learner hot-path endpoints.
+
+Run with::
+
+    # in-process against the local database (synthetic users required)
+    poetry run python -m src.scripts.bench_api --users 50 --concurrency 16 --requests 400
+
+    # against a running server, one Supabase access token per line
+    poetry run python -m src.scripts.bench_api --base-url http://localhost:8000 \\
+        --tokens-file tokens.txt
+
+Each endpoint in :data:`HOT_ENDPOINTS` is driven with ``--requests`` GETs by
+``--concurrency`` workers, cycling through the benchmark users. The report has
+p50 / p95 / p99 latency, throughput and errors per endpoint, and is written to
+``--output`` in the ``k6/baselines.json`` schema (``bench_<endpoint>_time``
+metrics, extra ``p50`` / ``p99`` / ``db_roundtrips`` keys alongside ``p95``) so
+runs can be diffed against each other.
+
+In-process mode (no ``--base-url``) runs the real application lifespan and
+serves requests through ``httpx.ASGITransport``. Users are the population made
+by :mod:`src.scripts.generate_synthetic_dataset` (``--tag``); their bearer token
+is their ``supabase_id`` and Supabase JWT verification is swapped for a lookup
+of that id, so everything after signature checking (user load, services, SQL)
+is the production path. Before the timed phase every endpoint is requested
+once, sequentially, with a ``before_cursor_execute`` hook counting its SQL
+round-trips. Remote mode cannot count round-trips; ``db_roundtrips`` is null.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from loguru import logger
+from sqlalchemy import event, select
+
+from src.config import settings
+from src.scripts.generate_synthetic_dataset import email_pattern
+
+DEFAULT_OUTPUT = Path("bench-baselines.json")
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """One benchmarked GET; ``name`` becomes the ``bench_<name>_time`` metric."""
+
+    name: str
+    path: str
+
+
+HOT_ENDPOINTS: tuple[Endpoint, ...] = (
+    Endpoint("me", "/auth/me"),
+    Endpoint("progress_dashboard", "/progress/dashboard"),
+    Endpoint("dashboard_summary", "/dashboard/summary"),
+    Endpoint("progress_trends", "/progress/trends"),
+    Endpoint("study_queue", "/study/queue/v2"),
+    Endpoint("exercise_queue", "/exercises/queue"),
+    Endpoint("xp_stats", "/xp/stats"),
+    Endpoint("xp_achievements", "/xp/achievements"),
+    Endpoint("notifications_unread", "/notifications/unread-count"),
+    Endpoint("culture_decks", "/culture/decks"),
+)
+
+
+@dataclass
+class EndpointResult:
+    """Latency samples and counters for one endpoint."""
+
+    endpoint: Endpoint
+    samples_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    wall_seconds: float = 0.0
+    db_roundtrips: int | None = None
+
+    def percentile(self, pct: float) -> float:
+        return percentile(sorted(self.samples_ms), pct)
+
+    @property
+    def throughput(self) -> float:
+        return len(self.samples_ms) / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+
+def percentile(sorted_samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already-sorted samples (0.0 when empty)."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_samples) * pct / 100))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def baseline_document(results: Sequence[EndpointResult], commit: str) -> dict[str, Any]:
+    """Render results in the ``k6/baselines.json`` schema."""
+    return {
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "metrics": {
+            f"bench_{result.endpoint.name}_time": {
+                "p95": round(result.percentile(95)),
+                "p50": round(result.percentile(50)),
+                "p99": round(result.percentile(99)),
+                "db_roundtrips": result.db_roundtrips,
+            }
+            for result in results
+        },
+    }
+
+
+def format_report(results: Sequence[EndpointResult]) -> str:
+    """Fixed-width summary table for the console."""
+    lines = [f"{'endpoint':<22}{'p50':>8}{'p95':>8}{'p99':>8}{'req/s':>9}{'errors':>8}{'db rt':>7}"]
+    for result in results:
+        roundtrips = "-" if result.db_roundtrips is None else str(result.db_roundtrips)
+        lines.append(
+            f"{result.endpoint.name:<22}"
+            f"{result.percentile(50):>8.1f}{result.percentile(95):>8.1f}"
+            f"{result.percentile(99):>8.1f}{result.throughput:>9.1f}"
+            f"{result.errors:>8}{roundtrips:>7}"
+        )
+    return "\n".join(lines)
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    endpoint: Endpoint,
+    tokens: Sequence[str],
+    *,
+    requests: int,
+    concurrency: int,
+) -> EndpointResult:
+    """Issue ``requests`` GETs to ``endpoint`` from ``concurrency`` workers."""
+    result = EndpointResult(endpoint)
+    url = f"{settings.api_v1_prefix}{endpoint.path}"
+    issued = iter(range(requests))
+
+    async def worker() -> None:
+        for n in issued:
+            headers = {"Authorization": f"Bearer {tokens[n % len(tokens)]}"}
+            start = time.perf_counter()
+            try:
+                response = await client.get(url, headers=headers)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                result.samples_ms.append((time.perf_counter() - start) * 1000)
+            else:
+                result.errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.wall_seconds = time.perf_counter() - start
+    return result
+
+
+# ---------------------------------------------------------------------------
+# In-process mode
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _token_is_supabase_id() -> Iterator[None]:
+    """Accept any bearer token as the ``supabase_id`` of an existing user."""
+    import src.core.dependencies as dependencies  # noqa: PLC0415
+    from src.core.supabase_auth import SupabaseUserClaims  # noqa: PLC0415
+
+    async def _verify(token: str) -> SupabaseUserClaims:
+        return SupabaseUserClaims(supabase_id=token)
+
+    original = dependencies.verify_supabase_token
+    dependencies.verify_supabase_token = _verify  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        dependencies.verify_supabase_token = original  # type: ignore[assignment]
+
+
+@contextmanager
+def count_statements(engine: Any) -> Iterator[list[str]]:
+    """Collect every statement executed on ``engine`` while the block runs."""
+    statements: list[str] = []
+
+    def _hook(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _hook)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _hook)
+
+
+async def _synthetic_tokens(tag: str, limit: int) -> list[str]:
+    from src.db.models import User  # noqa: PLC0415
+    from src.db.session import get_session_factory  # noqa: PLC0415
+
+    async with get_session_factory()() as db:
+        result = await db.execute(
+            select(User.supabase_id)
+            .where(User.email.like(email_pattern(tag)))
+            .order_by(User.email)
+            .limit(limit)
+        )
+        return [supabase_id for supabase_id in result.scalars() if supabase_id]
+
+
+@asynccontextmanager
+async def in_process_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Run the app lifespan and yield a client bound to it over ASGI."""
+    from src.main import app  # noqa: PLC0415
+
+    with _token_is_supabase_id():
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                yield client
+
+
+async def count_roundtrips(client: httpx.AsyncClient, endpoint: Endpoint, token: str) -> int | None:
+    """SQL statements issued by one sequential request to ``endpoint``."""
+    from src.db.session import get_session_factory  # noqa: PLC0415
+
+    engine = get_session_factory().kw["bind"]
+    with count_statements(engine) as statements:
+        response = await client.get(
+            f"{settings.api_v1_prefix}{endpoint.path}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    return len(statements) if response.status_code < 400 else None
+
+
+async def run(args: argparse.Namespace) -> list[EndpointResult]:
+    """Benchmark every hot endpoint and return the results in order."""
+    endpoints = [e for e in HOT_ENDPOINTS if not args.only or e.name in args.only]
+    results: list[EndpointResult] = []
+
+    if args.base_url:
+        tokens = [line.strip() for line in args.tokens_file.read_text().splitlines()]
+        tokens = [token for token in tokens if token]
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            for endpoint in endpoints:
+                results.append(await _timed(client, endpoint, tokens, args))
+        return results
+
+    async with in_process_client() as client:
+        tokens = await _synthetic_tokens(args.tag, args.users)
+        if not tokens:
+            raise RuntimeError(
+                f"No synthetic users tagged {args.tag!r}; run generate_synthetic_dataset first"
+            )
+        for endpoint in endpoints:
+            roundtrips = await count_roundtrips(client, endpoint, tokens[0])
+            result = await _timed(client, endpoint, tokens, args)
+            result.db_roundtrips = roundtrips
+            results.append(result)
+    return results
+
+
+async def _timed(
+    client: httpx.AsyncClient,
+    endpoint: Endpoint,
+    tokens: Sequence[str],
+    args: argparse.Namespace,
+) -> EndpointResult:
+    # Untimed warm-up so connection setup and first-use caches are excluded.
+    await drive(client, endpoint, tokens, requests=args.concurrency, concurrency=args.concurrency)
+    result = await drive(
+        client, endpoint, tokens, requests=args.requests, concurrency=args.concurrency
+    )
+    logger.info(
+        f"{endpoint.name}: p95 {result.percentile(95):.1f} ms over "
+        f"{len(result.samples_ms):,} requests ({result.errors} errors)"
+    )
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the learner hot-path endpoints")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400, help="Timed requests per endpoint")
+    parser.add_argument("--users", type=int, default=50, help="Synthetic users to cycle through")
+    parser.add_argument("--tag", default="synthetic", help="Synthetic population tag")
+    parser.add_argument("--only", nargs="*", help="Endpoint names to run (default: all)")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of in-process")
+    parser.add_argument("--tokens-file", type=Path, help="Bearer tokens, one per line")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--commit", default=os.environ.get("GITHUB_SHA", "local"), help="Recorded commit"
+    )
+    args = parser.parse_args(argv)
+    if args.base_url and not args.tokens_file:
+        parser.error("--base-url requires --tokens-file")
+
+    try:
+        results = asyncio.run(run(args))
+    except RuntimeError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    print(format_report(results))
+    args.output.write_text(json.dumps(baseline_document(results, args.commit), indent=2) + "\n")
+    logger.info(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Per-request cost of production logging: synchronous JSON sink vs log pipeline.
+
+Each simulated request logs what a study request logs today: the middleware's
+start and completion records, a few service records and the ``ANALYTICS:``
+review record, all with request-scoped extras. The time spent inside the
+logging calls is measured per request, and p50/p95/p99/max are reported for:
+
+- ``sync``: loguru ``serialize=True`` on the stream (the previous setup)
+- ``pipeline``: ``LogPipeline`` with the configured queue, sampling and dedup
+
+``--write-latency-us`` makes every stream write block for that long, to model
+a slow stdout pipe (log shipper back-pressure); writes go to ``os.devnull``.
+
+Usage:
+    poetry run python -m src.scripts.bench_logging
+    poetry run python -m src.scripts.bench_logging --requests 20000 --write-latency-us 50
+    poetry run python -m src.scripts.bench_logging --info-rate 0.2 --route-rate 0.5
+
+Nothing connects to Postgres, Redis or the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from typing import Any, Callable, TextIO
+from uuid import uuid4
+
+from loguru import logger
+
+from src.core.log_pipeline import LogPipeline, LogPipelineStats, end_request_sampling
+
+DEFAULT_REQUESTS = 5000
+DEFAULT_RECORDS_PER_REQUEST = 6
+
+
+class _SlowStream:
+    """Text stream over ``os.devnull`` whose writes block for a fixed time."""
+
+    def __init__(self, latency_us: float) -> None:
+        self._file: TextIO = open(os.devnull, "w")  # noqa: SIM115 - closed in close()
+        self._latency = latency_us / 1_000_000
+
+    def write(self, text: str) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._file.write(text)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _simulate_request(records: int, pipeline: LogPipeline | None) -> int:
+    """Log one request's records; returns the nanoseconds spent logging."""
+    request_logger = logger.bind(request_id=uuid4().hex[:8], user_id=str(uuid4()))
+    start = time.perf_counter_ns()
+    scope = pipeline.begin_request("/api/v1/reviews/v2") if pipeline is not None else None
+    request_logger.info(
+        "Request started",
+        method="POST",
+        path="/api/v1/reviews/v2",
+        client_ip="10.0.0.1",
+        user_agent="Mozilla/5.0",
+    )
+    for i in range(max(records - 3, 0)):
+        request_logger.info("Study queue built", deck_index=i, due=12, new=5)
+    request_logger.info(
+        "ANALYTICS: review_completed",
+        event="review_completed",
+        quality=4,
+        time_taken=7,
+        previous_status="learning",
+        new_status="review",
+    )
+    request_logger.info("Request completed", status_code=200, duration_ms=12.5)
+    if scope is not None:
+        end_request_sampling(scope)
+    return time.perf_counter_ns() - start
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return float(sorted_values[index])
+
+
+def summarize(samples_ns: list[int]) -> dict[str, float]:
+    """p50/p95/p99/max/mean of per-request samples, in microseconds."""
+    ordered = sorted(samples_ns)
+    return {
+        "p50_us": _percentile(ordered, 0.50) / 1000,
+        "p95_us": _percentile(ordered, 0.95) / 1000,
+        "p99_us": _percentile(ordered, 0.99) / 1000,
+        "max_us": ordered[-1] / 1000,
+        "mean_us": statistics.fmean(ordered) / 1000,
+    }
+
+
+def run_mode(
+    install: Callable[[Any], tuple[int, LogPipeline | None]],
+    *,
+    requests: int,
+    records: int,
+    latency_us: float,
+) -> tuple[dict[str, float], LogPipelineStats | None, float]:
+    """Run ``requests`` simulated requests against one sink setup.
+
+    Returns the per-request summary, the pipeline counters (None for the
+    synchronous sink) and the seconds the writer needed to drain afterwards.
+    """
+    stream = _SlowStream(latency_us)
+    logger.remove()
+    handler_id, pipeline = install(stream)
+    try:
+        samples = [_simulate_request(records, pipeline) for _ in range(requests)]
+        drain_start = time.perf_counter()
+        if pipeline is not None:
+            pipeline.stop(timeout=600)
+        drain_seconds = time.perf_counter() - drain_start
+        return summarize(samples), pipeline.stats() if pipeline else None, drain_seconds
+    finally:
+        logger.remove(handler_id)
+        stream.close()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure the per-request cost of logging (sync sink vs log pipeline)."
+    )
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument(
+        "--records",
+        type=int,
+        default=DEFAULT_RECORDS_PER_REQUEST,
+        help=f"Records logged per request (default: {DEFAULT_RECORDS_PER_REQUEST})",
+    )
+    parser.add_argument(
+        "--write-latency-us",
+        type=float,
+        default=0.0,
+        help="Block every stream write for this long (models a slow stdout pipe)",
+    )
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument(
+        "--info-rate", type=float, default=1.0, help="Pipeline keep rate for INFO records"
+    )
+    parser.add_argument(
+        "--route-rate", type=float, default=1.0, help="Pipeline keep rate for the request route"
+    )
+    parser.add_argument("--dedup-burst", type=int, default=20)
+    return parser
+
+
+def main() -> None:
+    """CLI entrypoint: run both modes and print the comparison."""
+    args = _build_parser().parse_args()
+
+    def sync(stream: Any) -> tuple[int, None]:
+        return logger.add(stream, serialize=True, level="INFO"), None
+
+    def piped(stream: Any) -> tuple[int, LogPipeline]:
+        pipeline = LogPipeline(
+            stream,
+            queue_size=args.queue_size,
+            level_rates={"INFO": args.info_rate},
+            route_rates={"/api/v1/reviews": args.route_rate},
+            dedup_window_seconds=10.0,
+            dedup_burst=args.dedup_burst,
+        )
+        handler_id = logger.add(
+            pipeline.enqueue, filter=pipeline.admit, format="{message}", level="INFO"
+        )
+        pipeline.start()
+        return handler_id, pipeline
+
+    print(
+        f"requests={args.requests} records/request={args.records} "
+        f"write_latency_us={args.write_latency_us}"
+    )
+    for name, install in (("sync", sync), ("pipeline", piped)):
+        summary, stats, drain = run_mode(
+            install,
+            requests=args.requests,
+            records=args.records,
+            latency_us=args.write_latency_us,
+        )
+        line = "  ".join(f"{key}={value:,.1f}" for key, value in summary.items())
+        print(f"{name:<9} {line}")
+        if stats is not None:
+            print(
+                f"{'':<9} written={stats.written} dropped_queue_full={stats.dropped_queue_full} "
+                f"dropped_sampled={stats.dropped_sampled} "
+                f"suppressed_duplicates={stats.suppressed_duplicates} drain_s={drain:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
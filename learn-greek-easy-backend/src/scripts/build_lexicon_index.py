@@ -0,0 +1,98 @@
+"""Compile reference.greek_lexicon into the memory-mapped lexicon index.
+
+Usage:
+    poetry run python -m src.scripts.build_lexicon_index                  # -> LEXICON_INDEX_PATH
+    poetry run python -m src.scripts.build_lexicon_index --output lex.idx
+
+The file format lives in :mod:`src.services.lexicon_index`. The index records
+the ``greek_lexicon`` dataset-stamp version it was built from, and
+``LexiconService`` only maps a file whose version matches the database, so
+rebuild after every lexicon load. ``load_lexicon`` does this automatically
+(inside its load transaction) when ``LEXICON_INDEX_PATH`` is set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import psycopg2
+import psycopg2.extensions
+from loguru import logger
+
+from src.config import settings
+from src.scripts.streaming_ingest import DATASET_STAMP_TABLE, Throughput
+from src.services.lexicon_index import LexiconRow, write_lexicon_index
+
+TABLE = "reference.greek_lexicon"
+FETCH_SIZE = 50_000
+
+
+def get_connection() -> psycopg2.extensions.connection:
+    """Create psycopg2 connection using sync database URL."""
+    return psycopg2.connect(settings.database_url_sync)
+
+
+def _dataset_version(conn: psycopg2.extensions.connection) -> int:
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"SELECT version FROM {DATASET_STAMP_TABLE} WHERE dataset = %s", ("greek_lexicon",)
+        )
+        row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+def _iter_rows(conn: psycopg2.extensions.connection) -> Iterator[LexiconRow]:
+    """Stream lexicon rows in load order through a server-side cursor."""
+    with conn.cursor(name="lexicon_index_rows") as cursor:
+        cursor.itersize = FETCH_SIZE
+        cursor.execute(f"SELECT form, lemma, pos, gender, ptosi, number FROM {TABLE} ORDER BY id")
+        yield from cursor
+
+
+def build_index(conn: psycopg2.extensions.connection, output: Path) -> int:
+    """Write the index for everything ``conn`` can see; returns the entry count.
+
+    The stamp is read before the rows: if a load commits in between, the file
+    claims an older version than its data and is treated as stale (safe).
+    """
+    version = _dataset_version(conn)
+    meter = Throughput(f"Build lexicon index {output}")
+    count = write_lexicon_index(_iter_rows(conn), output, version)
+    meter.add(count)
+    meter.log()
+    logger.info(
+        f"Lexicon index written: {count:,} entries, dataset version {version}, "
+        f"{output.stat().st_size / (1024 * 1024):.1f} MB"
+    )
+    return count
+
+
+def main() -> None:
+    """Parse arguments and build the index."""
+    parser = argparse.ArgumentParser(description="Build the memory-mapped Greek lexicon index")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(settings.lexicon_index_path) if settings.lexicon_index_path else None,
+        help="Index file path (default: LEXICON_INDEX_PATH)",
+    )
+    args = parser.parse_args()
+    if args.output is None:
+        logger.error("No --output given and LEXICON_INDEX_PATH is not set")
+        sys.exit(1)
+
+    conn = get_connection()
+    try:
+        build_index(conn, args.output)
+    except psycopg2.Error as e:
+        logger.error(f"Database error: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,555 @@
+"""Bulk-load a parameterized synthetic learner population for load testing.
+
+Run with::
+
+    poetry run python -m src.scripts.generate_synthetic_dataset \\
+        --users 100000 --cards-per-user 300 --reviews-per-user 2000
+
+    # one very heavy learner
+    poetry run python -m src.scripts.generate_synthetic_dataset \\
+        --users 1 --reviews-per-user 200000 --tag heavy
+
+    # remove a previous population (CASCADE clears every per-user row)
+    poetry run python -m src.scripts.generate_synthetic_dataset --purge --tag heavy
+
+``SeedService`` creates a handful of fixed E2E users; this script creates as
+many learners as asked for, each with:
+
+- a ``users`` + ``user_settings`` row (email ``<tag>+<n>@perf.invalid``),
+- ``card_record_statistics`` for ``--cards-per-user`` active card records,
+- ``card_record_reviews`` spread over a Markov-chain activity calendar, so
+  users have realistic streaks, gaps and a varying current streak,
+- ``culture_answer_history`` + ``culture_question_stats``,
+- ``exercise_records`` + ``exercise_reviews``.
+
+Per-card SM-2 state is obtained by replaying each card's generated review
+history through :func:`src.core.sm2.calculate_sm2`, so due dates, statuses and
+mastery counts are consistent with what the API would have written.
+
+Content (card records, culture questions, exercises) is NOT generated: the
+rows reference whatever the database already holds, so seed content first
+(``POST /api/v1/test/seed/all`` or the E2E seed script). Generation is
+deterministic for a given ``--seed`` and pool, and rows are streamed through
+``COPY ... FROM STDIN`` in batches of ``--batch-users`` users, one transaction
+per batch. Refuses to run against production.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Sequence
+from uuid import UUID
+
+import psycopg2
+import psycopg2.extensions
+from loguru import logger
+
+from src.config import settings
+from src.core.sm2 import (
+    DEFAULT_EASINESS_FACTOR,
+    calculate_sm2,
+    derive_exercise_quality,
+)
+from src.db.models import CardStatus
+from src.scripts.streaming_ingest import Throughput, batched, copy_rows
+
+EMAIL_DOMAIN = "perf.invalid"
+
+#: Card review quality weights for 0..5 (mostly successful recalls).
+QUALITY_WEIGHTS = (3, 4, 8, 25, 35, 25)
+CULTURE_LANGUAGES = ("en", "el", "ru")
+CULTURE_LANGUAGE_WEIGHTS = (6, 2, 2)
+CULTURE_CORRECT_RATE = 0.7
+EXERCISE_MAX_SCORE = 5
+
+USER_COLUMNS = (
+    "id",
+    "email",
+    "full_name",
+    "is_active",
+    "is_superuser",
+    "supabase_id",
+    "created_at",
+    "updated_at",
+)
+USER_SETTINGS_COLUMNS = ("user_id", "daily_goal", "email_notifications")
+CARD_STATS_COLUMNS = (
+    "user_id",
+    "card_record_id",
+    "easiness_factor",
+    "interval",
+    "repetitions",
+    "next_review_date",
+    "status",
+)
+CARD_REVIEW_COLUMNS = (
+    "user_id",
+    "card_record_id",
+    "quality",
+    "time_taken",
+    "reviewed_at",
+    "created_at",
+    "updated_at",
+)
+CULTURE_STATS_COLUMNS = (
+    "user_id",
+    "question_id",
+    "easiness_factor",
+    "interval",
+    "repetitions",
+    "next_review_date",
+    "status",
+)
+CULTURE_ANSWER_COLUMNS = (
+    "user_id",
+    "question_id",
+    "language",
+    "is_correct",
+    "selected_option",
+    "time_taken_seconds",
+    "deck_category",
+    "created_at",
+    "updated_at",
+)
+EXERCISE_RECORD_COLUMNS = (
+    "id",
+    "user_id",
+    "exercise_id",
+    "easiness_factor",
+    "interval",
+    "repetitions",
+    "next_review_date",
+    "status",
+)
+EXERCISE_REVIEW_COLUMNS = (
+    "exercise_record_id",
+    "user_id",
+    "quality",
+    "score",
+    "max_score",
+    "easiness_factor_before",
+    "easiness_factor_after",
+    "interval_before",
+    "interval_after",
+    "repetitions_before",
+    "repetitions_after",
+    "reviewed_at",
+)
+
+#: (table, columns) in FK order; ``SyntheticBatch`` keys match the table names.
+TABLES: tuple[tuple[str, Sequence[str]], ...] = (
+    ("users", USER_COLUMNS),
+    ("user_settings", USER_SETTINGS_COLUMNS),
+    ("card_record_statistics", CARD_STATS_COLUMNS),
+    ("card_record_reviews", CARD_REVIEW_COLUMNS),
+    ("culture_question_stats", CULTURE_STATS_COLUMNS),
+    ("culture_answer_history", CULTURE_ANSWER_COLUMNS),
+    ("exercise_records", EXERCISE_RECORD_COLUMNS),
+    ("exercise_reviews", EXERCISE_REVIEW_COLUMNS),
+)
+
+
+@dataclass(frozen=True)
+class Population:
+    """Size parameters for one synthetic population."""
+
+    users: int = 1_000
+    cards_per_user: int = 300
+    reviews_per_user: int = 2_000
+    history_days: int = 365
+    culture_answers_per_user: int = 200
+    exercises_per_user: int = 30
+    seed: int = 42
+    tag: str = "synthetic"
+
+
+@dataclass(frozen=True)
+class ContentPool:
+    """Existing content the synthetic rows point at."""
+
+    card_record_ids: Sequence[UUID]
+    culture_questions: Sequence[tuple[UUID, int, str]]  # (id, correct_option, category)
+    exercise_ids: Sequence[UUID]
+
+
+@dataclass
+class SyntheticBatch:
+    """Generated rows for a group of users, keyed by target table."""
+
+    rows: dict[str, list[tuple[Any, ...]]] = field(default_factory=lambda: defaultdict(list))
+
+    def count(self) -> int:
+        return sum(len(rows) for rows in self.rows.values())
+
+
+@dataclass(frozen=True)
+class _SM2State:
+    easiness_factor: float = DEFAULT_EASINESS_FACTOR
+    interval: int = 0
+    repetitions: int = 0
+    status: CardStatus = CardStatus.NEW
+
+    def review(self, quality: int) -> "_SM2State":
+        result = calculate_sm2(self.easiness_factor, self.interval, self.repetitions, quality)
+        return _SM2State(
+            result.new_easiness_factor,
+            result.new_interval,
+            result.new_repetitions,
+            result.new_status,
+        )
+
+
+def email_pattern(tag: str) -> str:
+    """SQL ``LIKE`` pattern matching every user generated under ``tag``."""
+    return f"{tag}+%@{EMAIL_DOMAIN}"
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def activity_calendar(rng: random.Random, history_days: int, activity: float) -> list[int]:
+    """Days-ago offsets (oldest first) on which a learner studied.
+
+    A two-state Markov chain: an active learner keeps studying with probability
+    ``0.6 + 0.35 * activity`` and resumes after a gap with probability
+    ``0.05 + 0.5 * activity``, which yields multi-day streaks separated by
+    breaks rather than uniformly scattered days. At least today is returned.
+    """
+    stay = 0.6 + 0.35 * activity
+    resume = 0.05 + 0.5 * activity
+    active = rng.random() < activity
+    days: list[int] = []
+    for offset in range(history_days - 1, -1, -1):
+        active = rng.random() < (stay if active else resume)
+        if active:
+            days.append(offset)
+    return days or [0]
+
+
+def _timestamp(rng: random.Random, today: date, days_ago: int) -> datetime:
+    day = datetime.combine(today - timedelta(days=days_ago), time(), tzinfo=timezone.utc)
+    return day + timedelta(seconds=rng.randint(7 * 3600, 23 * 3600 - 1))
+
+
+def _spread(rng: random.Random, count: int, days: Sequence[int], today: date) -> list[datetime]:
+    """``count`` sorted timestamps on the given study days."""
+    return sorted(_timestamp(rng, today, rng.choice(days)) for _ in range(count))
+
+
+def _add_cards(
+    batch: SyntheticBatch,
+    rng: random.Random,
+    user_id: UUID,
+    population: Population,
+    pool: ContentPool,
+    days: Sequence[int],
+    today: date,
+) -> None:
+    cards = rng.sample(
+        pool.card_record_ids, min(population.cards_per_user, len(pool.card_record_ids))
+    )
+    states = {card: _SM2State() for card in cards}
+    last_review: dict[UUID, date] = {}
+    if cards:
+        for reviewed_at in _spread(rng, population.reviews_per_user, days, today):
+            card = rng.choice(cards)
+            quality = rng.choices(range(6), weights=QUALITY_WEIGHTS)[0]
+            states[card] = states[card].review(quality)
+            last_review[card] = reviewed_at.date()
+            batch.rows["card_record_reviews"].append(
+                (user_id, card, quality, rng.randint(2, 30), reviewed_at, reviewed_at, reviewed_at)
+            )
+    for card, state in states.items():
+        due = last_review[card] + timedelta(days=state.interval) if card in last_review else today
+        batch.rows["card_record_statistics"].append(
+            (
+                user_id,
+                card,
+                state.easiness_factor,
+                state.interval,
+                state.repetitions,
+                due,
+                state.status.name,
+            )
+        )
+
+
+def _add_culture(
+    batch: SyntheticBatch,
+    rng: random.Random,
+    user_id: UUID,
+    population: Population,
+    pool: ContentPool,
+    days: Sequence[int],
+    today: date,
+) -> None:
+    if not pool.culture_questions:
+        return
+    states: dict[UUID, _SM2State] = {}
+    last_answer: dict[UUID, date] = {}
+    for answered_at in _spread(rng, population.culture_answers_per_user, days, today):
+        question_id, correct_option, category = rng.choice(pool.culture_questions)
+        is_correct = rng.random() < CULTURE_CORRECT_RATE
+        selected = (
+            correct_option
+            if is_correct
+            else rng.choice([option for option in range(1, 5) if option != correct_option])
+        )
+        states[question_id] = states.get(question_id, _SM2State()).review(3 if is_correct else 1)
+        last_answer[question_id] = answered_at.date()
+        batch.rows["culture_answer_history"].append(
+            (
+                user_id,
+                question_id,
+                rng.choices(CULTURE_LANGUAGES, weights=CULTURE_LANGUAGE_WEIGHTS)[0],
+                is_correct,
+                selected,
+                rng.randint(5, 60),
+                category,
+                answered_at,
+                answered_at,
+            )
+        )
+    for question_id, state in states.items():
+        batch.rows["culture_question_stats"].append(
+            (
+                user_id,
+                question_id,
+                state.easiness_factor,
+                state.interval,
+                state.repetitions,
+                last_answer[question_id] + timedelta(days=state.interval),
+                state.status.name,
+            )
+        )
+
+
+def _add_exercises(
+    batch: SyntheticBatch,
+    rng: random.Random,
+    user_id: UUID,
+    population: Population,
+    pool: ContentPool,
+    days: Sequence[int],
+    today: date,
+) -> None:
+    exercises = rng.sample(
+        pool.exercise_ids, min(population.exercises_per_user, len(pool.exercise_ids))
+    )
+    for exercise_id in exercises:
+        record_id = _uuid(rng)
+        state = _SM2State()
+        reviewed_on = today
+        for reviewed_at in _spread(rng, rng.randint(0, 4), days, today):
+            score = rng.randint(0, EXERCISE_MAX_SCORE)
+            quality = derive_exercise_quality(score, EXERCISE_MAX_SCORE)
+            after = state.review(quality)
+            batch.rows["exercise_reviews"].append(
+                (
+                    record_id,
+                    user_id,
+                    quality,
+                    score,
+                    EXERCISE_MAX_SCORE,
+                    state.easiness_factor,
+                    after.easiness_factor,
+                    state.interval,
+                    after.interval,
+                    state.repetitions,
+                    after.repetitions,
+                    reviewed_at,
+                )
+            )
+            state, reviewed_on = after, reviewed_at.date()
+        batch.rows["exercise_records"].append(
+            (
+                record_id,
+                user_id,
+                exercise_id,
+                state.easiness_factor,
+                state.interval,
+                state.repetitions,
+                reviewed_on + timedelta(days=state.interval),
+                state.status.name,
+            )
+        )
+
+
+def generate_user(
+    batch: SyntheticBatch,
+    population: Population,
+    pool: ContentPool,
+    index: int,
+    today: date,
+) -> UUID:
+    """Append every row for synthetic user number ``index`` to ``batch``.
+
+    Each user gets its own RNG derived from ``(seed, index)``, so a user's rows
+    do not depend on batch boundaries or on the users generated before it.
+    """
+    rng = random.Random(f"{population.seed}:{index}")
+    user_id = _uuid(rng)
+    joined = datetime.combine(
+        today - timedelta(days=population.history_days), time(), tzinfo=timezone.utc
+    )
+    batch.rows["users"].append(
+        (
+            user_id,
+            f"{population.tag}+{index:07d}@{EMAIL_DOMAIN}",
+            f"Synthetic Learner {index}",
+            True,
+            False,
+            f"{population.tag}-{user_id}",
+            joined,
+            joined,
+        )
+    )
+    batch.rows["user_settings"].append((user_id, rng.choice((10, 20, 30, 50)), False))
+
+    days = activity_calendar(rng, population.history_days, rng.betavariate(2, 3))
+    _add_cards(batch, rng, user_id, population, pool, days, today)
+    _add_culture(batch, rng, user_id, population, pool, days, today)
+    _add_exercises(batch, rng, user_id, population, pool, days, today)
+    return user_id
+
+
+# ---------------------------------------------------------------------------
+# Database
+# ---------------------------------------------------------------------------
+
+
+def get_connection() -> psycopg2.extensions.connection:
+    """Create psycopg2 connection using sync database URL."""
+    return psycopg2.connect(settings.database_url_sync)
+
+
+def load_content_pool(cursor: psycopg2.extensions.cursor) -> ContentPool:
+    """Read the ids of the content rows synthetic users will reference."""
+    cursor.execute("SELECT id FROM card_records WHERE is_active ORDER BY id")
+    card_record_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT q.id, q.correct_option, d.category FROM culture_questions q "
+        "JOIN culture_decks d ON d.id = q.deck_id "
+        "WHERE NOT q.is_pending_review ORDER BY q.id"
+    )
+    culture_questions = [tuple(row) for row in cursor.fetchall()]
+    cursor.execute("SELECT id FROM exercises ORDER BY id")
+    exercise_ids = [row[0] for row in cursor.fetchall()]
+    return ContentPool(card_record_ids, culture_questions, exercise_ids)  # type: ignore[arg-type]
+
+
+def purge(conn: psycopg2.extensions.connection, tag: str) -> int:
+    """Delete every user generated under ``tag``; FKs cascade to their rows."""
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM users WHERE email LIKE %s", (email_pattern(tag),))
+        deleted = max(cursor.rowcount, 0)
+    conn.commit()
+    logger.info(f"Purged {deleted:,} synthetic users tagged {tag!r}")
+    return deleted
+
+
+def write_batch(cursor: psycopg2.extensions.cursor, batch: SyntheticBatch) -> int:
+    """COPY one batch into every table in FK order; returns rows written."""
+    written = 0
+    for table, columns in TABLES:
+        rows = batch.rows.get(table)
+        if rows:
+            written += copy_rows(cursor, table, columns, rows)
+    return written
+
+
+def generate(
+    conn: psycopg2.extensions.connection,
+    population: Population,
+    *,
+    batch_users: int = 500,
+    today: date | None = None,
+) -> int:
+    """Generate and load ``population``; returns the total number of rows written."""
+    today = today or date.today()
+    with conn.cursor() as cursor:
+        pool = load_content_pool(cursor)
+    conn.commit()
+    if not pool.card_record_ids:
+        raise RuntimeError("No active card_records found; seed content before generating users")
+    logger.info(
+        f"Content pool: {len(pool.card_record_ids):,} cards, "
+        f"{len(pool.culture_questions):,} culture questions, {len(pool.exercise_ids):,} exercises"
+    )
+
+    meter = Throughput(f"Synthetic population {population.tag!r}")
+    for indexes in batched(range(population.users), batch_users):
+        batch = SyntheticBatch()
+        for index in indexes:
+            generate_user(batch, population, pool, index, today)
+        with conn.cursor() as cursor:
+            # Throwaway benchmark data: trade durability for load speed.
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            meter.add(write_batch(cursor, batch))
+        conn.commit()
+        logger.info(f"Loaded users {indexes[0]:,}..{indexes[-1]:,} ({meter.rows:,} rows so far)")
+
+    with conn.cursor() as cursor:
+        for table, _ in TABLES:
+            cursor.execute(f"ANALYZE {table}")
+    conn.commit()
+    meter.log()
+    return meter.rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    defaults = Population()
+    parser = argparse.ArgumentParser(description="Bulk-load a synthetic learner population")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--cards-per-user", type=int, default=defaults.cards_per_user)
+    parser.add_argument("--reviews-per-user", type=int, default=defaults.reviews_per_user)
+    parser.add_argument("--history-days", type=int, default=defaults.history_days)
+    parser.add_argument(
+        "--culture-answers-per-user", type=int, default=defaults.culture_answers_per_user
+    )
+    parser.add_argument("--exercises-per-user", type=int, default=defaults.exercises_per_user)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--tag", default=defaults.tag, help="Email tag identifying this population")
+    parser.add_argument("--batch-users", type=int, default=500, help="Users per COPY batch")
+    parser.add_argument(
+        "--purge", action="store_true", help="Delete the tagged population and exit"
+    )
+    args = parser.parse_args(argv)
+
+    if settings.is_production:
+        logger.error("Refusing to generate synthetic data in production")
+        sys.exit(1)
+
+    conn = get_connection()
+    try:
+        if args.purge:
+            purge(conn, args.tag)
+            return
+        population = Population(
+            users=args.users,
+            cards_per_user=args.cards_per_user,
+            reviews_per_user=args.reviews_per_user,
+            history_days=args.history_days,
+            culture_answers_per_user=args.culture_answers_per_user,
+            exercises_per_user=args.exercises_per_user,
+            seed=args.seed,
+            tag=args.tag,
+        )
+        generate(conn, population, batch_users=args.batch_users)
+    except (psycopg2.Error, RuntimeError) as e:
+        conn.rollback()
+        logger.error(f"Generation failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
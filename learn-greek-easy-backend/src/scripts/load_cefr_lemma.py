@@ -70,6 +70,7 @@ from loguru import logger
 
 from src.config import settings
 from src.schemas.nlp import NormalizedLemma
+from src.scripts.streaming_ingest import bump_dataset_stamp
 
 CEFR_TABLE = "reference.cefr_lemma"
 REVIEW_TABLE = "reference.cefr_lemma_review"
@@ -457,6 +458,7 @@ def load_data(
             # 8. Batch insert survivors and review rows.
             inserted = _insert_main_rows(cursor, main_rows)
             reviewed = _insert_review_rows(cursor, review_rows)
+            bump_dataset_stamp(cursor, "cefr_lemma")
             conn.commit()
 
             # 9. Per-source summary (AC-16).
@@ -44,6 +44,7 @@ from loguru import logger
 
 from src.config import settings
 from src.schemas.nlp import NormalizedLemma
+from src.scripts.streaming_ingest import Throughput, bump_dataset_stamp
 from src.utils.greek_text import _final_sigma_unfold  # noqa: WPS450 (private import by design)
 
 FREQUENCY_TABLE = "reference.frequency_rank"
@@ -240,6 +241,7 @@ def load_data(
         word_source = _resolve_word_source()
 
     # 1. Read surface tokens, applying limit.
+    normalise_meter = Throughput("Read + normalise surface tokens")
     raw_items: list[tuple[str, float]] = []
     for i, (token, freq) in enumerate(word_source()):
         if limit is not None and i >= limit:
@@ -250,6 +252,8 @@ def load_data(
 
     # 2. Normalise surface tokens → lemma; drop confidence==0.0 tokens.
     lemma_freq_pairs, dropped = _normalise_tokens(raw_items, normalize)
+    normalise_meter.add(surface_count)
+    normalise_meter.log()
 
     # 3. Aggregate frequencies by lemma and compute dense ranks.
     ranked = dense_rank(aggregate_by_lemma(lemma_freq_pairs))
@@ -262,13 +266,17 @@ def load_data(
     # 4. Open DB connection and write.
     conn = _get_connection()
     try:
+        insert_meter = Throughput(f"Insert into {FREQUENCY_TABLE}")
         with conn.cursor() as cursor:
             if force:
                 logger.warning(f"--force: deleting all rows from {FREQUENCY_TABLE}")
                 cursor.execute(f"DELETE FROM {FREQUENCY_TABLE}")
             inserted = _insert_ranked_rows(cursor, ranked)
+            bump_dataset_stamp(cursor, "frequency_rank")
 
         conn.commit()
+        insert_meter.add(inserted)
+        insert_meter.log()
 
         # 5. Summary logging.
         max_rank = ranked[-1][1] if ranked else 0
@@ -3,6 +3,10 @@
 Usage:
     poetry run python -m src.scripts.load_lexicon           # Normal load
     poetry run python -m src.scripts.load_lexicon --force    # Truncate and reload
+
+When ``LEXICON_INDEX_PATH`` is set, the memory-mapped lexicon index
+(:mod:`src.scripts.build_lexicon_index`) is rebuilt from the new rows before
+the load commits, so it carries the new dataset-stamp version.
 """
 
 import argparse
@@ -16,6 +20,7 @@ import psycopg2.extensions
 from loguru import logger
 
 from src.config import settings
+from src.scripts.streaming_ingest import bump_dataset_stamp
 
 # Path to compressed CSV -- repo root / data / greek_lexicon.csv.gz
 DATA_FILE = Path(__file__).resolve().parent.parent.parent.parent / "data" / "greek_lexicon.csv.gz"
@@ -90,6 +95,11 @@ def load_data(force: bool = False) -> None:
         with gzip.open(DATA_FILE, "rt", encoding="utf-8") as f:
             cursor.copy_expert(copy_sql, f)
 
+        bump_dataset_stamp(cursor, "greek_lexicon")
+        if settings.lexicon_index_path:
+            from src.scripts.build_lexicon_index import build_index  # noqa: PLC0415
+
+            build_index(conn, Path(settings.lexicon_index_path))
         conn.commit()
         duration = time.monotonic() - start
 
@@ -18,6 +18,7 @@ import psycopg2.extras
 from loguru import logger
 
 from src.config import settings
+from src.scripts.streaming_ingest import bump_dataset_stamp
 from src.utils.gloss_cleaning import clean_gloss
 from src.utils.pos_mapping import map_pos
 
@@ -162,6 +163,7 @@ def load_data(force: bool = False) -> None:
         """
 
         total_count, skipped_count = _parse_rows(cursor, insert_sql)
+        bump_dataset_stamp(cursor, "translations")
         conn.commit()
         duration = time.monotonic() - start
 
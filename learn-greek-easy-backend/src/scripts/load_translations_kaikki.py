@@ -3,21 +3,30 @@
 Usage:
     poetry run python -m src.scripts.load_translations_kaikki           # Normal load
     poetry run python -m src.scripts.load_translations_kaikki --force    # Delete and reload
+    poetry run python -m src.scripts.load_translations_kaikki --force --workers 4
 """
 
 import argparse
 import json
 import sys
-import time
 import unicodedata
 from pathlib import Path
+from typing import Iterator
 
 import psycopg2
 import psycopg2.extensions
-import psycopg2.extras
 from loguru import logger
 
 from src.config import settings
+from src.scripts.streaming_ingest import (
+    Throughput,
+    bump_dataset_stamp,
+    copy_rows,
+    create_staging_table,
+    iter_jsonl_lines,
+    parse_chunks,
+    swap_from_staging,
+)
 from src.utils.gloss_cleaning import clean_gloss
 from src.utils.pos_mapping import map_pos
 
@@ -28,8 +37,12 @@ DATA_FILE = (
 )
 
 TABLE = "reference.translations"
+STAGING_TABLE = "translations_kaikki_staging"
 SOURCE = "kaikki"
-BATCH_SIZE = 10_000
+COLUMNS = ("lemma", "language", "sense_index", "translation", "part_of_speech", "source")
+
+#: One ``reference.translations`` row in :data:`COLUMNS` order.
+TranslationRow = tuple[str, str, int, str, str | None, str]
 
 
 def get_connection() -> psycopg2.extensions.connection:
@@ -44,67 +57,49 @@ def get_row_count(cursor: psycopg2.extensions.cursor, source: str) -> int:
     return int(row[0])
 
 
-def _parse_rows(
-    cursor: psycopg2.extensions.cursor,
-    insert_sql: str,
-) -> tuple[int, int]:
-    """Parse JSONL and insert rows in batches. Returns (total_count, skipped_count)."""
-    batch: list[tuple[str, str, int, str, str | None, str]] = []
-    total_count = 0
-    skipped_count = 0
-
-    with DATA_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                logger.warning(f"Skipping invalid JSON line: {line[:80]}")
-                continue
-            total_count, skipped_count, batch = _process_entry(
-                entry, batch, cursor, insert_sql, total_count, skipped_count
-            )
+def _parse_chunk(lines: list[str]) -> tuple[list[TranslationRow], int]:
+    """Parse a chunk of JSONL lines into translation rows. Returns (rows, skipped_glosses).
 
-    if batch:
-        psycopg2.extras.execute_values(cursor, insert_sql, batch)
-        total_count += len(batch)
-
-    return total_count, skipped_count
-
-
-def _process_entry(
-    entry: dict,
-    batch: list,
-    cursor: psycopg2.extensions.cursor,
-    insert_sql: str,
-    total_count: int,
-    skipped_count: int,
-) -> tuple[int, int, list]:
-    """Process one JSONL entry, flushing batch when full."""
+    Module-level and pure so :func:`parse_chunks` can run it in a worker process.
+    """
+    rows: list[TranslationRow] = []
+    skipped_count = 0
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping invalid JSON line: {line[:80]}")
+            continue
+        skipped_count += _process_entry(entry, rows)
+    return rows, skipped_count
+
+
+def _process_entry(entry: dict, rows: list[TranslationRow]) -> int:
+    """Append one JSONL entry's cleaned glosses to ``rows``. Returns skipped gloss count."""
     raw_lemma = entry.get("word", "")
     if not raw_lemma:
-        return total_count, skipped_count, batch
+        return 0
 
     lemma = unicodedata.normalize("NFC", raw_lemma)
     raw_pos = entry.get("pos", "")
     upos: str | None = map_pos(raw_pos) if raw_pos else None
 
+    skipped_count = 0
     for sense_index, sense in enumerate(entry.get("senses", [])):
         for gloss in sense.get("glosses", []):
             cleaned = clean_gloss(gloss)
             if cleaned is None:
                 skipped_count += 1
                 continue
-            batch.append((lemma, "en", sense_index, cleaned, upos, SOURCE))
-            if len(batch) >= BATCH_SIZE:
-                psycopg2.extras.execute_values(cursor, insert_sql, batch)
-                total_count += len(batch)
-                batch = []
-                logger.debug(f"Inserted {total_count:,} rows so far...")
+            rows.append((lemma, "en", sense_index, cleaned, upos, SOURCE))
+    return skipped_count
 
-    return total_count, skipped_count, batch
+
+def _stream_rows(workers: int, skipped_ref: list[int]) -> Iterator[TranslationRow]:
+    """Lazily yield translation rows from the dump, tallying skipped glosses."""
+    for rows, skipped in parse_chunks(iter_jsonl_lines(DATA_FILE), _parse_chunk, workers=workers):
+        skipped_ref[0] += skipped
+        yield from rows
 
 
 def _log_mismatch_report(cursor: psycopg2.extensions.cursor, source: str) -> None:
@@ -137,11 +132,16 @@ def _log_mismatch_report(cursor: psycopg2.extensions.cursor, source: str) -> Non
             logger.info("Consider accent-insensitive fallback for unmatched lemmas")
 
 
-def load_data(force: bool = False) -> None:
+def load_data(force: bool = False, workers: int = 1) -> None:
     """Load Greek-English translations from Kaikki JSONL into database.
 
+    Rows are parsed lazily (optionally across ``workers`` processes), streamed
+    into a staging table via COPY, and moved into ``reference.translations``
+    in the same transaction, so readers never see a half-loaded source.
+
     Args:
-        force: If True, delete existing kaikki rows before loading.
+        force: If True, replace existing kaikki rows.
+        workers: Number of parser processes (1 = parse inline).
     """
     conn = get_connection()
     try:
@@ -156,29 +156,37 @@ def load_data(force: bool = False) -> None:
             )
             return
 
-        if count > 0 and force:
-            logger.warning(f"Force mode: deleting {count:,} existing rows for source='{SOURCE}'...")
-            cursor.execute(f"DELETE FROM {TABLE} WHERE source = %s", (SOURCE,))
-
         if not DATA_FILE.exists():
             logger.error(f"Data file not found: {DATA_FILE}")
             sys.exit(1)
 
-        logger.info(f"Loading data from {DATA_FILE}...")
-        start = time.monotonic()
+        logger.info(f"Loading data from {DATA_FILE} with {workers} parser worker(s)...")
+        create_staging_table(cursor, STAGING_TABLE, TABLE, COLUMNS)
 
-        insert_sql = f"""
-            INSERT INTO {TABLE} (lemma, language, sense_index, translation, part_of_speech, source)
-            VALUES %s
-        """
-
-        total_count, skipped_count = _parse_rows(cursor, insert_sql)
+        copy_meter = Throughput("COPY into staging")
+        skipped_ref = [0]
+        copy_meter.add(
+            copy_rows(cursor, STAGING_TABLE, COLUMNS, _stream_rows(workers, skipped_ref))
+        )
+        copy_meter.log()
+
+        swap_meter = Throughput(f"Swap into {TABLE}")
+        swap_meter.add(
+            swap_from_staging(
+                cursor,
+                TABLE,
+                STAGING_TABLE,
+                COLUMNS,
+                replace=count > 0,
+                scope_sql="source = %s",
+                scope_params=(SOURCE,),
+            )
+        )
+        bump_dataset_stamp(cursor, "translations")
         conn.commit()
-        duration = time.monotonic() - start
+        swap_meter.log()
 
-        logger.info(
-            f"Loaded {total_count:,} rows in {duration:.1f}s (skipped {skipped_count:,} glosses)"
-        )
+        logger.info(f"Loaded {swap_meter.rows:,} rows (skipped {skipped_ref[0]:,} glosses)")
         _log_mismatch_report(cursor, SOURCE)
 
     except psycopg2.Error as e:
@@ -203,8 +211,14 @@ def main() -> None:
         action="store_true",
         help="Delete existing kaikki rows and reload",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parser processes to fan JSONL parsing out to (default: 1, inline)",
+    )
     args = parser.parse_args()
-    load_data(force=args.force)
+    load_data(force=args.force, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -22,6 +22,7 @@ import psycopg2.extras
 from loguru import logger
 
 from src.config import settings
+from src.scripts.streaming_ingest import bump_dataset_stamp
 from src.utils.pos_mapping import map_pos
 
 DATA_FILE = (
@@ -226,6 +227,7 @@ def load_data(force: bool = False) -> None:
         en_ru_dict = build_en_ru_dict(DATA_FILE)
         total_pivots, exact_pos, fallback = generate_pivots(conn, en_ru_dict)
 
+        bump_dataset_stamp(cursor, "translations")
         conn.commit()
         total_duration = time.monotonic() - overall_start
 
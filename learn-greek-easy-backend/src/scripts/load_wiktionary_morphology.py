@@ -1,6 +1,14 @@
 """Load Wiktionary noun morphology from Kaikki JSONL into reference.wiktionary_morphology.
 
-Run with: poetry run python -m src.scripts.load_wiktionary_morphology [--force]
+Run with: poetry run python -m src.scripts.load_wiktionary_morphology [--force] [--workers N]
+
+The load streams (see :mod:`src.scripts.streaming_ingest`): matching entries are
+parsed lazily — optionally across ``--workers`` processes — and COPYed unmerged
+into a raw staging table tagged with their dump order. Postgres then sorts them
+by ``(lemma, pos, gender)``, and each group is merged in Python (first form /
+IPA wins, glosses unioned) and COPYed into a second staging table, which is
+swapped into the target in the same transaction. Only one merge group is held
+in memory at a time, whatever the dump size.
 """
 
 from __future__ import annotations
@@ -9,17 +17,27 @@ import argparse
 import json
 import re
 import sys
-import time
+from functools import partial
+from itertools import groupby
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import psycopg2
 import psycopg2.extensions
-import psycopg2.extras
 from loguru import logger
 
 from src.config import settings
 from src.core.lexgen_forms import flat_to_bundles
 from src.schemas.lexgen import FormBundle
+from src.scripts.streaming_ingest import (
+    Throughput,
+    batched,
+    copy_rows,
+    create_staging_table,
+    iter_jsonl_lines,
+    parse_chunks,
+    swap_from_staging,
+)
 
 DATA_FILE = (
     Path(__file__).resolve().parent.parent.parent.parent
@@ -27,6 +45,10 @@ DATA_FILE = (
     / "kaikki.org-dictionary-Greek.jsonl"
 )
 TABLE = "reference.wiktionary_morphology"
+RAW_STAGING_TABLE = "wiktionary_morphology_raw"
+STAGING_TABLE = "wiktionary_morphology_staging"
+COLUMNS = ("lemma", "gender", "forms", "pos", "pronunciation", "glosses_en")
+RAW_COLUMNS = ("ord", "lemma", "pos", "gender", "forms", "pronunciation", "glosses_en")
 BATCH_SIZE = 10_000
 GENDER_MAP = {"m": "masculine", "f": "feminine", "n": "neuter"}
 INFLECTED_FORM_RE = re.compile(
@@ -111,6 +133,32 @@ def _merge_into(
         existing["pronunciation"] = ipa
 
 
+def _classify_entry(entry: dict, pos: str) -> dict | None:
+    """Build the unmerged row for one entry, or return None if it is filtered out.
+
+    Filtered entries are inflected-form cross-references and entries without a
+    gender or lemma. The row's ``forms`` is still the flat ``{case}_{number}`` dict.
+    """
+    if _is_inflected_form_only(entry):
+        return None
+
+    gender = _get_gender(entry)
+    if gender is None:
+        return None
+
+    lemma = str(entry.get("word", "")).strip()
+    if not lemma:
+        return None
+    return {
+        "lemma": lemma,
+        "pos": pos,
+        "gender": gender,
+        "forms": _extract_forms(entry),
+        "pronunciation": _extract_ipa(entry),
+        "glosses_en": _extract_glosses(entry),
+    }
+
+
 def _process_noun_entry(
     entry: dict,
     merged: dict,
@@ -121,40 +169,31 @@ def _process_noun_entry(
     """Process a single entry, updating merged dict and counters."""
     total_raw_ref[0] += 1
 
-    if _is_inflected_form_only(entry):
+    row = _classify_entry(entry, pos)
+    if row is None:
         filtered_ref[0] += 1
         return
 
-    gender = _get_gender(entry)
-    if gender is None:
-        filtered_ref[0] += 1
-        return
-
-    lemma = str(entry.get("word", "")).strip()
-    if not lemma:
-        filtered_ref[0] += 1
-        return
-    key = (lemma, pos, gender)
-    forms = _extract_forms(entry)
-    ipa = _extract_ipa(entry)
-    glosses = _extract_glosses(entry)
-
+    key = (row["lemma"], pos, row["gender"])
     if key in merged:
-        _merge_into(merged[key], forms, ipa, glosses)
+        _merge_into(merged[key], row["forms"], row["pronunciation"], row["glosses_en"])
     else:
-        merged[key] = {
-            "lemma": lemma,
-            "pos": pos,
-            "gender": gender,
-            "forms": forms,
-            "pronunciation": ipa,
-            "glosses_en": glosses,
-        }
+        merged[key] = row
+
+
+def _to_bundle_forms(row: dict) -> dict:
+    """Convert a merged row's flat forms to a JSON-ready bundle list (in-place)."""
+    bundles = flat_to_bundles(row["forms"], pos=row["pos"])
+    row["forms"] = [bundle.model_dump(mode="json") for bundle in bundles]
+    return row
 
 
 def _parse_entries(path: Path, pos: str = "noun") -> tuple[list[dict], int, int]:
     """Parse JSONL file, returning merged list of rows keyed by (lemma, pos, gender).
 
+    In-memory counterpart of the streaming load in :func:`load_data`, sharing its
+    per-entry classification and merge rules; handy for fixtures and small files.
+
     Forms are merged as flat ``{case}_{number}`` dicts across duplicate entries,
     then converted ONCE — after all merging completes — to feature-keyed
     ``FormBundle`` dicts via :func:`flat_to_bundles`, so each returned row's
@@ -180,8 +219,7 @@ def _parse_entries(path: Path, pos: str = "noun") -> tuple[list[dict], int, int]
     # Convert each row's combined flat forms to a feature-keyed bundle list
     # exactly once, after all cross-entry merging is complete.
     for row in merged.values():
-        bundles = flat_to_bundles(row["forms"], pos=row["pos"])
-        row["forms"] = [bundle.model_dump(mode="json") for bundle in bundles]
+        _to_bundle_forms(row)
 
     filtered = filtered_ref[0]
     total_raw = total_raw_ref[0]
@@ -206,13 +244,84 @@ def _log_mismatch_report(cursor: psycopg2.extensions.cursor) -> None:
     )
 
 
-def _insert_rows(cursor: psycopg2.extensions.cursor, rows: list[dict]) -> tuple[int, int, int]:
-    """Batch-insert rows; return (with_forms, with_ipa, with_glosses) counts."""
-    insert_sql = f"""
-        INSERT INTO {TABLE} (lemma, gender, forms, pos, pronunciation, glosses_en)
-        VALUES %s
-        ON CONFLICT DO NOTHING
+def _parse_chunk(lines: list[str], pos: str) -> tuple[list[dict], int, int]:
+    """Classify a chunk of JSONL lines. Returns (kept_rows, pos_matched, filtered).
+
+    Module-level and pure so :func:`parse_chunks` can run it in a worker process.
+    """
+    rows: list[dict] = []
+    matched = filtered = 0
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if entry.get("pos") != pos:
+            continue
+        matched += 1
+        row = _classify_entry(entry, pos)
+        if row is None:
+            filtered += 1
+        else:
+            rows.append(row)
+    return rows, matched, filtered
+
+
+def _stream_raw_rows(pos: str, workers: int, counts: list[int]) -> Iterator[tuple]:
+    """Lazily yield unmerged RAW_COLUMNS tuples, tallying (matched, filtered) into counts."""
+    ordinal = 0
+    chunk_results = parse_chunks(
+        iter_jsonl_lines(DATA_FILE), partial(_parse_chunk, pos=pos), workers=workers
+    )
+    for rows, matched, filtered in chunk_results:
+        counts[0] += matched
+        counts[1] += filtered
+        for row in rows:
+            yield (
+                ordinal,
+                row["lemma"],
+                row["pos"],
+                row["gender"],
+                row["forms"],
+                row["pronunciation"],
+                row["glosses_en"],
+            )
+            ordinal += 1
+
+
+def _iter_merged_rows(conn: psycopg2.extensions.connection) -> Iterator[dict]:
+    """Read raw rows back sorted by merge key and yield one merged row per group.
+
+    Uses a server-side cursor so only ``BATCH_SIZE`` raw rows are buffered.
+    Rows within a group arrive in dump order, so first-wins merging matches
+    :func:`_parse_entries`.
     """
+    with conn.cursor(name="wiktionary_morphology_merge") as cursor:
+        cursor.itersize = BATCH_SIZE
+        cursor.execute(f"""
+            SELECT lemma, pos, gender, forms, pronunciation, glosses_en
+            FROM {RAW_STAGING_TABLE}
+            ORDER BY lemma, pos, gender, ord
+            """)
+        for _key, group in groupby(cursor, key=lambda r: (r[0], r[1], r[2])):
+            lemma, pos, gender, forms, pronunciation, glosses = next(group)
+            row = {
+                "lemma": lemma,
+                "pos": pos,
+                "gender": gender,
+                "forms": dict(forms),
+                "pronunciation": pronunciation,
+                "glosses_en": glosses,
+            }
+            for _l, _p, _g, dup_forms, dup_ipa, dup_glosses in group:
+                _merge_into(row, dup_forms, dup_ipa, dup_glosses)
+            yield _to_bundle_forms(row)
+
+
+def _insert_rows(
+    cursor: psycopg2.extensions.cursor, rows: Iterable[dict], table: str = STAGING_TABLE
+) -> tuple[int, int, int]:
+    """COPY merged rows into ``table``; return (with_forms, with_ipa, with_glosses) counts."""
     with_forms = with_ipa = with_glosses = 0
     batch: list[tuple] = []
 
@@ -227,7 +336,7 @@ def _insert_rows(cursor: psycopg2.extensions.cursor, rows: list[dict]) -> tuple[
         # JSON-serializable dicts (already-dict elements pass through unchanged).
         # Not dead: the isinstance branch is exercised by tests that call
         # _insert_rows directly with FormBundle objects (e.g. flat_to_bundles
-        # output), while the _parse_entries flow already supplies plain dicts.
+        # output), while the streaming merge already supplies plain dicts.
         forms_payload = [
             bundle.model_dump(mode="json") if isinstance(bundle, FormBundle) else bundle
             for bundle in row["forms"]
@@ -236,48 +345,87 @@ def _insert_rows(cursor: psycopg2.extensions.cursor, rows: list[dict]) -> tuple[
             (
                 row["lemma"],
                 row["gender"],
-                psycopg2.extras.Json(forms_payload),
+                forms_payload,
                 row["pos"],
                 row["pronunciation"],
                 row["glosses_en"],
             )
         )
-        if len(batch) >= BATCH_SIZE:
-            psycopg2.extras.execute_values(cursor, insert_sql, batch)
-            batch = []
 
     if batch:
-        psycopg2.extras.execute_values(cursor, insert_sql, batch)
+        copy_rows(cursor, table, COLUMNS, batch)
 
     return with_forms, with_ipa, with_glosses
 
 
-def load_data(force: bool = False, pos: str = "noun") -> None:
+def _load_merged(
+    conn: psycopg2.extensions.connection,
+    cursor: psycopg2.extensions.cursor,
+    force: bool,
+    pos: str,
+    workers: int,
+) -> None:
+    """Run the raw COPY → sorted merge → staging COPY → swap phases in one transaction."""
+    cursor.execute(f"""
+        CREATE TEMP TABLE {RAW_STAGING_TABLE} (
+            ord bigint, lemma text, pos text, gender text,
+            forms jsonb, pronunciation text, glosses_en text
+        ) ON COMMIT DROP
+        """)
+    counts = [0, 0]
+    raw_meter = Throughput("Parse + COPY raw entries")
+    raw_meter.add(
+        copy_rows(cursor, RAW_STAGING_TABLE, RAW_COLUMNS, _stream_raw_rows(pos, workers, counts))
+    )
+    raw_meter.log()
+
+    create_staging_table(cursor, STAGING_TABLE, TABLE, COLUMNS)
+    merge_meter = Throughput("Merge + COPY staging rows")
+    with_forms = with_ipa = with_glosses = 0
+    # Each batch is fully materialised before its COPY starts: the server-side
+    # merge cursor cannot FETCH while the connection is in COPY mode.
+    for chunk in batched(_iter_merged_rows(conn), BATCH_SIZE):
+        chunk_forms, chunk_ipa, chunk_glosses = _insert_rows(cursor, chunk)
+        with_forms += chunk_forms
+        with_ipa += chunk_ipa
+        with_glosses += chunk_glosses
+        merge_meter.add(len(chunk))
+    merge_meter.log()
+
+    swap_meter = Throughput(f"Swap into {TABLE}")
+    swap_meter.add(
+        swap_from_staging(
+            cursor,
+            TABLE,
+            STAGING_TABLE,
+            COLUMNS,
+            replace=force,
+            on_conflict="ON CONFLICT DO NOTHING",
+        )
+    )
+    conn.commit()
+    swap_meter.log()
+
+    total_raw, filtered = counts
+    merged = max(0, total_raw - filtered - merge_meter.rows)
+    logger.info(f"Parsed {total_raw:,} {pos} entries from JSONL")
+    logger.info(f"Loaded {swap_meter.rows:,} rows")
+    logger.info(f"  With declension forms: {with_forms:,}")
+    logger.info(f"  With IPA: {with_ipa:,}")
+    logger.info(f"  With glosses: {with_glosses:,}")
+    logger.info(f"  Filtered (inflected-form refs or no gender): {filtered:,}")
+    logger.info(f"  Merged (duplicate lemma+pos+gender): {merged:,}")
+
+
+def load_data(force: bool = False, pos: str = "noun", workers: int = 1) -> None:
     if not DATA_FILE.exists():
         logger.error(f"Data file not found: {DATA_FILE}")
         sys.exit(1)
 
-    start = time.time()
-    rows, filtered, merged = _parse_entries(DATA_FILE, pos=pos)
-
     conn = _get_connection()
     try:
         with conn.cursor() as cursor:
-            if force:
-                logger.warning(f"--force: deleting all rows from {TABLE}")
-                cursor.execute(f"DELETE FROM {TABLE}")
-
-            with_forms, with_ipa, with_glosses = _insert_rows(cursor, rows)
-            conn.commit()
-
-            duration = time.time() - start
-            logger.info(f"Loaded {len(rows):,} rows in {duration:.1f}s")
-            logger.info(f"  With declension forms: {with_forms:,}")
-            logger.info(f"  With IPA: {with_ipa:,}")
-            logger.info(f"  With glosses: {with_glosses:,}")
-            logger.info(f"  Filtered (inflected-form refs): {filtered:,}")
-            logger.info(f"  Merged (duplicate lemma+gender): {merged:,}")
-
+            _load_merged(conn, cursor, force=force, pos=pos, workers=workers)
             _log_mismatch_report(cursor)
 
     except psycopg2.Error as exc:
@@ -294,8 +442,14 @@ def main() -> None:
     )
     parser.add_argument("--force", action="store_true", help="Delete existing rows and reload")
     parser.add_argument("--pos", default="noun", help="Part of speech to load (default: noun)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parser processes to fan JSONL parsing out to (default: 1, inline)",
+    )
     args = parser.parse_args()
-    load_data(force=args.force, pos=args.pos)
+    load_data(force=args.force, pos=args.pos, workers=args.workers)
 
 
 if __name__ == "__main__":
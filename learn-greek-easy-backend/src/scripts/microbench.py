@@ -0,0 +1,218 @@
+"""Offline micro-benchmarks for pure hot-path functions, with baselines.
+
+Run with::
+
+    # measure and save a baseline (do this on the reference machine / branch)
+    poetry run python -m src.scripts.microbench run --save microbench-baseline.json
+
+    # measure again and fail (exit 1) if any case is >15% slower
+    poetry run python -m src.scripts.microbench run --compare microbench-baseline.json
+
+    # compare two saved runs
+    poetry run python -m src.scripts.microbench compare base.json current.json --threshold 0.10
+
+Cases live in :mod:`src.scripts.microbench_cases`; ``--filter`` selects by
+substring. Statistics: each case is calibrated so one sample lasts at least
+``--min-sample-ms``, then ``--repeat`` samples are taken with GC disabled
+(``timeit``). The median per-call time is the comparison statistic; the
+relative inter-quartile range is reported as noise. A case regresses when its
+median exceeds the baseline median by more than the threshold. Baselines are
+machine-specific: only compare runs from the same host and interpreter.
+
+Nothing connects to Postgres, Redis or the network; importing the service
+modules only needs the usual settings environment (``.env``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from src.scripts.microbench_cases import BenchCase, build_cases
+
+DEFAULT_REPEAT = 15
+DEFAULT_MIN_SAMPLE_MS = 20.0
+DEFAULT_THRESHOLD = 0.15
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Per-call timing statistics for one case, in nanoseconds."""
+
+    name: str
+    number: int
+    median_ns: float
+    min_ns: float
+    iqr_ns: float
+
+    @property
+    def noise(self) -> float:
+        """Inter-quartile range relative to the median."""
+        return self.iqr_ns / self.median_ns if self.median_ns else 0.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Baseline vs current for one case; ``status`` drives the exit code."""
+
+    name: str
+    status: str  # ok | regressed | improved | new | missing
+    baseline_ns: float | None
+    current_ns: float | None
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline_ns or self.current_ns is None:
+            return None
+        return self.current_ns / self.baseline_ns - 1
+
+
+def summarize(name: str, number: int, sample_seconds: Sequence[float]) -> Measurement:
+    """Reduce raw ``timeit`` samples (seconds per ``number`` calls) to per-call stats."""
+    per_call = sorted(s / number * 1e9 for s in sample_seconds)
+    if len(per_call) >= 4:
+        q1, _, q3 = statistics.quantiles(per_call, n=4)
+    else:
+        q1, q3 = per_call[0], per_call[-1]
+    return Measurement(name, number, statistics.median(per_call), per_call[0], q3 - q1)
+
+
+def measure(case: BenchCase, *, repeat: int, min_sample_ms: float) -> Measurement:
+    """Calibrate the loop count for ``case`` and collect ``repeat`` samples."""
+    timer = timeit.Timer(case.func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed * 1000 >= min_sample_ms or number >= 1 << 24:
+            break
+        number *= 2
+    return summarize(case.name, number, timer.repeat(repeat=repeat, number=number))
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[Comparison]:
+    """Compare two saved runs case by case, in current-run order."""
+    base_cases = baseline.get("cases", {})
+    cur_cases = current.get("cases", {})
+    results = []
+    for name, cur in cur_cases.items():
+        base = base_cases.get(name)
+        if base is None:
+            results.append(Comparison(name, "new", None, cur["median_ns"]))
+            continue
+        ratio = cur["median_ns"] / base["median_ns"] if base["median_ns"] else 1.0
+        if ratio > 1 + threshold:
+            status = "regressed"
+        elif ratio < 1 - threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        results.append(Comparison(name, status, base["median_ns"], cur["median_ns"]))
+    for name, base in base_cases.items():
+        if name not in cur_cases:
+            results.append(Comparison(name, "missing", base["median_ns"], None))
+    return results
+
+
+def run_document(measurements: Sequence[Measurement]) -> dict[str, Any]:
+    """Serializable run record (the baseline file format)."""
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "cases": {
+            m.name: {k: v for k, v in asdict(m).items() if k != "name"} for m in measurements
+        },
+    }
+
+
+def _fmt_ns(ns: float | None) -> str:
+    if ns is None:
+        return "-"
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def format_comparisons(comparisons: Sequence[Comparison], threshold: float) -> str:
+    lines = [f"{'case':<40}{'baseline':>12}{'current':>12}{'change':>9}  status"]
+    for c in comparisons:
+        change = "-" if c.change is None else f"{c.change:+.1%}"
+        lines.append(
+            f"{c.name:<40}{_fmt_ns(c.baseline_ns):>12}{_fmt_ns(c.current_ns):>12}"
+            f"{change:>9}  {c.status}"
+        )
+    regressed = sum(c.status == "regressed" for c in comparisons)
+    lines.append(f"{regressed} regression(s) beyond {threshold:.0%}")
+    return "\n".join(lines)
+
+
+def _load(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def _report(comparisons: Sequence[Comparison], threshold: float) -> int:
+    print(format_comparisons(comparisons, threshold))
+    return 1 if any(c.status == "regressed" for c in comparisons) else 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    cases = [c for c in build_cases() if not args.filter or args.filter in c.name]
+    measurements = []
+    for case in cases:
+        m = measure(case, repeat=args.repeat, min_sample_ms=args.min_sample_ms)
+        measurements.append(m)
+        print(
+            f"{case.name:<40}{_fmt_ns(m.median_ns):>12}  ±{m.noise:5.1%}  "
+            f"(x{m.number}, {case.description})"
+        )
+    document = run_document(measurements)
+    if args.save:
+        args.save.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Saved {len(measurements)} case(s) to {args.save}")
+    if args.compare:
+        return _report(compare(_load(args.compare), document, args.threshold), args.threshold)
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    comparisons = compare(_load(args.baseline), _load(args.current), args.threshold)
+    return _report(comparisons, args.threshold)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Pure-function micro-benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Measure every case")
+    run.add_argument("--filter", help="Only cases whose name contains this substring")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run.add_argument("--min-sample-ms", type=float, default=DEFAULT_MIN_SAMPLE_MS)
+    run.add_argument("--save", type=Path, help="Write the run as a baseline file")
+    run.add_argument("--compare", type=Path, help="Baseline to compare against")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run.set_defaults(handler=cmd_run)
+
+    cmp_ = sub.add_parser("compare", help="Compare two saved runs")
+    cmp_.add_argument("baseline", type=Path)
+    cmp_.add_argument("current", type=Path)
+    cmp_.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    cmp_.set_defaults(handler=cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
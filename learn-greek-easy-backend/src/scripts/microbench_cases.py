@@ -0,0 +1,404 @@
+"""Benchmark cases for :mod:`src.scripts.microbench`.
+
+Each case times one realistic unit of per-request work over inputs sized like
+production: a 200-card review session, a year of study history, a dashboard
+with 40 decks, a page of word entries. Inputs are generated once, up front,
+from a fixed seed so every run times identical work. No DB, Redis or network.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Callable
+from uuid import UUID
+
+from authlib.jose import JsonWebKey, jwt
+
+from src.core import supabase_auth
+from src.core.cache import ExpiringLRU
+from src.core.lexgen_forms import bundles_to_flat, flat_to_bundles
+from src.core.sm2 import calculate_next_review_date, calculate_sm2
+from src.repositories.card_record_review import SessionAgg
+from src.schemas.dashboard import DashboardDeckSlice, SlimNews, SlimSituation
+from src.schemas.lexgen import FormBundle
+from src.schemas.progress import DeckProgressSummary
+from src.services.dashboard_compose import ComposeFeedSignals, compose_feed, map_deck_slice
+from src.services.gamification.projection import (
+    _compute_action_xp,
+    _compute_daily_goal_exceeded,
+    _compute_daily_goal_streak,
+    _compute_earliest_hour_inverted,
+    _compute_session_accuracy,
+    _compute_session_speed_cpm,
+)
+from src.services.gamification.streak import (
+    _compute_streak_from_dates,
+    _longest_streak_from_dates,
+)
+from src.utils.greek_text import extract_searchable_forms, normalize_greek_accents
+
+SESSION_REVIEWS = 200
+HISTORY_DAYS = 365
+SESSIONS = 300
+DASHBOARD_DECKS = 40
+WORD_ENTRIES = 50
+
+_CASES = ("nominative", "genitive", "accusative", "vocative")
+_NUMBERS = ("singular", "plural")
+_WORDS = (
+    "καλημέρα",
+    "ευχαριστώ",
+    "σπίτι",
+    "θάλασσα",
+    "πρωινό",
+    "αύριο",
+    "οικογένεια",
+    "προϊόν",
+    "ταξίδι",
+    "εργασία",
+)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One timed operation; ``func`` is called with no arguments."""
+
+    name: str
+    func: Callable[[], object]
+    description: str
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _study_days(rng: random.Random, today: date) -> list[date]:
+    """Ascending study dates over a year, ending today, with a long current streak."""
+    days = [today - timedelta(days=offset) for offset in range(HISTORY_DAYS)]
+    recent = days[:60]
+    older = [d for d in days[60:] if rng.random() < 0.7]
+    return sorted(recent + older)
+
+
+def _sessions(rng: random.Random, today: date) -> list[SessionAgg]:
+    sessions = []
+    for n in range(SESSIONS):
+        cards = rng.randint(5, 60)
+        start = datetime.combine(
+            today - timedelta(days=n), datetime.min.time(), tzinfo=timezone.utc
+        ) + timedelta(hours=rng.randint(6, 22))
+        sessions.append(
+            SessionAgg(
+                start_at=start,
+                card_count=cards,
+                correct_count=rng.randint(0, cards),
+                total_time_seconds=cards * rng.randint(3, 20),
+                min_hour_utc=start.hour,
+                max_hour_utc=min(23, start.hour + 1),
+            )
+        )
+    return sessions
+
+
+def _daily(rng: random.Random, days: list[date], high: int) -> list[tuple[date, int]]:
+    return [(d, rng.randint(0, high)) for d in days]
+
+
+def _deck_inputs(
+    rng: random.Random,
+) -> list[tuple[SimpleNamespace, DeckProgressSummary | None, int]]:
+    inputs = []
+    for n in range(DASHBOARD_DECKS):
+        deck_id = _uuid(rng)
+        total = rng.randint(20, 400)
+        studied = rng.randint(0, total)
+        deck = SimpleNamespace(
+            id=deck_id,
+            name_el=f"Τράπουλα {n}",
+            name_en=f"Deck {n}",
+            name_ru=f"Колода {n}",
+            level=rng.choice(("A1", "A2", "B1", "B2")),
+            is_premium=n % 5 == 0,
+            cover_image_url=None,
+            cover_image_variants=None,
+        )
+        progress = (
+            None
+            if n % 4 == 0
+            else DeckProgressSummary(
+                deck_id=deck_id,
+                deck_name=f"Deck {n}",
+                deck_level="A1",
+                total_cards=total,
+                cards_studied=studied,
+                cards_mastered=rng.randint(0, studied),
+                cards_due=rng.randint(0, studied),
+                mastery_percentage=rng.random() * 100,
+                completion_percentage=studied / total * 100,
+                last_studied_at=datetime(2026, 1, 1, tzinfo=timezone.utc)
+                + timedelta(hours=rng.randint(0, 5000)),
+                average_easiness_factor=2.4,
+                estimated_review_time_minutes=rng.randint(0, 30),
+            )
+        )
+        inputs.append((deck, progress, total))
+    return inputs
+
+
+def _feed_signals(rng: random.Random, slices: list[DashboardDeckSlice]) -> ComposeFeedSignals:
+    situation = SlimSituation(
+        id=_uuid(rng),
+        scenario_el="Στον καφέ",
+        scenario_en="At the coffee shop",
+        scenario_ru="В кофейне",
+        status="ready",
+        has_audio=True,
+        has_dialog=True,
+        exercise_total=6,
+        exercise_completed=2,
+        source_image_url=None,
+        domain=None,
+        description_source_type=None,
+    )
+    news = [
+        SlimNews(
+            id=_uuid(rng),
+            situation_id=_uuid(rng),
+            title_el="Τίτλος",
+            title_en="Title",
+            title_ru="Заголовок",
+            publication_date=date(2026, 3, 1),
+            country="cyprus",
+            audio_duration_seconds=30.0,
+            image_url=None,
+            image_variants=None,
+        )
+        for _ in range(10)
+    ]
+    return ComposeFeedSignals(
+        deck_slices=slices,
+        cards_due=120,
+        situation=situation,
+        news=news,
+        current_streak=60,
+        longest_streak=90,
+        queue_count=40,
+    )
+
+
+def _adjective_data(word: str) -> dict:
+    stem = word[:-1]
+    data = {}
+    for gender, article in (("masculine", "ο"), ("feminine", "η"), ("neuter", "το")):
+        for case in _CASES:
+            for number in _NUMBERS:
+                data[f"{gender}_{case}_{number}"] = f"{article} {stem}{len(case) % 7}"
+    data["comparative"] = f"πιο {word}"
+    data["superlative"] = f"ο πιο {word}"
+    return {"adjective_data": data}
+
+
+def _noun_data(word: str) -> dict:
+    data = {"gender": "neuter"}
+    for case in _CASES:
+        for number in _NUMBERS:
+            data[f"{case}_{number}"] = f"το {word}{case[0]}{number[0]}"
+    return {"noun_data": data}
+
+
+def _signed_token(issuer: str) -> tuple[bytes, dict]:
+    """An RS256 Supabase-shaped access token and the JWKS that verifies it."""
+    private_key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "bench"})
+    payload = {
+        "sub": "00000000-0000-4000-8000-000000000000",
+        "email": "bench@example.com",
+        "aud": "authenticated",
+        "iss": issuer,
+        "exp": int(datetime.now(timezone.utc).timestamp()) + 3600,
+        "user_metadata": {"full_name": "Bench User"},
+    }
+    token = jwt.encode({"alg": "RS256", "kid": "bench"}, payload, private_key)
+    return token, {"keys": [private_key.as_dict(is_private=False)]}
+
+
+def _sm2_batch_case(reviews: list[tuple[float, int, int, int]]) -> BenchCase | None:
+    """The vectorized SM-2 case, or None when NumPy is not installed.
+
+    NumPy is imported here rather than at module level, so the other cases
+    (and ``--help``) work without it.
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+
+        from src.core.sm2_batch import calculate_sm2_batch  # noqa: PLC0415
+    except ImportError:
+        return None
+    review_arrays = [np.array(column) for column in zip(*reviews)]
+    return BenchCase(
+        "sm2_batch.calculate_sm2_batch",
+        lambda: calculate_sm2_batch(*review_arrays),
+        f"{SESSION_REVIEWS} reviews as arrays (one vectorized step)",
+    )
+
+
+def build_cases() -> list[BenchCase]:
+    """Construct every benchmark case with its pre-generated inputs."""
+    rng = random.Random(1234)
+    today = datetime.now(timezone.utc).date()
+
+    reviews = [
+        (rng.uniform(1.3, 3.0), rng.choice((0, 1, 6, 15, 40)), rng.randint(0, 8), rng.randint(0, 5))
+        for _ in range(SESSION_REVIEWS)
+    ]
+    intervals = [rng.randint(0, 180) for _ in range(SESSION_REVIEWS)]
+    ascending = _study_days(rng, today)
+    descending = ascending[::-1]
+    sessions = _sessions(rng, today)
+    vocab_daily = _daily(rng, ascending, 60)
+    culture_daily = _daily(rng, ascending, 20)
+    deck_inputs = _deck_inputs(rng)
+    slices = [map_deck_slice(*args) for args in deck_inputs]
+    signals = _feed_signals(rng, slices)
+    words = [rng.choice(_WORDS) + rng.choice(_WORDS) for _ in range(1_000)]
+    entries = [
+        (_adjective_data(w) if n % 2 else _noun_data(w), w)
+        for n, w in enumerate(_WORDS * (WORD_ENTRIES // len(_WORDS)))
+    ]
+    flats = [
+        {f"{case}_{number}": f"{w}{case[:2]}{number[:2]}" for number in _NUMBERS for case in _CASES}
+        for w in _WORDS
+    ]
+    bundles = [
+        [
+            FormBundle(form=f"{w}{case[:2]}{number[:2]}", features={"case": case, "number": number})
+            for number in reversed(_NUMBERS)
+            for case in reversed(_CASES)
+        ]
+        for w in _WORDS
+    ]
+
+    issuer = "https://bench.supabase.co/auth/v1"
+    token, jwks = _signed_token(issuer)
+    supabase_auth._jwks_cache.set(jwks)
+    verified: ExpiringLRU[object] = ExpiringLRU(max_size=1_000)
+    verified.set(supabase_auth._token_digest(token), object(), float("inf"))
+    claims_options = {
+        "iss": {"essential": True, "value": issuer},
+        "aud": {"essential": True, "value": "authenticated"},
+        "exp": {"essential": True},
+        "sub": {"essential": True},
+    }
+
+    def decode_importing_key_set() -> object:
+        # The pre-fast-path verification: re-import the JWKS on every request
+        claims = jwt.decode(token, JsonWebKey.import_key_set(jwks), claims_options=claims_options)
+        claims.validate()
+        return claims
+
+    def action_xp() -> int:
+        return _compute_action_xp(
+            total_reviews=25_000,
+            weekly_correct=400,
+            weekly_total=520,
+            culture_total=3_000,
+            culture_correct=2_100,
+            streak_days=60,
+            sessions=sessions,
+            vocab_daily=vocab_daily,
+            culture_daily=culture_daily,
+            daily_goal=20,
+        )
+
+    def projection_metrics() -> tuple[int, ...]:
+        return (
+            _compute_session_accuracy(sessions),
+            _compute_session_speed_cpm(sessions),
+            _compute_earliest_hour_inverted(sessions),
+            _compute_daily_goal_streak(vocab_daily, culture_daily, 20),
+            _compute_daily_goal_exceeded(vocab_daily, culture_daily, 20),
+        )
+
+    cases = [
+        BenchCase(
+            "sm2.calculate_sm2",
+            lambda: [calculate_sm2(*review) for review in reviews],
+            f"{SESSION_REVIEWS} reviews (one study session)",
+        ),
+        BenchCase(
+            "sm2.calculate_next_review_date",
+            lambda: [calculate_next_review_date(i, today) for i in intervals],
+            f"{SESSION_REVIEWS} due dates",
+        ),
+        BenchCase(
+            "streak.current",
+            lambda: _compute_streak_from_dates(descending),
+            f"{len(descending)} study dates, 60-day current streak",
+        ),
+        BenchCase(
+            "streak.longest",
+            lambda: _longest_streak_from_dates(ascending),
+            f"{len(ascending)} study dates",
+        ),
+        BenchCase(
+            "projection.action_xp",
+            action_xp,
+            f"{SESSIONS} sessions, {len(ascending)} days of daily counts",
+        ),
+        BenchCase(
+            "projection.metrics",
+            projection_metrics,
+            "session/daily-goal metric derivations",
+        ),
+        BenchCase(
+            "dashboard.map_deck_slice",
+            lambda: [map_deck_slice(*args) for args in deck_inputs],
+            f"{DASHBOARD_DECKS} decks",
+        ),
+        BenchCase(
+            "dashboard.compose_feed",
+            lambda: compose_feed(signals),
+            f"{DASHBOARD_DECKS} decks, 10 news items",
+        ),
+        BenchCase(
+            "greek_text.normalize_greek_accents",
+            lambda: [normalize_greek_accents(w) for w in words],
+            f"{len(words)} words",
+        ),
+        BenchCase(
+            "greek_text.extract_searchable_forms",
+            lambda: [extract_searchable_forms(data, front) for data, front in entries],
+            f"{len(entries)} noun/adjective entries",
+        ),
+        BenchCase(
+            "lexgen_forms.bundles_to_flat",
+            lambda: [bundles_to_flat(b) for b in bundles],
+            f"{len(bundles)} 8-cell paradigms",
+        ),
+        BenchCase(
+            "supabase_auth.decode_import_key_set",
+            decode_importing_key_set,
+            "RS256 verify, JWKS re-imported per call (baseline)",
+        ),
+        BenchCase(
+            "supabase_auth.decode_token",
+            lambda: supabase_auth._decode_token(token, issuer),
+            "RS256 verify, pre-imported key by kid",
+        ),
+        BenchCase(
+            "supabase_auth.verified_token_hit",
+            lambda: verified.get(supabase_auth._token_digest(token)),
+            "SHA-256 digest + verified-token LRU hit",
+        ),
+        BenchCase(
+            "lexgen_forms.flat_to_bundles",
+            lambda: [flat_to_bundles(f) for f in flats],
+            f"{len(flats)} 8-cell paradigms",
+        ),
+    ]
+    batch = _sm2_batch_case(reviews)
+    if batch is not None:
+        cases.insert(1, batch)
+    return cases
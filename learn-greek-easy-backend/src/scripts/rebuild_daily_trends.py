@@ -0,0 +1,127 @@
+"""Rebuild the ``user_daily_trends`` series from the source tables.
+
+The series is maintained on write (fused review path, legacy review
+persistence, culture answers). This CLI recounts it from
+``card_record_reviews``, ``card_record_statistics``, ``culture_answer_history``
+and ``culture_question_stats`` after drift: a bulk data fix, a write path that
+bypassed the repository, or the window between the migration's backfill and
+the new code going live.
+
+Usage:
+    # Everything, committing every --batch-size users
+    railway run python -m src.scripts.rebuild_daily_trends
+
+    # One user, and/or only the days since a date
+    railway run python -m src.scripts.rebuild_daily_trends --user-id <uuid>
+    railway run python -m src.scripts.rebuild_daily_trends --since 2026-07-01
+
+Idempotent: a rebuild replaces the rows in scope, so re-running is safe.
+Counters are recounted from the rows still on disk; review partitions already
+dropped by retention are not included.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import close_db, get_session_factory, init_db
+from src.db.models import User
+from src.repositories.user_daily_trends import UserDailyTrendsRepository
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def days_since(since: date, today: date | None = None) -> list[date]:
+    """Every day from ``since`` to ``today`` (inclusive)."""
+    today = today or date.today()
+    return [since + timedelta(days=i) for i in range((today - since).days + 1)]
+
+
+async def rebuild(
+    session: AsyncSession,
+    *,
+    user_ids: list[UUID] | None = None,
+    since: date | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Rebuild the series rows in scope, committing per batch. Returns rows written."""
+    repo = UserDailyTrendsRepository(session)
+    days = days_since(since) if since is not None else None
+    if user_ids is not None:
+        written = await repo.refresh(user_ids=user_ids, days=days)
+        await session.commit()
+        return written
+
+    written = 0
+    last_id: UUID | None = None
+    while True:
+        query = select(User.id).order_by(User.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(User.id > last_id)
+        batch = list((await session.execute(query)).scalars().all())
+        if not batch:
+            return written
+        written += await repo.refresh(user_ids=batch, days=days)
+        await session.commit()
+        last_id = batch[-1]
+        logger.info(f"Rebuilt daily trends for {len(batch)} users (rows so far: {written})")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Recount user_daily_trends from the review, answer and statistics tables."
+    )
+    parser.add_argument(
+        "--user-id",
+        type=UUID,
+        action="append",
+        dest="user_ids",
+        help="Only rebuild this user (repeatable)",
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="Only rebuild days from this date (YYYY-MM-DD) to today",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Users per transaction for a full rebuild (default: {DEFAULT_BATCH_SIZE})",
+    )
+    return parser
+
+
+async def _main_async(args: argparse.Namespace) -> int:
+    await init_db(warm_min=0)
+    try:
+        async with get_session_factory()() as session:
+            written = await rebuild(
+                session,
+                user_ids=args.user_ids,
+                since=args.since,
+                batch_size=args.batch_size,
+            )
+    finally:
+        await close_db()
+
+    print(f"user_daily_trends rows written: {written}")
+    return 0
+
+
+def main() -> None:
+    """CLI entrypoint: parse args, run the async shell, exit with its code."""
+    import asyncio
+    import sys
+
+    sys.exit(asyncio.run(_main_async(_build_parser().parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Rebuild the ``user_deck_progress`` counters from the source tables.
+
+The counters are maintained on write (fused review path, legacy review
+persistence, deck membership changes). This CLI recounts them from
+``card_record_statistics`` and ``card_record_reviews`` after drift: a bulk
+data fix, a write path that bypassed the repository, or the window between
+the migration's backfill and the new code going live.
+
+Usage:
+    # Everything, committing every --batch-size users
+    railway run python -m src.scripts.rebuild_deck_progress
+
+    # One user, or one deck (for every user)
+    railway run python -m src.scripts.rebuild_deck_progress --user-id <uuid>
+    railway run python -m src.scripts.rebuild_deck_progress --deck-id <uuid>
+
+Idempotent: a rebuild replaces the rows in scope, so re-running is safe.
+Review totals are recounted from the reviews still on disk; partitions already
+dropped by retention are not included.
+"""
+
+from __future__ import annotations
+
+import argparse
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import close_db, get_session_factory, init_db
+from src.db.models import User
+from src.repositories.user_deck_progress import UserDeckProgressRepository
+
+DEFAULT_BATCH_SIZE = 500
+
+
+async def rebuild(
+    session: AsyncSession,
+    *,
+    user_ids: list[UUID] | None = None,
+    deck_id: UUID | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Rebuild the counters in scope, committing per batch. Returns rows written."""
+    repo = UserDeckProgressRepository(session)
+    if user_ids is not None or deck_id is not None:
+        written = await repo.refresh(user_ids=user_ids, deck_id=deck_id)
+        await session.commit()
+        return written
+
+    written = 0
+    last_id: UUID | None = None
+    while True:
+        query = select(User.id).order_by(User.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(User.id > last_id)
+        batch = list((await session.execute(query)).scalars().all())
+        if not batch:
+            return written
+        written += await repo.refresh(user_ids=batch)
+        await session.commit()
+        last_id = batch[-1]
+        logger.info(f"Rebuilt deck progress for {len(batch)} users (rows so far: {written})")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Recount user_deck_progress from card_record_statistics and reviews."
+    )
+    parser.add_argument(
+        "--user-id",
+        type=UUID,
+        action="append",
+        dest="user_ids",
+        help="Only rebuild this user (repeatable)",
+    )
+    parser.add_argument("--deck-id", type=UUID, help="Only rebuild this deck")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Users per transaction for a full rebuild (default: {DEFAULT_BATCH_SIZE})",
+    )
+    return parser
+
+
+async def _main_async(args: argparse.Namespace) -> int:
+    await init_db(warm_min=0)
+    try:
+        async with get_session_factory()() as session:
+            written = await rebuild(
+                session,
+                user_ids=args.user_ids,
+                deck_id=args.deck_id,
+                batch_size=args.batch_size,
+            )
+    finally:
+        await close_db()
+
+    print(f"user_deck_progress rows written: {written}")
+    return 0
+
+
+def main() -> None:
+    """CLI entrypoint: parse args, run the async shell, exit with its code."""
+    import asyncio
+    import sys
+
+    sys.exit(asyncio.run(_main_async(_build_parser().parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Recompute ``card_record_statistics`` by replaying ``card_record_reviews``.
+
+Use after an SM-2 parameter change or a data fix: every card's EF, interval,
+repetitions, status and next review date are rebuilt from its review history
+with the vectorized engine (``src.core.sm2_batch``), which matches
+``calculate_sm2`` exactly.
+
+Users are processed in keyset-paged chunks of ``--batch-size``. Per chunk:
+one ordered, streamed read of the chunk's reviews, replayed in lockstep
+slices of whole cards as the rows arrive (about ``STREAM_ROWS`` reviews are
+held at a time), multi-row upserts into ``card_record_statistics``
+(``updated_at`` is left alone), then the chunk's ``user_deck_progress`` and
+``user_daily_trends`` rows are recounted, its due histograms dropped (rebuilt
+on next read), and the chunk commits.
+
+Usage:
+    # Everyone
+    railway run python -m src.scripts.recompute_card_statistics
+
+    # One user; or replay and count without writing
+    railway run python -m src.scripts.recompute_card_statistics --user-id <uuid>
+    railway run python -m src.scripts.recompute_card_statistics --dry-run
+
+A replay needs each card's full history. With ACTIVITY_RETENTION_MONTHS set,
+old review partitions may be gone, so the script refuses to run unless
+``--allow-truncated-history`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from src.config import settings
+from src.core.sm2_batch import replay_reviews
+from src.db import close_db, get_session_factory, init_db
+from src.db.models import CardRecordReview, CardRecordStatistics, User
+from src.repositories.user_daily_trends import UserDailyTrendsRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
+from src.repositories.user_due_histogram import UserDueHistogramRepository
+
+DEFAULT_BATCH_SIZE = 200
+
+# Rows per upsert statement: 7 bind parameters per row stays well under the
+# 32767-parameter protocol limit.
+UPSERT_ROWS = 2000
+
+# Reviews fetched per round trip from the server-side cursor, and the size
+# at which a replay slice is cut (at the next card boundary).
+STREAM_ROWS = 10000
+
+
+@dataclass
+class RecomputeSummary:
+    users: int = 0
+    cards: int = 0
+    reviews: int = 0
+
+
+def replay_rows(rows: list[Any]) -> list[dict]:
+    """Statistics values for every (user, card) in ``rows``.
+
+    ``rows`` are review rows (user_id, card_record_id, quality, reviewed_at),
+    ordered by review time within each card.
+    """
+    keys: dict[tuple[UUID, UUID], int] = {}
+    card_index = np.fromiter(
+        (keys.setdefault((row.user_id, row.card_record_id), len(keys)) for row in rows),
+        dtype=np.int64,
+        count=len(rows),
+    )
+    quality = np.fromiter((row.quality for row in rows), dtype=np.int64, count=len(rows))
+    review_day = np.fromiter(
+        (row.reviewed_at.date().toordinal() for row in rows), dtype=np.int64, count=len(rows)
+    )
+    state = replay_reviews(card_index, quality, review_day, len(keys))
+
+    statuses = state.statuses()
+    next_review = (state.last_review_day + state.interval).tolist()
+    return [
+        {
+            "user_id": user_id,
+            "card_record_id": card_record_id,
+            "easiness_factor": float(state.easiness_factor[i]),
+            "interval": int(state.interval[i]),
+            "repetitions": int(state.repetitions[i]),
+            "next_review_date": date.fromordinal(next_review[i]),
+            "status": statuses[i],
+        }
+        for (user_id, card_record_id), i in keys.items()
+    ]
+
+
+async def _replay_streamed(result: AsyncResult) -> tuple[int, list[dict]]:
+    """Replay streamed review rows without holding them all.
+
+    Rows are buffered until ``STREAM_ROWS`` and replayed once the next row
+    starts a new card, so a card's history is never split across slices.
+
+    Returns:
+        (reviews replayed, statistics values)
+    """
+    reviews = 0
+    values: list[dict] = []
+    pending: list[Any] = []
+    async for row in result:
+        if len(pending) >= STREAM_ROWS and (row.user_id, row.card_record_id) != (
+            pending[-1].user_id,
+            pending[-1].card_record_id,
+        ):
+            values.extend(replay_rows(pending))
+            reviews += len(pending)
+            pending = []
+        pending.append(row)
+    if pending:
+        values.extend(replay_rows(pending))
+        reviews += len(pending)
+    return reviews, values
+
+
+async def _recompute_users(
+    session: AsyncSession, user_ids: list[UUID], *, dry_run: bool
+) -> tuple[int, int]:
+    """Replay and (unless ``dry_run``) write the users' statistics.
+
+    Returns:
+        (reviews replayed, cards recomputed)
+    """
+    result = await session.stream(
+        select(
+            CardRecordReview.user_id,
+            CardRecordReview.card_record_id,
+            CardRecordReview.quality,
+            CardRecordReview.reviewed_at,
+        )
+        .where(CardRecordReview.user_id.in_(user_ids))
+        .order_by(
+            CardRecordReview.user_id, CardRecordReview.card_record_id, CardRecordReview.reviewed_at
+        )
+        .execution_options(yield_per=STREAM_ROWS)
+    )
+    reviews, values = await _replay_streamed(result)
+    if dry_run or not values:
+        return reviews, len(values)
+
+    for start in range(0, len(values), UPSERT_ROWS):
+        stmt = pg_insert(CardRecordStatistics).values(values[start : start + UPSERT_ROWS])
+        # ON CONFLICT updates skip Column.onupdate, so updated_at (which the
+        # daily trends status buckets key on) is preserved.
+        await session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_user_card_record",
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (
+                        "easiness_factor",
+                        "interval",
+                        "repetitions",
+                        "next_review_date",
+                        "status",
+                    )
+                },
+            )
+        )
+    await UserDeckProgressRepository(session).refresh(user_ids=user_ids)
+    await UserDailyTrendsRepository(session).refresh(user_ids=user_ids)
+    await UserDueHistogramRepository(session).invalidate(user_ids=user_ids)
+    return reviews, len(values)
+
+
+async def recompute(
+    session: AsyncSession,
+    *,
+    user_ids: list[UUID] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+) -> RecomputeSummary:
+    """Recompute statistics for ``user_ids`` (default: every user), committing per chunk."""
+    summary = RecomputeSummary()
+    last_id: UUID | None = None
+    while True:
+        if user_ids is not None:
+            batch = user_ids[summary.users : summary.users + batch_size]
+        else:
+            query = select(User.id).order_by(User.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(User.id > last_id)
+            batch = list((await session.execute(query)).scalars().all())
+        if not batch:
+            return summary
+
+        reviews, cards = await _recompute_users(session, batch, dry_run=dry_run)
+        summary.reviews += reviews
+        summary.cards += cards
+        if dry_run:
+            await session.rollback()
+        else:
+            await session.commit()
+        summary.users += len(batch)
+        last_id = batch[-1]
+        logger.info(
+            f"Recomputed card statistics for {summary.users} users "
+            f"({summary.reviews} reviews replayed)"
+        )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Recompute card_record_statistics by replaying card_record_reviews."
+    )
+    parser.add_argument(
+        "--user-id",
+        type=UUID,
+        action="append",
+        dest="user_ids",
+        help="Only recompute this user (repeatable)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Users per chunk and transaction (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Replay and report counts without writing",
+    )
+    parser.add_argument(
+        "--allow-truncated-history",
+        action="store_true",
+        help="Run even though ACTIVITY_RETENTION_MONTHS may have dropped old reviews",
+    )
+    return parser
+
+
+async def _main_async(args: argparse.Namespace) -> int:
+    if settings.activity_retention_months and not args.allow_truncated_history:
+        print(
+            "ACTIVITY_RETENTION_MONTHS is set: review history may be incomplete. "
+            "Re-run with --allow-truncated-history to recompute anyway."
+        )
+        return 1
+
+    await init_db(warm_min=0)
+    try:
+        async with get_session_factory()() as session:
+            summary = await recompute(
+                session,
+                user_ids=args.user_ids,
+                batch_size=args.batch_size,
+                dry_run=args.dry_run,
+            )
+    finally:
+        await close_db()
+
+    mode = " (dry run, nothing written)" if args.dry_run else ""
+    print(
+        f"Users: {summary.users}, cards: {summary.cards}, "
+        f"reviews replayed: {summary.reviews}{mode}"
+    )
+    return 0
+
+
+def main() -> None:
+    """CLI entrypoint: parse args, run the async shell, exit with its code."""
+    import asyncio
+    import sys
+
+    sys.exit(asyncio.run(_main_async(_build_parser().parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Bulk LEXGEN runner CLI — seed a deck's worth of proposals in one go.
+
+Feeds a lemma list through :class:`src.services.lexgen_bulk_service.LexgenBulkRunner`:
+evidence reads are batched with ``IN`` queries, a bounded number of pipelines run
+concurrently, OpenRouter rate limits shrink the concurrency and back off, and every
+proposal is committed as soon as its pipeline finishes.
+
+Input is either the ``lemma, level, source`` CSV written by
+:mod:`src.scripts.export_deck_lemmas` (optionally filtered with ``--level``) or a
+plain text file with one lemma per line.
+
+Run with::
+
+    poetry run python -m src.scripts.run_lexgen_bulk \
+        --input data/cefr_lemma/deck_export.csv --level A1
+
+    # Plain list, more pipelines in flight
+    poetry run python -m src.scripts.run_lexgen_bulk --input lemmas.txt --concurrency 8
+
+Resuming: committed proposals are the checkpoint. Re-running the same command after
+a crash or Ctrl-C skips every lemma that already has a proposal for ``--pos`` and
+retries the rest. Pass ``--no-resume`` to process every lemma regardless.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from src.db import close_db, get_session_factory, init_db
+from src.services.lexgen_bulk_service import BulkRunSummary, LexgenBulkRunner
+
+
+def read_lemmas(path: Path, level: str | None = None) -> list[str]:
+    """Read lemmas from an export_deck_lemmas CSV or a one-per-line text file.
+
+    A file whose first line is a CSV header containing ``lemma`` is read as CSV;
+    ``level`` then keeps only rows at that CEFR level. Anything else is read as
+    one lemma per line (blank lines and ``#`` comments skipped), and ``level``
+    is rejected because plain lists carry no level.
+    """
+    with path.open("r", encoding="utf-8", newline="") as fh:
+        first = fh.readline()
+        fh.seek(0)
+        header = [col.strip() for col in first.split(",")]
+        if "lemma" in header:
+            reader = csv.DictReader(fh)
+            return [
+                row["lemma"]
+                for row in reader
+                if row.get("lemma") and (level is None or row.get("level") == level)
+            ]
+        if level is not None:
+            raise ValueError(f"--level needs a CSV with a level column; {path} is a plain list")
+        return [line.strip() for line in fh if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run a lemma list through the LEXGEN pipeline")
+    parser.add_argument("--input", type=Path, required=True, help="Lemma CSV or text file")
+    parser.add_argument("--level", choices=["A1", "A2", "B1", "B2"], help="CSV level filter")
+    parser.add_argument("--pos", default="noun", help="Part of speech (default: noun)")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Max pipelines in flight (default: config)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=None, help="Lemmas per prefetch batch (default: config)"
+    )
+    parser.add_argument(
+        "--resume",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Skip lemmas that already have a proposal (default: True)",
+    )
+    return parser
+
+
+async def _main_async(args: argparse.Namespace, lemmas: list[str]) -> BulkRunSummary:
+    """init_db(warm_min=0) -> runner -> close_db(), mirroring tag_culture_topics."""
+    await init_db(warm_min=0)
+    try:
+        runner = LexgenBulkRunner(
+            get_session_factory(),
+            pos=args.pos,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            resume=args.resume,
+        )
+        return await runner.run(lemmas)
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    """CLI entrypoint: read the lemma list, run it, exit non-zero if any lemma failed."""
+    import asyncio
+
+    args = _build_parser().parse_args()
+    lemmas = read_lemmas(args.input, args.level)
+    if not lemmas:
+        logger.warning(f"No lemmas found in {args.input}")
+        sys.exit(0)
+
+    summary = asyncio.run(_main_async(args, lemmas))
+    logger.info(
+        f"Bulk run complete: {summary.queued} queued, {summary.rejected} rejected, "
+        f"{summary.skipped} skipped, {len(summary.failed)} failed (of {summary.total})"
+    )
+    for lemma, error in summary.failed.items():
+        logger.error(f"  {lemma}: {error}")
+    sys.exit(1 if summary.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
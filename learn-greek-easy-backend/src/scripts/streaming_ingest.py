@@ -0,0 +1,285 @@
+"""Shared streaming ingest helpers for the ``src/scripts/load_*`` reference loaders.
+
+The Kaikki dump is several hundred MB of JSONL, most of which is irrelevant to any
+single loader. These helpers keep peak memory flat regardless of dump size:
+
+1. :func:`iter_jsonl_lines` / :func:`iter_jsonl` read the file lazily, one line
+   at a time.
+2. :func:`parse_chunks` hands fixed-size line chunks to a pure, picklable
+   ``parse_chunk`` callable — inline when ``workers <= 1``, otherwise across a
+   ``ProcessPoolExecutor`` with a bounded number of chunks in flight. Results
+   come back in input order so "first entry wins" merge rules stay stable.
+3. :func:`copy_rows` streams row tuples into ``COPY ... FROM STDIN`` through an
+   on-demand text encoder (:class:`CopyRowReader`), so rows are never
+   materialised as one big buffer.
+4. :func:`create_staging_table` + :func:`swap_from_staging` load into a
+   transaction-scoped temp table and then replace the target's rows in a
+   single ``DELETE`` + ``INSERT ... SELECT`` inside the same transaction.
+   Readers keep seeing the old rows until ``COMMIT``, and the target keeps its
+   indexes, grants and FKs (a ``RENAME`` swap would have to rebuild them).
+5. :class:`Throughput` reports rows per second for each loader phase.
+6. :func:`bump_dataset_stamp` records a load in ``reference.dataset_stamp`` so
+   the API's in-memory reference snapshots know to reload.
+
+Everything here is psycopg2-only and DB-agnostic beyond standard Postgres SQL,
+so the helpers are unit-testable with a mock cursor.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+import psycopg2.extensions
+from loguru import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: Lines handed to one ``parse_chunk`` call (one pool task).
+DEFAULT_CHUNK_SIZE = 2_000
+
+#: Chunks in flight per worker; bounds memory held by pending futures.
+_IN_FLIGHT_PER_WORKER = 2
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+# ---------------------------------------------------------------------------
+# Lazy JSONL reading
+# ---------------------------------------------------------------------------
+
+
+def iter_jsonl_lines(path: Path) -> Iterator[str]:
+    """Yield stripped, non-empty lines of a JSONL file without loading it."""
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield decoded JSON objects from a JSONL file, skipping invalid lines."""
+    for line in iter_jsonl_lines(path):
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping invalid JSON line: {line[:80]}")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of at most ``size`` items from ``items``."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# ---------------------------------------------------------------------------
+# Optional process-pool fan-out
+# ---------------------------------------------------------------------------
+
+
+def parse_chunks(
+    lines: Iterable[str],
+    parse_chunk: Callable[[list[str]], R],
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[R]:
+    """Apply ``parse_chunk`` to successive line chunks, yielding results in order.
+
+    With ``workers <= 1`` parsing runs inline. Otherwise chunks are submitted to a
+    process pool, keeping at most ``workers * 2`` chunks pending so that a slow
+    consumer (e.g. a COPY) applies back-pressure instead of letting parsed rows
+    pile up in memory. ``parse_chunk`` must be a module-level function (or a
+    ``functools.partial`` of one) so it can be pickled.
+    """
+    chunks = batched(lines, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield parse_chunk(chunk)
+        return
+
+    max_in_flight = workers * _IN_FLIGHT_PER_WORKER
+    pending: deque[Future[R]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(parse_chunk, chunk))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ---------------------------------------------------------------------------
+# COPY FROM STDIN streaming
+# ---------------------------------------------------------------------------
+
+
+def encode_copy_value(value: Any) -> str:
+    """Encode one Python value as a Postgres COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class CopyRowReader(io.TextIOBase):
+    """File-like adapter that encodes row tuples into COPY text format on demand.
+
+    ``cursor.copy_expert`` pulls from :meth:`read`; rows are encoded only as
+    psycopg2 asks for more bytes, so the row iterator is consumed lazily.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._rows = iter(rows)
+        self._buffer = ""
+        self.row_count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _encode_next(self) -> bool:
+        row = next(self._rows, None)
+        if row is None:
+            return False
+        self._buffer += "\t".join(encode_copy_value(v) for v in row) + "\n"
+        self.row_count += 1
+        return True
+
+    def read(self, size: int | None = -1) -> str:  # type: ignore[override]
+        if size is None or size < 0:
+            while self._encode_next():
+                pass
+            data, self._buffer = self._buffer, ""
+            return data
+        while len(self._buffer) < size and self._encode_next():
+            pass
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def copy_rows(
+    cursor: psycopg2.extensions.cursor,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """Stream ``rows`` into ``table`` via ``COPY ... FROM STDIN``. Returns row count."""
+    reader = CopyRowReader(rows)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", reader)
+    return reader.row_count
+
+
+# ---------------------------------------------------------------------------
+# Staging table + atomic swap
+# ---------------------------------------------------------------------------
+
+
+def create_staging_table(
+    cursor: psycopg2.extensions.cursor,
+    staging: str,
+    target: str,
+    columns: Sequence[str],
+) -> None:
+    """Create a transaction-scoped temp table with ``columns`` typed like ``target``."""
+    cursor.execute(
+        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        f"SELECT {', '.join(columns)} FROM {target} WITH NO DATA"
+    )
+
+
+def swap_from_staging(
+    cursor: psycopg2.extensions.cursor,
+    target: str,
+    staging: str,
+    columns: Sequence[str],
+    *,
+    replace: bool,
+    scope_sql: str | None = None,
+    scope_params: Sequence[Any] = (),
+    on_conflict: str = "",
+) -> int:
+    """Move staged rows into ``target`` inside the caller's transaction.
+
+    When ``replace`` is True the target's existing rows — all of them, or only
+    those matching ``scope_sql`` — are deleted first. Staged rows are then
+    inserted, with ``on_conflict`` (e.g. ``"ON CONFLICT DO NOTHING"``) appended
+    verbatim when given. Nothing is visible to other sessions until the caller
+    commits, so the reload is atomic.
+
+    Returns the number of rows inserted into ``target``.
+    """
+    if replace:
+        where = f" WHERE {scope_sql}" if scope_sql else ""
+        logger.warning(f"Replacing rows in {target}{where}")
+        cursor.execute(f"DELETE FROM {target}{where}", tuple(scope_params))
+    cols = ", ".join(columns)
+    cursor.execute(
+        f"INSERT INTO {target} ({cols}) SELECT {cols} FROM {staging} {on_conflict}".rstrip()
+    )
+    return max(cursor.rowcount, 0)
+
+
+# ---------------------------------------------------------------------------
+# Dataset stamps
+# ---------------------------------------------------------------------------
+
+DATASET_STAMP_TABLE = "reference.dataset_stamp"
+
+
+def bump_dataset_stamp(cursor: psycopg2.extensions.cursor, dataset: str) -> None:
+    """Increment ``dataset``'s load counter inside the caller's transaction.
+
+    Call it just before the commit that publishes the new rows: the stamp then
+    changes atomically with the data, and snapshot readers never pair a new
+    version with old rows.
+    """
+    cursor.execute(
+        f"INSERT INTO {DATASET_STAMP_TABLE} (dataset, version, loaded_at) "
+        "VALUES (%s, 1, now()) "
+        "ON CONFLICT (dataset) DO UPDATE "
+        f"SET version = {DATASET_STAMP_TABLE}.version + 1, loaded_at = now()",
+        (dataset,),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Throughput reporting
+# ---------------------------------------------------------------------------
+
+
+class Throughput:
+    """Wall-clock rows-per-second meter for one loader phase."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.rows = 0
+        self._start = time.monotonic()
+
+    def add(self, count: int) -> None:
+        self.rows += count
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    @property
+    def rate(self) -> float:
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def log(self) -> None:
+        logger.info(
+            f"{self.label}: {self.rows:,} rows in {self.elapsed:.1f}s ({self.rate:,.0f} rows/s)"
+        )
@@ -5,7 +5,9 @@ that the generator renders into the example-sentence constraint. It is NOT an
 enforcement gate (that is LEXGEN-10).
 
 Per-request service (not singleton), instantiated with an AsyncSession — same
-pattern as FrequencyService (LEXGEN-05).
+pattern as FrequencyService (LEXGEN-05). With ``settings.reference_snapshots_enabled``
+the per-level sets are precomputed once per process (see ``reference_snapshot``)
+instead of re-reading the whole allowed set for every proposal.
 """
 
 from __future__ import annotations
@@ -13,12 +15,42 @@ from __future__ import annotations
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db.models import CefrLemma
+from src.services.reference_snapshot import ReferenceSnapshot
 
 TARGET_LEVEL_DEFAULT = "B1"
 CEFR_ORDER = ("A1", "A2", "B1")
 
 
+async def _load_cefr_snapshot(db: AsyncSession) -> dict[str, frozenset[str]]:
+    """Precompute the allowed-lemma set for every target level in CEFR_ORDER.
+
+    Same two arms as :meth:`CefrVocabularyService.allowed_lemmas`; rows at a
+    level outside CEFR_ORDER only enter through the closed-class arm.
+    """
+    result = await db.execute(select(CefrLemma.lemma, CefrLemma.level, CefrLemma.closed_class))
+    closed: set[str] = set()
+    by_level: dict[str, set[str]] = {level: set() for level in CEFR_ORDER}
+    for lemma, level, closed_class in result.all():
+        if closed_class:
+            closed.add(lemma)
+        if level in by_level:
+            by_level[level].add(lemma)
+
+    allowed: dict[str, frozenset[str]] = {}
+    running = set(closed)
+    for level in CEFR_ORDER:
+        running |= by_level[level]
+        allowed[level] = frozenset(running)
+    return allowed
+
+
+cefr_snapshot: ReferenceSnapshot[dict[str, frozenset[str]]] = ReferenceSnapshot(
+    "cefr_lemma", _load_cefr_snapshot
+)
+
+
 class CefrVocabularyService:
     """Per-request assembly of the closed-vocabulary allowed-lemma set from
     reference.cefr_lemma (LEXGEN-09-03). Prompt INPUT only — NOT a gate (LEXGEN-10 enforces).
@@ -53,6 +85,9 @@ class CefrVocabularyService:
         if target_level not in CEFR_ORDER:
             target_level = TARGET_LEVEL_DEFAULT
 
+        if settings.reference_snapshots_enabled:
+            return set((await cefr_snapshot.get(self.db))[target_level])
+
         allowed_levels = CEFR_ORDER[: CEFR_ORDER.index(target_level) + 1]
 
         result = await self.db.execute(
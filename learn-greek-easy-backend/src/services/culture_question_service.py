@@ -29,7 +29,7 @@ Example Usage:
 
 import asyncio
 import hashlib
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -62,6 +62,8 @@ from src.db.models import (
 )
 from src.repositories import CultureQuestionRepository
 from src.repositories.culture_question_stats import CultureQuestionStatsRepository
+from src.repositories.user_daily_trends import UserDailyTrendsRepository, culture_answer_deltas
+from src.repositories.user_due_histogram import UserDueHistogramRepository
 from src.schemas.culture import (
     AlsoInDeck,
     CategoryReadiness,
@@ -604,6 +606,8 @@ class CultureQuestionService:
         # Step 3: Get or create stats
         stats = await self._get_or_create_stats(user_id, question_id)
         previous_status = stats.status
+        previous_day = stats.updated_at.date() if stats.updated_at else None
+        previous_review_date = stats.next_review_date
 
         # Step 4: Calculate SM-2
         sm2_result = calculate_sm2(
@@ -621,6 +625,17 @@ class CultureQuestionService:
         stats.repetitions = sm2_result.new_repetitions
         stats.next_review_date = next_review
         stats.status = sm2_result.new_status
+        await UserDailyTrendsRepository(self.db).apply(
+            user_id,
+            culture_answer_deltas(
+                day=datetime.now(timezone.utc).date(),
+                is_correct=None,
+                previous_status=previous_status,
+                previous_day=previous_day,
+                new_status=sm2_result.new_status,
+            ),
+        )
+        await UserDueHistogramRepository(self.db).shift(user_id, previous_review_date, next_review)
 
         # Note: Answer history recording moved to background task for faster response
 
@@ -1562,6 +1577,7 @@ class CultureQuestionService:
             )
             self.db.add(stats)
             await self.db.flush()
+            await UserDueHistogramRepository(self.db).shift(user_id, None, stats.next_review_date)
 
         return stats
 
@@ -0,0 +1,176 @@
+"""DeckImportService — whole-deck word-entry manifests in one transaction.
+
+The admin create-and-link flow handles one word entry per request: an upsert,
+a link, then five card-generation upserts, each with its own pre-read. A
+500-word deck import through it is thousands of round-trips. This service
+takes the whole manifest and works set-wise, in four timed phases:
+
+1. ``validate`` -- deck exists and is active, and no manifest entry clashes
+   with a different word entry already in the deck (one query).
+2. ``upsert_entries`` -- multi-row ``INSERT ... ON CONFLICT ... RETURNING``
+   via ``WordEntryRepository.bulk_upsert``, per chunk.
+3. ``link`` -- one multi-row junction insert per chunk.
+4. ``generate_cards`` -- each requested card type generated for a whole
+   chunk at once through ``CardGeneratorService``.
+
+Chunks are ``settings.deck_import_chunk_size`` entries so a statement stays
+under the Postgres bind-parameter limit. Nothing is committed here.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.exceptions import ConflictException, NotFoundException
+from src.core.logging import get_logger
+from src.db.models import DeckWordEntry, WordEntry
+from src.repositories.deck import DeckRepository
+from src.repositories.word_entry import WordEntryRepository
+from src.schemas.word_entry import DeckImportCardType, DeckImportRequest, DeckImportResponse
+from src.services.card_generator_service import CardGeneratorService
+
+logger = get_logger(__name__)
+
+
+def _chunks(items: Sequence, size: int) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class DeckImportService:
+    """Import a deck manifest: upsert entries, link them, generate cards.
+
+    Does NOT commit -- the caller owns the transaction, so a failure in any
+    phase leaves the deck untouched.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.deck_repo = DeckRepository(db)
+        self.word_entry_repo = WordEntryRepository(db)
+        self.card_service = CardGeneratorService(db)
+        self.timings: dict[str, int] = {}
+
+    @contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed_ms = round((time.monotonic() - start) * 1000)
+            self.timings[f"{name}_ms"] = self.timings.get(f"{name}_ms", 0) + elapsed_ms
+
+    async def import_manifest(
+        self, deck_id: UUID, manifest: DeckImportRequest
+    ) -> DeckImportResponse:
+        """Import ``manifest`` into ``deck_id``.
+
+        Raises:
+            NotFoundException: Deck does not exist.
+            ConflictException: Deck is inactive, or already holds a different
+                word entry for one of the manifest's lemma + POS (+ gender).
+        """
+        self.timings = {}
+        entries_data = [entry.model_dump() for entry in manifest.word_entries]
+
+        with self._phase("validate"):
+            await self._validate(deck_id, entries_data)
+
+        created = updated = linked = cards_created = cards_updated = 0
+        chunk_size = settings.deck_import_chunk_size
+        for chunk in _chunks(entries_data, chunk_size):
+            with self._phase("upsert_entries"):
+                entries, chunk_created, chunk_updated = await self.word_entry_repo.bulk_upsert(
+                    owner_id=None, entries_data=list(chunk)
+                )
+            created += chunk_created
+            updated += chunk_updated
+
+            with self._phase("link"):
+                linked += await self.word_entry_repo.link_many_to_deck(
+                    [entry.id for entry in entries], deck_id
+                )
+
+            with self._phase("generate_cards"):
+                for card_type in manifest.card_types:
+                    c, u = await self._generate(card_type, entries, deck_id)
+                    cards_created += c
+                    cards_updated += u
+
+        logger.info(
+            "Deck manifest imported",
+            extra={
+                "deck_id": str(deck_id),
+                "entries": len(entries_data),
+                "created": created,
+                "updated": updated,
+                "linked": linked,
+                "cards_created": cards_created,
+                "cards_updated": cards_updated,
+                "timings": self.timings,
+            },
+        )
+        return DeckImportResponse(
+            deck_id=deck_id,
+            created_count=created,
+            updated_count=updated,
+            linked_count=linked,
+            cards_created=cards_created,
+            cards_updated=cards_updated,
+            timings=self.timings,
+        )
+
+    async def _validate(self, deck_id: UUID, entries_data: list[dict]) -> None:
+        deck = await self.deck_repo.get(deck_id)
+        if deck is None:
+            raise NotFoundException(resource="Deck", detail=f"Deck with id '{deck_id}' not found")
+        if not deck.is_active:
+            raise ConflictException(
+                detail=f"Deck '{deck_id}' is not active. Word entries can only be linked to active decks."
+            )
+
+        # Manifest entries upsert into shared (owner_id=None) entries, so only a
+        # linked entry with another owner can clash (same rule as the link endpoint).
+        result = await self.db.execute(
+            select(WordEntry.lemma, WordEntry.part_of_speech, WordEntry.gender)
+            .join(DeckWordEntry, DeckWordEntry.word_entry_id == WordEntry.id)
+            .where(
+                DeckWordEntry.deck_id == deck_id,
+                WordEntry.owner_id.is_not(None),
+                WordEntry.lemma.in_({entry["lemma"] for entry in entries_data}),
+            )
+        )
+        linked = result.all()
+        clashes = sorted(
+            {
+                f"'{entry['lemma']}' ({entry['part_of_speech'].value})"
+                for entry in entries_data
+                for row in linked
+                if row.lemma == entry["lemma"]
+                and row.part_of_speech == entry["part_of_speech"]
+                and (entry.get("gender") is None or row.gender == entry["gender"])
+            }
+        )
+        if clashes:
+            raise ConflictException(
+                detail=f"Deck already has a word entry for {', '.join(clashes)}"
+            )
+
+    async def _generate(
+        self, card_type: DeckImportCardType, entries: list[WordEntry], deck_id: UUID
+    ) -> tuple[int, int]:
+        generators = {
+            "meaning": self.card_service.generate_meaning_cards,
+            "plural_form": self.card_service.generate_plural_form_cards,
+            "article": self.card_service.generate_article_cards,
+            "sentence_translation": self.card_service.generate_sentence_translation_cards,
+            "declension": self.card_service.generate_declension_cards,
+        }
+        return await generators[card_type](entries, deck_id)
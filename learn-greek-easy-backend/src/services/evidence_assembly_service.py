@@ -23,6 +23,13 @@ POS casing contract:
     - pos forwarded verbatim (lowercase) to WiktionaryMorphologyService.
     - pos.upper() forwarded to GreekLexicon existence query / LexiconService.
 
+Bulk prefetch:
+    :func:`prefetch_evidence` reads the three sources for a whole batch of
+    lemmas with one ``IN`` query each (plus one for surface-form declensions)
+    and returns an :class:`EvidencePrefetch`. A service constructed with a
+    prefetch answers covered lemmas from it — producing the same packet as the
+    per-lemma queries — and falls back to the DB for anything else.
+
 This module contains NO LLM/chat-model imports (Stage 1 is retrieval-only;
 LEXGEN-09 is the generator).
 """
@@ -30,13 +37,22 @@ LEXGEN-09 is the generator).
 from __future__ import annotations
 
 import unicodedata
+from dataclasses import dataclass, field
+from typing import Iterable
 from uuid import UUID
 
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.word_proposal_state import transition
-from src.db.models import GreekLexicon, WordProposal, WordProposalOrigin, WordProposalState
+from src.db.models import (
+    FrequencyRank,
+    GreekLexicon,
+    WiktionaryMorphology,
+    WordProposal,
+    WordProposalOrigin,
+    WordProposalState,
+)
 from src.schemas.lexgen import (
     FEATURE_KEYS,
     EvidencePacket,
@@ -47,9 +63,9 @@ from src.schemas.lexgen import (
     RulesSource,
     WiktionarySource,
 )
-from src.services.frequency_service import FrequencyService
+from src.services.frequency_service import FrequencyService, band_for_rank
 from src.services.lemma_normalization_service import get_lemma_normalization_service
-from src.services.lexicon_service import LexiconService
+from src.services.lexicon_service import LexiconEntry, LexiconService
 from src.services.wiktionary_morphology_service import WiktionaryMorphologyService
 from src.utils.greek_text import _final_sigma_unfold  # noqa: WPS450 (private import by design)
 
@@ -80,6 +96,159 @@ _GENDER_MAP: dict[str, str] = {
 _WIKTIONARY_GENDERS = ("masculine", "feminine", "neuter")
 
 
+def normalize_lemma_input(lemma_input: str) -> str:
+    """Apply the D-NORM pipeline to a raw lemma and return the normalized lemma.
+
+    lower() → NFC → _final_sigma_unfold() → normalize().lemma
+    """
+    pre_normalized = _final_sigma_unfold(unicodedata.normalize("NFC", lemma_input.lower()))
+    return get_lemma_normalization_service().normalize(pre_normalized).lemma
+
+
+@dataclass(frozen=True)
+class _WiktionaryRow:
+    """Detached copy of the WiktionaryMorphology columns the assembler reads."""
+
+    gender: str | None
+    forms: list[dict]
+    pronunciation: str | None
+    glosses_en: str | None
+
+
+@dataclass
+class EvidencePrefetch:
+    """Reference rows for a batch of normalized lemmas, read with ``IN`` queries.
+
+    Built by :func:`prefetch_evidence` for a single ``pos``. Only lemmas in
+    ``lemmas`` are covered; absence from a per-source dict means the source
+    has no row for that lemma. Values are plain data (no ORM instances), so a
+    prefetch built in one session can be shared by pipelines in other sessions.
+    """
+
+    pos: str
+    lemmas: frozenset[str]
+    frequency_ranks: dict[str, int] = field(default_factory=dict)
+    wiktionary_rows: dict[str, list[_WiktionaryRow]] = field(default_factory=dict)
+    # normalized lemma → (resolved lemma, attested via the lemma column)
+    lexicon_hits: dict[str, tuple[str, bool]] = field(default_factory=dict)
+    # resolved lemma → declension rows in LexiconService.get_declensions order
+    lexicon_declensions: dict[str, list[LexiconEntry]] = field(default_factory=dict)
+
+    def covers(self, lemma: str, pos: str) -> bool:
+        """Return True when this prefetch holds the evidence for (lemma, pos)."""
+        return pos == self.pos and lemma in self.lemmas
+
+
+_PTOSI_ORDER = {"Nom": 0, "Gen": 1, "Acc": 2, "Voc": 3}
+
+# GreekLexicon columns in LexiconEntry field order, so rows unpack straight into it.
+_LEXICON_ENTRY_COLUMNS = (
+    GreekLexicon.form,
+    GreekLexicon.lemma,
+    GreekLexicon.pos,
+    GreekLexicon.gender,
+    GreekLexicon.ptosi,
+    GreekLexicon.number,
+)
+
+
+def _declension_sort_key(entry: LexiconEntry) -> tuple[int, int]:
+    """Mirror LexiconService.get_declensions ordering: Sing→Plur, then Nom→Gen→Acc→Voc."""
+    return (0 if entry.number == "Sing" else 1, _PTOSI_ORDER.get(entry.ptosi or "", 4))
+
+
+async def prefetch_evidence(db: AsyncSession, lemmas: Iterable[str], pos: str) -> EvidencePrefetch:
+    """Read the evidence sources for many normalized lemmas in a handful of queries.
+
+    Issues one ``IN`` query per source (frequency, Wiktionary, GreekLexicon)
+    plus, when some lemmas are only attested as surface forms, one more for
+    their resolved lemmas' declensions — instead of 4-8 queries per lemma.
+
+    Args:
+        db: Session to read with.
+        lemmas: Normalized lemmas (see :func:`normalize_lemma_input`).
+        pos: Lowercase part-of-speech shared by the whole batch.
+
+    Returns:
+        EvidencePrefetch covering every lemma passed in.
+    """
+    lemma_set = frozenset(lemmas)
+    prefetch = EvidencePrefetch(pos=pos, lemmas=lemma_set)
+    if not lemma_set:
+        return prefetch
+
+    freq_result = await db.execute(
+        select(FrequencyRank.lemma, FrequencyRank.rank).where(FrequencyRank.lemma.in_(lemma_set))
+    )
+    prefetch.frequency_ranks = {lemma: rank for lemma, rank in freq_result.all()}
+
+    wikt_result = await db.execute(
+        select(
+            WiktionaryMorphology.lemma,
+            WiktionaryMorphology.gender,
+            WiktionaryMorphology.forms,
+            WiktionaryMorphology.pronunciation,
+            WiktionaryMorphology.glosses_en,
+        ).where(WiktionaryMorphology.lemma.in_(lemma_set), WiktionaryMorphology.pos == pos)
+    )
+    for lemma, gender, forms, pronunciation, glosses_en in wikt_result.all():
+        prefetch.wiktionary_rows.setdefault(lemma, []).append(
+            _WiktionaryRow(gender, forms, pronunciation, glosses_en)
+        )
+
+    await _prefetch_greek_lexicon(db, prefetch, pos.upper())
+    return prefetch
+
+
+async def _prefetch_greek_lexicon(
+    db: AsyncSession, prefetch: EvidencePrefetch, pos_upper: str
+) -> None:
+    """Fill ``lexicon_hits`` / ``lexicon_declensions`` for the prefetch's lemmas.
+
+    One query fetches every row whose lemma OR form is in the batch — for
+    lemma-column hits that is already the full declension set. Surface-form-only
+    hits resolve to another lemma whose declensions need one extra query.
+    """
+    lemma_set = prefetch.lemmas
+    result = await db.execute(
+        select(*_LEXICON_ENTRY_COLUMNS).where(
+            or_(GreekLexicon.lemma.in_(lemma_set), GreekLexicon.form.in_(lemma_set)),
+            GreekLexicon.pos == pos_upper,
+        )
+    )
+    declensions: dict[str, list[LexiconEntry]] = {}
+    surface_hits: dict[str, str] = {}
+    for row in result.all():
+        entry = LexiconEntry(*row)
+        if entry.lemma in lemma_set:
+            declensions.setdefault(entry.lemma, []).append(entry)
+        if entry.form in lemma_set and entry.lemma != entry.form:
+            # Deterministic pick when a surface form belongs to several lemmas.
+            current = surface_hits.get(entry.form)
+            surface_hits[entry.form] = min(current or entry.lemma, entry.lemma)
+
+    for lemma in lemma_set:
+        if lemma in declensions:
+            prefetch.lexicon_hits[lemma] = (lemma, True)
+        elif lemma in surface_hits:
+            prefetch.lexicon_hits[lemma] = (surface_hits[lemma], False)
+
+    missing = {resolved for resolved, _ in prefetch.lexicon_hits.values()} - declensions.keys()
+    if missing:
+        extra = await db.execute(
+            select(*_LEXICON_ENTRY_COLUMNS).where(
+                GreekLexicon.lemma.in_(missing), GreekLexicon.pos == pos_upper
+            )
+        )
+        for row in extra.all():
+            entry = LexiconEntry(*row)
+            declensions.setdefault(entry.lemma, []).append(entry)
+
+    prefetch.lexicon_declensions = {
+        lemma: sorted(entries, key=_declension_sort_key) for lemma, entries in declensions.items()
+    }
+
+
 def _row_to_form_bundle(row: GreekLexicon) -> FormBundle | None:
     """Convert a GreekLexicon ORM row to a FormBundle.
 
@@ -114,6 +283,8 @@ class EvidenceAssemblyService:
 
     Constructor:
         db: AsyncSession — injected per-request SQLAlchemy async session.
+        prefetch: Optional :class:`EvidencePrefetch` from a bulk run; covered
+            lemmas are answered from it instead of per-lemma queries.
 
     Usage::
 
@@ -123,8 +294,9 @@ class EvidenceAssemblyService:
             ...
     """
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, prefetch: EvidencePrefetch | None = None) -> None:
         self.db = db
+        self.prefetch = prefetch
 
     # ------------------------------------------------------------------
     # Public API
@@ -199,9 +371,7 @@ class EvidenceAssemblyService:
             EvidencePacket with all four per-source sub-models populated.
         """
         # --- Normalization (D-NORM) ---
-        pre_normalized = _final_sigma_unfold(unicodedata.normalize("NFC", lemma_input.lower()))
-        normalized_result = get_lemma_normalization_service().normalize(pre_normalized)
-        normalized_lemma = normalized_result.lemma
+        normalized_lemma = normalize_lemma_input(lemma_input)
 
         # --- Assemble each source (sequential; no external I/O concurrency needed) ---
         wiktionary_source = await self._assemble_wiktionary(normalized_lemma, pos)
@@ -258,6 +428,9 @@ class EvidenceAssemblyService:
         Absent (no rows for pos):
             - ``present=False``, empty forms, all optional fields None.
         """
+        if self.prefetch is not None and self.prefetch.covers(lemma, pos):
+            return self._wiktionary_from_rows(self.prefetch.wiktionary_rows.get(lemma, []))
+
         wikt_service = WiktionaryMorphologyService(self.db)
 
         # First try: get_form_bundles resolves to a single unambiguous row.
@@ -320,8 +493,73 @@ class EvidenceAssemblyService:
             genders=per_gender_hits,
         )
 
+    @staticmethod
+    def _wiktionary_from_rows(rows: list[_WiktionaryRow]) -> WiktionarySource:
+        """Build the WiktionarySource from prefetched rows for one (lemma, pos).
+
+        Same outcomes as the query path: exactly one row is the single-gender
+        case; otherwise each gender with a row is a per-gender hit.
+        """
+        if len(rows) == 1:
+            row = rows[0]
+            return WiktionarySource(
+                present=True,
+                forms=[FormBundle.model_validate(d) for d in row.forms],
+                gender=row.gender,
+                pronunciation=row.pronunciation,
+                glosses_en=row.glosses_en,
+                genders=None,
+            )
+
+        per_gender_hits: list[dict] = []
+        for g in _WIKTIONARY_GENDERS:
+            row = next((r for r in rows if r.gender == g), None)
+            if row is None:
+                continue
+            per_gender_hits.append(
+                {
+                    "gender": g,
+                    "pronunciation": row.pronunciation,
+                    "glosses_en": row.glosses_en,
+                    "forms": [FormBundle.model_validate(d) for d in row.forms],
+                }
+            )
+
+        if not per_gender_hits:
+            return WiktionarySource(present=False, forms=[])
+
+        if len(per_gender_hits) == 1:
+            hit = per_gender_hits[0]
+            return WiktionarySource(
+                present=True,
+                forms=hit["forms"],
+                gender=hit["gender"],
+                pronunciation=hit["pronunciation"],
+                glosses_en=hit["glosses_en"],
+                genders=None,
+            )
+
+        all_forms: list[FormBundle] = []
+        for hit in per_gender_hits:
+            all_forms.extend(hit["forms"])
+
+        return WiktionarySource(
+            present=True,
+            forms=all_forms,
+            gender=None,
+            pronunciation=None,
+            glosses_en=None,
+            genders=per_gender_hits,
+        )
+
     async def _assemble_frequency(self, lemma: str) -> FrequencySource:
         """Assemble frequency evidence for ``lemma``."""
+        if self.prefetch is not None and lemma in self.prefetch.lemmas:
+            rank = self.prefetch.frequency_ranks.get(lemma)
+            if rank is None:
+                return FrequencySource(present=False, rank=None, band=None)
+            return FrequencySource(present=True, rank=rank, band=band_for_rank(rank))
+
         freq_service = FrequencyService(self.db)
         rank = await freq_service.get_frequency_rank(lemma)
         if rank is None:
@@ -345,6 +583,21 @@ class EvidenceAssemblyService:
         """
         pos_upper = pos.upper()
 
+        if self.prefetch is not None and self.prefetch.covers(lemma, pos):
+            hit = self.prefetch.lexicon_hits.get(lemma)
+            if hit is None:
+                return GreekLexiconSource(
+                    present=False,
+                    attested_lemma=False,
+                    attested_surface_form=False,
+                )
+            resolved_lemma, attested_lemma = hit
+            return self._greek_lexicon_source(
+                resolved_lemma,
+                attested_lemma,
+                self.prefetch.lexicon_declensions.get(resolved_lemma, []),
+            )
+
         stmt = (
             select(GreekLexicon)
             .where(
@@ -366,7 +619,6 @@ class EvidenceAssemblyService:
 
         # Determine how we matched.
         attested_lemma = row.lemma == lemma
-        attested_surface_form = not attested_lemma
 
         # Resolve the canonical lemma for declension fetching.
         resolved_lemma = lemma if attested_lemma else row.lemma
@@ -374,7 +626,13 @@ class EvidenceAssemblyService:
         # Fetch all declension rows and map to FormBundles.
         lexicon_service = LexiconService(self.db)
         declension_entries = await lexicon_service.get_declensions(resolved_lemma, pos_upper)
+        return self._greek_lexicon_source(resolved_lemma, attested_lemma, declension_entries)
 
+    @staticmethod
+    def _greek_lexicon_source(
+        resolved_lemma: str, attested_lemma: bool, declension_entries: list[LexiconEntry]
+    ) -> GreekLexiconSource:
+        """Map declension rows for an attested lemma to a present GreekLexiconSource."""
         forms: list[FormBundle] = []
         for entry in declension_entries:
             features: dict[str, str] = {}
@@ -392,7 +650,7 @@ class EvidenceAssemblyService:
         return GreekLexiconSource(
             present=True,
             attested_lemma=attested_lemma,
-            attested_surface_form=attested_surface_form,
+            attested_surface_form=not attested_lemma,
             resolved_lemma=resolved_lemma,
             forms=forms,
         )
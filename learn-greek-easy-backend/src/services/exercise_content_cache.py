@@ -0,0 +1,324 @@
+"""Versioned in-process cache of exercise content for the study queue.
+
+``ExerciseSM2Service.get_study_queue`` needs two very different kinds of data:
+per-user scheduling (which exercises are due, new or up for early practice)
+and per-exercise content (description text, audio key, word timestamps,
+items, picture-match anchor and distractor pool). Scheduling changes on every
+review; content only changes when an admin edits or regenerates it. This
+module holds the content side, keyed by exercise id, so a queue build is the
+scheduling queries plus a batched cache read.
+
+What is cached:
+    - ``DescriptionContent`` per description-source exercise, with the A2/B1
+      and modality selection already applied and the raw audio S3 key (never
+      a presigned URL — URLs expire and are applied per request).
+    - ``PictureMatchContent`` per picture-source exercise: the anchor picture
+      and description as detached ``PictureRef``/``DescriptionRef`` views.
+    - The distractor pool per picture-match exercise type, as the same views.
+      Distractor picks and the anchor position stay random per request.
+
+Versioning:
+    The cache is stamped with a content version: ``count(*)`` and the latest
+    ``updated_at`` (``created_at`` for items) of every content table. At most
+    once per ``settings.exercise_content_cache_ttl`` seconds a lookup re-reads
+    the version and drops every entry if it moved, so an edit (or a delete) is
+    visible to this worker within that window. ``0`` disables the cache and
+    every lookup reads the database, as before.
+
+The cache is per process; each worker warms its own copy.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.config import settings
+from src.core.logging import get_logger
+from src.db.models import (
+    DeckLevel,
+    DescriptionExercise,
+    DescriptionExerciseItem,
+    Exercise,
+    ExerciseModality,
+    ExerciseType,
+    PictureExercise,
+    Situation,
+    SituationDescription,
+    SituationPicture,
+)
+from src.services.picture_match_service import DescriptionRef, PictureRef, load_distractor_pool
+
+logger = get_logger(__name__)
+
+# Version statements are split so neither joins situation_pictures,
+# situation_descriptions and picture_exercises in one statement (that shape is
+# reserved for the distractor-pool query).
+_DESCRIPTION_TABLES = (
+    Exercise,
+    DescriptionExercise,
+    DescriptionExerciseItem,
+    SituationDescription,
+    Situation,
+)
+_PICTURE_TABLES = (PictureExercise, SituationPicture)
+
+
+@dataclass(frozen=True)
+class DescriptionContent:
+    """Queue-ready content of one description-source exercise."""
+
+    situation_id: UUID | None
+    scenario_el: str | None
+    scenario_en: str | None
+    scenario_ru: str | None
+    text_el: str | None
+    audio_key: str | None
+    audio_duration: float | None
+    word_timestamps: list[dict[str, Any]] | None
+    items: tuple[tuple[int, dict[str, Any]], ...]
+    exercise_type: ExerciseType
+    modality: ExerciseModality
+    audio_level: DeckLevel
+
+
+@dataclass(frozen=True)
+class PictureMatchContent:
+    """Anchor of one picture-source exercise; ``description`` is None when missing."""
+
+    exercise_type: ExerciseType
+    picture: PictureRef
+    description: DescriptionRef | None
+
+
+def _version_statement(models: Sequence[type]) -> Any:
+    columns = []
+    for model in models:
+        stamp = model.updated_at if hasattr(model, "updated_at") else model.created_at  # type: ignore[attr-defined]
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(stamp)).scalar_subquery())
+    return select(*columns)
+
+
+async def content_version(db: AsyncSession) -> tuple[Any, ...]:
+    """Current content version: (count, latest timestamp) per content table."""
+    version: list[Any] = []
+    for models in (_DESCRIPTION_TABLES, _PICTURE_TABLES):
+        result = await db.execute(_version_statement(models))
+        version.extend(result.one())
+    return tuple(version)
+
+
+def description_content(de: DescriptionExercise) -> DescriptionContent:
+    """Select the level- and modality-specific content of a loaded DescriptionExercise."""
+    desc = de.description
+    situation = desc.situation if desc else None
+
+    if de.audio_level == DeckLevel.A2:
+        text_el = desc.text_el_a2 or desc.text_el if desc else None
+        audio_key = desc.audio_a2_s3_key if desc else None
+        duration = desc.audio_a2_duration_seconds if desc else None
+        timestamps = desc.word_timestamps_a2 if desc else None
+    else:
+        text_el = desc.text_el if desc else None
+        audio_key = desc.audio_s3_key if desc else None
+        duration = desc.audio_duration_seconds if desc else None
+        timestamps = desc.word_timestamps if desc else None
+
+    if de.modality == ExerciseModality.LISTENING:
+        text_el = None
+        timestamps = None
+    elif de.modality == ExerciseModality.READING:
+        audio_key = None
+        duration = None
+        timestamps = None
+
+    return DescriptionContent(
+        situation_id=situation.id if situation else None,
+        scenario_el=situation.scenario_el if situation else None,
+        scenario_en=situation.scenario_en if situation else None,
+        scenario_ru=situation.scenario_ru if situation else None,
+        text_el=text_el,
+        audio_key=audio_key,
+        audio_duration=duration,
+        word_timestamps=timestamps,
+        items=tuple(
+            (item.item_index, item.payload) for item in sorted(de.items, key=lambda x: x.item_index)
+        ),
+        exercise_type=de.exercise_type,
+        modality=de.modality,
+        audio_level=de.audio_level,
+    )
+
+
+def picture_match_content(pe: PictureExercise) -> PictureMatchContent:
+    """Detach the anchor picture and description of a loaded PictureExercise."""
+    picture = pe.picture
+    description = picture.situation.description
+    return PictureMatchContent(
+        exercise_type=pe.exercise_type,
+        picture=PictureRef(situation_id=picture.situation_id, image_s3_key=picture.image_s3_key),
+        description=(
+            DescriptionRef(situation_id=description.situation_id, text_el=description.text_el)
+            if description is not None
+            else None
+        ),
+    )
+
+
+class ExerciseContentCache:
+    """Exercise content by exercise id plus distractor pools by exercise type."""
+
+    def __init__(self) -> None:
+        self._descriptions: dict[UUID, DescriptionContent] = {}
+        self._pictures: dict[UUID, PictureMatchContent] = {}
+        self._pools: dict[ExerciseType, list[tuple[PictureRef, DescriptionRef]]] = {}
+        self._version: tuple[Any, ...] | None = None
+        self._checked_at = 0.0
+
+    def clear(self) -> None:
+        self._descriptions.clear()
+        self._pictures.clear()
+        self._pools.clear()
+        self._version = None
+        self._checked_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.exercise_content_cache_ttl > 0
+
+    async def _sync(self, db: AsyncSession) -> None:
+        """Drop every entry if the content version moved since the last check."""
+        now = time.monotonic()
+        if (
+            self._version is not None
+            and now - self._checked_at < settings.exercise_content_cache_ttl
+        ):
+            return
+        version = await content_version(db)
+        if version != self._version:
+            if self._version is not None:
+                logger.info(
+                    "exercise_content_cache_invalidated",
+                    descriptions=len(self._descriptions),
+                    pictures=len(self._pictures),
+                )
+            self._descriptions.clear()
+            self._pictures.clear()
+            self._pools.clear()
+            self._version = version
+        self._checked_at = now
+
+    async def descriptions(
+        self, db: AsyncSession, exercise_ids: Sequence[UUID]
+    ) -> dict[UUID, DescriptionContent]:
+        """Content for each description-source exercise in ``exercise_ids``.
+
+        Misses are loaded in one batched query. Ids without a
+        DescriptionExercise are absent from the result.
+        """
+        if not self.enabled:
+            return await self._load_descriptions(db, exercise_ids)
+        await self._sync(db)
+        missing = [eid for eid in exercise_ids if eid not in self._descriptions]
+        if missing:
+            self._descriptions.update(await self._load_descriptions(db, missing))
+        return {eid: self._descriptions[eid] for eid in exercise_ids if eid in self._descriptions}
+
+    async def pictures(
+        self, db: AsyncSession, exercise_ids: Sequence[UUID]
+    ) -> dict[UUID, PictureMatchContent]:
+        """Anchor content for each picture-source exercise in ``exercise_ids``."""
+        if not self.enabled:
+            return await self._load_pictures(db, exercise_ids)
+        await self._sync(db)
+        missing = [eid for eid in exercise_ids if eid not in self._pictures]
+        if missing:
+            self._pictures.update(await self._load_pictures(db, missing))
+        return {eid: self._pictures[eid] for eid in exercise_ids if eid in self._pictures}
+
+    async def distractor_pool(
+        self, db: AsyncSession, exercise_type: ExerciseType
+    ) -> list[tuple[PictureRef, DescriptionRef]]:
+        """The eligible distractor pool for ``exercise_type`` (see ``load_distractor_pool``)."""
+        if self.enabled:
+            await self._sync(db)
+            cached = self._pools.get(exercise_type)
+            if cached is not None:
+                return cached
+        pool = [
+            (
+                PictureRef(situation_id=sp.situation_id, image_s3_key=sp.image_s3_key),
+                DescriptionRef(situation_id=sd.situation_id, text_el=sd.text_el),
+            )
+            for sp, sd in await load_distractor_pool(db, exercise_type)
+        ]
+        if self.enabled:
+            self._pools[exercise_type] = pool
+        return pool
+
+    @staticmethod
+    async def _load_descriptions(
+        db: AsyncSession, exercise_ids: Sequence[UUID]
+    ) -> dict[UUID, DescriptionContent]:
+        stmt = (
+            select(Exercise)
+            .where(Exercise.id.in_(exercise_ids))
+            .options(
+                selectinload(Exercise.description_exercise).options(
+                    selectinload(DescriptionExercise.description).options(
+                        selectinload(SituationDescription.situation)
+                    ),
+                    selectinload(DescriptionExercise.items),
+                )
+            )
+        )
+        result = await db.execute(stmt)
+        return {
+            exercise.id: description_content(exercise.description_exercise)
+            for exercise in result.scalars().all()
+            if exercise.description_exercise is not None
+        }
+
+    @staticmethod
+    async def _load_pictures(
+        db: AsyncSession, exercise_ids: Sequence[UUID]
+    ) -> dict[UUID, PictureMatchContent]:
+        stmt = (
+            select(Exercise)
+            .where(Exercise.id.in_(exercise_ids))
+            .options(
+                selectinload(Exercise.picture_exercise).options(
+                    selectinload(PictureExercise.picture).options(
+                        selectinload(SituationPicture.situation).options(
+                            selectinload(Situation.description)
+                        )
+                    )
+                )
+            )
+        )
+        result = await db.execute(stmt)
+        return {
+            exercise.id: picture_match_content(exercise.picture_exercise)
+            for exercise in result.scalars().all()
+            if exercise.picture_exercise is not None
+        }
+
+
+_exercise_content_cache = ExerciseContentCache()
+
+
+def get_exercise_content_cache() -> ExerciseContentCache:
+    """Process-wide exercise content cache."""
+    return _exercise_content_cache
+
+
+def reset_exercise_content_cache() -> None:
+    """Drop every cached entry (tests, or after a bulk content import)."""
+    _exercise_content_cache.clear()
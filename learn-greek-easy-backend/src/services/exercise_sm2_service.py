@@ -7,7 +7,6 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.core.logging import get_logger
 from src.core.posthog import capture_event
@@ -15,16 +14,11 @@ from src.core.sm2 import calculate_next_review_date, calculate_sm2, derive_exerc
 from src.db.models import (
     CardStatus,
     DeckLevel,
-    DescriptionExercise,
     Exercise,
     ExerciseModality,
     ExerciseRecord,
     ExerciseSourceType,
     ExerciseType,
-    PictureExercise,
-    Situation,
-    SituationDescription,
-    SituationPicture,
 )
 from src.repositories.exercise_record import ExerciseRecordRepository
 from src.repositories.exercise_review import ExerciseReviewRepository
@@ -34,10 +28,11 @@ from src.schemas.exercise_queue import (
     ExerciseQueueItem,
     ExerciseReviewResult,
 )
+from src.services.exercise_content_cache import get_exercise_content_cache
 from src.services.picture_match_service import (
     InsufficientDistractorPoolError,
-    assemble_picture_match_payload,
-    load_distractor_pool,
+    build_picture_match_payload,
+    has_enough_distractors,
 )
 from src.services.s3_service import get_s3_service
 
@@ -142,7 +137,9 @@ class ExerciseSM2Service:
 
         # Enrich description-source items with audio + situation context
         if description_exercise_ids:
-            enrichment_map = await self.load_description_enrichment(description_exercise_ids)
+            enrichment_map = await self.load_description_enrichment(
+                description_exercise_ids, presign=not summary
+            )
             for item in all_items:
                 if item.exercise_id in enrichment_map:
                     enriched = enrichment_map[item.exercise_id]
@@ -166,7 +163,7 @@ class ExerciseSM2Service:
                         item.audio_level = audio_level_value
 
         # Enrich picture-source items with distractor payload; drop items that fail assembly
-        to_drop = await self.load_picture_match_enrichment(all_items)
+        to_drop = await self.load_picture_match_enrichment(all_items, summary=summary)
         if to_drop:
             all_items = [i for i in all_items if i.exercise_id not in to_drop]
 
@@ -242,74 +239,43 @@ class ExerciseSM2Service:
     async def load_description_enrichment(
         self,
         exercise_ids: list[UUID],
+        *,
+        presign: bool = True,
     ) -> dict[UUID, dict]:
-        """Batch-load description exercise enrichment data (audio, text, situation, items)."""
-        stmt = (
-            select(Exercise)
-            .where(Exercise.id.in_(exercise_ids))
-            .options(
-                selectinload(Exercise.description_exercise).options(
-                    selectinload(DescriptionExercise.description).options(
-                        selectinload(SituationDescription.situation)
-                    ),
-                    selectinload(DescriptionExercise.items),
-                )
-            )
-        )
-        result = await self.db.execute(stmt)
-        exercises = list(result.scalars().all())
+        """Batch-load description exercise enrichment data (audio, text, situation, items).
 
-        s3_service = get_s3_service()
-        enrichment: dict[UUID, dict] = {}
+        Content comes from the exercise content cache (one batched query for
+        misses); only the audio URL is produced here, per call, because
+        presigned URLs expire. ``presign=False`` skips it for callers that
+        discard the URL (summary mode).
+        """
+        contents = await get_exercise_content_cache().descriptions(self.db, exercise_ids)
 
-        for exercise in exercises:
-            de = exercise.description_exercise
-            if de is None:
-                continue
+        s3_service = get_s3_service() if presign else None
+        enrichment: dict[UUID, dict] = {}
 
-            desc = de.description
-            situation = desc.situation if desc else None
-
-            use_a2 = de.audio_level == DeckLevel.A2
-            if use_a2:
-                text_el = desc.text_el_a2 or desc.text_el if desc else None
-                audio_key = desc.audio_a2_s3_key if desc else None
-                duration = desc.audio_a2_duration_seconds if desc else None
-                timestamps = desc.word_timestamps_a2 if desc else None
-            else:
-                text_el = desc.text_el if desc else None
-                audio_key = desc.audio_s3_key if desc else None
-                duration = desc.audio_duration_seconds if desc else None
-                timestamps = desc.word_timestamps if desc else None
-
-            if de.modality == ExerciseModality.LISTENING:
-                text_el = None
-                timestamps = None
-            elif de.modality == ExerciseModality.READING:
-                audio_key = None
-                duration = None
-                timestamps = None
-
-            audio_url = s3_service.generate_presigned_url(audio_key) if audio_key else None
-
-            items = [
-                ExerciseItemPayload(item_index=item.item_index, payload=item.payload)
-                for item in sorted(de.items, key=lambda x: x.item_index)
-            ]
-
-            enrichment[exercise.id] = {
-                "situation_id": situation.id if situation else None,
-                "scenario_el": situation.scenario_el if situation else None,
-                "scenario_en": situation.scenario_en if situation else None,
-                "scenario_ru": situation.scenario_ru if situation else None,
-                "description_text_el": text_el,
+        for exercise_id, content in contents.items():
+            audio_url = (
+                s3_service.generate_presigned_url(content.audio_key)
+                if s3_service is not None and content.audio_key
+                else None
+            )
+            enrichment[exercise_id] = {
+                "situation_id": content.situation_id,
+                "scenario_el": content.scenario_el,
+                "scenario_en": content.scenario_en,
+                "scenario_ru": content.scenario_ru,
+                "description_text_el": content.text_el,
                 "description_audio_url": audio_url,
-                "description_audio_duration": duration,
-                "word_timestamps": timestamps,
-                "items": items,
-                "exercise_type": de.exercise_type,
-                "modality": de.modality,
-                "audio_level_value": de.audio_level,
+                "description_audio_duration": content.audio_duration,
+                "word_timestamps": content.word_timestamps,
+                "items": [
+                    ExerciseItemPayload(item_index=index, payload=payload)
+                    for index, payload in content.items
+                ],
+                "exercise_type": content.exercise_type,
+                "modality": content.modality,
+                "audio_level_value": content.audio_level,
             }
 
         return enrichment
@@ -317,15 +283,22 @@ class ExerciseSM2Service:
     async def load_picture_match_enrichment(
         self,
         queue_items: list[ExerciseQueueItem],
+        *,
+        summary: bool = False,
     ) -> set[UUID]:
         """Batch-load picture-match enrichment data; return exercise_ids that should be dropped.
 
-        Collects PICTURE-source items, bulk-loads their Exercise rows with the full
-        PictureExercise → SituationPicture → Situation → SituationDescription chain,
-        then calls assemble_picture_match_payload for each item.  Items that raise
-        InsufficientDistractorPoolError are added to the drop set and logged at INFO.
-        Items whose picture_exercise relation is unexpectedly None are added to the drop
-        set and logged at WARNING.
+        Collects PICTURE-source items, reads their anchor content and the
+        distractor pool per distinct exercise-type from the exercise content
+        cache, then calls build_picture_match_payload for each item (random
+        distractor picks and presigned URLs stay per request). Items that raise
+        InsufficientDistractorPoolError are added to the drop set and logged at
+        INFO. Items without a picture exercise (or whose anchor situation has no
+        description) are added to the drop set and logged at WARNING.
+
+        With ``summary`` the payload is not built (summary mode empties
+        ``items`` anyway); items are dropped on the same pool-size rule, so
+        queue counts match the full path.
         """
         picture_items = [
             item for item in queue_items if item.source_type == ExerciseSourceType.PICTURE
@@ -333,41 +306,23 @@ class ExerciseSM2Service:
         if not picture_items:
             return set()
 
-        picture_exercise_ids = [item.exercise_id for item in picture_items]
-
-        stmt = (
-            select(Exercise)
-            .where(Exercise.id.in_(picture_exercise_ids))
-            .options(
-                selectinload(Exercise.picture_exercise).options(
-                    selectinload(PictureExercise.picture).options(
-                        selectinload(SituationPicture.situation).options(
-                            selectinload(Situation.description)
-                        )
-                    )
-                )
-            )
+        content_cache = get_exercise_content_cache()
+        contents = await content_cache.pictures(
+            self.db, [item.exercise_id for item in picture_items]
         )
-        result = await self.db.execute(stmt)
-        exercises_by_id = {e.id: e for e in result.scalars().all()}
-
-        # Batch the distractor pool once per distinct exercise-type present among
-        # the picture items (≤2 types → ≤2 queries), instead of a per-item
-        # ORDER BY random() scan. (PERF-18-03)
-        distinct_exercise_types = {
-            e.picture_exercise.exercise_type
-            for e in exercises_by_id.values()
-            if e.picture_exercise is not None
-        }
+
+        # One distractor pool per distinct exercise-type present among the
+        # picture items (≤2 types), cached alongside the anchors. (PERF-18-03)
         pool_by_type = {
-            et: await load_distractor_pool(self.db, et) for et in distinct_exercise_types
+            et: await content_cache.distractor_pool(self.db, et)
+            for et in {content.exercise_type for content in contents.values()}
         }
 
         to_drop: set[UUID] = set()
 
         for item in picture_items:
-            exercise = exercises_by_id.get(item.exercise_id)
-            if exercise is None or exercise.picture_exercise is None:
+            content = contents.get(item.exercise_id)
+            if content is None or content.description is None:
                 logger.warning(
                     "picture_match_item_missing_picture_exercise",
                     exercise_id=str(item.exercise_id),
@@ -375,15 +330,19 @@ class ExerciseSM2Service:
                 to_drop.add(item.exercise_id)
                 continue
 
-            picture_exercise = exercise.picture_exercise
-
+            pool = pool_by_type[content.exercise_type]
             try:
-                payload = await assemble_picture_match_payload(
-                    self.db,
-                    picture_exercise,
-                    picture_exercise.exercise_type,
-                    pool=pool_by_type[picture_exercise.exercise_type],
-                )
+                if summary:
+                    if not has_enough_distractors(pool, content.picture.situation_id):
+                        raise InsufficientDistractorPoolError()
+                    items: list[ExerciseItemPayload] = []
+                else:
+                    payload = build_picture_match_payload(
+                        content.picture, content.description, content.exercise_type, pool=pool
+                    )
+                    items = [
+                        ExerciseItemPayload(item_index=0, payload=payload.model_dump(mode="json"))
+                    ]
             except InsufficientDistractorPoolError:
                 logger.info(
                     "picture_match_item_skipped_insufficient_pool",
@@ -392,11 +351,9 @@ class ExerciseSM2Service:
                 to_drop.add(item.exercise_id)
                 continue
 
-            item.exercise_type = picture_exercise.exercise_type
-            item.situation_id = picture_exercise.picture.situation_id
-            item.items = [
-                ExerciseItemPayload(item_index=0, payload=payload.model_dump(mode="json"))
-            ]
+            item.exercise_type = content.exercise_type
+            item.situation_id = content.picture.situation_id
+            item.items = items
 
         return to_drop
 
@@ -9,6 +9,9 @@ Design decisions (per LEXGEN-05-03 D6):
   and does NOT re-run spaCy normalisation.
 - Per-request service (not singleton); instantiated with an AsyncSession,
   following the same pattern as LexiconService.
+- With ``settings.reference_snapshots_enabled`` ranks are read from a
+  process-wide ``lemma -> rank`` dict (see ``reference_snapshot``) instead of
+  one query per lemma.
 """
 
 from __future__ import annotations
@@ -16,7 +19,9 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db.models import FrequencyRank
+from src.services.reference_snapshot import ReferenceSnapshot
 
 COMMON_MAX_RANK = 2000
 MID_MAX_RANK = 8000
@@ -39,6 +44,17 @@ def band_for_rank(rank: int | None) -> str | None:
     return "rare"
 
 
+async def _load_frequency_snapshot(db: AsyncSession) -> dict[str, int]:
+    """Load the whole frequency list as ``{lemma: rank}``."""
+    result = await db.execute(select(FrequencyRank.lemma, FrequencyRank.rank))
+    return {lemma: rank for lemma, rank in result.all()}
+
+
+frequency_snapshot: ReferenceSnapshot[dict[str, int]] = ReferenceSnapshot(
+    "frequency_rank", _load_frequency_snapshot
+)
+
+
 class FrequencyService:
     """Async lookup service for the frequency_rank reference table (LEXGEN-05).
 
@@ -51,6 +67,8 @@ class FrequencyService:
 
     async def get_frequency_rank(self, lemma: str) -> int | None:
         """Return the integer frequency rank for a lemma, or None if not found."""
+        if settings.reference_snapshots_enabled:
+            return (await frequency_snapshot.get(self.db)).get(lemma)
         result = await self.db.execute(
             select(FrequencyRank.rank).where(FrequencyRank.lemma == lemma)
         )
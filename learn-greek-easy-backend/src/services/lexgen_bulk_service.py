@@ -0,0 +1,304 @@
+"""LexgenBulkRunner — deck-sized batches through the LEXGEN pipeline.
+
+Runs ``LexgenPipelineService.run_for_lemma`` for a list of lemmas (e.g. the
+output of ``src.scripts.export_deck_lemmas``) instead of one admin submit at a
+time:
+
+- Batched reads: each batch's evidence is prefetched with one ``IN`` query
+  per reference source (``evidence_assembly_service.prefetch_evidence``) and
+  handed to every pipeline in the batch.
+- Bounded fan-out: each pipeline runs in its own session; at most
+  :class:`AdaptiveConcurrency` ``.limit`` pipelines are in flight.
+- Adaptive backoff: an OpenRouter rate limit or timeout halves the limit and
+  pauses new starts with exponential backoff; successes grow the limit back
+  one slot at a time (AIMD), never above ``settings.lexgen_bulk_concurrency``.
+- Checkpointing: every pipeline commits its own proposal, so committed
+  proposals ARE the checkpoint. With ``resume=True`` lemmas that already have
+  a proposal for the same pos are skipped, and a crashed run picks up where
+  it stopped.
+
+Proposals are created with ``origin=BATCH``. Failed lemmas are reported in
+the :class:`BulkRunSummary` and retried on the next run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.core.exceptions import OpenRouterRateLimitError, OpenRouterTimeoutError
+from src.core.logging import get_logger
+from src.db.models import WordProposal, WordProposalOrigin
+from src.db.session import get_session_factory
+from src.services.evidence_assembly_service import (
+    EvidencePrefetch,
+    normalize_lemma_input,
+    prefetch_evidence,
+)
+from src.services.lexgen_pipeline_service import LexgenPipelineService
+
+logger = get_logger(__name__)
+
+#: OpenRouter failures that mean "slow down", not "this lemma is broken".
+_BACKOFF_ERRORS = (OpenRouterRateLimitError, OpenRouterTimeoutError)
+
+# Process-local guard so the admin endpoint cannot start overlapping runs.
+_active_run = False
+
+
+def is_bulk_run_active() -> bool:
+    """Return True while a bulk run started by :func:`run_bulk_lexgen` is in progress."""
+    return _active_run
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit with a shared backoff window.
+
+    ``async with limiter:`` waits until a slot is free and no backoff is in
+    effect. :meth:`record_rate_limit` halves the limit and opens a backoff
+    window of ``base_delay * 2**strikes`` seconds (capped at ``max_delay``);
+    :meth:`record_success` adds one slot after ``limit`` consecutive successes
+    and clears the strike count.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._in_flight = 0
+        self._strikes = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._cond = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            async with self._cond:
+                if self._in_flight < self.limit and time.monotonic() >= self._resume_at:
+                    self._in_flight += 1
+                    return self
+                await self._cond.wait()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record_success(self) -> None:
+        self._strikes = 0
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+
+    def record_rate_limit(self) -> float:
+        """Shrink the limit and open a backoff window. Returns the delay in seconds."""
+        self.limit = max(1, self.limit // 2)
+        self._successes = 0
+        delay = min(self.max_delay, self.base_delay * (2**self._strikes))
+        self._strikes += 1
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+        return delay
+
+
+@dataclass
+class BulkRunSummary:
+    """Outcome counts for one bulk run."""
+
+    total: int = 0
+    skipped: int = 0
+    queued: int = 0
+    rejected: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "total": self.total,
+            "skipped": self.skipped,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "failed": len(self.failed),
+        }
+
+
+def dedupe_lemmas(lemmas: Iterable[str]) -> list[str]:
+    """Strip, drop blanks and duplicates, preserving first-seen order."""
+    seen: set[str] = set()
+    result: list[str] = []
+    for raw in lemmas:
+        lemma = raw.strip()
+        if lemma and lemma not in seen:
+            seen.add(lemma)
+            result.append(lemma)
+    return result
+
+
+class LexgenBulkRunner:
+    """Run the LEXGEN pipeline over many lemmas with batching and bounded concurrency.
+
+    Constructor:
+        session_factory: Creates one session per batch prefetch and per pipeline.
+        pos: Part-of-speech shared by the whole run.
+        requested_by: User recorded on every proposal (None for CLI runs).
+        concurrency: Max pipelines in flight (default settings.lexgen_bulk_concurrency).
+        batch_size: Lemmas per prefetch batch (default settings.lexgen_bulk_batch_size).
+        resume: Skip lemmas that already have a proposal for ``pos``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        pos: str = "noun",
+        requested_by: UUID | None = None,
+        concurrency: int | None = None,
+        batch_size: int | None = None,
+        resume: bool = True,
+        limiter: AdaptiveConcurrency | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.pos = pos
+        self.requested_by = requested_by
+        self.batch_size = batch_size or settings.lexgen_bulk_batch_size
+        self.resume = resume
+        self.limiter = limiter or AdaptiveConcurrency(
+            concurrency or settings.lexgen_bulk_concurrency
+        )
+
+    async def run(self, lemmas: Sequence[str]) -> BulkRunSummary:
+        """Process ``lemmas`` batch by batch and return the outcome summary."""
+        unique = dedupe_lemmas(lemmas)
+        summary = BulkRunSummary(total=len(unique))
+        logger.info(
+            "lexgen.bulk.start",
+            total=summary.total,
+            pos=self.pos,
+            concurrency=self.limiter.max_concurrency,
+            batch_size=self.batch_size,
+        )
+        start = time.monotonic()
+
+        for offset in range(0, len(unique), self.batch_size):
+            batch = unique[offset : offset + self.batch_size]
+            async with self.session_factory() as session:
+                done = await self._already_proposed(session, batch) if self.resume else set()
+                pending = [lemma for lemma in batch if lemma not in done]
+                normalized = {lemma: normalize_lemma_input(lemma) for lemma in pending}
+                prefetch = await prefetch_evidence(session, normalized.values(), self.pos)
+            summary.skipped += len(batch) - len(pending)
+
+            outcomes = await asyncio.gather(*(self._run_one(lemma, prefetch) for lemma in pending))
+            for lemma, (outcome, error) in zip(pending, outcomes):
+                if outcome == "queued":
+                    summary.queued += 1
+                elif outcome == "rejected":
+                    summary.rejected += 1
+                else:
+                    summary.failed[lemma] = error or "unknown error"
+
+            logger.info(
+                "lexgen.bulk.batch",
+                processed=min(offset + self.batch_size, len(unique)),
+                limit=self.limiter.limit,
+                **summary.as_dict(),
+            )
+
+        logger.info(
+            "lexgen.bulk.done",
+            elapsed_s=round(time.monotonic() - start, 1),
+            **summary.as_dict(),
+        )
+        return summary
+
+    async def _already_proposed(self, session: AsyncSession, batch: list[str]) -> set[str]:
+        """Return the lemmas in ``batch`` that already have a proposal for this pos."""
+        result = await session.execute(
+            select(WordProposal.lemma_input)
+            .where(WordProposal.lemma_input.in_(batch), WordProposal.pos == self.pos)
+            .distinct()
+        )
+        return set(result.scalars().all())
+
+    async def _run_one(
+        self, lemma: str, prefetch: EvidencePrefetch
+    ) -> tuple[str | None, str | None]:
+        """Run one lemma's pipeline, retrying on rate limits. Returns (outcome, error)."""
+        error: str | None = None
+        for attempt in range(1, settings.lexgen_bulk_max_attempts + 1):
+            async with self.limiter:
+                try:
+                    async with self.session_factory() as session:
+                        _, outcome = await LexgenPipelineService(session).run_for_lemma(
+                            lemma,
+                            pos=self.pos,
+                            requested_by=self.requested_by,
+                            origin=WordProposalOrigin.BATCH,
+                            prefetch=prefetch,
+                        )
+                except _BACKOFF_ERRORS as exc:
+                    delay = self.limiter.record_rate_limit()
+                    error = f"{type(exc).__name__}: {exc}"
+                    logger.warning(
+                        "lexgen.bulk.backoff",
+                        lemma=lemma,
+                        attempt=attempt,
+                        delay_s=delay,
+                        limit=self.limiter.limit,
+                    )
+                    continue
+                except Exception as exc:  # one bad lemma must not abort the run
+                    logger.error("lexgen.bulk.failed", lemma=lemma, error=str(exc))
+                    return (None, f"{type(exc).__name__}: {exc}")
+            self.limiter.record_success()
+            return (outcome, None)
+
+        logger.error("lexgen.bulk.failed", lemma=lemma, error=error)
+        return (None, error)
+
+
+async def run_bulk_lexgen(
+    lemmas: Sequence[str],
+    *,
+    pos: str = "noun",
+    requested_by: UUID | None = None,
+    concurrency: int | None = None,
+) -> BulkRunSummary:
+    """Background-task entry point for the admin bulk endpoint.
+
+    Uses the app's global session factory and holds the process-local
+    single-run guard for the duration of the run.
+    """
+    global _active_run
+    _active_run = True
+    try:
+        runner = LexgenBulkRunner(
+            get_session_factory(),
+            pos=pos,
+            requested_by=requested_by,
+            concurrency=concurrency,
+        )
+        return await runner.run(lemmas)
+    finally:
+        _active_run = False
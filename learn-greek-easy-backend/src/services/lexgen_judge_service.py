@@ -30,6 +30,7 @@ diff against).
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import Literal
@@ -218,11 +219,18 @@ class LexgenJudgeService:
         content = GeneratedLexContent.model_validate(raw_content)
         packet = EvidencePacket.model_validate(proposal.evidence_packet)
 
-        # Run each configured judge sequentially (exactly two slugs in v1).
-        judges: list[JudgeResult] = [
-            await self._run_one_judge(slug, content, packet)
-            for slug in settings.lexgen_judge_models
-        ]
+        # Run the configured judges concurrently (exactly two slugs in v1). Each
+        # judge only awaits OpenRouter (never the session) and never raises, so
+        # gather is safe; results keep ``lexgen_judge_models`` order. In-flight
+        # requests are capped process-wide by the OpenRouter limiter.
+        judges: list[JudgeResult] = list(
+            await asyncio.gather(
+                *(
+                    self._run_one_judge(slug, content, packet)
+                    for slug in settings.lexgen_judge_models
+                )
+            )
+        )
         rubric_a = judges[0].rubric if judges else None
         rubric_b = judges[1].rubric if len(judges) > 1 else None
 
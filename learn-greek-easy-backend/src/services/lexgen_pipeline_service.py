@@ -15,7 +15,9 @@ Binary routing invariant (Decision Record §3):
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,6 +27,7 @@ from src.db.models import WordProposalOrigin, WordProposalState
 
 if TYPE_CHECKING:
     from src.db.models import WordProposal
+    from src.services.evidence_assembly_service import EvidencePrefetch
     from src.services.openrouter_service import OpenRouterService
 
 
@@ -43,17 +46,38 @@ def _get_openrouter() -> "OpenRouterService":
     When BOTH conditions hold the deterministic FakeOpenRouter is returned:
       1. ``settings.lexgen_e2e_fake_llm is True``
       2. ``not settings.is_production``
+
+    Either client is wrapped in the opt-in persistent response cache
+    (``openrouter_cache.wrap_with_response_cache``); with the cache off the
+    client is returned unchanged.
     """
     from src.config import settings  # noqa: PLC0415
+    from src.services.openrouter_cache import wrap_with_response_cache  # noqa: PLC0415
 
     if settings.lexgen_e2e_fake_llm and not settings.is_production:
         from src.services.lexgen_fake_openrouter import FakeOpenRouter  # noqa: PLC0415
 
-        return FakeOpenRouter()  # type: ignore[return-value]
+        return wrap_with_response_cache(FakeOpenRouter())  # type: ignore[arg-type]
 
     from src.services.openrouter_service import OpenRouterService  # noqa: PLC0415
 
-    return OpenRouterService()
+    return wrap_with_response_cache(OpenRouterService())
+
+
+@contextmanager
+def record_stage_timing(proposal: "WordProposal", stage: str) -> Iterator[None]:
+    """Record the wall-clock duration of one pipeline stage on the proposal.
+
+    Writes ``{"<stage>_ms": int}`` into ``proposal.stage_timings``. The dict is
+    reassigned rather than mutated so SQLAlchemy detects the JSONB change. The
+    timing is recorded even when the stage raises.
+    """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        elapsed_ms = round((time.monotonic() - start) * 1000)
+        proposal.stage_timings = {**(proposal.stage_timings or {}), f"{stage}_ms": elapsed_ms}
 
 
 def get_lexgen_pipeline_service(db: AsyncSession) -> "LexgenPipelineService":
@@ -90,6 +114,8 @@ class LexgenPipelineService:
         *,
         pos: str = "noun",
         requested_by: UUID | None,
+        origin: WordProposalOrigin = WordProposalOrigin.ADMIN,
+        prefetch: "EvidencePrefetch | None" = None,
     ) -> tuple["WordProposal", str]:
         """Run the full pipeline for a single lemma and commit.
 
@@ -97,6 +123,9 @@ class LexgenPipelineService:
             lemma_input: Raw lemma string.
             pos: Part-of-speech (default "noun").
             requested_by: User UUID or None.
+            origin: Proposal origin (ADMIN for single submits, BATCH for bulk runs).
+            prefetch: Batched reference reads from a bulk run (see
+                ``evidence_assembly_service.prefetch_evidence``); None queries per lemma.
 
         Returns:
             (WordProposal, outcome_str) — outcome is "queued" or "rejected".
@@ -108,13 +137,16 @@ class LexgenPipelineService:
         # Step 1: assemble evidence and create the proposal.
         # Returns a WordProposal at GENERATING (attested) or REJECTED (never-invent).
         # The proposal is flushed but not committed.
-        assembly_svc = EvidenceAssemblyService(self.db)
+        assembly_svc = EvidenceAssemblyService(self.db, prefetch=prefetch)
+        assemble_start = time.monotonic()
         proposal = await assembly_svc.assemble(
             lemma_input,
             pos,
-            origin=WordProposalOrigin.ADMIN,
+            origin=origin,
             requested_by=requested_by,
         )
+        # The proposal only exists once assemble returns, so time it by hand.
+        proposal.stage_timings = {"assemble_ms": round((time.monotonic() - assemble_start) * 1000)}
 
         # Bind proposal_id so every downstream stage log — here and inside the
         # generator/verify/reconcile/judge services — is traceable end-to-end in
@@ -144,7 +176,8 @@ class LexgenPipelineService:
 
         openrouter = _get_openrouter()
 
-        await LexgenGeneratorService(self.db, openrouter).generate(proposal)
+        with record_stage_timing(proposal, "generate"):
+            await LexgenGeneratorService(self.db, openrouter).generate(proposal)
 
         # The generator can exhaust retries and transition GENERATING→REJECTED.
         # Commit and return early if that happened (no reconcile/judge on rejected).
@@ -160,17 +193,25 @@ class LexgenPipelineService:
 
         logger.info("lexgen.pipeline.generated", stage="generate", status=proposal.status.value)
 
-        await LexgenVerifyService(self.db, openrouter).verify(proposal)
+        with record_stage_timing(proposal, "verify"):
+            await LexgenVerifyService(self.db, openrouter).verify(proposal)
         # verify() returns a VerifyOutcome and never transitions status — no branch needed.
         logger.info("lexgen.pipeline.verified", stage="verify")
 
-        await LexgenReconcilerService(self.db).reconcile(proposal)
+        with record_stage_timing(proposal, "reconcile"):
+            await LexgenReconcilerService(self.db).reconcile(proposal)
         # reconcile() transitions GENERATING→SCORED.
         logger.info("lexgen.pipeline.reconciled", stage="reconcile", status=proposal.status.value)
 
-        await LexgenJudgeService(self.db, openrouter).judge(proposal)
+        with record_stage_timing(proposal, "judge"):
+            await LexgenJudgeService(self.db, openrouter).judge(proposal)
         # judge() transitions SCORED→NEEDS_REVIEW.
 
         await self.db.commit()
-        logger.info("lexgen.pipeline.queued", stage="judge", status=proposal.status.value)
+        logger.info(
+            "lexgen.pipeline.queued",
+            stage="judge",
+            status=proposal.status.value,
+            stage_timings=proposal.stage_timings,
+        )
         return (proposal, "queued")
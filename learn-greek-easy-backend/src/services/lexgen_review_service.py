@@ -51,6 +51,7 @@ from src.db.models import (
 )
 from src.repositories.word_entry import WordEntryRepository
 from src.services.card_generator_service import CardGeneratorService
+from src.services.openrouter_cache import bypass_response_cache
 
 if TYPE_CHECKING:
     from src.db.models import WordProposal
@@ -466,8 +467,11 @@ class LexgenReviewService:
         from src.services.lexgen_reconciler_service import LexgenReconcilerService  # noqa: PLC0415
         from src.services.lexgen_verify_service import LexgenVerifyService  # noqa: PLC0415
 
+        # A reviewer regenerate asks for NEW content: never serve the generator
+        # from the response cache (the fresh result still refreshes it).
         generator_svc = LexgenGeneratorService(self.db, openrouter)
-        await generator_svc.generate(proposal)
+        with bypass_response_cache():
+            await generator_svc.generate(proposal)
 
         verify_svc = LexgenVerifyService(self.db, openrouter)
         await verify_svc.verify(proposal)
@@ -561,14 +565,19 @@ def _get_openrouter() -> "OpenRouterService":
     production even if the env-var leaks.  The fake covers BOTH callers
     (edit's judge call at line 387 and regenerate's generator/verify/judge
     calls at line 462) because both obtain their client via this function.
+
+    Either client is wrapped in the opt-in persistent response cache
+    (``openrouter_cache.wrap_with_response_cache``); with the cache off the
+    client is returned unchanged.
     """
     from src.config import settings  # noqa: PLC0415
+    from src.services.openrouter_cache import wrap_with_response_cache  # noqa: PLC0415
 
     if settings.lexgen_e2e_fake_llm and not settings.is_production:
         from src.services.lexgen_fake_openrouter import FakeOpenRouter  # noqa: PLC0415
 
-        return FakeOpenRouter()  # type: ignore[return-value]
+        return wrap_with_response_cache(FakeOpenRouter())  # type: ignore[arg-type]
 
     from src.services.openrouter_service import OpenRouterService  # noqa: PLC0415
 
-    return OpenRouterService()
+    return wrap_with_response_cache(OpenRouterService())
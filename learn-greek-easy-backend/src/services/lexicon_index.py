@@ -0,0 +1,415 @@
+"""Compact, memory-mapped read-only index of ``reference.greek_lexicon``.
+
+``LexiconService`` answers ``lookup`` / ``get_declensions`` /
+``lookup_all_genders`` per token for lexgen verify, evidence assembly and
+reverse lookup. With ``settings.lexicon_index_path`` set, those calls read this
+file instead of querying Postgres. It is built by
+``src/scripts/build_lexicon_index.py`` and mapped with ``mmap`` (read-only,
+shared through the page cache by every worker process; nothing is
+deserialized up front).
+
+File layout (native byte order, recorded in the metadata):
+
+    b"GLXIDX01" | u32 metadata length | metadata JSON | pad to 8 | sections
+
+Sections (each 8-byte aligned, offsets in the metadata):
+
+    str_offsets   u32[n_strings + 1]  — interned UTF-8 forms and lemmas
+    str_blob      bytes
+    form_keys     u32[n_forms]        — string ids, sorted by UTF-8 bytes
+    form_starts   u32[n_forms + 1]    — entry range per form
+    lemma_keys    u32[n_lemmas]       — string ids, sorted by UTF-8 bytes
+    lemma_starts  u32[n_lemmas + 1]   — range into lemma_entries per lemma
+    lemma_entries u32[n_entries]      — entry ids in declension order
+    entry_form    u32[n_entries]
+    entry_lemma   u32[n_entries]
+    entry_pos, entry_gender, entry_ptosi, entry_number   u8[n_entries]
+
+``pos`` / ``gender`` / ``ptosi`` / ``number`` are codes into small tables in
+the metadata (code 0 is NULL). Entries are stored per form in
+``lookup`` preference order (Sing first, then Nom first, then load order) and
+``lemma_entries`` per lemma in ``get_declensions`` order (Sing→Plur, then
+Nom→Gen→Acc→Voc), so every query is a binary search plus a linear scan of one
+small range. The metadata also records the ``greek_lexicon`` dataset-stamp
+version the file was built from; the service ignores a file whose version no
+longer matches the database.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.services.lexicon_service import LexiconEntry
+
+MAGIC = b"GLXIDX01"
+FORMAT_VERSION = 1
+
+_DECLENSION_CASE_ORDER = {"Nom": 0, "Gen": 1, "Acc": 2, "Voc": 3}
+
+#: (form, lemma, pos, gender, ptosi, number) — the columns LexiconEntry needs.
+LexiconRow = tuple[str, str, str, str | None, str | None, str | None]
+
+_U32_SECTIONS = (
+    "str_offsets",
+    "form_keys",
+    "form_starts",
+    "lemma_keys",
+    "lemma_starts",
+    "lemma_entries",
+    "entry_form",
+    "entry_lemma",
+)
+_U8_SECTIONS = ("entry_pos", "entry_gender", "entry_ptosi", "entry_number")
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+class _CodeTable:
+    """Value -> small int code; code 0 is reserved for NULL."""
+
+    def __init__(self) -> None:
+        self.values: list[str | None] = [None]
+        self._codes: dict[str | None, int] = {None: 0}
+
+    def code(self, value: str | None) -> int:
+        if value not in self._codes:
+            if len(self.values) > 255:
+                raise ValueError(f"Too many distinct values for a u8 code table: {value!r}")
+            self._codes[value] = len(self.values)
+            self.values.append(value)
+        return self._codes[value]
+
+
+def _sorted_range_index(keys: list[int], encoded: list[bytes]) -> tuple[array, array, list[int]]:
+    """Group positions by string id, ordering groups by the strings' UTF-8 bytes.
+
+    Returns ``(sorted_keys, starts, order)`` where ``order`` lists positions of
+    ``keys`` grouped by key (stable within a group).
+    """
+    order = sorted(range(len(keys)), key=lambda i: encoded[keys[i]])
+    sorted_keys = array("I")
+    starts = array("I")
+    for pos, i in enumerate(order):
+        if not sorted_keys or sorted_keys[-1] != keys[i]:
+            sorted_keys.append(keys[i])
+            starts.append(pos)
+    starts.append(len(order))
+    return sorted_keys, starts, order
+
+
+def write_lexicon_index(rows: Iterable[LexiconRow], path: str | Path, dataset_version: int) -> int:
+    """Compile lexicon rows into an index file at ``path``; returns the entry count.
+
+    The file is written next to ``path`` and renamed into place, so processes
+    that already mapped the previous file keep reading it undisturbed.
+    """
+    strings: dict[str, int] = {}
+    pos_codes, gender_codes, ptosi_codes, number_codes = (_CodeTable() for _ in range(4))
+    raw: list[tuple[int, int, int, int, int, int]] = []
+    for form, lemma, pos, gender, ptosi, number in rows:
+        raw.append(
+            (
+                strings.setdefault(form, len(strings)),
+                strings.setdefault(lemma, len(strings)),
+                pos_codes.code(pos),
+                gender_codes.code(gender),
+                ptosi_codes.code(ptosi),
+                number_codes.code(number),
+            )
+        )
+    encoded = [s.encode("utf-8") for s in strings]
+    sing = number_codes.code("Sing")
+    nom = ptosi_codes.code("Nom")
+
+    # Entries in lookup preference order within each form (sort is stable).
+    raw.sort(key=lambda e: (e[5] != sing, e[4] != nom))
+    form_keys, form_starts, entry_order = _sorted_range_index([e[0] for e in raw], encoded)
+    entries = [raw[i] for i in entry_order]
+
+    case_rank = {
+        code: _DECLENSION_CASE_ORDER.get(value, 4)  # type: ignore[arg-type]
+        for code, value in enumerate(ptosi_codes.values)
+    }
+    declension_order = sorted(
+        range(len(entries)), key=lambda i: (entries[i][5] != sing, case_rank[entries[i][4]])
+    )
+    lemma_keys, lemma_starts, lemma_order = _sorted_range_index(
+        [entries[i][1] for i in declension_order], encoded
+    )
+    lemma_entries = array("I", (declension_order[i] for i in lemma_order))
+
+    str_offsets = array("I", [0])
+    for value in encoded:
+        str_offsets.append(str_offsets[-1] + len(value))
+
+    sections: dict[str, bytes] = {
+        "str_offsets": str_offsets.tobytes(),
+        "str_blob": b"".join(encoded),
+        "form_keys": form_keys.tobytes(),
+        "form_starts": form_starts.tobytes(),
+        "lemma_keys": lemma_keys.tobytes(),
+        "lemma_starts": lemma_starts.tobytes(),
+        "lemma_entries": lemma_entries.tobytes(),
+        "entry_form": array("I", (e[0] for e in entries)).tobytes(),
+        "entry_lemma": array("I", (e[1] for e in entries)).tobytes(),
+        "entry_pos": bytes(e[2] for e in entries),
+        "entry_gender": bytes(e[3] for e in entries),
+        "entry_ptosi": bytes(e[4] for e in entries),
+        "entry_number": bytes(e[5] for e in entries),
+    }
+    _write_file(
+        Path(path),
+        sections,
+        {
+            "format_version": FORMAT_VERSION,
+            "dataset_version": dataset_version,
+            "byteorder": sys.byteorder,
+            "entries": len(entries),
+            "pos": pos_codes.values,
+            "gender": gender_codes.values,
+            "ptosi": ptosi_codes.values,
+            "number": number_codes.values,
+        },
+    )
+    return len(entries)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _write_file(path: Path, sections: dict[str, bytes], meta: dict) -> None:
+    # Section offsets depend on the metadata length, which depends on the
+    # offsets' digits; iterate until the layout is stable (twice in practice).
+    layout: dict[str, list[int]] = {}
+    while True:
+        header = json.dumps({**meta, "sections": layout}).encode("utf-8")
+        offset = _align(len(MAGIC) + 4 + len(header))
+        new_layout: dict[str, list[int]] = {}
+        for name, blob in sections.items():
+            new_layout[name] = [offset, len(blob)]
+            offset = _align(offset + len(blob))
+        if new_layout == layout:
+            break
+        layout = new_layout
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with tmp.open("wb") as fh:
+        fh.write(MAGIC)
+        fh.write(struct.pack("=I", len(header)))
+        fh.write(header)
+        for name, blob in sections.items():
+            start = layout[name][0]
+            fh.write(b"\0" * (start - fh.tell()))
+            fh.write(blob)
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class LexiconIndexError(ValueError):
+    """The file is not a readable lexicon index (bad magic, version or byte order)."""
+
+
+class LexiconIndex:
+    """Read-only view over a memory-mapped lexicon index file.
+
+    Readers that may overlap a reload bracket their queries with
+    :meth:`acquire` / :meth:`release`; :meth:`retire` then defers the
+    :meth:`close` of a replaced index until the last of them has finished.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._state_lock = threading.Lock()
+        self._readers = 0
+        self._retired = False
+        self._closed = False
+        with self.path.open("rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    @classmethod
+    def open(cls, path: str | Path | None) -> LexiconIndex | None:
+        """Map ``path``; None when it is unset or missing."""
+        if not path or not Path(path).is_file():
+            return None
+        return cls(path)
+
+    def _parse(self) -> None:
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            raise LexiconIndexError(f"{self.path} is not a lexicon index")
+        (meta_len,) = struct.unpack_from("=I", self._mmap, len(MAGIC))
+        start = len(MAGIC) + 4
+        meta = json.loads(self._mmap[start : start + meta_len])
+        if meta["format_version"] != FORMAT_VERSION or meta["byteorder"] != sys.byteorder:
+            raise LexiconIndexError(f"{self.path} has an incompatible format or byte order")
+
+        self.dataset_version: int = meta["dataset_version"]
+        self._entries: int = meta["entries"]
+        self._pos: list[str | None] = meta["pos"]
+        self._gender: list[str | None] = meta["gender"]
+        self._ptosi: list[str | None] = meta["ptosi"]
+        self._number: list[str | None] = meta["number"]
+
+        view = memoryview(self._mmap)
+        sections = meta["sections"]
+
+        def section(name: str) -> memoryview:
+            offset, length = sections[name]
+            return view[offset : offset + length]
+
+        self._blob = section("str_blob")
+        for name in _U32_SECTIONS:
+            setattr(self, f"_{name}", section(name).cast("I"))
+        for name in _U8_SECTIONS:
+            setattr(self, f"_{name}", section(name))
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def acquire(self) -> bool:
+        """Register a reader; False once the index has been retired."""
+        with self._state_lock:
+            if self._retired:
+                return False
+            self._readers += 1
+            return True
+
+    def release(self) -> None:
+        """Unregister a reader, closing a retired index when it was the last one."""
+        with self._state_lock:
+            self._readers -= 1
+            last = self._retired and self._readers == 0
+        if last:
+            self.close()
+
+    def retire(self) -> None:
+        """Refuse new readers and close once the in-flight ones have released."""
+        with self._state_lock:
+            self._retired = True
+            idle = self._readers == 0
+        if idle:
+            self.close()
+
+    def close(self) -> None:
+        """Release the mapping; views handed out earlier must not be used afterwards."""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+        for name in (*_U32_SECTIONS, *_U8_SECTIONS, "blob"):
+            getattr(self, f"_{name}").release()
+        self._mmap.close()
+
+    # -- primitives ---------------------------------------------------------
+
+    def _bytes(self, string_id: int) -> bytes:
+        return bytes(self._blob[self._str_offsets[string_id] : self._str_offsets[string_id + 1]])
+
+    def _string(self, string_id: int) -> str:
+        return self._bytes(string_id).decode("utf-8")
+
+    def _find(self, keys: memoryview, value: str) -> int | None:
+        """Binary-search sorted string ids ``keys`` for ``value``; returns its position."""
+        target = value.encode("utf-8")
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bytes(keys[mid]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(keys) and self._bytes(keys[lo]) == target:
+            return lo
+        return None
+
+    def _code(self, table: list[str | None], value: str | None) -> int | None:
+        """Code for a filter value, or None when the value never occurs."""
+        try:
+            return table.index(value)
+        except ValueError:
+            return None
+
+    def _entry(self, i: int) -> LexiconEntry:
+        return LexiconEntry(
+            form=self._string(self._entry_form[i]),
+            lemma=self._string(self._entry_lemma[i]),
+            pos=self._pos[self._entry_pos[i]],  # type: ignore[arg-type]
+            gender=self._gender[self._entry_gender[i]],
+            ptosi=self._ptosi[self._entry_ptosi[i]],
+            number=self._number[self._entry_number[i]],
+        )
+
+    def _form_range(self, form: str) -> range:
+        pos = self._find(self._form_keys, form)
+        if pos is None:
+            return range(0)
+        return range(self._form_starts[pos], self._form_starts[pos + 1])
+
+    def _matches(self, i: int, pos_code: int | None, gender_code: int | None) -> bool:
+        return (pos_code is None or self._entry_pos[i] == pos_code) and (
+            gender_code is None or self._entry_gender[i] == gender_code
+        )
+
+    # -- LexiconService queries ---------------------------------------------
+
+    def lookup(
+        self, form: str, pos: str | None = None, gender: str | None = None
+    ) -> LexiconEntry | None:
+        """Same contract as :meth:`LexiconService.lookup`."""
+        pos_code = self._code(self._pos, pos) if pos is not None else None
+        gender_code = self._code(self._gender, gender) if gender is not None else None
+        if (pos is not None and pos_code is None) or (gender is not None and gender_code is None):
+            return None
+        for i in self._form_range(form):
+            if self._matches(i, pos_code, gender_code):
+                return self._entry(i)
+        return None
+
+    def get_declensions(
+        self, lemma: str, pos: str = "NOUN", gender: str | None = None
+    ) -> list[LexiconEntry]:
+        """Same contract as :meth:`LexiconService.get_declensions`."""
+        pos_code = self._code(self._pos, pos)
+        gender_code = self._code(self._gender, gender) if gender is not None else None
+        key = self._find(self._lemma_keys, lemma)
+        if key is None or pos_code is None or (gender is not None and gender_code is None):
+            return []
+        ids = self._lemma_entries[self._lemma_starts[key] : self._lemma_starts[key + 1]]
+        return [self._entry(i) for i in ids if self._matches(i, pos_code, gender_code)]
+
+    def lookup_all_genders(self, form: str, pos: str | None = None) -> list[LexiconEntry]:
+        """Same contract as :meth:`LexiconService.lookup_all_genders`.
+
+        One entry per distinct gender (first in preference order), ordered by
+        gender with NULL last — Postgres ``DISTINCT ON (gender) ORDER BY gender``.
+        """
+        pos_code = self._code(self._pos, pos) if pos is not None else None
+        if pos is not None and pos_code is None:
+            return []
+        first: dict[int, int] = {}
+        for i in self._form_range(form):
+            if self._matches(i, pos_code, None):
+                first.setdefault(self._entry_gender[i], i)
+        ordered = sorted(first, key=lambda code: (code == 0, self._gender[code] or ""))
+        return [self._entry(first[code]) for code in ordered]
@@ -1,13 +1,35 @@
-"""Lexicon lookup service for the reference.greek_lexicon table."""
+"""Lexicon lookup service for the reference.greek_lexicon table.
+
+When ``settings.lexicon_index_path`` points at a file built by
+``src/scripts/build_lexicon_index.py``, lookups read that memory-mapped index
+(``src.services.lexicon_index``) instead of Postgres. The mapping is opened
+once per process as a reference snapshot keyed on the ``greek_lexicon`` dataset
+stamp; a missing file, or one built from a different stamp version, falls
+back to the database queries below. While falling back, a changed file mtime
+(e.g. the index was rebuilt) triggers a fresh attempt to map it. A replaced
+mapping is closed once the lookups still reading it have finished.
+"""
 
 from __future__ import annotations
 
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from sqlalchemy import case, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.core.logging import get_logger
 from src.db.models import GreekLexicon
+from src.services.reference_snapshot import ReferenceSnapshot, read_dataset_version
+
+if TYPE_CHECKING:
+    from src.services.lexicon_index import LexiconIndex
+
+logger = get_logger(__name__)
 
 _CASE_ORDER = {"Nom": 0, "Gen": 1, "Acc": 2, "Voc": 3}
 
@@ -24,6 +46,61 @@ class LexiconEntry:
     number: str | None
 
 
+@dataclass(frozen=True)
+class _MappedLexicon:
+    """Snapshot value: the mapped index, or None when the DB must be used."""
+
+    index: "LexiconIndex | None"
+    mtime: float | None = None
+
+
+def _index_mtime(path: str | None) -> float | None:
+    try:
+        return os.stat(path).st_mtime if path else None
+    except OSError:
+        return None
+
+
+async def _open_lexicon_index(db: AsyncSession) -> _MappedLexicon:
+    """Map the configured index file if it matches the current greek_lexicon stamp."""
+    from src.services.lexicon_index import LexiconIndex, LexiconIndexError  # noqa: PLC0415
+
+    path = settings.lexicon_index_path
+    mtime = _index_mtime(path)
+    try:
+        index = LexiconIndex.open(path)
+    except (OSError, LexiconIndexError) as exc:
+        logger.warning("Lexicon index unreadable, using database", path=path, error=str(exc))
+        return _MappedLexicon(None, mtime)
+    if index is None:
+        if path:
+            logger.warning("Lexicon index file missing, using database", path=path)
+        return _MappedLexicon(None, mtime)
+
+    version = await read_dataset_version(db, "greek_lexicon")
+    if index.dataset_version != version:
+        logger.warning(
+            "Lexicon index is stale, using database",
+            path=path,
+            index_version=index.dataset_version,
+            dataset_version=version,
+        )
+        index.close()
+        return _MappedLexicon(None, mtime)
+    return _MappedLexicon(index, mtime)
+
+
+def _retire_lexicon_index(mapped: _MappedLexicon) -> None:
+    """Snapshot dispose hook: unmap a replaced index after its last reader."""
+    if mapped.index is not None:
+        mapped.index.retire()
+
+
+lexicon_index_snapshot: ReferenceSnapshot[_MappedLexicon] = ReferenceSnapshot(
+    "greek_lexicon", _open_lexicon_index, name="lexicon_index", dispose=_retire_lexicon_index
+)
+
+
 class LexiconService:
     """Async lookup service for the Greek lexicon reference table.
 
@@ -34,6 +111,33 @@ class LexiconService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
+    async def _mapped_index(self) -> "LexiconIndex | None":
+        """The memory-mapped index when configured and current, else None."""
+        path = settings.lexicon_index_path
+        if not path:
+            return None
+        mapped = await lexicon_index_snapshot.get(self.db)
+        if mapped.index is None and _index_mtime(path) != mapped.mtime:
+            lexicon_index_snapshot.reset()
+            mapped = await lexicon_index_snapshot.get(self.db)
+        return mapped.index
+
+    @asynccontextmanager
+    async def _reading_index(self) -> AsyncIterator["LexiconIndex | None"]:
+        """Hold the mapped index for one query so a reload cannot unmap it mid-read.
+
+        Yields None (use the database) when there is no current index, or when
+        it was retired between the snapshot read and the acquire.
+        """
+        index = await self._mapped_index()
+        if index is None or not index.acquire():
+            yield None
+            return
+        try:
+            yield index
+        finally:
+            index.release()
+
     async def lookup(
         self, form: str, pos: str | None = None, gender: str | None = None
     ) -> LexiconEntry | None:
@@ -49,6 +153,10 @@ class LexiconService:
         Returns:
             LexiconEntry if found, None otherwise.
         """
+        async with self._reading_index() as index:
+            if index is not None:
+                return index.lookup(form, pos, gender)
+
         query = (
             select(GreekLexicon)
             .where(GreekLexicon.form == form)
@@ -95,6 +203,10 @@ class LexiconService:
         Returns:
             List of LexiconEntry objects, empty if lemma not found.
         """
+        async with self._reading_index() as index:
+            if index is not None:
+                return index.get_declensions(lemma, pos, gender)
+
         query = (
             select(GreekLexicon)
             .where(
@@ -145,6 +257,10 @@ class LexiconService:
             List of LexiconEntry, one per gender variant (preferring Nominative Singular).
             Returns empty list if no matches found.
         """
+        async with self._reading_index() as index:
+            if index is not None:
+                return index.lookup_all_genders(form, pos)
+
         query = (
             select(GreekLexicon)
             .where(GreekLexicon.form == form)
@@ -47,6 +47,7 @@ from src.db.models import (
     MockExamStatus,
 )
 from src.repositories.mock_exam import MockExamRepository
+from src.repositories.user_due_histogram import UserDueHistogramRepository
 from src.services.s3_service import IMAGE_PRESIGN_EXPIRY_SECONDS, S3Service, get_s3_service
 from src.services.xp_service import XPService
 
@@ -699,6 +700,7 @@ class MockExamService:
         )
         result = await self.db.execute(query)
         stats = result.scalar_one_or_none()
+        previous_review_date = stats.next_review_date if stats is not None else None
 
         if stats is None:
             stats = CultureQuestionStats(
@@ -730,6 +732,7 @@ class MockExamService:
         stats.repetitions = sm2_result.new_repetitions
         stats.next_review_date = next_review
         stats.status = sm2_result.new_status
+        await UserDueHistogramRepository(self.db).shift(user_id, previous_review_date, next_review)
 
 
 # ============================================================================
@@ -37,6 +37,11 @@ class NotificationService:
             NotificationEvent(event_type="unread_count", user_id=user_id, payload={"count": count}),
         )
 
+    async def _current_unread_count(self, user_id: UUID) -> int:
+        """Unread count after this service's writes, without a query when a write returned it."""
+        count = self.repo.unread_counts.get(user_id)
+        return count if count is not None else await self.repo.get_unread_count(user_id)
+
     async def _signal_new_notification(self, user_id: UUID, notification: Notification) -> None:
         """Signal new notification to active SSE streams."""
         await notification_event_bus.signal(
@@ -91,8 +96,8 @@ class NotificationService:
             },
         )
 
+        count = await self.repo.adjust_unread_count(user_id, 1)
         await self._signal_new_notification(user_id, notification)
-        count = await self.get_unread_count(user_id)
         await self._signal_unread_count(user_id, count)
 
         return notification
@@ -126,7 +131,7 @@ class NotificationService:
                 "Notification marked as read",
                 extra={"notification_id": str(notification_id)},
             )
-            count = await self.get_unread_count(user_id)
+            count = await self._current_unread_count(user_id)
             await self._signal_unread_count(user_id, count)
         return updated
 
@@ -144,7 +149,7 @@ class NotificationService:
         """Delete a notification."""
         success = await self.repo.delete_by_id(notification_id, user_id)
         if success:
-            count = await self.get_unread_count(user_id)
+            count = await self._current_unread_count(user_id)
             await self._signal_unread_count(user_id, count)
         return success
 
@@ -0,0 +1,310 @@
+"""Persistent prompt-hash response cache for OpenRouterService.complete.
+
+The lexgen generator, verify and judge stages send deterministic prompts, so
+reruns after a crash, regenerations of unchanged content and calibration
+sweeps repeat identical requests. :class:`CachingOpenRouter` wraps an
+``OpenRouterService`` (or the ``FakeOpenRouter`` stand-in) and serves those
+repeats from a persistent store instead of re-paying LLM latency and cost.
+
+Key:
+    sha256 over the canonical JSON of the effective model, messages,
+    temperature, max_tokens, response_format (the schema) and reasoning,
+    plus :data:`CACHE_KEY_VERSION`. Any prompt change is a new key.
+
+Stores:
+    :class:`PostgresResponseStore` — ``openrouter_response_cache`` table, one
+    short session per lookup (safe under the judge's concurrent calls).
+    :class:`DiskResponseStore` — one JSON file per key under a directory;
+    handy for offline benchmarking with a copied cache directory.
+
+Modes (``settings.openrouter_cache_mode``):
+    off        — no wrapping; :func:`wrap_with_response_cache` returns the service.
+    read_write — serve hits, call + store on miss.
+    record     — always call, store every response (refreshes the cache).
+    replay     — serve hits, raise ``OpenRouterCacheMissError`` on a miss; the
+                 API is never called.
+
+Bypass:
+    Inside ``with bypass_response_cache():`` reads are skipped and the fresh
+    response is stored (record semantics). Replay ignores the bypass so it can
+    never reach the network. Store failures are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Protocol
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.config import settings
+from src.core.exceptions import OpenRouterCacheMissError
+from src.core.logging import get_logger
+from src.db.models import OpenRouterResponseCache
+from src.schemas.nlp import OpenRouterResponse
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.services.openrouter_service import OpenRouterService
+
+logger = get_logger(__name__)
+
+#: Bump to invalidate every cached entry (e.g. when the response shape changes).
+CACHE_KEY_VERSION = 1
+
+_bypass: ContextVar[bool] = ContextVar("openrouter_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_response_cache() -> Iterator[None]:
+    """Skip cache reads for OpenRouter calls made inside the block."""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def request_cache_key(
+    *,
+    model: str,
+    messages: list[dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict[str, Any] | None,
+    reasoning: dict[str, Any] | None,
+) -> str:
+    """Return the sha256 hex key for one chat-completion request."""
+    canonical = json.dumps(
+        {
+            "v": CACHE_KEY_VERSION,
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+            "reasoning": reasoning,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseStore(Protocol):
+    """Persistence backend for cached responses."""
+
+    async def get(self, key: str) -> OpenRouterResponse | None:
+        """Return the live entry for ``key``, or None if absent or expired."""
+
+    async def put(
+        self, key: str, model: str, response: OpenRouterResponse, ttl_seconds: int
+    ) -> None:
+        """Upsert ``response`` under ``key``; ``ttl_seconds=0`` never expires."""
+
+
+class DiskResponseStore:
+    """One ``<key>.json`` file per entry, sharded by the first two hex digits."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> OpenRouterResponse | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return OpenRouterResponse.model_validate(entry["response"])
+
+    def _write(self, key: str, model: str, response: OpenRouterResponse, ttl: int) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "model": model,
+            "expires_at": time.time() + ttl if ttl else None,
+            "response": response.model_dump(mode="json"),
+        }
+        # Write-then-rename so concurrent readers never see a partial file.
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    async def get(self, key: str) -> OpenRouterResponse | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def put(
+        self, key: str, model: str, response: OpenRouterResponse, ttl_seconds: int
+    ) -> None:
+        await asyncio.to_thread(self._write, key, model, response, ttl_seconds)
+
+
+class PostgresResponseStore:
+    """Rows in ``openrouter_response_cache``, one short-lived session per call.
+
+    Deliberately does not share the caller's session: the cache is read from
+    concurrent judge calls and must not interleave with the pipeline's
+    transaction.
+    """
+
+    def __init__(self, session_factory: "async_sessionmaker[AsyncSession] | None" = None) -> None:
+        self._session_factory = session_factory
+
+    def _factory(self) -> "async_sessionmaker[AsyncSession]":
+        if self._session_factory is None:
+            from src.db.session import get_session_factory  # noqa: PLC0415
+
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    async def get(self, key: str) -> OpenRouterResponse | None:
+        async with self._factory()() as session:
+            result = await session.execute(
+                select(OpenRouterResponseCache.response, OpenRouterResponseCache.expires_at).where(
+                    OpenRouterResponseCache.cache_key == key
+                )
+            )
+            row = result.one_or_none()
+        if row is None:
+            return None
+        response, expires_at = row
+        if expires_at is not None and expires_at <= datetime.now(timezone.utc):
+            return None
+        return OpenRouterResponse.model_validate(response)
+
+    async def put(
+        self, key: str, model: str, response: OpenRouterResponse, ttl_seconds: int
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        values = {
+            "cache_key": key,
+            "model": model,
+            "response": response.model_dump(mode="json"),
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl_seconds) if ttl_seconds else None,
+        }
+        stmt = insert(OpenRouterResponseCache).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OpenRouterResponseCache.cache_key],
+            set_={k: stmt.excluded[k] for k in ("model", "response", "created_at", "expires_at")},
+        )
+        async with self._factory().begin() as session:
+            await session.execute(stmt)
+
+
+class CachingOpenRouter:
+    """Duck-typed OpenRouterService wrapper that caches ``complete()`` responses.
+
+    Everything other than ``complete`` (``generate_image``, ``start``,
+    ``close``) is delegated to the wrapped service untouched.
+    """
+
+    def __init__(
+        self,
+        inner: "OpenRouterService",
+        store: ResponseStore,
+        *,
+        mode: str,
+        ttl_seconds: int,
+    ) -> None:
+        self._inner = inner
+        self._store = store
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        response_format: dict[str, Any] | None = None,
+        temperature: float = 0.3,
+        max_tokens: int = 2048,
+        reasoning: dict[str, Any] | None = None,
+    ) -> OpenRouterResponse:
+        """Serve from the cache per ``mode``; otherwise call through and store."""
+        effective_model = model or settings.openrouter_default_model
+        key = request_cache_key(
+            model=effective_model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            reasoning=reasoning,
+        )
+
+        read = self.mode == "replay" or (self.mode == "read_write" and not _bypass.get())
+        if read:
+            start = time.monotonic()
+            cached = await self._safe_get(key)
+            if cached is not None:
+                latency_ms = round((time.monotonic() - start) * 1000, 1)
+                logger.debug(
+                    "OpenRouter cache hit", extra={"model": effective_model, "cache_key": key}
+                )
+                return cached.model_copy(update={"latency_ms": latency_ms})
+            if self.mode == "replay":
+                raise OpenRouterCacheMissError(key)
+
+        response = await self._inner.complete(
+            messages,
+            model=model,
+            response_format=response_format,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            reasoning=reasoning,
+        )
+        await self._safe_put(key, effective_model, response)
+        return response
+
+    async def _safe_get(self, key: str) -> OpenRouterResponse | None:
+        try:
+            return await self._store.get(key)
+        except Exception as exc:  # a broken cache must never fail the LLM call
+            logger.warning("OpenRouter cache read failed", extra={"error": str(exc)})
+            return None
+
+    async def _safe_put(self, key: str, model: str, response: OpenRouterResponse) -> None:
+        try:
+            await self._store.put(key, model, response, self.ttl_seconds)
+        except Exception as exc:
+            logger.warning("OpenRouter cache write failed", extra={"error": str(exc)})
+
+
+def get_response_store() -> ResponseStore:
+    """Build the store selected by ``settings.openrouter_cache_backend``."""
+    if settings.openrouter_cache_backend == "disk":
+        return DiskResponseStore(settings.openrouter_cache_dir)
+    return PostgresResponseStore()
+
+
+def wrap_with_response_cache(service: "OpenRouterService") -> "OpenRouterService":
+    """Wrap ``service`` in a :class:`CachingOpenRouter` unless the cache is off."""
+    if settings.openrouter_cache_mode == "off":
+        return service
+    return CachingOpenRouter(  # type: ignore[return-value]
+        service,
+        get_response_store(),
+        mode=settings.openrouter_cache_mode,
+        ttl_seconds=settings.openrouter_cache_ttl_seconds,
+    )
@@ -4,6 +4,7 @@ This service provides:
 - Generic HTTP client for OpenRouter chat completions API
 - Per-call model selection with configurable default
 - Retry with exponential backoff (3 attempts max)
+- Process-wide concurrency limiter shared by all instances
 - Structured logging with token usage tracking
 - response_format pass-through for JSON mode
 
@@ -12,6 +13,7 @@ Configuration:
     OPENROUTER_BASE_URL: API base URL (default: https://openrouter.ai/api/v1)
     OPENROUTER_DEFAULT_MODEL: Default model (default: google/gemini-2.5-flash-lite)
     OPENROUTER_TIMEOUT: API call timeout in seconds (default: 60)
+    OPENROUTER_MAX_CONCURRENCY: Max in-flight requests per process (default: 8)
 """
 
 import asyncio
@@ -38,6 +40,23 @@ logger = get_logger(__name__)
 MAX_ATTEMPTS = 3
 BACKOFF_SECONDS = [1, 2]
 
+_limiter: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+def _get_concurrency_limiter() -> asyncio.Semaphore:
+    """Return the process-wide request semaphore for the running event loop.
+
+    Callers build short-lived ``OpenRouterService()`` instances (pipeline,
+    review service), so the limit cannot live on the instance. The semaphore is
+    re-created when the running loop changes (tests, ``asyncio.run`` scripts),
+    since an asyncio primitive must not be shared across loops.
+    """
+    global _limiter
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter[0] is not loop:
+        _limiter = (loop, asyncio.Semaphore(settings.openrouter_max_concurrency))
+    return _limiter[1]
+
 
 class OpenRouterService:
     """Service for OpenRouter chat completions API."""
@@ -115,11 +134,17 @@ class OpenRouterService:
         for attempt in range(1, MAX_ATTEMPTS + 1):
             start_time = time.monotonic()
             try:
-                if self._client is not None:
-                    response = await self._client.post(url, headers=self._get_headers(), json=body)
-                else:
-                    async with httpx.AsyncClient(timeout=settings.openrouter_timeout) as client:
-                        response = await client.post(url, headers=self._get_headers(), json=body)
+                # Only the HTTP round-trip holds a limiter slot; backoff sleeps do not.
+                async with _get_concurrency_limiter():
+                    if self._client is not None:
+                        response = await self._client.post(
+                            url, headers=self._get_headers(), json=body
+                        )
+                    else:
+                        async with httpx.AsyncClient(timeout=settings.openrouter_timeout) as client:
+                            response = await client.post(
+                                url, headers=self._get_headers(), json=body
+                            )
 
                 latency_ms = round((time.monotonic() - start_time) * 1000)
 
@@ -296,11 +321,14 @@ class OpenRouterService:
         log_extra: dict[str, Any] = {"model": model, "aspect_ratio": aspect_ratio}
         start_time = time.monotonic()
         try:
-            if self._client is not None:
-                response = await self._client.post(url, headers=headers, json=body, timeout=timeout)
-            else:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.post(url, headers=headers, json=body)
+            async with _get_concurrency_limiter():
+                if self._client is not None:
+                    response = await self._client.post(
+                        url, headers=headers, json=body, timeout=timeout
+                    )
+                else:
+                    async with httpx.AsyncClient(timeout=timeout) as client:
+                        response = await client.post(url, headers=headers, json=body)
         except httpx.TimeoutException as exc:
             latency_ms = round((time.monotonic() - start_time) * 1000)
             logger.warning(
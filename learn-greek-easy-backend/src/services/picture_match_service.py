@@ -12,6 +12,7 @@ than 3 eligible distractor Situations exist for the anchor.
 from __future__ import annotations
 
 import random
+from dataclasses import dataclass
 from uuid import UUID
 
 from sqlalchemy import select
@@ -38,8 +39,34 @@ from src.services.s3_service import IMAGE_PRESIGN_EXPIRY_SECONDS, get_s3_service
 
 logger = get_logger(__name__)
 
+
+@dataclass(frozen=True)
+class PictureRef:
+    """Detached view of the SituationPicture columns the payload builders read.
+
+    Cached by ``exercise_content_cache`` in place of ORM rows so a cached entry
+    never touches a closed session.
+    """
+
+    situation_id: UUID
+    image_s3_key: str | None
+
+
+@dataclass(frozen=True)
+class DescriptionRef:
+    """Detached view of the SituationDescription columns the payload builders read."""
+
+    situation_id: UUID
+    text_el: str
+
+
 # Type alias for the (picture, description) candidate pair used internally.
-_Candidate = tuple[SituationPicture, SituationDescription]
+_Candidate = tuple[SituationPicture | PictureRef, SituationDescription | DescriptionRef]
+
+_PICTURE_MATCH_TYPES = (
+    ExerciseType.SELECT_PICTURE_FROM_DESCRIPTION,
+    ExerciseType.SELECT_DESCRIPTION_FROM_PICTURE,
+)
 
 
 class InsufficientDistractorPoolError(Exception):
@@ -113,10 +140,7 @@ async def assemble_picture_match_payload(
         InsufficientDistractorPoolError: When fewer than 3 eligible distractors exist,
             or when a presigned URL cannot be generated for a required image.
     """
-    if exercise_type not in (
-        ExerciseType.SELECT_PICTURE_FROM_DESCRIPTION,
-        ExerciseType.SELECT_DESCRIPTION_FROM_PICTURE,
-    ):
+    if exercise_type not in _PICTURE_MATCH_TYPES:
         raise ValueError(f"unsupported exercise_type for picture match: {exercise_type!r}")
 
     anchor_picture: SituationPicture = exercise.picture
@@ -130,6 +154,32 @@ async def assemble_picture_match_payload(
             f"anchor situation {anchor_situation_id} has no description"
         )
 
+    return build_picture_match_payload(anchor_picture, anchor_description, exercise_type, pool=pool)
+
+
+def build_picture_match_payload(
+    anchor_picture: SituationPicture | PictureRef,
+    anchor_description: SituationDescription | DescriptionRef,
+    exercise_type: ExerciseType,
+    *,
+    pool: list[_Candidate],
+) -> SelectPictureFromDescriptionPayload | SelectDescriptionFromPicturePayload:
+    """Pick distractors, place the anchor and presign images for one picture-match item.
+
+    The IO-free core of ``assemble_picture_match_payload``: accepts ORM rows or
+    the detached ``PictureRef``/``DescriptionRef`` views served by the exercise
+    content cache, so the study queue can build payloads from cached content
+    with only the presigning done per request.
+
+    Raises:
+        ValueError: For unsupported exercise_type values.
+        InsufficientDistractorPoolError: When fewer than 3 eligible distractors exist,
+            or when a presigned URL cannot be generated for a required image.
+    """
+    if exercise_type not in _PICTURE_MATCH_TYPES:
+        raise ValueError(f"unsupported exercise_type for picture match: {exercise_type!r}")
+
+    anchor_situation_id = anchor_picture.situation_id
     candidates = _fetch_candidates(pool, anchor_situation_id, anchor_picture, anchor_description)
     correct_index = candidates.index((anchor_picture, anchor_description))
 
@@ -153,11 +203,21 @@ async def assemble_picture_match_payload(
     return payload
 
 
+def has_enough_distractors(pool: list[_Candidate], anchor_situation_id: UUID) -> bool:
+    """True when ``pool`` holds at least 3 distractors for the anchor situation.
+
+    The same eligibility test ``_fetch_candidates`` applies, without the random
+    picks or presigning — enough for callers that only need to know whether
+    the item would be dropped.
+    """
+    return sum(1 for sp, _sd in pool if sp.situation_id != anchor_situation_id) >= 3
+
+
 def _fetch_candidates(
     pool: list[_Candidate],
     anchor_situation_id: UUID,
-    anchor_picture: SituationPicture,
-    anchor_description: SituationDescription,
+    anchor_picture: SituationPicture | PictureRef,
+    anchor_description: SituationDescription | DescriptionRef,
 ) -> list[_Candidate]:
     """Pick 3 random distractor pairs from ``pool``, then insert the anchor at a random slot.
 
@@ -206,7 +266,7 @@ def _fetch_candidates(
 
 
 def _build_select_picture_payload(
-    anchor_description: SituationDescription,
+    anchor_description: SituationDescription | DescriptionRef,
     candidates: list[_Candidate],
     correct_index: int,
 ) -> SelectPictureFromDescriptionPayload:
@@ -234,7 +294,7 @@ def _build_select_picture_payload(
 
 
 def _build_select_description_payload(
-    anchor_picture: SituationPicture,
+    anchor_picture: SituationPicture | PictureRef,
     anchor_situation_id: UUID,
     candidates: list[_Candidate],
     correct_index: int,
@@ -24,7 +24,9 @@ from src.db.models import (
     Deck,
     ExerciseReview,
     MockExamSession,
+    UserDeckProgress,
 )
+from src.db.session import get_session_factory
 from src.repositories.card_record import CardRecordRepository
 from src.repositories.card_record_review import CardRecordReviewRepository
 from src.repositories.card_record_statistics import CardRecordStatisticsRepository
@@ -34,6 +36,13 @@ from src.repositories.culture_question_stats import CultureQuestionStatsReposito
 from src.repositories.deck import DeckRepository
 from src.repositories.exercise_review import ExerciseReviewRepository
 from src.repositories.mock_exam import MockExamRepository
+from src.repositories.user_daily_trends import COUNTER_COLUMNS, UserDailyTrendsRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
+from src.repositories.user_due_histogram import (
+    UserDueHistogramRepository,
+    build_counts,
+    due_window,
+)
 from src.schemas.progress import (
     DailyStats,
     DashboardStatsResponse,
@@ -43,9 +52,11 @@ from src.schemas.progress import (
     DeckProgressSummary,
     DeckStatistics,
     DeckTimeline,
+    ForecastDay,
     LearningTrendsResponse,
     OverviewStats,
     RecentActivity,
+    ReviewForecastResponse,
     StreakStats,
     TodayStats,
     TrendsSummary,
@@ -61,6 +72,9 @@ from src.services.gamification.streak import (  # noqa: F401
 )
 from src.utils.heatmap import bucket_heatmap_intensity
 
+# Longest trends period ("quarter"); week and month are slices of this series.
+TRENDS_SERIES_DAYS = 90
+
 
 class ProgressService:
     def __init__(self, db: AsyncSession) -> None:
@@ -74,6 +88,9 @@ class ProgressService:
         self.culture_deck_repo = CultureDeckRepository(db)
         self.mock_exam_repo = MockExamRepository(db)
         self.exercise_review_repo = ExerciseReviewRepository(db)
+        self.deck_progress_repo = UserDeckProgressRepository(db)
+        self.daily_trends_repo = UserDailyTrendsRepository(db)
+        self.due_histogram_repo = UserDueHistogramRepository(db)
 
     # ── Dashboard ──────────────────────────────────────────────────────────
 
@@ -161,7 +178,11 @@ class ProgressService:
         )
 
         # Today
-        cards_due = vocab_status.get("due", 0) + culture_status.get("due", 0)
+        if settings.due_histogram:
+            overdue, per_day = await self._due_window(user_id, date.today(), 1)
+            cards_due = overdue + per_day[0]
+        else:
+            cards_due = vocab_status.get("due", 0) + culture_status.get("due", 0)
         daily_goal = 20
         reviews_total_today = reviews_today + culture_answers_today
         goal_pct = min((reviews_total_today / daily_goal * 100), 100.0) if daily_goal > 0 else 0.0
@@ -428,6 +449,65 @@ class ProgressService:
         all_dates = sorted(set(vocab_dates) | set(culture_dates) | set(mock_dates))
         return _longest_streak_from_dates(all_dates)
 
+    # ── Review forecast ────────────────────────────────────────────────────
+
+    async def get_review_forecast(self, user_id: UUID, days: int = 30) -> ReviewForecastResponse:
+        start_date = date.today()
+        overdue, per_day = await self._due_window(user_id, start_date, days)
+        return ReviewForecastResponse(
+            start_date=start_date,
+            end_date=start_date + timedelta(days=days - 1),
+            overdue_count=overdue,
+            days=[
+                ForecastDay(date=start_date + timedelta(days=i), due_count=count)
+                for i, count in enumerate(per_day)
+            ],
+            total_due=overdue + sum(per_day),
+        )
+
+    async def _due_window(
+        self, user_id: UUID, start_date: date, days: int
+    ) -> tuple[int, list[int]]:
+        """Cards due before ``start_date`` and on each of ``days`` days from it.
+
+        Served from the user's due histogram (one primary-key read). The
+        histogram is rebuilt only when it is missing, does not cover the
+        window, or has a negative slot; drift the row cannot show is left to
+        the daily repair task.
+        """
+        if not settings.due_histogram:
+            due_by_date = await self.due_histogram_repo.due_by_date(user_id)
+            counts = build_counts(due_by_date, start_date, days)
+            return due_window(counts, start_date, start_date, days)  # type: ignore[return-value]
+
+        histogram = await self.due_histogram_repo.get(user_id)
+        window = (
+            due_window(histogram.counts, histogram.base_date, start_date, days)
+            if histogram is not None
+            else None
+        )
+        if histogram is not None and min(histogram.counts, default=0) < 0:
+            window = None
+        if window is None:
+            counts = await self._rebuild_due_histogram(user_id, start_date)
+            window = due_window(counts, start_date, start_date, days)
+        return window  # type: ignore[return-value]
+
+    @staticmethod
+    async def _rebuild_due_histogram(user_id: UUID, base_date: date) -> list[int]:
+        """Rebuild on the primary in a transaction of its own.
+
+        Progress routes read through ``get_read_db``, whose session cannot
+        write; the recount also reads the primary, so it never bakes replica
+        lag into the stored row.
+        """
+        async with get_session_factory()() as session:
+            counts = await UserDueHistogramRepository(session).rebuild(
+                user_id, base_date, settings.due_histogram_horizon_days
+            )
+            await session.commit()
+        return counts
+
     # ── Trends ────────────────────────────────────────────────────────────
 
     async def get_learning_trends(
@@ -441,6 +521,106 @@ class ProgressService:
         end_date = date.today()
         start_date = end_date - timedelta(days=days - 1)
 
+        if settings.daily_trends_series:
+            # Every period is a slice of the same cached series (one index probe
+            # for its version, plus one range read of user_daily_trends on a miss).
+            series = await self._get_trends_series(user_id, end_date)
+            daily_stats = [
+                self._series_daily_stats_entry(d, series.get(d))
+                for d in (start_date + timedelta(days=i) for i in range(days))
+            ]
+            cards_mastered_in_range = sum(
+                point["vocab_mastered"] for d, point in series.items() if d >= start_date
+            )
+        else:
+            daily_stats, cards_mastered_in_range = await self._query_daily_stats(
+                user_id, start_date, end_date
+            )
+
+        best_day: date | None = None
+        best_day_reviews = 0
+        for entry in daily_stats:
+            if entry.reviews_count > best_day_reviews:
+                best_day_reviews = entry.reviews_count
+                best_day = entry.date
+
+        total_reviews = sum(s.reviews_count for s in daily_stats)
+        total_study_time = sum(s.study_time_seconds for s in daily_stats)
+        avg_daily = round(total_reviews / days, 1) if days > 0 else 0.0
+        quality_trend = self._compute_quality_trend(daily_stats)
+
+        summary = TrendsSummary(
+            total_reviews=total_reviews,
+            total_study_time_seconds=total_study_time,
+            cards_mastered=cards_mastered_in_range,
+            average_daily_reviews=avg_daily,
+            best_day=best_day if best_day_reviews > 0 else None,
+            quality_trend=quality_trend,
+        )
+
+        return LearningTrendsResponse(
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            daily_stats=daily_stats,
+            summary=summary,
+        )
+
+    async def _get_trends_series(self, user_id: UUID, end_date: date) -> dict[date, dict]:
+        """The user's daily series for the longest period, keyed by day.
+
+        The cache key carries the series' last update, so any write (including
+        a card leaving an older day's status bucket) selects a new entry.
+        """
+        updated_at = await self.daily_trends_repo.latest_update(user_id)
+        if updated_at is None:
+            return {}
+        cache = get_cache()
+        key = f"progress:user:{user_id}:trends:{end_date.isoformat()}:{updated_at.timestamp()}"
+
+        async def _factory() -> list[dict]:
+            rows = await self.daily_trends_repo.get_range(
+                user_id, end_date - timedelta(days=TRENDS_SERIES_DAYS - 1), end_date
+            )
+            return [
+                {"day": row.day.isoformat(), **{c: getattr(row, c) for c in COUNTER_COLUMNS}}
+                for row in rows
+            ]
+
+        cached = await cache.get_or_set(key, _factory, ttl=settings.cache_learning_trends_ttl)  # type: ignore[arg-type]
+        if not isinstance(cached, list):
+            cached = await _factory()
+        return {date.fromisoformat(point["day"]): point for point in cached}
+
+    def _series_daily_stats_entry(self, d: date, point: dict | None) -> DailyStats:
+        """Build one day's DailyStats from a series point (None: no activity)."""
+        if point is None:
+            return self._build_daily_stats_entry(d, {}, {}, {}, {}, {})
+        reviews = point["vocab_reviews"]
+        vocab_row = {
+            "reviews_count": reviews,
+            "total_time": point["vocab_study_time_seconds"],
+            "avg_quality": point["vocab_quality_sum"] / reviews if reviews else 0.0,
+            "correct": point["vocab_correct"],
+            "total": reviews,
+        }
+        culture_accuracy = {
+            "correct_count": point["culture_correct"],
+            "total_count": point["culture_answers"],
+        }
+        return self._build_daily_stats_entry(
+            d,
+            {d: vocab_row} if reviews else {},
+            {d: {"learning": point["vocab_learning"], "mastered": point["vocab_mastered"]}},
+            {d: {"learning": point["culture_learning"], "mastered": point["culture_mastered"]}},
+            {d: vocab_row} if reviews else {},
+            {d: culture_accuracy} if point["culture_answers"] else {},
+        )
+
+    async def _query_daily_stats(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> tuple[list[DailyStats], int]:
+        """Daily stats and vocab cards mastered in range, from the source tables."""
         # Sequential on the shared AsyncSession (INFRA-01).
         # SQLCON-02 Merge A: one combined query replaces get_daily_stats +
         # get_daily_accuracy_stats.  The combined rows serve both vocab_daily_map
@@ -469,45 +649,18 @@ class ProgressService:
         vocab_status_map = self._build_vocab_status_map(vocab_status_per_day)
         vocab_accuracy_map = {row["date"]: row for row in vocab_combined}
 
-        daily_stats = []
-        best_day: date | None = None
-        best_day_reviews = 0
-        for i in range(days):
-            d = start_date + timedelta(days=i)
-            entry = self._build_daily_stats_entry(
-                d,
+        daily_stats = [
+            self._build_daily_stats_entry(
+                start_date + timedelta(days=i),
                 vocab_daily_map,
                 vocab_status_map,
                 culture_status_per_day,
                 vocab_accuracy_map,
                 culture_accuracy_per_day,
             )
-            daily_stats.append(entry)
-            if entry.reviews_count > best_day_reviews:
-                best_day_reviews = entry.reviews_count
-                best_day = d
-
-        total_reviews = sum(s.reviews_count for s in daily_stats)
-        total_study_time = sum(s.study_time_seconds for s in daily_stats)
-        avg_daily = round(total_reviews / days, 1) if days > 0 else 0.0
-        quality_trend = self._compute_quality_trend(daily_stats)
-
-        summary = TrendsSummary(
-            total_reviews=total_reviews,
-            total_study_time_seconds=total_study_time,
-            cards_mastered=cards_mastered_in_range,
-            average_daily_reviews=avg_daily,
-            best_day=best_day if best_day_reviews > 0 else None,
-            quality_trend=quality_trend,
-        )
-
-        return LearningTrendsResponse(
-            period=period,
-            start_date=start_date,
-            end_date=end_date,
-            daily_stats=daily_stats,
-            summary=summary,
-        )
+            for i in range((end_date - start_date).days + 1)
+        ]
+        return daily_stats, cards_mastered_in_range
 
     # ── Deck List ─────────────────────────────────────────────────────────
 
@@ -548,45 +701,7 @@ class ProgressService:
         skip = (page - 1) * page_size
 
         # ── Phase A — ordering query (scalar columns only; lazy="raise" safe) ─
-        # Vocab branch: distinct active decks the user has studied (active
-        # cards), mirroring get_deck_progress_summaries ∩ get_by_ids(active).
-        studied_vocab_decks = (
-            select(CardRecord.deck_id.label("deck_id"))
-            .join(CardRecordStatistics, CardRecordStatistics.card_record_id == CardRecord.id)
-            .where(
-                CardRecordStatistics.user_id == user_id,
-                CardRecord.is_active.is_(True),
-            )
-            .distinct()
-            .subquery("studied_vocab_decks")
-        )
-        vocab_last_review = (
-            select(
-                CardRecord.deck_id.label("deck_id"),
-                func.max(CardRecordReview.reviewed_at).label("last_studied"),
-            )
-            .join(CardRecordReview, CardRecordReview.card_record_id == CardRecord.id)
-            .where(CardRecordReview.user_id == user_id)
-            .group_by(CardRecord.deck_id)
-            .subquery("vocab_last_review")
-        )
-        vocab_branch = (
-            select(
-                studied_vocab_decks.c.deck_id.label("deck_id"),
-                literal("vocabulary").label("deck_type"),
-                vocab_last_review.c.last_studied.label("last_studied"),
-            )
-            .select_from(studied_vocab_decks)
-            .join(
-                Deck,
-                and_(Deck.id == studied_vocab_decks.c.deck_id, Deck.is_active.is_(True)),
-            )
-            .join(
-                vocab_last_review,
-                vocab_last_review.c.deck_id == studied_vocab_decks.c.deck_id,
-                isouter=True,
-            )
-        )
+        vocab_branch = self._vocab_ordering_branch(user_id)
 
         # Culture branch: newest 100 active decks by created_at DESC — reproduces
         # list_active()'s default limit=100 (culture_deck.py) BEFORE the sort (D13).
@@ -655,7 +770,7 @@ class ProgressService:
         vocab_summary_by_id: dict[UUID, DeckProgressSummary] = {}
         if vocab_page_ids:
             page_id_set = set(vocab_page_ids)
-            vocab_summaries = await self.card_stats_repo.get_deck_progress_summaries(user_id)
+            vocab_summaries = await self._vocab_progress_rows(user_id, vocab_page_ids)
             deck_info_map = {
                 deck.id: deck for deck in await self.deck_repo.get_by_ids(vocab_page_ids)
             }
@@ -751,6 +866,125 @@ class ProgressService:
             decks=decks,
         )
 
+    def _vocab_ordering_branch(self, user_id: UUID) -> Any:
+        """Phase A vocab branch: (deck_id, deck_type, last_studied) per studied active deck."""
+        if settings.deck_progress_counters:
+            # One indexed scan of the user's counter rows (ix_user_deck_progress_user_last_studied).
+            tracked = (
+                UserDeckProgress.cards_new
+                + UserDeckProgress.cards_learning
+                + UserDeckProgress.cards_review
+                + UserDeckProgress.cards_mastered
+            )
+            return (
+                select(
+                    UserDeckProgress.deck_id.label("deck_id"),
+                    literal("vocabulary").label("deck_type"),
+                    UserDeckProgress.last_studied_at.label("last_studied"),
+                )
+                .join(Deck, and_(Deck.id == UserDeckProgress.deck_id, Deck.is_active.is_(True)))
+                .where(UserDeckProgress.user_id == user_id, tracked > 0)
+            )
+
+        # Distinct active decks the user has studied (active cards), mirroring
+        # get_deck_progress_summaries ∩ get_by_ids(active).
+        studied_vocab_decks = (
+            select(CardRecord.deck_id.label("deck_id"))
+            .join(CardRecordStatistics, CardRecordStatistics.card_record_id == CardRecord.id)
+            .where(
+                CardRecordStatistics.user_id == user_id,
+                CardRecord.is_active.is_(True),
+            )
+            .distinct()
+            .subquery("studied_vocab_decks")
+        )
+        vocab_last_review = (
+            select(
+                CardRecord.deck_id.label("deck_id"),
+                func.max(CardRecordReview.reviewed_at).label("last_studied"),
+            )
+            .join(CardRecordReview, CardRecordReview.card_record_id == CardRecord.id)
+            .where(CardRecordReview.user_id == user_id)
+            .group_by(CardRecord.deck_id)
+            .subquery("vocab_last_review")
+        )
+        return (
+            select(
+                studied_vocab_decks.c.deck_id.label("deck_id"),
+                literal("vocabulary").label("deck_type"),
+                vocab_last_review.c.last_studied.label("last_studied"),
+            )
+            .select_from(studied_vocab_decks)
+            .join(
+                Deck,
+                and_(Deck.id == studied_vocab_decks.c.deck_id, Deck.is_active.is_(True)),
+            )
+            .join(
+                vocab_last_review,
+                vocab_last_review.c.deck_id == studied_vocab_decks.c.deck_id,
+                isouter=True,
+            )
+        )
+
+    async def _vocab_progress_rows(self, user_id: UUID, deck_ids: list[UUID]) -> list[dict]:
+        """Per-deck summary aggregates, shaped like get_deck_progress_summaries."""
+        if not settings.deck_progress_counters:
+            return await self.card_stats_repo.get_deck_progress_summaries(user_id)
+
+        counters = await self.deck_progress_repo.get_by_decks(user_id, deck_ids)
+        due_by_deck = await self.card_stats_repo.count_due_by_decks(
+            user_id, deck_ids, exclude_statuses=(CardStatus.NEW, CardStatus.MASTERED)
+        )
+        return [
+            {
+                "deck_id": deck_id,
+                "cards_studied": row.cards_learning + row.cards_review + row.cards_mastered,
+                "cards_mastered": row.cards_mastered,
+                "cards_due": due_by_deck.get(deck_id, 0),
+                "avg_ef": (
+                    row.easiness_factor_sum / row.cards_tracked if row.cards_tracked else 2.5
+                ),
+            }
+            for deck_id, row in counters.items()
+        ]
+
+    async def _deck_status_and_review_stats(
+        self, user_id: UUID, deck_id: UUID
+    ) -> tuple[dict[str, int], dict]:
+        """Status counts (plus "due") and review totals for one deck."""
+        if not settings.deck_progress_counters:
+            vocab_status = await self.card_stats_repo.count_by_status(user_id, deck_id)
+            review_stats = await self.card_review_repo.get_deck_review_stats(user_id, deck_id)
+            return vocab_status, review_stats
+
+        row = await self.deck_progress_repo.get_for_deck(user_id, deck_id)
+        if row is None:
+            row = UserDeckProgress(
+                cards_new=0,
+                cards_learning=0,
+                cards_review=0,
+                cards_mastered=0,
+                total_reviews=0,
+                quality_sum=0,
+                total_study_time_seconds=0,
+            )
+        due = await self.card_stats_repo.count_due_by_decks(user_id, [deck_id])
+        vocab_status = {
+            "new": row.cards_new,
+            "learning": row.cards_learning,
+            "review": row.cards_review,
+            "mastered": row.cards_mastered,
+            "due": due.get(deck_id, 0),
+        }
+        review_stats = {
+            "total_reviews": row.total_reviews,
+            "total_study_time_seconds": row.total_study_time_seconds,
+            "average_quality": (row.quality_sum / row.total_reviews if row.total_reviews else 0.0),
+            "first_reviewed_at": row.first_studied_at,
+            "last_reviewed_at": row.last_studied_at,
+        }
+        return vocab_status, review_stats
+
     # ── Deck Detail ───────────────────────────────────────────────────────
 
     async def get_deck_progress_detail(
@@ -774,8 +1008,7 @@ class ProgressService:
 
         # Sequential on the shared AsyncSession (INFRA-01).
         # SQLCON-07: avg_ef + avg_interval collapsed from 2 round-trips → 1.
-        vocab_status = await self.card_stats_repo.count_by_status(user_id, deck_id)
-        review_stats = await self.card_review_repo.get_deck_review_stats(user_id, deck_id)
+        vocab_status, review_stats = await self._deck_status_and_review_stats(user_id, deck_id)
         avg_ef, avg_interval = await self.card_stats_repo.get_average_ef_and_interval(
             user_id, deck_id
         )
@@ -0,0 +1,201 @@
+"""Process-wide, read-only in-memory snapshots of the static reference tables.
+
+``reference.frequency_rank``, ``reference.cefr_lemma``,
+``reference.translations`` and ``reference.greek_lexicon`` only change when a
+``src/scripts/load_*`` script runs, yet ``FrequencyService``,
+``CefrVocabularyService.allowed_lemmas``, ``TranslationLookupService`` and
+``ReverseLookupService`` query them on every call. With
+``settings.reference_snapshots_enabled`` those services read a compact
+in-memory copy instead.
+
+Versioning:
+    Each loader bumps its row in ``reference.dataset_stamp`` in the same
+    transaction as its data (``streaming_ingest.bump_dataset_stamp``). A
+    :class:`ReferenceSnapshot` re-reads that one-row stamp at most every
+    ``settings.reference_snapshot_check_seconds`` and reloads only when the
+    version changed. The stamp is read BEFORE the rows, so a concurrent load
+    can only make the snapshot newer than its recorded version (and trigger
+    one extra reload), never older. A dataset without a stamp row is version 0.
+
+Loading:
+    Lazy on first use, through the caller's session, behind a lock so
+    concurrent first requests trigger one load. The services own their loaders
+    (the snapshot shape is theirs); this module owns the caching, the registry
+    and :func:`warm_reference_snapshots`, which ``main.lifespan`` calls at
+    startup to pre-load every snapshot and log its memory footprint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from dataclasses import fields, is_dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generic, TypeVar
+
+from sqlalchemy import select
+
+from src.config import settings
+from src.core.logging import get_logger
+from src.db.models import ReferenceDatasetStamp
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = get_logger(__name__)
+
+_T = TypeVar("_T")
+
+_REGISTRY: list["ReferenceSnapshot[Any]"] = []
+
+
+async def read_dataset_version(db: "AsyncSession", dataset: str) -> int:
+    """Return the loader-written version for ``dataset`` (0 when never stamped)."""
+    result = await db.execute(
+        select(ReferenceDatasetStamp.version).where(ReferenceDatasetStamp.dataset == dataset)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+def approx_size_bytes(obj: object) -> int:
+    """Approximate deep size of a snapshot value, counting shared objects once.
+
+    Walks dicts, sets, tuples, lists and dataclass instances; everything else
+    contributes its shallow ``sys.getsizeof``. Good enough for a startup log.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (set, frozenset, tuple, list)):
+            stack.extend(item)
+        elif is_dataclass(item) and not isinstance(item, type):
+            stack.extend(getattr(item, f.name) for f in fields(item))
+    return total
+
+
+class ReferenceSnapshot(Generic[_T]):
+    """Lazily loaded, stamp-versioned in-memory copy of one reference dataset.
+
+    ``loader(db)`` must build the complete snapshot value from the session; the
+    value is treated as immutable and shared by every request in the process.
+    ``name`` distinguishes several snapshots built from the same dataset.
+    ``dispose(value)``, when given, is called with a value once a reload or
+    :meth:`reset` has replaced it (e.g. to release a memory mapping).
+    """
+
+    def __init__(
+        self,
+        dataset: str,
+        loader: Callable[["AsyncSession"], Awaitable[_T]],
+        *,
+        name: str | None = None,
+        dispose: Callable[[_T], None] | None = None,
+    ) -> None:
+        self.dataset = dataset
+        self.name = name or dataset
+        self._loader = loader
+        self._dispose = dispose
+        self._lock = asyncio.Lock()
+        self._value: _T | None = None
+        self._version: int | None = None
+        self._checked_at = 0.0
+        self.footprint_bytes = 0
+        _REGISTRY.append(self)
+
+    @property
+    def version(self) -> int | None:
+        """Stamp version of the loaded value, or None before the first load."""
+        return self._version
+
+    def _fresh(self) -> bool:
+        return (
+            self._value is not None
+            and time.monotonic() - self._checked_at < settings.reference_snapshot_check_seconds
+        )
+
+    async def get(self, db: "AsyncSession") -> _T:
+        """Return the snapshot, loading or reloading it if the stamp moved."""
+        if self._fresh():
+            assert self._value is not None
+            return self._value
+
+        async with self._lock:
+            # A concurrent caller may have refreshed it while we waited.
+            if self._fresh():
+                assert self._value is not None
+                return self._value
+
+            version = await read_dataset_version(db, self.dataset)
+            self._checked_at = time.monotonic()
+            if self._value is not None and version == self._version:
+                return self._value
+
+            start = time.perf_counter()
+            value = await self._loader(db)
+            previous = self._value
+            self._value, self._version = value, version
+            self._discard(previous)
+            self.footprint_bytes = approx_size_bytes(value)
+            logger.info(
+                "Reference snapshot loaded",
+                snapshot=self.name,
+                dataset=self.dataset,
+                version=version,
+                entries=len(value) if hasattr(value, "__len__") else None,
+                approx_bytes=self.footprint_bytes,
+                load_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+            return value
+
+    def _discard(self, value: _T | None) -> None:
+        if value is not None and self._dispose is not None:
+            self._dispose(value)
+
+    def reset(self) -> None:
+        """Drop the loaded value so the next ``get()`` reloads (tests, manual refresh)."""
+        self._discard(self._value)
+        self._value = None
+        self._version = None
+        self._checked_at = 0.0
+        self.footprint_bytes = 0
+
+
+def reset_reference_snapshots() -> None:
+    """Reset every registered snapshot."""
+    for snapshot in _REGISTRY:
+        snapshot.reset()
+
+
+async def warm_reference_snapshots(
+    session_factory: "async_sessionmaker[AsyncSession]",
+) -> dict[str, int]:
+    """Load every reference snapshot and log the total footprint.
+
+    Importing the service modules registers their snapshots. Returns
+    ``{snapshot name: approx_bytes}``.
+    """
+    import src.services.cefr_vocabulary_service  # noqa: F401, PLC0415
+    import src.services.frequency_service  # noqa: F401, PLC0415
+    import src.services.reverse_lookup_service  # noqa: F401, PLC0415
+    import src.services.translation_service  # noqa: F401, PLC0415
+
+    async with session_factory() as db:
+        for snapshot in _REGISTRY:
+            await snapshot.get(db)
+
+    footprint = {snapshot.name: snapshot.footprint_bytes for snapshot in _REGISTRY}
+    logger.info(
+        "Reference snapshots warmed",
+        total_mb=round(sum(footprint.values()) / (1024 * 1024), 1),
+        **{f"{name}_mb": round(size / (1024 * 1024), 1) for name, size in footprint.items()},
+    )
+    return footprint
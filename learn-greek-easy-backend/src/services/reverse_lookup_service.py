@@ -1,16 +1,37 @@
-"""Reverse lookup service — find Greek lemmas by English/Russian translation."""
+"""Reverse lookup service — find Greek lemmas by English/Russian translation.
+
+Two engines produce the same ranked results:
+
+- **Postgres** (default): one regex word-boundary + pg_trgm query over
+  ``reference.translations`` and a second query for noun genders.
+- **In-memory** (``settings.reference_snapshots_enabled``): a per-language
+  :class:`ReverseLookupIndex` over the NOUN rows of ``reference.translations``
+  plus a precomputed ``lemma -> gender`` map from ``reference.greek_lexicon``,
+  both held as stamp-versioned reference snapshots.
+
+Only NOUN groups scoring >= 2.0 (a ``full`` or ``substring`` hit) are returned,
+so the index holds NOUN rows only. Word-boundary hits come from a token inverted
+index (every ``\\w+`` token of the query must be a whole token of the row),
+verified with the boundary regex. Fuzzy rows can never lift a group to 2.0; they
+only add translations to groups that already qualified, so trigram similarity is
+computed just for those groups' rows instead of scanning the whole language.
+"""
 
 from __future__ import annotations
 
 import re
+from array import array
+from collections import defaultdict
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from sqlalchemy import Float, and_, case, func, literal, or_, select, text
 from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db.models import GreekLexicon, Translation
+from src.services.reference_snapshot import ReferenceSnapshot
 from src.utils.greek_articles import GENDER_MAP, get_nominative_article, infer_gender_from_ending
 
 _SOURCE_PRIORITY = case(
@@ -22,12 +43,192 @@ _SOURCE_PRIORITY = case(
 
 _GroupKey = tuple[str, str | None]
 
+#: ``pg_trgm.similarity_threshold`` used by the ``%`` operator in the DB query.
+_TRIGRAM_THRESHOLD = 0.75
+_SHORT_TRANSLATION_MAX = 40
+_MIN_RESULT_SCORE = 2.0
+
+_TOKEN_RE = re.compile(r"\w+")
+# pg_trgm treats only alphanumerics as word characters (no underscore).
+_TRIGRAM_WORD_RE = re.compile(r"[^\W_]+")
+
 
 def _escape_pg_regex(text: str) -> str:
     """Escape PostgreSQL regex metacharacters."""
     return re.sub(r"([.+*?^${}()|[\]\\])", r"\\\1", text)
 
 
+def _trigrams(value: str) -> frozenset[str]:
+    """pg_trgm-style trigram set: each word padded with two leading and one trailing blank."""
+    grams: set[str] = set()
+    for word in _TRIGRAM_WORD_RE.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def _trigram_similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    """pg_trgm ``similarity()``: shared trigrams over the union."""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def _boundary_pattern(query_lower: str) -> re.Pattern[str]:
+    """Python equivalent of the Postgres ``\\m<query>\\M`` word-boundary regex."""
+    return re.compile(r"(?<!\w)(?=\w)" + re.escape(query_lower) + r"(?<=\w)(?!\w)")
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexedTranslation:
+    """One NOUN translation row held by :class:`ReverseLookupIndex`."""
+
+    lemma: str
+    part_of_speech: str
+    translation: str
+
+
+@dataclass
+class ReverseLookupIndex:
+    """In-memory reverse-lookup index over one language's NOUN translations.
+
+    Rows are stored in ``(lemma, source priority, sense_index)`` order, so each
+    lemma's rows are contiguous (``group_bounds``) and already in the order the
+    Postgres query returns them.
+    """
+
+    rows: list[_IndexedTranslation] = field(default_factory=list)
+    lowered: list[str] = field(default_factory=list)
+    group_of: array = field(default_factory=lambda: array("I"))
+    group_bounds: list[tuple[int, int]] = field(default_factory=list)
+    tokens: dict[str, array] = field(default_factory=dict)
+    full: dict[str, list[int]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, lemma: str, translation: str) -> None:
+        """Append one row; callers must add rows grouped by lemma, in lookup order."""
+        row_id = len(self.rows)
+        if not self.group_bounds or self.rows[-1].lemma != lemma:
+            self.group_bounds.append((row_id, row_id))
+        start, _ = self.group_bounds[-1]
+        self.group_bounds[-1] = (start, row_id + 1)
+
+        lowered = translation.lower()
+        self.rows.append(_IndexedTranslation(lemma, "NOUN", translation))
+        self.lowered.append(lowered)
+        self.group_of.append(len(self.group_bounds) - 1)
+        for token in set(_TOKEN_RE.findall(lowered)):
+            self.tokens.setdefault(token, array("I")).append(row_id)
+        self.full.setdefault(lowered, []).append(row_id)
+
+    def _boundary_hits(self, query_lower: str) -> dict[int, tuple[float, str]]:
+        """Score rows matching the query on word boundaries, plus exact matches."""
+        hits: dict[int, tuple[float, str]] = {}
+        query_tokens = set(_TOKEN_RE.findall(query_lower))
+        if query_tokens:
+            postings = sorted((self.tokens.get(t, array("I")) for t in query_tokens), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+            pattern = _boundary_pattern(query_lower)
+            for row_id in candidates:
+                if not pattern.search(self.lowered[row_id]):
+                    continue
+                if self.lowered[row_id] == query_lower:
+                    hits[row_id] = (3.0, "full")
+                elif len(self.rows[row_id].translation) <= _SHORT_TRANSLATION_MAX:
+                    hits[row_id] = (2.0, "substring")
+                else:
+                    hits[row_id] = (1.0, "incidental")
+        # An exact match also qualifies through the trigram arm (similarity 1.0).
+        if _trigrams(query_lower):
+            for row_id in self.full.get(query_lower, ()):
+                hits.setdefault(row_id, (3.0, "full"))
+        return hits
+
+    def match(self, query: str) -> list[tuple[_IndexedTranslation, float, str]]:
+        """Return ``(row, score, match_type)`` rows for every qualifying lemma group.
+
+        Same shape and tiers as the Postgres query rows, restricted to groups
+        with a full/substring hit. Fuzzy rows get whole-string trigram
+        similarity times the length penalty as their score; being below 1.0
+        it never decides a group's score or match type.
+        """
+        query_lower = query.lower()
+        hits = self._boundary_hits(query_lower)
+        groups = sorted({self.group_of[r] for r, (score, _) in hits.items() if score >= 2.0})
+        if not groups:
+            return []
+
+        query_grams = _trigrams(query_lower)
+        rows: list[tuple[_IndexedTranslation, float, str]] = []
+        for group in groups:
+            start, end = self.group_bounds[group]
+            for row_id in range(start, end):
+                if row_id in hits:
+                    rows.append((self.rows[row_id], *hits[row_id]))
+                    continue
+                similarity = _trigram_similarity(query_grams, _trigrams(self.lowered[row_id]))
+                if similarity >= _TRIGRAM_THRESHOLD:
+                    penalty = 30.0 / max(len(self.rows[row_id].translation), 30.0)
+                    rows.append((self.rows[row_id], similarity * penalty, "fuzzy"))
+        return rows
+
+
+async def _load_reverse_lookup_index(db: AsyncSession) -> dict[str, ReverseLookupIndex]:
+    """Build one :class:`ReverseLookupIndex` per language from the NOUN translations."""
+    result = await db.execute(
+        select(Translation.language, Translation.lemma, Translation.translation)
+        .where(Translation.part_of_speech == "NOUN")
+        .order_by(
+            Translation.language,
+            Translation.lemma,
+            _SOURCE_PRIORITY,
+            Translation.sense_index,
+            Translation.id,
+        )
+    )
+    indexes: dict[str, ReverseLookupIndex] = defaultdict(ReverseLookupIndex)
+    for language, lemma, translation in result.all():
+        indexes[language].add(lemma, translation)
+    return dict(indexes)
+
+
+def _noun_gender_query():
+    return (
+        select(GreekLexicon.lemma, GreekLexicon.gender)
+        .where(
+            GreekLexicon.pos == "NOUN",
+            GreekLexicon.gender.is_not(None),
+            GreekLexicon.ptosi == "Nom",
+            GreekLexicon.number == "Sing",
+        )
+        .distinct()
+    )
+
+
+async def _load_noun_genders(db: AsyncSession) -> dict[str, str]:
+    """Precompute ``lemma -> gender`` from nominative-singular lexicon nouns."""
+    result = await db.execute(
+        _noun_gender_query().order_by(GreekLexicon.lemma, GreekLexicon.gender)
+    )
+    genders: dict[str, str] = {}
+    for lemma, gender in result.all():
+        genders.setdefault(lemma, gender)
+    return genders
+
+
+reverse_lookup_snapshot: ReferenceSnapshot[dict[str, ReverseLookupIndex]] = ReferenceSnapshot(
+    "translations", _load_reverse_lookup_index, name="reverse_lookup_index"
+)
+noun_gender_snapshot: ReferenceSnapshot[dict[str, str]] = ReferenceSnapshot(
+    "greek_lexicon", _load_noun_genders, name="noun_genders"
+)
+
+
 @dataclass(frozen=True)
 class ReverseLookupResult:
     lemma: str
@@ -42,7 +243,7 @@ class ReverseLookupResult:
 
 
 def _group_rows(
-    rows: Sequence[Row],
+    rows: Sequence[Row] | Sequence[tuple],
 ) -> tuple[
     dict[_GroupKey, list[str]],
     dict[_GroupKey, float],
@@ -82,6 +283,46 @@ def _group_rows(
     return groups, group_scores, group_match_types
 
 
+def _qualifying_groups(
+    rows: Sequence[Row] | Sequence[tuple],
+) -> tuple[
+    dict[_GroupKey, list[str]],
+    dict[_GroupKey, float],
+    dict[_GroupKey, str],
+]:
+    """Group rows and keep only NOUN groups scoring >= 2.0 (full/substring)."""
+    groups, group_scores, group_match_types = _group_rows(rows)
+    keep = {k for k in groups if k[1] == "NOUN" and group_scores[k] >= _MIN_RESULT_SCORE}
+    return (
+        {k: v for k, v in groups.items() if k in keep},
+        {k: v for k, v in group_scores.items() if k in keep},
+        {k: v for k, v in group_match_types.items() if k in keep},
+    )
+
+
+def _rank_results(
+    groups: dict[_GroupKey, list[str]],
+    group_scores: dict[_GroupKey, float],
+    group_match_types: dict[_GroupKey, str],
+    gender_map: dict[str, str],
+    limit: int,
+) -> list[ReverseLookupResult]:
+    """Build results and sort by score desc, shorter translations, then lemma."""
+    results = [
+        _build_result(
+            lemma=lemma,
+            pos=pos,
+            translations=translations,
+            score=group_scores[(lemma, pos)],
+            match_type=group_match_types[(lemma, pos)],
+            gender_map=gender_map,
+        )
+        for (lemma, pos), translations in groups.items()
+    ]
+    results.sort(key=lambda r: (-r.score, sum(len(t) for t in r.translations), r.lemma))
+    return results[:limit]
+
+
 def _build_result(
     lemma: str,
     pos: str | None,
@@ -150,6 +391,9 @@ class ReverseLookupService:
             List of ReverseLookupResult, sorted by score desc then NOUNs first
             then alphabetically.
         """
+        if settings.reference_snapshots_enabled:
+            return await self._search_index(query, language, limit)
+
         escaped = _escape_pg_regex(query.lower())
         word_boundary_pattern = f"\\m{escaped}\\M"
         query_lower = query.lower()
@@ -201,13 +445,8 @@ class ReverseLookupService:
         if not rows:
             return []
 
-        groups, group_scores, group_match_types = _group_rows(rows)
-
         # Filter: only NOUNs with score >= 2.0
-        filtered_keys = {k for k in groups if k[1] == "NOUN" and group_scores[k] >= 2.0}
-        groups = {k: v for k, v in groups.items() if k in filtered_keys}
-        group_scores = {k: v for k, v in group_scores.items() if k in filtered_keys}
-        group_match_types = {k: v for k, v in group_match_types.items() if k in filtered_keys}
+        groups, group_scores, group_match_types = _qualifying_groups(rows)
 
         if not groups:
             return []
@@ -216,33 +455,26 @@ class ReverseLookupService:
         noun_lemmas = [lemma for (lemma, _pos) in groups]
         gender_map: dict[str, str] = {}
         if noun_lemmas:
-            lexicon_stmt = (
-                select(GreekLexicon.lemma, GreekLexicon.gender)
-                .where(
-                    GreekLexicon.lemma.in_(noun_lemmas),
-                    GreekLexicon.pos == "NOUN",
-                    GreekLexicon.gender.is_not(None),
-                    GreekLexicon.ptosi == "Nom",
-                    GreekLexicon.number == "Sing",
-                )
-                .distinct()
-            )
+            lexicon_stmt = _noun_gender_query().where(GreekLexicon.lemma.in_(noun_lemmas))
             lex_result = await self.db.execute(lexicon_stmt)
             for lex_lemma, lex_gender in lex_result.all():
                 if lex_lemma not in gender_map:
                     gender_map[lex_lemma] = lex_gender
 
-        results = [
-            _build_result(
-                lemma=lemma,
-                pos=pos,
-                translations=translations,
-                score=group_scores[(lemma, pos)],
-                match_type=group_match_types[(lemma, pos)],
-                gender_map=gender_map,
-            )
-            for (lemma, pos), translations in groups.items()
-        ]
+        return _rank_results(groups, group_scores, group_match_types, gender_map, limit)
 
-        results.sort(key=lambda r: (-r.score, sum(len(t) for t in r.translations), r.lemma))
-        return results[:limit]
+    async def _search_index(
+        self,
+        query: str,
+        language: str,
+        limit: int,
+    ) -> list[ReverseLookupResult]:
+        """In-memory engine: token index + precomputed genders, no per-query SQL."""
+        index = (await reverse_lookup_snapshot.get(self.db)).get(language)
+        if index is None:
+            return []
+        groups, group_scores, group_match_types = _qualifying_groups(index.match(query))
+        if not groups:
+            return []
+        gender_map = await noun_gender_snapshot.get(self.db)
+        return _rank_results(groups, group_scores, group_match_types, gender_map, limit)
@@ -0,0 +1,514 @@
+"""Fused single-transaction write path for V2 card reviews.
+
+The legacy path spreads one review over four sessions (request-side
+``count_reviews_today`` + ``get_or_create``, then ``persist_deck_review_task``,
+``award_flashcard_xp_task`` and the daily-goal check each opening their own).
+``ReviewPipeline`` instead:
+
+1. Loads the card record, its deck, the user's statistics row and the daily
+   goal counters in ONE statement.
+2. Computes SM2, XP and the daily-goal crossing in Python.
+3. Writes statistics, the review row, the deck progress counters, the daily
+   trends series, the due histogram, the XP transaction and the UserXP total
+   in ONE statement (data-modifying CTEs), inside the request's transaction.
+
+Rare follow-ups (level-up / daily-goal notifications) run in savepoints so a
+failure there cannot abort the review. The achievement reconcile stays out of
+the transaction; the route dispatches it (coalesced under the job queue).
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import and_, case, event, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, lazyload
+
+from src.config import settings
+from src.core.exceptions import NotFoundException
+from src.core.logging import get_logger
+from src.core.posthog import capture_event
+from src.core.sm2 import calculate_next_review_date, calculate_sm2
+from src.core.subscription import check_premium_deck_access
+from src.db.models import (
+    CardRecord,
+    CardRecordReview,
+    CardRecordStatistics,
+    CardStatus,
+    CultureQuestionStats,
+    User,
+    UserDailyTrends,
+    UserDeckProgress,
+    UserDueHistogram,
+    UserSettings,
+    UserXP,
+    XPTransaction,
+)
+from src.repositories.user_daily_trends import delta_upserts, vocab_review_deltas
+from src.repositories.user_deck_progress import review_delta_upsert
+from src.repositories.user_due_histogram import due_shift_update
+from src.schemas.v2_sm2 import V2ReviewResult
+from src.services.v2_sm2_service import V2SM2Service
+from src.services.xp_constants import (
+    LEVELS,
+    XP_FLASHCARD_CORRECT,
+    XP_FLASHCARD_WRONG,
+    get_level_definition,
+    get_level_from_xp,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_DAILY_GOAL = 20
+
+
+@dataclass(frozen=True)
+class ReviewState:
+    """Per-user state for one review, loaded in a single statement."""
+
+    card_record: CardRecord
+    stats_id: UUID | None
+    easiness_factor: float
+    interval: int
+    repetitions: int
+    status: CardStatus
+    stats_created_at: datetime | None
+    daily_goal: int
+    reviews_today: int
+    culture_answers_today: int
+    stats_updated_at: datetime | None = None
+    stats_next_review_date: date | None = None
+
+    @property
+    def deck_id(self) -> UUID:
+        return self.card_record.deck_id
+
+
+@asynccontextmanager
+async def count_statements(session: AsyncSession) -> AsyncIterator[list[str]]:
+    """Collect the SQL statements ``session`` sends while the block runs.
+
+    The hook is attached to the session's own connection, not the engine, so
+    concurrent requests on other pooled connections are not counted.
+    """
+    statements: list[str] = []
+
+    def _hook(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        statements.append(statement)
+
+    connection = (await session.connection()).sync_connection
+    event.listen(connection, "before_cursor_execute", _hook)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", _hook)
+
+
+def _today_start() -> datetime:
+    return datetime.combine(date.today(), datetime.min.time())
+
+
+def _level_case(total_xp: Any) -> Any:
+    """SQL mirror of get_level_from_xp, so the upsert sets a race-free level."""
+    return case(
+        *[(total_xp >= level.total_xp, level.level) for level in reversed(LEVELS)],
+        else_=1,
+    )
+
+
+def _flashcard_xp(quality: int) -> tuple[int, str]:
+    """Same amounts and reasons as XPService.award_flashcard_review_xp."""
+    if quality >= 3:
+        return XP_FLASHCARD_CORRECT, "flashcard_review"
+    return XP_FLASHCARD_WRONG, "flashcard_attempt"
+
+
+class ReviewPipeline:
+    """Applies a V2 review (SM2, XP, daily goal) in the caller's transaction."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def load_state(self, user_id: UUID, card_record_id: UUID) -> ReviewState | None:
+        """Load the card record, its deck and the user's counters in one SELECT.
+
+        Deck relationships stay unloaded (``lazyload``): only the deck's own
+        columns are needed for the premium check, while the default selectin
+        cascade (owner, word entries, their card records) costs several
+        statements per review.
+        """
+        today_start = _today_start()
+        daily_goal = (
+            select(UserSettings.daily_goal).where(UserSettings.user_id == user_id).scalar_subquery()
+        )
+        reviews_today = (
+            select(func.count())
+            .select_from(CardRecordReview)
+            .where(
+                CardRecordReview.user_id == user_id,
+                CardRecordReview.reviewed_at >= today_start,
+            )
+            .scalar_subquery()
+        )
+        culture_answers_today = (
+            select(func.count(CultureQuestionStats.id))
+            .where(
+                CultureQuestionStats.user_id == user_id,
+                CultureQuestionStats.updated_at >= today_start,
+            )
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                CardRecord,
+                CardRecordStatistics.id,
+                CardRecordStatistics.easiness_factor,
+                CardRecordStatistics.interval,
+                CardRecordStatistics.repetitions,
+                CardRecordStatistics.status,
+                CardRecordStatistics.created_at,
+                func.coalesce(daily_goal, DEFAULT_DAILY_GOAL),
+                reviews_today,
+                culture_answers_today,
+                CardRecordStatistics.updated_at,
+                CardRecordStatistics.next_review_date,
+            )
+            .outerjoin(
+                CardRecordStatistics,
+                and_(
+                    CardRecordStatistics.card_record_id == CardRecord.id,
+                    CardRecordStatistics.user_id == user_id,
+                ),
+            )
+            .options(
+                joinedload(CardRecord.deck).lazyload("*"),
+                lazyload(CardRecord.word_entry),
+            )
+            .where(CardRecord.id == card_record_id)
+        )
+        row = (await self.db.execute(query)).one_or_none()
+        if row is None:
+            return None
+
+        card_record, stats_id, ef, interval, reps, status, created_at = row[:7]
+        goal, reviews, culture, updated_at, previous_review_date = row[7:]
+        if stats_id is None:
+            # Same defaults as CardRecordStatisticsRepository.get_or_create
+            ef, interval, reps, status = 2.5, 0, 0, CardStatus.NEW
+        return ReviewState(
+            card_record=card_record,
+            stats_id=stats_id,
+            easiness_factor=ef,
+            interval=interval,
+            repetitions=reps,
+            status=status,
+            stats_created_at=created_at,
+            daily_goal=goal,
+            reviews_today=reviews,
+            culture_answers_today=culture,
+            stats_updated_at=updated_at,
+            stats_next_review_date=previous_review_date,
+        )
+
+    async def submit(
+        self,
+        user: User,
+        card_record_id: UUID,
+        quality: int,
+        time_taken: int,
+    ) -> tuple[V2ReviewResult, ReviewState]:
+        """Load, check access, apply and log one review. Caller commits.
+
+        Raises:
+            NotFoundException: If the card record does not exist.
+            PremiumRequiredException: If the deck is premium and the user is not.
+        """
+        async with count_statements(self.db) as statements:
+            state = await self.load_state(user.id, card_record_id)
+            if state is None:
+                raise NotFoundException(resource="Card record")
+            check_premium_deck_access(user, state.card_record.deck)
+
+            result = await self.apply(user, state, quality, time_taken)
+
+            if not settings.feature_background_tasks:
+                await self._reconcile_inline(user.id)
+
+        logger.info(
+            "V2 review persisted (fused)",
+            extra={
+                "user_id": str(user.id),
+                "card_record_id": str(card_record_id),
+                "new_status": result.new_status.value,
+                "statements": len(statements),
+            },
+        )
+        return result, state
+
+    async def apply(
+        self,
+        user: User,
+        state: ReviewState,
+        quality: int,
+        time_taken: int,
+    ) -> V2ReviewResult:
+        """Compute SM2 from ``state`` and write every row in one statement."""
+        card_record = state.card_record
+        sm2_result = calculate_sm2(
+            current_ef=state.easiness_factor,
+            current_interval=state.interval,
+            current_repetitions=state.repetitions,
+            quality=quality,
+        )
+        next_review_date = calculate_next_review_date(sm2_result.new_interval)
+        amount, reason = _flashcard_xp(quality)
+
+        stats_values = {
+            "easiness_factor": sm2_result.new_easiness_factor,
+            "interval": sm2_result.new_interval,
+            "repetitions": sm2_result.new_repetitions,
+            "next_review_date": next_review_date,
+            "status": sm2_result.new_status,
+        }
+        stats_upsert = pg_insert(CardRecordStatistics).values(
+            user_id=user.id, card_record_id=card_record.id, **stats_values
+        )
+        stats_cte = (
+            stats_upsert.on_conflict_do_update(
+                constraint="uq_user_card_record",
+                set_={**stats_values, "updated_at": func.now()},
+            )
+            .returning(CardRecordStatistics.id)
+            .cte("review_stats")
+        )
+        reviewed_at = datetime.now(timezone.utc)
+        review_cte = (
+            insert(CardRecordReview)
+            .values(
+                user_id=user.id,
+                card_record_id=card_record.id,
+                quality=quality,
+                time_taken=time_taken,
+                reviewed_at=reviewed_at,
+            )
+            .returning(CardRecordReview.id)
+            .cte("review_row")
+        )
+        is_new_row = state.stats_id is None
+        deck_progress_cte = (
+            review_delta_upsert(
+                user_id=user.id,
+                deck_id=card_record.deck_id,
+                previous_status=None if is_new_row else state.status,
+                new_status=sm2_result.new_status,
+                easiness_factor_delta=sm2_result.new_easiness_factor
+                - (0.0 if is_new_row else state.easiness_factor),
+                quality=quality,
+                time_taken=time_taken,
+                reviewed_at=reviewed_at,
+                counts_status=bool(card_record.is_active),
+            )
+            .returning(UserDeckProgress.deck_id)
+            .cte("review_deck_progress")
+        )
+        trends_deltas = vocab_review_deltas(
+            day=reviewed_at.date(),
+            quality=quality,
+            time_taken=time_taken,
+            previous_status=None if is_new_row else state.status,
+            previous_day=state.stats_updated_at.date() if state.stats_updated_at else None,
+            new_status=sm2_result.new_status,
+        )
+        daily_trends_ctes = [
+            upsert.returning(UserDailyTrends.day).cte(f"review_daily_trends_{i}")
+            for i, upsert in enumerate(delta_upserts(user.id, trends_deltas))
+        ]
+        # Inactive card records are outside the due counts the histogram mirrors.
+        due_shift = (
+            due_shift_update(user.id, state.stats_next_review_date, next_review_date)
+            if card_record.is_active
+            else None
+        )
+        due_histogram_ctes = (
+            [due_shift.returning(UserDueHistogram.user_id).cte("review_due_histogram")]
+            if due_shift is not None
+            else []
+        )
+        xp_transaction_cte = (
+            insert(XPTransaction)
+            .values(user_id=user.id, amount=amount, reason=reason, source_id=card_record.id)
+            .returning(XPTransaction.id)
+            .cte("review_xp_transaction")
+        )
+        xp_upsert = pg_insert(UserXP).values(
+            user_id=user.id, total_xp=amount, current_level=get_level_from_xp(amount)
+        )
+        new_total = UserXP.total_xp + xp_upsert.excluded.total_xp
+        statement = (
+            xp_upsert.on_conflict_do_update(
+                index_elements=[UserXP.user_id],
+                set_={
+                    "total_xp": new_total,
+                    "current_level": _level_case(new_total),
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(UserXP.total_xp, UserXP.current_level)
+            .add_cte(
+                stats_cte,
+                review_cte,
+                deck_progress_cte,
+                *daily_trends_ctes,
+                *due_histogram_ctes,
+                xp_transaction_cte,
+            )
+        )
+        total_xp, new_level = (await self.db.execute(statement)).one()
+
+        if new_level > get_level_from_xp(total_xp - amount):
+            await self._notify_level_up(user.id, new_level)
+        await self._check_daily_goal(user.id, state)
+
+        is_now_mastered = sm2_result.new_status == CardStatus.MASTERED
+        was_mastered = state.status == CardStatus.MASTERED
+        if is_now_mastered and not was_mastered:
+            self._capture_mastery(user, state, sm2_result.new_repetitions)
+
+        logger.info(
+            "ANALYTICS: review_completed",
+            extra={
+                "analytics": True,
+                "event_type": "review_completed",
+                "user_id": str(user.id),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "event_data": {
+                    "card_record_id": str(card_record.id),
+                    "quality": quality,
+                    "time_taken": time_taken,
+                    "new_status": sm2_result.new_status.value,
+                },
+            },
+        )
+
+        return V2ReviewResult(
+            card_record_id=card_record.id,
+            quality=quality,
+            previous_status=state.status,
+            new_status=sm2_result.new_status,
+            easiness_factor=sm2_result.new_easiness_factor,
+            interval=sm2_result.new_interval,
+            repetitions=sm2_result.new_repetitions,
+            next_review_date=next_review_date,
+            message=V2SM2Service(self.db)._get_review_message(
+                quality=quality,
+                is_first_review=state.status == CardStatus.NEW,
+                was_mastered=was_mastered,
+                is_now_mastered=is_now_mastered,
+            ),
+        )
+
+    async def _notify_level_up(self, user_id: UUID, new_level: int) -> None:
+        """Level-up notification in a savepoint; never fails the review."""
+        from src.services.notification_service import NotificationService
+
+        try:
+            async with self.db.begin_nested():
+                await NotificationService(self.db).notify_level_up(
+                    user_id=user_id,
+                    new_level=new_level,
+                    level_name=get_level_definition(new_level).name_english,
+                )
+        except Exception as e:
+            logger.warning(
+                "Failed to create level-up notification",
+                extra={"user_id": str(user_id), "new_level": new_level, "error": str(e)},
+            )
+
+    async def _check_daily_goal(self, user_id: UUID, state: ReviewState) -> None:
+        """Notify once when this review crosses the combined daily goal.
+
+        Uses the counters loaded with the state (no re-query) and the same
+        Redis SETNX dedup key as the background and culture paths.
+        """
+        total_before = state.reviews_today + state.culture_answers_today
+        total_after = total_before + 1
+        if not total_before < state.daily_goal <= total_after:
+            return
+
+        from src.core.redis import get_redis
+        from src.services.notification_service import NotificationService
+
+        try:
+            redis = get_redis()
+            if redis:
+                cache_key = f"daily_goal_notified:{user_id}:{date.today().isoformat()}"
+                if not await redis.setnx(cache_key, "1"):
+                    return
+                await redis.expire(cache_key, 86400)
+
+            async with self.db.begin_nested():
+                await NotificationService(self.db).notify_daily_goal_complete(
+                    user_id=user_id,
+                    reviews_completed=total_after,
+                )
+            logger.info(
+                "Daily goal notification created (fused review path)",
+                extra={"user_id": str(user_id), "reviews": total_after},
+            )
+        except Exception as e:
+            logger.warning(
+                "Daily goal check failed in fused review path",
+                extra={"user_id": str(user_id), "error": str(e)},
+            )
+
+    def _capture_mastery(self, user: User, state: ReviewState, repetitions: int) -> None:
+        days_to_master = 0
+        if state.stats_created_at:
+            created_at = state.stats_created_at
+            if created_at.tzinfo is not None:
+                created_at = created_at.replace(tzinfo=None)
+            days_to_master = (datetime.now(timezone.utc).replace(tzinfo=None) - created_at).days
+        capture_event(
+            distinct_id=str(user.id),
+            event="card_mastered_v2",
+            properties={
+                "deck_id": str(state.card_record.deck_id),
+                "card_record_id": str(state.card_record.id),
+                "card_type": state.card_record.card_type.value,
+                "reviews_to_master": repetitions,
+                "days_to_master": days_to_master,
+            },
+            user_email=user.email,
+        )
+
+    async def _reconcile_inline(self, user_id: UUID) -> None:
+        """Synchronous fallback when background tasks are disabled."""
+        try:
+            from src.services.gamification.reconciler import GamificationReconciler
+            from src.services.gamification.types import ReconcileMode
+
+            await GamificationReconciler.reconcile(self.db, user_id, mode=ReconcileMode.IMMEDIATE)
+        except Exception as exc:
+            logger.warning(
+                "gamification.reconcile.error",
+                extra={
+                    "event": "gamification.reconcile.error",
+                    "endpoint": "review_pipeline.submit",
+                    "user_id": str(user_id),
+                    "error_type": type(exc).__name__,
+                    "error_message": str(exc),
+                },
+            )
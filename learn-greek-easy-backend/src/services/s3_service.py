@@ -710,6 +710,16 @@ def get_s3_service() -> S3Service:
     return _s3_service
 
 
+def reset_s3_service() -> None:
+    """Drop the singleton so the next get_s3_service() builds a fresh boto3 client.
+
+    Used after fork: a botocore client (and its urllib3 pool) must not be
+    shared between processes.
+    """
+    global _s3_service
+    _s3_service = None
+
+
 def maybe_generate_derivatives(
     base_s3_key: str,
     image_bytes: bytes,
@@ -78,9 +78,13 @@ from src.db.models import (
     WordEntry,
     XPTransaction,
 )
+from src.repositories.notification import NotificationRepository
+from src.repositories.user_daily_trends import UserDailyTrendsRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
 from src.services.achievement_definitions import ACHIEVEMENTS as ACHIEVEMENT_DEFS
 from src.services.card_generator_service import CardGeneratorService
 from src.services.seed_data.prod_content import PROD_SITUATIONS, PROD_WORD_ENRICHMENT
+from src.services.seed_snapshot import SeedSnapshotStore
 from src.services.xp_constants import get_level_from_xp
 
 logger = get_logger(__name__)
@@ -218,6 +222,7 @@ class SeedService:
         # --- Card tables (children first) ---
         "card_record_reviews",  # → users, card_records
         "card_record_statistics",  # → users, card_records
+        "user_deck_progress",  # → users, decks
         "card_records",  # → word_entries, decks
         # --- Card error reports ---
         "card_error_reports",  # → users (x2)
@@ -238,6 +243,8 @@ class SeedService:
         "feedback",  # → users
         # --- User settings ---
         "user_settings",  # → users
+        "user_daily_trends",  # → users
+        "user_due_histograms",  # → users
         # --- Content tables ---
         "deck_word_entries",  # → decks, word_entries
         "word_entries",  # → users (nullable)
@@ -2828,6 +2835,9 @@ class SeedService:
                 }
             )
 
+        # Notifications were added directly; recount the learner's unread counter
+        await NotificationRepository(self.db).repair_unread_counts([learner_id])
+
         return {
             "success": True,
             "campaigns_created": len(created_campaigns),
@@ -3571,6 +3581,7 @@ class SeedService:
             )
 
         await self.db.flush()
+        await NotificationRepository(self.db).repair_unread_counts([user_id])
 
         return {
             "success": True,
@@ -3612,6 +3623,7 @@ class SeedService:
             "culture_history": 0,
             "notifications": 0,
         }
+        notified_user_ids: list[UUID] = []
 
         for user_data in self.DANGER_ZONE_USERS:
             email = user_data["email"]
@@ -3863,6 +3875,7 @@ class SeedService:
                     )
                     self.db.add(notification)
                     data_counts["notifications"] += 1
+                notified_user_ids.append(user.id)
 
                 user_info["has_progress"] = True
             else:
@@ -3878,6 +3891,7 @@ class SeedService:
             created_users.append(user_info)
 
         await self.db.flush()
+        await NotificationRepository(self.db).repair_unread_counts(notified_user_ids)
 
         return {
             "success": True,
@@ -4668,6 +4682,10 @@ class SeedService:
     # Full Seed Orchestration
     # =====================
 
+    def _snapshot_store(self) -> SeedSnapshotStore | None:
+        """Snapshot store for seed_all, or None when snapshots are disabled."""
+        return SeedSnapshotStore(self.db) if settings.seed_snapshot_enabled else None
+
     async def seed_all(self, pr_number: int | str | None = None) -> dict[str, Any]:  # noqa: C901
         """Execute full database seeding sequence.
 
@@ -4691,6 +4709,10 @@ class SeedService:
                 Supabase Auth (RGATE-05).  Default None → behaviour is
                 byte-for-byte unchanged.
 
+        With ``settings.seed_snapshot_enabled`` a matching snapshot (see
+        ``seed_snapshot``) is restored instead of running the steps above, and
+        a full run captures a fresh one in the same transaction.
+
         Returns:
             dict with complete seeding summary
 
@@ -4699,6 +4721,15 @@ class SeedService:
         """
         self._check_can_seed()
 
+        snapshots = self._snapshot_store()
+        snapshot_key = ""
+        if snapshots is not None:
+            snapshot_key = await snapshots.key_for(pr_number)
+            restored = await snapshots.restore(snapshot_key, self.TRUNCATION_ORDER)
+            if restored is not None:
+                await self.db.commit()
+                return restored
+
         # Resolve the beginner email for this run.
         beginner_email = namespaced_beginner_email(pr_number)
 
@@ -5013,10 +5044,7 @@ class SeedService:
         # Step 20: Seed situations with descriptions and exercises
         situations_result = await self.seed_situations(learner_id=learner_id)
 
-        # Commit all changes
-        await self.db.commit()
-
-        return {
+        result: dict[str, Any] = {
             "success": True,
             "truncation": truncate_result,
             "users": users_result,
@@ -5047,6 +5075,21 @@ class SeedService:
             "situations": situations_result,
         }
 
+        # Seeded statistics, reviews and answers bypass the write paths that
+        # maintain the per-deck counters and the learning trends series; recount
+        # both from them.
+        await UserDeckProgressRepository(self.db).refresh()
+        await UserDailyTrendsRepository(self.db).refresh()
+
+        if snapshots is not None:
+            await snapshots.capture(snapshot_key, self.TRUNCATION_ORDER, result)
+            result["snapshot"] = {"restored": False, "key": snapshot_key[:12]}
+
+        # Commit all changes
+        await self.db.commit()
+
+        return result
+
     @staticmethod
     def _flatten_grammar_cases(grammar_data: dict[str, Any] | None) -> dict[str, Any] | None:
         """Convert the legacy nested {"cases": {"singular": {...}}} grammar shape
@@ -0,0 +1,198 @@
+"""In-database snapshot of the fully seeded E2E dataset.
+
+``SeedService.seed_all`` rebuilds the whole E2E dataset through the ORM on
+every call: thousands of INSERT round-trips for a result that is identical
+from one call to the next. With ``settings.seed_snapshot_enabled`` the first
+full seed copies every table in ``SeedService.TRUNCATION_ORDER`` into the
+``seed_snapshot`` schema; later calls with the same key restore it with one
+``TRUNCATE`` plus one ``INSERT ... SELECT`` per table, inside the caller's
+transaction.
+
+Why not a template database: ``CREATE DATABASE ... TEMPLATE`` needs the
+target database to have no other connections, which the running API (and
+its pool) always holds. The snapshot schema lives next to the data, needs no
+extra privileges and is invisible to Alembic autogenerate, which only
+compares the default schema.
+
+Invalidation:
+    The key hashes the seed source files, the Alembic revision (so column
+    layouts match), the PR namespace and the current UTC date (seeded
+    timestamps are relative to "now", and due-card scenarios break on a stale
+    day). Any change misses, runs the full seed and re-captures.
+
+A restore does not call Supabase Auth: the namespaced beginner was
+provisioned by the full seed that captured the snapshot, and its
+``supabase_id`` is part of the restored ``users`` rows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_SCHEMA = "seed_snapshot"
+META_TABLE = f"{SNAPSHOT_SCHEMA}._meta"
+
+_SERVICES_DIR = Path(__file__).resolve().parent
+
+# Modules whose contents decide what seed_all writes.
+SEED_SOURCES: tuple[Path, ...] = (
+    _SERVICES_DIR / "seed_service.py",
+    _SERVICES_DIR / "seed_lexicon_data.py",
+    _SERVICES_DIR / "seed_translation_data.py",
+    _SERVICES_DIR / "seed_grammar_data.py",
+    _SERVICES_DIR / "achievement_definitions.py",
+    _SERVICES_DIR / "xp_constants.py",
+    *sorted((_SERVICES_DIR / "seed_data").glob("*.py")),
+)
+
+
+@lru_cache(maxsize=1)
+def seed_source_digest() -> str:
+    """SHA-256 over the seed source files (cached for the process lifetime)."""
+    digest = hashlib.sha256()
+    for path in SEED_SOURCES:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.hexdigest()
+
+
+def snapshot_key(revision: str | None, pr_number: int | str | None, today: str) -> str:
+    """Combine every invalidation input into one opaque key."""
+    payload = "|".join((seed_source_digest(), revision or "", str(pr_number or ""), today))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def snapshot_table(table: str) -> str:
+    """Snapshot copy of ``table`` (``reference.x`` becomes ``reference__x``)."""
+    return f'{SNAPSHOT_SCHEMA}."{table.replace(".", "__")}"'
+
+
+def _qualified(table: str) -> str:
+    return table if "." in table else f"public.{table}"
+
+
+class SeedSnapshotStore:
+    """Capture and restore the seeded tables through the caller's session.
+
+    Neither method commits; ``seed_all`` commits once so a capture or restore
+    is atomic with the data it describes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def key_for(self, pr_number: int | str | None) -> str:
+        today = datetime.now(timezone.utc).date().isoformat()
+        return snapshot_key(await self._alembic_revision(), pr_number, today)
+
+    async def restore(self, key: str, tables: Sequence[str]) -> dict[str, Any] | None:
+        """Replace ``tables`` with the snapshot for ``key``; None on a miss.
+
+        ``tables`` is children-first (``TRUNCATION_ORDER``), so rows are
+        inserted in reverse order to satisfy foreign keys.
+        """
+        stored = await self._stored(key)
+        if stored is None:
+            return None
+
+        await self.db.execute(text(f"TRUNCATE TABLE {', '.join(tables)} RESTART IDENTITY CASCADE"))
+        columns, sequences = await self._column_layout(tables)
+        for table in reversed(tables):
+            cols = ", ".join(f'"{c}"' for c in columns.get(_qualified(table), []))
+            if not cols:
+                continue
+            await self.db.execute(
+                text(
+                    f"INSERT INTO {table} ({cols}) OVERRIDING SYSTEM VALUE "
+                    f"SELECT {cols} FROM {snapshot_table(table)}"
+                )
+            )
+        for table, column, sequence in sequences:
+            await self.db.execute(
+                text(
+                    f'SELECT setval(:seq, COALESCE((SELECT max("{column}") FROM {table}), 0) + 1,'
+                    " false)"
+                ),
+                {"seq": sequence},
+            )
+        await self.db.flush()
+
+        logger.info("Seed snapshot restored", key=key[:12], tables=len(tables))
+        return {**stored, "snapshot": {"restored": True, "key": key[:12]}}
+
+    async def capture(self, key: str, tables: Sequence[str], result: dict[str, Any]) -> None:
+        """Replace the snapshot schema with copies of ``tables`` and ``result``."""
+        await self.db.execute(text(f"DROP SCHEMA IF EXISTS {SNAPSHOT_SCHEMA} CASCADE"))
+        await self.db.execute(text(f"CREATE SCHEMA {SNAPSHOT_SCHEMA}"))
+        for table in tables:
+            await self.db.execute(
+                text(f"CREATE TABLE {snapshot_table(table)} AS SELECT * FROM {table}")
+            )
+        await self.db.execute(
+            text(
+                f"CREATE TABLE {META_TABLE} (key text PRIMARY KEY, result jsonb NOT NULL, "
+                "captured_at timestamptz NOT NULL DEFAULT now())"
+            )
+        )
+        await self.db.execute(
+            text(f"INSERT INTO {META_TABLE} (key, result) VALUES (:key, CAST(:result AS jsonb))"),
+            {"key": key, "result": json.dumps(result, default=str)},
+        )
+        logger.info("Seed snapshot captured", key=key[:12], tables=len(tables))
+
+    async def _alembic_revision(self) -> str | None:
+        exists = await self.db.execute(text("SELECT to_regclass('public.alembic_version')"))
+        if exists.scalar() is None:
+            return None
+        revision = await self.db.execute(
+            text("SELECT string_agg(version_num, ',' ORDER BY version_num) FROM alembic_version")
+        )
+        return revision.scalar()
+
+    async def _stored(self, key: str) -> dict[str, Any] | None:
+        exists = await self.db.execute(text(f"SELECT to_regclass('{META_TABLE}')"))
+        if exists.scalar() is None:
+            return None
+        row = await self.db.execute(
+            text(f"SELECT result FROM {META_TABLE} WHERE key = :key"), {"key": key}
+        )
+        stored = row.scalar_one_or_none()
+        if isinstance(stored, str):
+            stored = json.loads(stored)
+        return stored
+
+    async def _column_layout(
+        self, tables: Sequence[str]
+    ) -> tuple[dict[str, list[str]], list[tuple[str, str, str]]]:
+        """Insertable columns per table, plus (table, column, sequence) to reset."""
+        rows = await self.db.execute(
+            text(
+                "SELECT table_schema || '.' || table_name, column_name, "
+                "pg_get_serial_sequence(quote_ident(table_schema) || '.' || "
+                "quote_ident(table_name), column_name) "
+                "FROM information_schema.columns "
+                "WHERE table_schema || '.' || table_name = ANY(:names) "
+                "AND is_generated = 'NEVER' "
+                "ORDER BY table_schema, table_name, ordinal_position"
+            ),
+            {"names": [_qualified(t) for t in tables]},
+        )
+        columns: dict[str, list[str]] = {}
+        sequences: list[tuple[str, str, str]] = []
+        for qualified, column, sequence in rows.fetchall():
+            columns.setdefault(qualified, []).append(column)
+            if sequence:
+                sequences.append((qualified, column, sequence))
+        return columns, sequences
@@ -1,15 +1,24 @@
-"""Translation lookup service for reference.translations table."""
+"""Translation lookup service for reference.translations table.
+
+With ``settings.reference_snapshots_enabled`` rows come from a process-wide
+``(lemma, language) -> entries`` snapshot (see ``reference_snapshot``), already
+in source-priority order, instead of one or two queries per lookup.
+"""
 
 from __future__ import annotations
 
 import unicodedata
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import Sequence
 
 from sqlalchemy import case, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.core.logging import get_logger
 from src.db.models import Translation
+from src.services.reference_snapshot import ReferenceSnapshot
 
 logger = get_logger(__name__)
 
@@ -22,7 +31,7 @@ _SOURCE_PRIORITY = case(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranslationEntry:
     """A single translation row from reference.translations."""
 
@@ -43,6 +52,33 @@ class TranslationResult:
     combined_text: str  # unique translations joined with ", "
 
 
+async def _load_translation_snapshot(
+    db: AsyncSession,
+) -> dict[tuple[str, str], tuple[TranslationEntry, ...]]:
+    """Load every translation grouped by ``(lemma, language)`` in lookup order."""
+    result = await db.execute(
+        select(
+            Translation.lemma,
+            Translation.language,
+            Translation.sense_index,
+            Translation.translation,
+            Translation.part_of_speech,
+            Translation.source,
+        ).order_by(
+            Translation.lemma, Translation.language, _SOURCE_PRIORITY, Translation.sense_index
+        )
+    )
+    grouped: dict[tuple[str, str], list[TranslationEntry]] = defaultdict(list)
+    for row in result.all():
+        grouped[(row.lemma, row.language)].append(TranslationEntry(*row))
+    return {key: tuple(entries) for key, entries in grouped.items()}
+
+
+translation_snapshot: ReferenceSnapshot[dict[tuple[str, str], tuple[TranslationEntry, ...]]] = (
+    ReferenceSnapshot("translations", _load_translation_snapshot)
+)
+
+
 class TranslationLookupService:
     """Per-request async lookup service for reference.translations.
 
@@ -87,8 +123,16 @@ class TranslationLookupService:
         lemma: str,
         language: str,
         pos: str | None,
-    ) -> list[Translation]:
+    ) -> Sequence[Translation | TranslationEntry]:
         """Query translations with optional POS preference."""
+        if settings.reference_snapshots_enabled:
+            entries = (await translation_snapshot.get(self.db)).get((lemma, language), ())
+            if pos is not None:
+                pos_entries = [e for e in entries if e.part_of_speech == pos]
+                if pos_entries:
+                    return pos_entries
+            return entries
+
         base_query = (
             select(Translation)
             .where(Translation.lemma == lemma, Translation.language == language)
@@ -105,8 +149,8 @@ class TranslationLookupService:
         result = await self.db.execute(base_query)
         return list(result.scalars().all())
 
-    def _build_result(self, rows: list[Translation]) -> TranslationResult:
-        """Build TranslationResult from a list of Translation ORM rows."""
+    def _build_result(self, rows: Sequence[Translation | TranslationEntry]) -> TranslationResult:
+        """Build TranslationResult from Translation ORM rows or snapshot entries."""
         # Three-tier source resolution
         has_direct = any(r.source in _DIRECT_SOURCES for r in rows)
         has_pivot = any(r.source == "pivot" for r in rows)
@@ -22,6 +22,9 @@ from src.repositories import (
     MockExamRepository,
     NotificationRepository,
 )
+from src.repositories.user_daily_trends import UserDailyTrendsRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository
+from src.repositories.user_due_histogram import UserDueHistogramRepository
 from src.schemas.danger_zone import ResetProgressResult
 
 logger = logging.getLogger(__name__)
@@ -55,10 +58,13 @@ class UserProgressResetService:
         # Initialize repositories
         self.card_record_stats_repo = CardRecordStatisticsRepository(db)
         self.card_record_review_repo = CardRecordReviewRepository(db)
+        self.deck_progress_repo = UserDeckProgressRepository(db)
         self.culture_stats_repo = CultureQuestionStatsRepository(db)
         self.culture_history_repo = CultureAnswerHistoryRepository(db)
         self.mock_exam_repo = MockExamRepository(db)
         self.notification_repo = NotificationRepository(db)
+        self.due_histogram_repo = UserDueHistogramRepository(db)
+        self.daily_trends_repo = UserDailyTrendsRepository(db)
 
     async def reset_all_progress(self, user_id: UUID) -> ResetProgressResult:
         """Reset all progress data for a user.
@@ -102,22 +108,34 @@ class UserProgressResetService:
             f"Deleted {card_record_statistics_deleted} card record statistics for user {user_id}"
         )
 
-        # 3. Delete culture answer history
+        # 3. Delete user deck progress (counters over the rows deleted above)
+        deck_progress_deleted = await self.deck_progress_repo.delete_all_by_user_id(user_id)
+        logger.debug(f"Deleted {deck_progress_deleted} deck progress rows for user {user_id}")
+
+        # 4. Delete culture answer history
         culture_history_deleted = await self.culture_history_repo.delete_all_by_user_id(user_id)
         logger.debug(f"Deleted {culture_history_deleted} culture answer history for user {user_id}")
 
-        # 4. Delete culture question stats
+        # 5. Delete culture question stats
         culture_stats_deleted = await self.culture_stats_repo.delete_all_by_user_id(user_id)
         logger.debug(f"Deleted {culture_stats_deleted} culture question stats for user {user_id}")
 
-        # 5. Delete mock exam sessions (cascades to answers)
+        # The due histogram counted the deleted statistics; the next read rebuilds it
+        await self.due_histogram_repo.invalidate(user_ids=[user_id])
+
+        # The learning trends series summarized the deleted reviews and answers;
+        # with no rows left there is no latest update, so no cached series is read.
+        trends_deleted = await self.daily_trends_repo.delete_all_by_user_id(user_id)
+        logger.debug(f"Deleted {trends_deleted} daily trends rows for user {user_id}")
+
+        # 6. Delete mock exam sessions (cascades to answers)
         sessions_deleted, answers_deleted = await self.mock_exam_repo.delete_all_by_user_id(user_id)
         logger.debug(
             f"Deleted {sessions_deleted} mock exam sessions and "
             f"{answers_deleted} answers for user {user_id}"
         )
 
-        # 6. Delete XP transactions (direct SQLAlchemy - no dedicated repo)
+        # 7. Delete XP transactions (direct SQLAlchemy - no dedicated repo)
         xp_transactions_result = await self.db.execute(
             delete(XPTransaction).where(XPTransaction.user_id == user_id)
         )
@@ -129,7 +147,7 @@ class UserProgressResetService:
         )
         logger.debug(f"Deleted {xp_transactions_deleted} XP transactions for user {user_id}")
 
-        # 7. Delete user achievements (direct SQLAlchemy - no dedicated repo)
+        # 8. Delete user achievements (direct SQLAlchemy - no dedicated repo)
         achievements_result = await self.db.execute(
             delete(UserAchievement).where(UserAchievement.user_id == user_id)
         )
@@ -141,11 +159,11 @@ class UserProgressResetService:
         )
         logger.debug(f"Deleted {achievements_deleted} achievements for user {user_id}")
 
-        # 8. Delete notifications
+        # 9. Delete notifications
         notifications_deleted = await self.notification_repo.delete_all_by_user(user_id)
         logger.debug(f"Deleted {notifications_deleted} notifications for user {user_id}")
 
-        # 9. Reset UserXP to 0 (UPDATE, not delete - preserve the record)
+        # 10. Reset UserXP to 0 (UPDATE, not delete - preserve the record)
         xp_reset_result = await self.db.execute(
             update(UserXP)
             .where(UserXP.user_id == user_id)
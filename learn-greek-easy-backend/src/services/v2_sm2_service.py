@@ -19,6 +19,8 @@ from src.db.models import (
     WordEntry,
 )
 from src.repositories.card_record_statistics import CardRecordStatisticsRepository
+from src.repositories.user_daily_trends import UserDailyTrendsRepository, vocab_review_deltas
+from src.repositories.user_deck_progress import UserDeckProgressRepository
 from src.schemas.v2_sm2 import V2RatingPreview, V2ReviewResult, V2StudyQueue, V2StudyQueueCard
 from src.services.s3_service import get_s3_service
 
@@ -317,6 +319,7 @@ class V2SM2Service:
 
         # Step 2: Track previous state
         previous_status = stats.status
+        previous_day = stats.updated_at.date() if stats.updated_at else None
         is_first_review = stats.status == CardStatus.NEW
         was_mastered = stats.status == CardStatus.MASTERED
 
@@ -351,6 +354,17 @@ class V2SM2Service:
         )
         self.db.add(review)
         await self.db.flush()
+        await UserDailyTrendsRepository(self.db).apply(
+            user_id,
+            vocab_review_deltas(
+                day=review.reviewed_at.date(),
+                quality=quality,
+                time_taken=time_taken,
+                previous_status=previous_status,
+                previous_day=previous_day,
+                new_status=sm2_result.new_status,
+            ),
+        )
 
         # Step 7: Fire PostHog event if newly mastered
         if sm2_result.new_status == CardStatus.MASTERED and previous_status != CardStatus.MASTERED:
@@ -460,6 +474,7 @@ class V2SM2Service:
             "time_taken": time_taken,
             "stats_id": str(stats.id),
             "stats_created_at_iso": stats.created_at.isoformat() if stats.created_at else None,
+            "stats_updated_at_iso": stats.updated_at.isoformat() if stats.updated_at else None,
             "new_ef": sm2_result.new_easiness_factor,
             "new_interval": sm2_result.new_interval,
             "new_repetitions": sm2_result.new_repetitions,
@@ -496,6 +511,24 @@ class V2SM2Service:
         )
         self.db.add(review)
         await self.db.flush()
+        await UserDeckProgressRepository(self.db).refresh(
+            user_ids=[UUID(context["user_id"])], deck_id=UUID(context["deck_id"])
+        )
+        await UserDailyTrendsRepository(self.db).apply(
+            UUID(context["user_id"]),
+            vocab_review_deltas(
+                day=review.reviewed_at.date(),
+                quality=context["quality"],
+                time_taken=context["time_taken"],
+                previous_status=CardStatus(context["previous_status_value"]),
+                previous_day=(
+                    datetime.fromisoformat(context["stats_updated_at_iso"]).date()
+                    if context.get("stats_updated_at_iso")
+                    else None
+                ),
+                new_status=CardStatus(context["new_status_value"]),
+            ),
+        )
 
         if context["is_newly_mastered"]:
             stats_created_at_iso: str | None = context["stats_created_at_iso"]
@@ -3,6 +3,8 @@
 This module provides:
 1. FastAPI BackgroundTasks functions for async fire-and-forget operations
 2. APScheduler for scheduled periodic jobs (in dedicated service)
+3. A durable, coalescing job queue (src/tasks/queue.py) consumed by the job
+   worker service (src/worker_main.py) when JOB_QUEUE_ENABLED is set
 
 Example usage for background tasks:
     from fastapi import BackgroundTasks
@@ -47,6 +49,7 @@ from src.tasks.background import (
     persist_culture_answer_task,
     process_answer_side_effects_task,
 )
+from src.tasks.queue import dispatch_task, enqueue_job, get_job_store
 from src.tasks.scheduler import get_scheduler, setup_scheduler, shutdown_scheduler
 
 __all__ = [
@@ -60,6 +63,10 @@ __all__ = [
     "log_analytics_task",
     "persist_culture_answer_task",
     "process_answer_side_effects_task",
+    # Durable job queue (consumed by src/worker_main.py)
+    "dispatch_task",
+    "enqueue_job",
+    "get_job_store",
     # Scheduler (dedicated service)
     "get_scheduler",
     "setup_scheduler",
@@ -28,6 +28,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import settings
 from src.core.logging import get_logger
 from src.db.session import get_session_factory
+from src.tasks.queue import enqueue_job, running_as_job
 
 logger = get_logger(__name__)
 
@@ -153,6 +154,8 @@ async def check_achievements_task(user_id: UUID) -> None:
             extra={"user_id": str(user_id), "error": str(e)},
             exc_info=True,
         )
+        if running_as_job():
+            raise
 
 
 async def invalidate_cache_task(
@@ -235,6 +238,8 @@ async def invalidate_cache_task(
             },
             exc_info=True,
         )
+        if running_as_job():
+            raise
 
 
 # Supported analytics event types
@@ -361,6 +366,47 @@ async def _check_daily_goal_for_review(
         )
 
 
+async def _reinvalidate_progress(user_id: UUID, deck_id: UUID | None) -> None:
+    """Evict progress caches after a job's own commit; never raises.
+
+    Jobs of one claimed batch run concurrently, so the request's invalidation
+    job may finish before the persistence job commits. Failing here must not
+    fail (and so retry) a job whose writes are already committed.
+    """
+    try:
+        from src.core.cache import get_cache
+
+        await get_cache().invalidate_user_progress(user_id, deck_id)
+    except Exception as e:
+        logger.warning(
+            "Progress cache re-invalidation failed",
+            extra={"user_id": str(user_id), "error": str(e)},
+        )
+
+
+async def _enqueue_achievement_check(user_id: UUID, *, session: AsyncSession | None = None) -> bool:
+    """Queue a coalesced check_achievements_task for ``user_id``.
+
+    Reviews arriving within settings.job_queue_coalesce_seconds of each other
+    share one pending job, so a burst of answers reconciles the user once.
+    """
+    return await enqueue_job(
+        "check_achievements_task",
+        {"user_id": user_id},
+        coalesce_key=f"check_achievements:{user_id}",
+        delay_seconds=settings.job_queue_coalesce_seconds,
+        session=session,
+    )
+
+
+async def _check_achievements_for_review(user_id: UUID) -> None:
+    """Reconcile now (in-process) or debounce through the job queue (worker)."""
+    if running_as_job():
+        await _enqueue_achievement_check(user_id)
+    else:
+        await check_achievements_task(user_id=user_id)
+
+
 async def _persist_review_core(
     session: AsyncSession,
     *,
@@ -379,12 +425,16 @@ async def _persist_review_core(
     next_review_date_iso: str,
     is_newly_mastered: bool,
     user_email: str | None,
+    previous_status_value: str,
+    stats_updated_at_iso: str | None,
 ) -> None:
     """Write SM2 stats, create review record, and fire mastery event. Caller commits."""
     from datetime import date, datetime, timezone
 
     from src.db.models import CardRecordReview, CardStatus
     from src.repositories.card_record_statistics import CardRecordStatisticsRepository
+    from src.repositories.user_daily_trends import UserDailyTrendsRepository, vocab_review_deltas
+    from src.repositories.user_deck_progress import UserDeckProgressRepository
 
     stats_repo = CardRecordStatisticsRepository(session)
     await stats_repo.update_sm2_data(
@@ -405,6 +455,24 @@ async def _persist_review_core(
     )
     session.add(review)
     await session.flush()
+    await UserDeckProgressRepository(session).refresh(
+        user_ids=[UUID(user_id)], deck_id=UUID(deck_id)
+    )
+    await UserDailyTrendsRepository(session).apply(
+        UUID(user_id),
+        vocab_review_deltas(
+            day=review.reviewed_at.date(),
+            quality=quality,
+            time_taken=time_taken,
+            previous_status=CardStatus(previous_status_value),
+            previous_day=(
+                datetime.fromisoformat(stats_updated_at_iso).date()
+                if stats_updated_at_iso
+                else None
+            ),
+            new_status=CardStatus(new_status_value),
+        ),
+    )
 
     if is_newly_mastered:
         days_to_master = 0
@@ -469,7 +537,7 @@ async def _run_review_side_effects(
 
     # Calls GamificationReconciler via the wrapper (Phase 6 will inline this).
     try:
-        await check_achievements_task(user_id=UUID(user_id))
+        await _check_achievements_for_review(UUID(user_id))
     except Exception as e:
         logger.warning(
             "Achievement check failed in persist_deck_review_task",
@@ -513,6 +581,7 @@ async def persist_deck_review_task(
     is_newly_mastered: bool,
     reviews_before: int,
     user_email: str | None,
+    stats_updated_at_iso: str | None = None,
 ) -> None:
     """Persist a deck review and run all post-review side effects in background.
 
@@ -554,6 +623,8 @@ async def persist_deck_review_task(
                 next_review_date_iso=next_review_date_iso,
                 is_newly_mastered=is_newly_mastered,
                 user_email=user_email,
+                previous_status_value=previous_status_value,
+                stats_updated_at_iso=stats_updated_at_iso,
             )
             await session.commit()
 
@@ -571,8 +642,13 @@ async def persist_deck_review_task(
             extra={"user_id": user_id, "card_record_id": card_record_id, "error": str(e)},
             exc_info=True,
         )
+        if running_as_job():
+            raise  # nothing was committed; the queue retries the whole job
         return
 
+    if running_as_job():
+        await _reinvalidate_progress(UUID(user_id), UUID(deck_id))
+
     # Phase 2: Non-critical side effects (XP, daily goal, achievements, analytics)
     await _run_review_side_effects(
         user_id=user_id,
@@ -632,6 +708,10 @@ async def process_answer_side_effects_task(
         async with get_session_factory()() as session:
             # Step 1: Record answer history
             from src.db.models import CultureAnswerHistory
+            from src.repositories.user_daily_trends import (
+                UserDailyTrendsRepository,
+                culture_answer_deltas,
+            )
 
             answer_history = CultureAnswerHistory(
                 user_id=user_id,
@@ -643,6 +723,16 @@ async def process_answer_side_effects_task(
                 deck_category=deck_category,
             )
             session.add(answer_history)
+            await UserDailyTrendsRepository(session).apply(
+                user_id,
+                culture_answer_deltas(
+                    day=datetime.now(timezone.utc).date(),
+                    is_correct=is_correct,
+                    previous_status=None,
+                    previous_day=None,
+                    new_status=None,
+                ),
+            )
 
             logger.debug(
                 "Recorded culture answer history in background",
@@ -853,6 +943,11 @@ async def persist_culture_answer_task(  # noqa: C901
 
             from src.db.models import CardStatus, CultureAnswerHistory, CultureQuestionStats
             from src.repositories.culture_question_stats import CultureQuestionStatsRepository
+            from src.repositories.user_daily_trends import (
+                UserDailyTrendsRepository,
+                culture_answer_deltas,
+            )
+            from src.repositories.user_due_histogram import UserDueHistogramRepository
             from src.services.gamification.reconciler import GamificationReconciler
             from src.services.gamification.types import ReconcileMode
             from src.services.xp_service import XPService
@@ -864,6 +959,8 @@ async def persist_culture_answer_task(  # noqa: C901
             )
             result = await session.execute(query)
             stats = result.scalar_one_or_none()
+            previous_day = stats.updated_at.date() if stats else None
+            previous_review_date = stats.next_review_date if stats else None
 
             if not stats:
                 from src.core.sm2 import DEFAULT_EASINESS_FACTOR
@@ -888,6 +985,9 @@ async def persist_culture_answer_task(  # noqa: C901
             stats.repetitions = sm2_new_repetitions
             stats.status = CardStatus(sm2_new_status)
             stats.next_review_date = date_type.fromisoformat(sm2_next_review_date)
+            await UserDueHistogramRepository(session).shift(
+                user_id, previous_review_date, stats.next_review_date
+            )
 
             logger.debug(
                 "SM-2 values applied in persistence task",
@@ -911,6 +1011,16 @@ async def persist_culture_answer_task(  # noqa: C901
                 deck_category=deck_category,
             )
             session.add(answer_history)
+            await UserDailyTrendsRepository(session).apply(
+                user_id,
+                culture_answer_deltas(
+                    day=datetime.now(timezone.utc).date(),
+                    is_correct=is_correct,
+                    previous_status=previous_status,
+                    previous_day=previous_day,
+                    new_status=CardStatus(sm2_new_status),
+                ),
+            )
 
             # Step 4: Award XP for the answer
             xp_service = XPService(session)
@@ -953,10 +1063,16 @@ async def persist_culture_answer_task(  # noqa: C901
             # notifications inline). Replaces legacy check_culture_achievements;
             # legacy method removed in Phase 6 (GAMIF-06).
             try:
-                reconcile_result = await GamificationReconciler.reconcile(
-                    session, user_id, ReconcileMode.IMMEDIATE
-                )
-                if reconcile_result.new_unlocks:
+                if running_as_job():
+                    # Debounced: one reconcile per user per coalescing window,
+                    # enqueued in this transaction.
+                    await _enqueue_achievement_check(user_id, session=session)
+                    reconcile_result = None
+                else:
+                    reconcile_result = await GamificationReconciler.reconcile(
+                        session, user_id, ReconcileMode.IMMEDIATE
+                    )
+                if reconcile_result is not None and reconcile_result.new_unlocks:
                     logger.info(
                         "Achievements unlocked via reconciler in culture persistence",
                         extra={
@@ -982,6 +1098,9 @@ async def persist_culture_answer_task(  # noqa: C901
             # Commit all changes
             await session.commit()
 
+        if running_as_job():
+            await _reinvalidate_progress(user_id, None)
+
         duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
         logger.info(
             "Culture answer persistence complete",
@@ -1006,6 +1125,8 @@ async def persist_culture_answer_task(  # noqa: C901
             },
             exc_info=True,
         )
+        if running_as_job():
+            raise
 
 
 async def create_announcement_notifications_task(
@@ -1051,6 +1172,9 @@ async def create_announcement_notifications_task(
 
             from src.db.models import Notification, NotificationType, User
             from src.repositories.announcement import AnnouncementCampaignRepository
+            from src.repositories.notification import NotificationRepository
+
+            notification_repo = NotificationRepository(session)
 
             # Get all active user IDs
             query = select(User.id).where(User.is_active.is_(True))
@@ -1084,6 +1208,7 @@ async def create_announcement_notifications_task(
 
                 # Flush after each batch to avoid memory buildup
                 await session.flush()
+                await notification_repo.increment_unread_counts(batch)
 
                 logger.debug(
                     "Notification batch created",
@@ -1125,3 +1250,5 @@ async def create_announcement_notifications_task(
             },
             exc_info=True,
         )
+        if running_as_job():
+            raise
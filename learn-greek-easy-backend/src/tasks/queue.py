@@ -0,0 +1,612 @@
+"""Durable, coalescing job queue for background work.
+
+With ``settings.job_queue_enabled`` the API enqueues review persistence,
+culture-answer persistence, cache invalidation and announcement fan-out here
+instead of running them as in-process ``BackgroundTasks``. A separate job
+worker service (``python -m src.worker_main``) consumes the queue, so the work
+survives restarts and deploys and no longer competes with request handling
+for the API's event loop or connection pool.
+
+    API request --dispatch_task()--> background_jobs --JobWorker--> task function
+
+Stores (``settings.job_queue_backend``):
+    :class:`PostgresJobStore` — the ``background_jobs`` table. Workers claim
+    due rows with ``FOR UPDATE SKIP LOCKED``, so any number of workers can
+    share the queue. An enqueue made with the request's session commits (or
+    rolls back) together with the request's own writes.
+    :class:`InMemoryJobStore` — a local stand-in for tests and single-process
+    development; nothing survives a restart.
+
+Coalescing:
+    A job enqueued with a ``coalesce_key`` is a no-op while another job with
+    the same key is still pending. Combined with a delay this debounces work:
+    twenty reviews inside ``settings.job_queue_coalesce_seconds`` schedule one
+    ``check_achievements_task`` for the user.
+
+Retries and dead letters:
+    A job whose task raises is retried with exponential backoff
+    (``job_queue_retry_base_seconds * 2 ** (attempt - 1)``) until
+    ``job_queue_max_attempts``; after that it stays in the store with status
+    ``dead`` for inspection. Task functions swallow and log their errors when
+    run in-process; under the worker (:func:`running_as_job`) they re-raise so
+    the queue can retry them. Jobs left ``running`` by a crashed worker are
+    returned to ``pending`` after ``job_queue_stale_seconds``.
+
+Metrics:
+    The worker logs ``Job queue metrics`` every ``job_queue_metrics_seconds``:
+    depth per status, the age of the oldest due job and its own
+    processed/retried/dead counters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Protocol
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, exists, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+
+from src.config import settings
+from src.core.logging import get_logger
+from src.db.models import BackgroundJob
+
+if TYPE_CHECKING:
+    from fastapi import BackgroundTasks
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = get_logger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DEAD = "dead"
+
+_PENDING_KEY_WHERE = text("status = 'pending' AND coalesce_key IS NOT NULL")
+
+_running_as_job: ContextVar[bool] = ContextVar("running_as_job", default=False)
+
+
+def running_as_job() -> bool:
+    """True inside a task run by the job worker (failures must raise to be retried)."""
+    return _running_as_job.get()
+
+
+def job_tasks() -> dict[str, Callable[..., Awaitable[None]]]:
+    """Task functions the worker may run, by name (the enqueued ``task`` value)."""
+    from src.tasks.background import (
+        check_achievements_task,
+        create_announcement_notifications_task,
+        invalidate_cache_task,
+        persist_culture_answer_task,
+        persist_deck_review_task,
+    )
+
+    return {
+        fn.__name__: fn
+        for fn in (
+            check_achievements_task,
+            create_announcement_notifications_task,
+            invalidate_cache_task,
+            persist_culture_answer_task,
+            persist_deck_review_task,
+        )
+    }
+
+
+# ============================================================================
+# Payload encoding
+# ============================================================================
+
+
+def encode_payload(value: Any) -> Any:
+    """JSON-safe form of task kwargs; UUIDs and dates are tagged to round-trip."""
+    if isinstance(value, dict):
+        return {key: encode_payload(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_payload(item) for item in value]
+    if isinstance(value, UUID):
+        return {"__uuid__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    return value
+
+
+def decode_payload(value: Any) -> Any:
+    """Inverse of :func:`encode_payload`."""
+    if isinstance(value, list):
+        return [decode_payload(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        ((tag, raw),) = value.items()
+        if tag == "__uuid__":
+            return UUID(raw)
+        if tag == "__datetime__":
+            return datetime.fromisoformat(raw)
+        if tag == "__date__":
+            return date.fromisoformat(raw)
+    return {key: decode_payload(item) for key, item in value.items()}
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Backoff before the next try of a job that has failed ``attempts`` times."""
+    return settings.job_queue_retry_base_seconds * 2 ** max(attempts - 1, 0)
+
+
+# ============================================================================
+# Stores
+# ============================================================================
+
+
+@dataclass
+class Job:
+    """A claimed job. ``attempts`` includes the current run."""
+
+    id: UUID
+    task: str
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+    coalesce_key: str | None = None
+
+
+class JobStore(Protocol):
+    """Persistence backend for queued jobs."""
+
+    async def enqueue(
+        self,
+        task: str,
+        payload: dict[str, Any],
+        *,
+        coalesce_key: str | None = None,
+        delay_seconds: float = 0,
+        session: "AsyncSession | None" = None,
+    ) -> bool:
+        """Add a job; False when coalesced into an already pending one."""
+
+    async def claim(self, limit: int) -> list[Job]:
+        """Mark up to ``limit`` due pending jobs running and return them."""
+
+    async def complete(self, job: Job) -> None:
+        """Remove a job that finished successfully."""
+
+    async def fail(self, job: Job, error: str) -> str:
+        """Schedule a retry or dead-letter ``job``; returns the new status."""
+
+    async def requeue_stale(self, older_than_seconds: float) -> int:
+        """Return jobs stuck in running (crashed worker) to pending."""
+
+    async def depth(self) -> dict[str, Any]:
+        """Job counts per status and the age of the oldest due pending job."""
+
+
+@dataclass
+class _MemoryEntry:
+    job: Job
+    status: str
+    run_after: float
+    locked_at: float | None = None
+    last_error: str | None = None
+
+
+@dataclass
+class InMemoryJobStore:
+    """Process-local store with the same semantics as :class:`PostgresJobStore`."""
+
+    entries: dict[UUID, _MemoryEntry] = field(default_factory=dict)
+
+    def _pending_key_exists(self, coalesce_key: str | None, *, exclude: UUID | None = None) -> bool:
+        return coalesce_key is not None and any(
+            entry.status == PENDING and entry.job.coalesce_key == coalesce_key and job_id != exclude
+            for job_id, entry in self.entries.items()
+        )
+
+    async def enqueue(
+        self,
+        task: str,
+        payload: dict[str, Any],
+        *,
+        coalesce_key: str | None = None,
+        delay_seconds: float = 0,
+        session: "AsyncSession | None" = None,
+    ) -> bool:
+        if self._pending_key_exists(coalesce_key):
+            return False
+        job = Job(
+            id=uuid4(),
+            task=task,
+            payload=encode_payload(payload),
+            attempts=0,
+            max_attempts=settings.job_queue_max_attempts,
+            coalesce_key=coalesce_key,
+        )
+        self.entries[job.id] = _MemoryEntry(
+            job=job, status=PENDING, run_after=time.monotonic() + delay_seconds
+        )
+        return True
+
+    async def claim(self, limit: int) -> list[Job]:
+        now = time.monotonic()
+        due = sorted(
+            (e for e in self.entries.values() if e.status == PENDING and e.run_after <= now),
+            key=lambda e: e.run_after,
+        )[:limit]
+        for entry in due:
+            entry.status = RUNNING
+            entry.locked_at = now
+            entry.job.attempts += 1
+        return [entry.job for entry in due]
+
+    async def complete(self, job: Job) -> None:
+        self.entries.pop(job.id, None)
+
+    async def fail(self, job: Job, error: str) -> str:
+        entry = self.entries[job.id]
+        entry.last_error = error
+        if job.attempts >= job.max_attempts:
+            entry.status = DEAD
+        elif self._pending_key_exists(job.coalesce_key, exclude=job.id):
+            del self.entries[job.id]  # a newer pending job will do the same work
+            return PENDING
+        else:
+            entry.status = PENDING
+            entry.locked_at = None
+            entry.run_after = time.monotonic() + retry_delay_seconds(job.attempts)
+        return entry.status
+
+    async def requeue_stale(self, older_than_seconds: float) -> int:
+        cutoff = time.monotonic() - older_than_seconds
+        stale = [
+            e
+            for e in self.entries.values()
+            if e.status == RUNNING and e.locked_at is not None and e.locked_at < cutoff
+        ]
+        for entry in stale:
+            if self._pending_key_exists(entry.job.coalesce_key):
+                del self.entries[entry.job.id]
+            else:
+                entry.status = PENDING
+                entry.locked_at = None
+        return len(stale)
+
+    async def depth(self) -> dict[str, Any]:
+        now = time.monotonic()
+        counts = {PENDING: 0, RUNNING: 0, DEAD: 0}
+        oldest: float | None = None
+        for entry in self.entries.values():
+            counts[entry.status] += 1
+            if entry.status == PENDING and entry.run_after <= now:
+                oldest = max(oldest or 0.0, now - entry.run_after)
+        return {**counts, "oldest_due_seconds": round(oldest or 0.0, 1)}
+
+
+class PostgresJobStore:
+    """Rows in ``background_jobs``; claims use ``FOR UPDATE SKIP LOCKED``."""
+
+    def __init__(self, session_factory: "async_sessionmaker[AsyncSession] | None" = None) -> None:
+        self._session_factory = session_factory
+
+    def _factory(self) -> "async_sessionmaker[AsyncSession]":
+        if self._session_factory is None:
+            from src.db.session import get_session_factory
+
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    async def enqueue(
+        self,
+        task: str,
+        payload: dict[str, Any],
+        *,
+        coalesce_key: str | None = None,
+        delay_seconds: float = 0,
+        session: "AsyncSession | None" = None,
+    ) -> bool:
+        stmt = (
+            insert(BackgroundJob)
+            .values(
+                task=task,
+                payload=encode_payload(payload),
+                coalesce_key=coalesce_key,
+                max_attempts=settings.job_queue_max_attempts,
+                run_after=func.now() + timedelta(seconds=delay_seconds),
+            )
+            .on_conflict_do_nothing(index_elements=["coalesce_key"], index_where=_PENDING_KEY_WHERE)
+            .returning(BackgroundJob.id)
+        )
+        if session is not None:
+            # Commits with the caller's transaction (e.g. the request's get_db session).
+            return (await session.execute(stmt)).scalar_one_or_none() is not None
+        async with self._factory().begin() as own:
+            return (await own.execute(stmt)).scalar_one_or_none() is not None
+
+    async def claim(self, limit: int) -> list[Job]:
+        due = (
+            select(BackgroundJob.id)
+            .where(BackgroundJob.status == PENDING, BackgroundJob.run_after <= func.now())
+            .order_by(BackgroundJob.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(BackgroundJob)
+            .where(BackgroundJob.id.in_(due.scalar_subquery()))
+            .values(status=RUNNING, locked_at=func.now(), attempts=BackgroundJob.attempts + 1)
+            .returning(
+                BackgroundJob.id,
+                BackgroundJob.task,
+                BackgroundJob.payload,
+                BackgroundJob.attempts,
+                BackgroundJob.max_attempts,
+                BackgroundJob.coalesce_key,
+            )
+        )
+        async with self._factory().begin() as session:
+            rows = (await session.execute(stmt)).all()
+        return [Job(*row) for row in rows]
+
+    async def complete(self, job: Job) -> None:
+        async with self._factory().begin() as session:
+            await session.execute(delete(BackgroundJob).where(BackgroundJob.id == job.id))
+
+    @staticmethod
+    def _superseded(job_id: Any) -> Any:
+        """Rows whose coalesce key already has another pending job."""
+        other = aliased(BackgroundJob)
+        return exists().where(
+            other.coalesce_key == BackgroundJob.coalesce_key,
+            other.status == PENDING,
+            other.id != job_id,
+        )
+
+    async def fail(self, job: Job, error: str) -> str:
+        async with self._factory().begin() as session:
+            if job.attempts >= job.max_attempts:
+                await session.execute(
+                    update(BackgroundJob)
+                    .where(BackgroundJob.id == job.id)
+                    .values(status=DEAD, locked_at=None, last_error=error)
+                )
+                return DEAD
+            # A retry must not collide with a newer pending job for the same key;
+            # that job will do the same work, so this one is simply dropped.
+            await session.execute(
+                delete(BackgroundJob).where(
+                    BackgroundJob.id == job.id, self._superseded(BackgroundJob.id)
+                )
+            )
+            await session.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job.id)
+                .values(
+                    status=PENDING,
+                    locked_at=None,
+                    last_error=error,
+                    run_after=func.now() + timedelta(seconds=retry_delay_seconds(job.attempts)),
+                )
+            )
+        return PENDING
+
+    async def requeue_stale(self, older_than_seconds: float) -> int:
+        stale = (BackgroundJob.status == RUNNING) & (
+            BackgroundJob.locked_at < func.now() - timedelta(seconds=older_than_seconds)
+        )
+        # One stale job per coalesce key survives (the pending-key index allows
+        # only one); the others would redo the same work and are dropped.
+        keep = (
+            select(BackgroundJob.id)
+            .where(stale, BackgroundJob.coalesce_key.is_not(None))
+            .distinct(BackgroundJob.coalesce_key)
+            .order_by(BackgroundJob.coalesce_key, BackgroundJob.run_after, BackgroundJob.id)
+        )
+        async with self._factory().begin() as session:
+            superseded = await session.execute(
+                delete(BackgroundJob).where(stale, self._superseded(BackgroundJob.id))
+            )
+            duplicates = await session.execute(
+                delete(BackgroundJob).where(
+                    stale,
+                    BackgroundJob.coalesce_key.is_not(None),
+                    BackgroundJob.id.not_in(keep.scalar_subquery()),
+                )
+            )
+            requeued = await session.execute(
+                update(BackgroundJob).where(stale).values(status=PENDING, locked_at=None)
+            )
+        return sum(result.rowcount or 0 for result in (superseded, duplicates, requeued))
+
+    async def depth(self) -> dict[str, Any]:
+        stmt = select(
+            BackgroundJob.status,
+            func.count(),
+            func.min(BackgroundJob.run_after).filter(BackgroundJob.run_after <= func.now()),
+        ).group_by(BackgroundJob.status)
+        async with self._factory()() as session:
+            rows = (await session.execute(stmt)).all()
+        counts: dict[str, Any] = {PENDING: 0, RUNNING: 0, DEAD: 0}
+        oldest_due: datetime | None = None
+        for status, count, min_due in rows:
+            counts[status] = count
+            if status == PENDING:
+                oldest_due = min_due
+        age = (datetime.now(timezone.utc) - oldest_due).total_seconds() if oldest_due else 0.0
+        return {**counts, "oldest_due_seconds": round(max(age, 0.0), 1)}
+
+
+_job_store: JobStore | None = None
+
+
+def get_job_store() -> JobStore:
+    """Process-wide store selected by ``settings.job_queue_backend``."""
+    global _job_store
+    if _job_store is None:
+        if settings.job_queue_backend == "memory":
+            _job_store = InMemoryJobStore()
+        else:
+            _job_store = PostgresJobStore()
+    return _job_store
+
+
+def reset_job_store() -> None:
+    """Drop the process-wide store (tests)."""
+    global _job_store
+    _job_store = None
+
+
+# ============================================================================
+# Producer side
+# ============================================================================
+
+
+async def enqueue_job(
+    task: str,
+    payload: dict[str, Any],
+    *,
+    coalesce_key: str | None = None,
+    delay_seconds: float = 0,
+    session: "AsyncSession | None" = None,
+) -> bool:
+    """Add a job to the durable queue; False when coalesced into a pending one.
+
+    Pass ``session`` to enqueue inside the caller's transaction (the job is
+    only visible to workers once that transaction commits).
+    """
+    if task not in job_tasks():
+        raise ValueError(f"Unknown job task: {task}")
+    enqueued = await get_job_store().enqueue(
+        task,
+        payload,
+        coalesce_key=coalesce_key,
+        delay_seconds=delay_seconds,
+        session=session,
+    )
+    logger.debug(
+        "Job enqueued" if enqueued else "Job coalesced",
+        extra={"task": task, "coalesce_key": coalesce_key},
+    )
+    return enqueued
+
+
+async def dispatch_task(
+    background_tasks: "BackgroundTasks",
+    task: Callable[..., Awaitable[None]],
+    /,
+    *,
+    session: "AsyncSession | None" = None,
+    coalesce_key: str | None = None,
+    delay_seconds: float = 0,
+    **kwargs: Any,
+) -> None:
+    """Run ``task(**kwargs)`` in the background: durable queue or in-process.
+
+    With ``settings.job_queue_enabled`` the call is enqueued (in ``session``'s
+    transaction when given) for the job worker; otherwise it is added to the
+    request's ``BackgroundTasks`` as before. ``coalesce_key`` and
+    ``delay_seconds`` only apply to the queue.
+    """
+    if settings.job_queue_enabled:
+        await enqueue_job(
+            task.__name__,
+            kwargs,
+            coalesce_key=coalesce_key,
+            delay_seconds=delay_seconds,
+            session=session,
+        )
+    else:
+        background_tasks.add_task(task, **kwargs)
+
+
+# ============================================================================
+# Consumer side
+# ============================================================================
+
+
+@dataclass
+class JobWorker:
+    """Claims and runs jobs until ``stop`` is set. One per worker process."""
+
+    store: JobStore
+    batch_size: int = field(default_factory=lambda: settings.job_queue_batch_size)
+    poll_seconds: float = field(default_factory=lambda: settings.job_queue_poll_seconds)
+    counters: dict[str, int] = field(
+        default_factory=lambda: {"processed": 0, "retried": 0, "dead": 0}
+    )
+
+    async def run_job(self, job: Job) -> None:
+        """Run one claimed job and record its outcome in the store."""
+        task = job_tasks().get(job.task)
+        token = _running_as_job.set(True)
+        started = time.perf_counter()
+        try:
+            if task is None:
+                raise LookupError(f"Unknown job task: {job.task}")
+            await task(**decode_payload(job.payload))
+        except Exception as exc:
+            status = await self.store.fail(job, f"{type(exc).__name__}: {exc}")
+            self.counters["dead" if status == DEAD else "retried"] += 1
+            log = logger.error if status == DEAD else logger.warning
+            log(
+                "Job dead-lettered" if status == DEAD else "Job failed, will retry",
+                extra={
+                    "job_id": str(job.id),
+                    "task": job.task,
+                    "attempt": job.attempts,
+                    "max_attempts": job.max_attempts,
+                    "error": str(exc),
+                },
+            )
+        else:
+            await self.store.complete(job)
+            self.counters["processed"] += 1
+            logger.debug(
+                "Job complete",
+                extra={
+                    "job_id": str(job.id),
+                    "task": job.task,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+        finally:
+            _running_as_job.reset(token)
+
+    async def run_once(self) -> int:
+        """Claim one batch and run it concurrently; returns the batch size."""
+        jobs = await self.store.claim(self.batch_size)
+        if jobs:
+            await asyncio.gather(*(self.run_job(job) for job in jobs))
+        return len(jobs)
+
+    async def log_metrics(self) -> dict[str, Any]:
+        metrics = {**await self.store.depth(), **self.counters}
+        logger.info("Job queue metrics", extra={"job_queue": metrics})
+        return metrics
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Poll until ``stop`` is set; a claimed batch is always finished."""
+        next_maintenance = 0.0
+        while not stop.is_set():
+            now = time.monotonic()
+            if now >= next_maintenance:
+                try:
+                    await self.store.requeue_stale(settings.job_queue_stale_seconds)
+                    await self.log_metrics()
+                except Exception as exc:
+                    logger.warning("Job queue maintenance failed", extra={"error": str(exc)})
+                next_maintenance = now + settings.job_queue_metrics_seconds
+            try:
+                claimed = await self.run_once()
+            except Exception as exc:
+                logger.error("Job claim failed", extra={"error": str(exc)}, exc_info=True)
+                claimed = 0
+            if claimed == 0:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
@@ -7,6 +7,9 @@ Tasks:
 - streak_reset_task: Daily at midnight UTC - Check and log broken streaks
 - session_cleanup_task: Hourly at minute 0 UTC - Clean up orphaned Redis sessions
 - stats_aggregate_task: Daily at 4 AM UTC - Aggregate user statistics for analytics
+- partition_maintenance_task: Daily at 1 AM UTC - Create/drop monthly activity partitions
+- notification_counter_repair_task: Daily at 1:30 AM UTC - Fix drifted unread counters
+- due_histogram_repair_task: Daily at 1:45 AM UTC - Drop drifted due histograms
 """
 
 from datetime import datetime, timedelta, timezone
@@ -469,3 +472,107 @@ async def trial_expiration_task() -> None:
     except Exception as e:
         logger.error(f"Trial expiration task failed: {e}", exc_info=True)
         raise
+
+
+async def partition_maintenance_task() -> None:
+    """Create upcoming and drop expired monthly partitions of the activity tables.
+
+    Runs daily; each run is idempotent, so a missed day only delays retention.
+    Partitions are created ``partition_months_ahead`` months in advance so
+    inserts never fall through to the default partition. Expired notification
+    (and, when configured, review/answer history) partitions are dropped whole
+    instead of deleting their rows. See ``src.db.partitioning``.
+    """
+    from src.db.partitioning import (
+        CARD_RECORD_REVIEWS,
+        CULTURE_ANSWER_HISTORY,
+        EXERCISE_REVIEWS,
+        NOTIFICATIONS,
+        maintain_partitions,
+    )
+
+    logger.info("Starting partition maintenance task")
+    start_time = datetime.now(timezone.utc)
+    retention = {
+        CARD_RECORD_REVIEWS.name: settings.activity_retention_months,
+        EXERCISE_REVIEWS.name: settings.activity_retention_months,
+        CULTURE_ANSWER_HISTORY.name: settings.activity_retention_months,
+        NOTIFICATIONS.name: settings.notification_retention_months,
+    }
+
+    try:
+        async with get_session_factory()() as session:
+            summary = await maintain_partitions(
+                session,
+                start_time.date(),
+                months_ahead=settings.partition_months_ahead,
+                retention_months=retention,
+                rollup=settings.partition_rollup_on_drop,
+            )
+            await session.commit()
+
+        duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+        logger.info(
+            "Partition maintenance complete",
+            extra={"tables": summary, "duration_ms": duration_ms},
+        )
+
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {e}", exc_info=True)
+        raise
+
+
+async def notification_counter_repair_task() -> None:
+    """Recount unread notifications and fix drifted ``users.unread_notification_count``.
+
+    The counter is maintained on every write through ``NotificationRepository``;
+    this catches writes that bypass it (seeding, dropped notification
+    partitions, manual SQL). Runs daily after partition maintenance.
+    """
+    from src.repositories.notification import NotificationRepository
+
+    logger.info("Starting notification counter repair task")
+    start_time = datetime.now(timezone.utc)
+
+    try:
+        async with get_session_factory()() as session:
+            repaired = await NotificationRepository(session).repair_unread_counts()
+            await session.commit()
+
+        duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+        logger.info(
+            "Notification counter repair complete",
+            extra={"users_repaired": repaired, "duration_ms": duration_ms},
+        )
+
+    except Exception as e:
+        logger.error(f"Notification counter repair failed: {e}", exc_info=True)
+        raise
+
+
+async def due_histogram_repair_task() -> None:
+    """Drop due histograms whose slots no longer add up to the user's cards.
+
+    Reads trust the stored histogram and only rebuild it on signals the row
+    shows itself; this catches the drift it cannot show (deactivated cards,
+    deleted statistics). Dropped rows are rebuilt on the user's next read.
+    """
+    from src.repositories.user_due_histogram import UserDueHistogramRepository
+
+    logger.info("Starting due histogram repair task")
+    start_time = datetime.now(timezone.utc)
+
+    try:
+        async with get_session_factory()() as session:
+            dropped = await UserDueHistogramRepository(session).invalidate_drifted()
+            await session.commit()
+
+        duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+        logger.info(
+            "Due histogram repair complete",
+            extra={"histograms_dropped": dropped, "duration_ms": duration_ms},
+        )
+
+    except Exception as e:
+        logger.error(f"Due histogram repair failed: {e}", exc_info=True)
+        raise
@@ -7,6 +7,9 @@ The scheduler runs periodic jobs like:
 - Streak reset (daily at midnight UTC)
 - Session cleanup (hourly)
 - Stats aggregation (daily at 00:30 UTC)
+- Activity partition maintenance (daily at 01:00 UTC)
+- Unread notification counter repair (daily at 01:30 UTC)
+- Due histogram drift repair (daily at 01:45 UTC)
 
 Architecture:
     This project uses a dedicated scheduler service pattern:
@@ -112,7 +115,10 @@ def setup_scheduler() -> None:
     # Register scheduled jobs (implemented in 12.07-12.09)
     # Import here to avoid circular imports
     from src.tasks.scheduled import (
+        due_histogram_repair_task,
         heartbeat_task,
+        notification_counter_repair_task,
+        partition_maintenance_task,
         session_cleanup_task,
         stats_aggregate_task,
         streak_reset_task,
@@ -143,6 +149,30 @@ def setup_scheduler() -> None:
         name="Daily Stats Aggregation",
     )
 
+    # Daily activity-table partition maintenance (create ahead, drop expired)
+    _scheduler.add_job(
+        partition_maintenance_task,
+        CronTrigger(hour=1, minute=0),
+        id="partition_maintenance",
+        name="Daily Partition Maintenance",
+    )
+
+    # Daily unread-notification counter drift repair (after partition drops)
+    _scheduler.add_job(
+        notification_counter_repair_task,
+        CronTrigger(hour=1, minute=30),
+        id="notification_counter_repair",
+        name="Daily Notification Counter Repair",
+    )
+
+    # Daily due-histogram drift repair (off the forecast/dashboard read path)
+    _scheduler.add_job(
+        due_histogram_repair_task,
+        CronTrigger(hour=1, minute=45),
+        id="due_histogram_repair",
+        name="Daily Due Histogram Repair",
+    )
+
     _scheduler.add_job(
         trial_expiration_task,
         CronTrigger(hour=2, minute=0),
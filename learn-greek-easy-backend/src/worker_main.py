@@ -0,0 +1,114 @@
+"""Standalone job worker service entry point.
+
+Consumes the durable background job queue (``src.tasks.queue``) that the API
+fills when ``JOB_QUEUE_ENABLED=true``: review and culture-answer persistence,
+achievement checks, cache invalidation and announcement fan-out. It handles:
+- Redis connection (cache invalidation tasks)
+- Database pool shared by the tasks and the queue itself
+- Graceful shutdown on SIGTERM/SIGINT (the claimed batch is finished first)
+
+Usage:
+    python -m src.worker_main
+
+Railway Configuration:
+    - Start Command: python -m src.worker_main
+    - No HTTP port needed (internal service)
+    - Same FEATURE_BACKGROUND_TASKS / JOB_QUEUE_* variables as the backend
+    - Scale by adding replicas; workers share the queue via SKIP LOCKED
+"""
+
+import asyncio
+import signal
+import sys
+from types import FrameType
+from typing import Optional
+
+from src.config import settings
+from src.core.logging import get_logger, setup_logging
+from src.core.redis import close_redis, init_redis
+from src.core.sentry import init_sentry, shutdown_sentry
+from src.db import close_db, init_db
+from src.tasks.queue import JobWorker, get_job_store
+
+# Configure logging with loguru
+setup_logging()
+logger = get_logger(__name__)
+
+# Global shutdown event
+shutdown_event = asyncio.Event()
+
+
+def handle_shutdown(signum: int, frame: Optional[FrameType]) -> None:
+    """Handle shutdown signals gracefully.
+
+    Args:
+        signum: Signal number received
+        frame: Current stack frame (unused)
+    """
+    sig_name = signal.Signals(signum).name
+    logger.info(f"Received {sig_name}, initiating graceful shutdown...")
+    shutdown_event.set()
+
+
+async def main() -> None:
+    """Main job worker service entry point."""
+    logger.info("Starting job worker service...")
+
+    if not settings.feature_background_tasks or not settings.job_queue_enabled:
+        logger.warning(
+            "Job queue disabled (FEATURE_BACKGROUND_TASKS and JOB_QUEUE_ENABLED must be true)"
+        )
+        logger.warning("Job worker service will exit. Enable both flags to run.")
+        return
+
+    if settings.job_queue_backend != "postgres":
+        logger.error("Job worker needs JOB_QUEUE_BACKEND=postgres (memory is per-process)")
+        return
+
+    # Register signal handlers
+    signal.signal(signal.SIGTERM, handle_shutdown)
+    signal.signal(signal.SIGINT, handle_shutdown)
+
+    try:
+        # Initialize Sentry before any other I/O so early failures are captured
+        init_sentry()
+
+        await init_redis()
+        logger.info("Redis connection established")
+
+        # warm_min=0: pool size follows the claimed batch; no keepalive needed.
+        await init_db(warm_min=0)
+        logger.info("Database connection pool established")
+
+        worker = JobWorker(get_job_store())
+        logger.info(
+            "Job worker ready",
+            extra={"batch_size": worker.batch_size, "poll_seconds": worker.poll_seconds},
+        )
+        await worker.run(shutdown_event)
+
+    except Exception as e:
+        logger.exception(f"Job worker service error: {e}")
+        raise
+
+    finally:
+        # Flush pending Sentry events before closing connections
+        shutdown_sentry()
+
+        logger.info("Closing Redis connection...")
+        await close_redis()
+
+        logger.info("Closing database connection pool...")
+        await close_db()
+
+        logger.info("Job worker service stopped")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Job worker interrupted by user")
+    except Exception as e:
+        logger.exception(f"Fatal error: {e}")
+        sys.exit(1)
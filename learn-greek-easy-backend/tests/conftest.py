@@ -385,7 +385,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     Yields:
         AsyncClient: The test HTTP client.
     """
-    from src.db.dependencies import get_db
+    from src.db.dependencies import get_db, get_read_db
     from src.main import app
 
     # Override the get_db dependency to use our test session
@@ -393,6 +393,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -519,7 +520,12 @@ def reset_test_state() -> Generator[None, None, None]:
     Yields:
         None: Allows the test to run.
     """
-    # Setup: nothing to do yet
+    from src.core.principal import clear_principal_snapshots
+    from src.services.exercise_content_cache import reset_exercise_content_cache
+
+    # Setup: content and principals cached by an earlier test must not leak into this one
+    reset_exercise_content_cache()
+    clear_principal_snapshots()
     yield
     # Teardown: nothing to do yet (database cleanup handled by db_session)
 
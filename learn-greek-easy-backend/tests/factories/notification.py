@@ -19,8 +19,10 @@ Usage:
 """
 
 import factory
+from sqlalchemy import update
 
-from src.db.models import Notification, NotificationType
+from src.db.models import Notification, NotificationType, User
+from tests.factories import base
 from tests.factories.base import BaseFactory, utc_now
 
 
@@ -128,3 +130,15 @@ class NotificationFactory(BaseFactory):
             read=True,
             read_at=factory.LazyFunction(utc_now),
         )
+
+    @classmethod
+    async def create(cls, session=None, **kwargs):
+        """Create the notification and bump the owner's unread counter like the repository."""
+        notification = await super().create(session=session, **kwargs)
+        if not notification.read:
+            await (session or base._factory_session).execute(
+                update(User)
+                .where(User.id == notification.user_id)
+                .values(unread_notification_count=User.unread_notification_count + 1)
+            )
+        return notification
@@ -82,6 +82,22 @@ def _get_override_function():
     return override_get_current_user
 
 
+def _get_principal_override_function():
+    """Return an override for get_current_principal that reuses the user override.
+
+    The principal is built from whatever the (overridden) get_current_user
+    returns, so routes depending on either resolve the same test user.
+    """
+    from src.core.dependencies import get_current_user
+    from src.core.principal import Principal
+
+    async def override_get_current_principal(user: User = Depends(get_current_user)):
+        """Override for get_current_principal dependency in tests."""
+        return Principal.from_user(user)
+
+    return override_get_current_principal
+
+
 # =============================================================================
 # Type Definitions
 # =============================================================================
@@ -291,7 +307,7 @@ async def auth_headers(test_user) -> dict[str, str]:
             response = await client.get("/api/v1/me", headers=auth_headers)
             assert response.status_code == 200
     """
-    from src.core.dependencies import get_current_user
+    from src.core.dependencies import get_current_principal, get_current_user
     from src.main import app
 
     # Generate unique token for this user
@@ -301,6 +317,8 @@ async def auth_headers(test_user) -> dict[str, str]:
     # Set up single override function if not already set
     if get_current_user not in app.dependency_overrides:
         app.dependency_overrides[get_current_user] = _get_override_function()
+    if get_current_principal not in app.dependency_overrides:
+        app.dependency_overrides[get_current_principal] = _get_principal_override_function()
 
     # Return headers with unique token
     headers = {"Authorization": f"Bearer {token}"}
@@ -334,7 +352,7 @@ async def superuser_auth_headers(test_superuser) -> dict[str, str]:
                                           headers=superuser_auth_headers)
             assert response.status_code == 200
     """
-    from src.core.dependencies import get_current_user
+    from src.core.dependencies import get_current_principal, get_current_user
     from src.main import app
 
     # Generate unique token for this superuser
@@ -344,6 +362,8 @@ async def superuser_auth_headers(test_superuser) -> dict[str, str]:
     # Set up single override function if not already set
     if get_current_user not in app.dependency_overrides:
         app.dependency_overrides[get_current_user] = _get_override_function()
+    if get_current_principal not in app.dependency_overrides:
+        app.dependency_overrides[get_current_principal] = _get_principal_override_function()
 
     # Return headers with unique token
     headers = {"Authorization": f"Bearer {token}"}
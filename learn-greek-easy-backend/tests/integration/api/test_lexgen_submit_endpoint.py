@@ -44,7 +44,7 @@ test_lexgen_pipeline_service.py so test lemma strings pass through unchanged.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
@@ -60,6 +60,7 @@ from src.services.lexgen_fake_openrouter import FakeOpenRouter
 # ---------------------------------------------------------------------------
 
 SUBMIT_URL = "/api/v1/admin/lexgen/proposals"
+BULK_URL = "/api/v1/admin/lexgen/proposals/bulk"
 
 # Old endpoints that must be GONE after the cutover (AC: old routes removed).
 OLD_GENERATE_URL = "/api/v1/admin/word-entries/generate"
@@ -349,6 +350,55 @@ class TestSubmitAuth:
         )
 
 
+# ---------------------------------------------------------------------------
+# Bulk submit — schedules a background run
+# ---------------------------------------------------------------------------
+
+
+class TestBulkSubmit:
+    """POST /api/v1/admin/lexgen/proposals/bulk schedules run_bulk_lexgen."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_submit_schedules_deduplicated_run(
+        self,
+        client: AsyncClient,
+        superuser_auth_headers: dict,
+    ):
+        with patch("src.api.v1.admin.run_bulk_lexgen", new=AsyncMock()) as run_bulk:
+            response = await client.post(
+                BULK_URL,
+                json={"lemmas": ["σπίτι", "δρόμος", "σπίτι"], "concurrency": 2},
+                headers=superuser_auth_headers,
+            )
+
+        assert response.status_code == 202, response.text
+        assert response.json() == {"accepted": 2}
+        run_bulk.assert_awaited_once()
+        assert run_bulk.await_args.args[0] == ["σπίτι", "δρόμος"]
+        assert run_bulk.await_args.kwargs["concurrency"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_submit_conflicts_while_run_active(
+        self,
+        client: AsyncClient,
+        superuser_auth_headers: dict,
+    ):
+        with patch("src.api.v1.admin.is_bulk_run_active", return_value=True):
+            response = await client.post(
+                BULK_URL, json={"lemmas": ["σπίτι"]}, headers=superuser_auth_headers
+            )
+        assert response.status_code == 409, response.text
+
+    @pytest.mark.asyncio
+    async def test_bulk_submit_requires_superuser(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+    ):
+        response = await client.post(BULK_URL, json={"lemmas": ["σπίτι"]}, headers=auth_headers)
+        assert response.status_code == 403, response.text
+
+
 # ---------------------------------------------------------------------------
 # A4 — Old generate_word_entry endpoints removed
 # ---------------------------------------------------------------------------
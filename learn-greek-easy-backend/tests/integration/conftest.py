@@ -138,7 +138,7 @@ async def real_commit_client(
     commit/rollback boundary -- the shared `client` fixture's bare
     `yield db_session` override never calls either.
     """
-    from src.db.dependencies import get_db
+    from src.db.dependencies import get_db, get_read_db
     from src.main import app
 
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -150,6 +150,7 @@ async def real_commit_client(
             raise
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
     app.dependency_overrides.clear()
@@ -0,0 +1,141 @@
+"""Integration tests for batched evidence prefetch (bulk lexgen runner).
+
+``prefetch_evidence`` reads a whole batch with ``IN`` queries; an
+``EvidenceAssemblyService`` built with that prefetch must produce the SAME
+``EvidencePacket`` as the per-lemma query path for every shape of evidence:
+single-gender Wiktionary, common-gender Wiktionary, lemma-column and
+surface-form-only GreekLexicon hits, frequency-only, and fully absent.
+
+Requires a real Postgres db_session (tests/fixtures/database.py); reference rows
+are seeded per test and rolled back with the transaction.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import FrequencyRank, GreekLexicon, WiktionaryMorphology
+from src.schemas.nlp import NormalizedLemma
+from src.services.evidence_assembly_service import EvidenceAssemblyService, prefetch_evidence
+
+_FORMS = [
+    {"form": "σπίτι_pf", "features": {"case": "nominative", "number": "singular"}},
+    {"form": "σπιτιού_pf", "features": {"case": "genitive", "number": "singular"}},
+]
+
+
+def _patch_identity_normalize():
+    """Patch normalization so every lemma passes through unchanged."""
+    mock_norm_svc = MagicMock()
+    mock_norm_svc.normalize = MagicMock(
+        side_effect=lambda word: NormalizedLemma(
+            input_word=word, lemma=word, gender=None, article=None, pos="NOUN", confidence=1.0
+        )
+    )
+    return patch(
+        "src.services.evidence_assembly_service.get_lemma_normalization_service",
+        return_value=mock_norm_svc,
+    )
+
+
+async def _seed(db_session: AsyncSession) -> None:
+    db_session.add_all(
+        [
+            # Single-gender Wiktionary + lemma-column lexicon hit + frequency.
+            WiktionaryMorphology(
+                lemma="σπίτι_pf",
+                pos="noun",
+                gender="neuter",
+                forms=_FORMS,
+                pronunciation="ˈspi.ti",
+                glosses_en="house",
+            ),
+            GreekLexicon(
+                form="σπιτιού_pf",
+                lemma="σπίτι_pf",
+                pos="NOUN",
+                gender="Neut",
+                ptosi="Gen",
+                number="Sing",
+            ),
+            GreekLexicon(
+                form="σπίτι_pf",
+                lemma="σπίτι_pf",
+                pos="NOUN",
+                gender="Neut",
+                ptosi="Nom",
+                number="Sing",
+            ),
+            FrequencyRank(lemma="σπίτι_pf", rank=120, source="wordfreq"),
+            # Common-gender Wiktionary (two rows).
+            WiktionaryMorphology(lemma="σύζυγος_pf", pos="noun", gender="masculine", forms=[]),
+            WiktionaryMorphology(lemma="σύζυγος_pf", pos="noun", gender="feminine", forms=[]),
+            # Surface-form-only lexicon hit: "δρόμου_pf" is a form of "δρόμος_pf".
+            GreekLexicon(
+                form="δρόμου_pf",
+                lemma="δρόμος_pf",
+                pos="NOUN",
+                gender="Masc",
+                ptosi="Gen",
+                number="Sing",
+            ),
+            GreekLexicon(
+                form="δρόμος_pf",
+                lemma="δρόμος_pf",
+                pos="NOUN",
+                gender="Masc",
+                ptosi="Nom",
+                number="Sing",
+            ),
+            # Frequency-only.
+            FrequencyRank(lemma="μόνο_pf", rank=9000, source="wordfreq"),
+        ]
+    )
+    await db_session.flush()
+
+
+_LEMMAS = ["σπίτι_pf", "σύζυγος_pf", "δρόμου_pf", "μόνο_pf", "τίποτα_pf"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_packets_match_per_lemma_queries(db_session: AsyncSession) -> None:
+    await _seed(db_session)
+
+    with _patch_identity_normalize():
+        prefetch = await prefetch_evidence(db_session, _LEMMAS, "noun")
+        for lemma in _LEMMAS:
+            expected = await EvidenceAssemblyService(db_session).assemble_evidence(lemma, "noun")
+            actual = await EvidenceAssemblyService(db_session, prefetch=prefetch).assemble_evidence(
+                lemma, "noun"
+            )
+            assert actual == expected, f"prefetch packet diverged for {lemma!r}"
+
+
+@pytest.mark.asyncio
+async def test_prefetch_resolves_surface_form_declensions(db_session: AsyncSession) -> None:
+    await _seed(db_session)
+
+    prefetch = await prefetch_evidence(db_session, ["δρόμου_pf"], "noun")
+
+    assert prefetch.lexicon_hits["δρόμου_pf"] == ("δρόμος_pf", False)
+    assert [e.form for e in prefetch.lexicon_declensions["δρόμος_pf"]] == [
+        "δρόμος_pf",
+        "δρόμου_pf",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_uncovered_lemma_falls_back_to_queries(db_session: AsyncSession) -> None:
+    await _seed(db_session)
+
+    with _patch_identity_normalize():
+        prefetch = await prefetch_evidence(db_session, ["μόνο_pf"], "noun")
+        packet = await EvidenceAssemblyService(db_session, prefetch=prefetch).assemble_evidence(
+            "σπίτι_pf", "noun"
+        )
+
+    assert packet.sources.wiktionary.present is True
+    assert packet.sources.frequency.rank == 120
@@ -191,6 +191,13 @@ async def test_run_for_lemma_attested_routes_to_needs_review(
     assert (
         proposal.reconciliation_log is not None
     ), "reconciliation_log must be non-null after the full attested pipeline"
+    assert set(proposal.stage_timings) == {
+        "assemble_ms",
+        "generate_ms",
+        "verify_ms",
+        "reconcile_ms",
+        "judge_ms",
+    }, f"Every stage must record a timing; got {proposal.stage_timings!r}"
 
 
 # ---------------------------------------------------------------------------
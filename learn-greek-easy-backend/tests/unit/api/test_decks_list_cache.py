@@ -7,6 +7,7 @@ so we use create=True on the patch; the RED condition is that setex is not
 called (miss/key tests) or repo is called more than once (hit tests).
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -33,6 +34,12 @@ def _make_mock_user():
     return user
 
 
+def _make_request(etag: str | None = None):
+    """Request stand-in; ``etag`` as set by the conditional GET dependency."""
+    state = SimpleNamespace() if etag is None else SimpleNamespace(content_etag=etag)
+    return SimpleNamespace(state=state)
+
+
 def _make_real_cache(mock_redis) -> CacheService:
     return CacheService(redis_client=mock_redis)
 
@@ -101,6 +108,7 @@ class TestListDecksCacheRed:
         ):
             _wire_repo_empty(mock_repo_cls)
             result = await list_decks(
+                request=_make_request(),
                 page=1,
                 page_size=20,
                 level=None,
@@ -121,6 +129,35 @@ class TestListDecksCacheRed:
         assert actual_key == expected_key, f"Wrong cache key: {actual_key!r}"
         assert actual_ttl == 300, f"Wrong TTL: {actual_ttl}"
 
+    async def test_list_decks_keys_entry_by_conditional_get_etag(self):
+        """With an ETag computed for the request, the entry is keyed by it.
+
+        A body cached before a catalog write then cannot be served under the
+        new ETag (and revalidated with 304s until the ETag rotates).
+        """
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = None
+
+        with (
+            _make_cache_settings_patch(),
+            patch("src.api.v1.decks.get_cache", return_value=_make_real_cache(mock_redis)),
+            patch("src.api.v1.decks.DeckRepository") as mock_repo_cls,
+            patch("src.api.v1.decks.get_s3_service", return_value=MagicMock()),
+        ):
+            _wire_repo_empty(mock_repo_cls)
+            await list_decks(
+                request=_make_request('"abc123"'),
+                page=1,
+                page_size=20,
+                level=None,
+                locale="en",
+                db=_make_mock_db(),
+                current_user=_make_mock_user(),
+            )
+
+        actual_key = mock_redis.setex.call_args[0][0]
+        assert actual_key == "cache:decks:list:en:all:1:20:abc123"
+
     async def test_list_decks_hit_skips_repo_fanout(self):
         """Cache hit: repo.list_active must not be called a second time.
 
@@ -156,10 +193,22 @@ class TestListDecksCacheRed:
             mock_repo = _wire_repo_empty(mock_repo_cls)
             # Call twice; second should be a cache hit → list_active not called again
             await list_decks(
-                page=1, page_size=20, level=None, locale="en", db=db, current_user=user
+                request=_make_request(),
+                page=1,
+                page_size=20,
+                level=None,
+                locale="en",
+                db=db,
+                current_user=user,
             )
             await list_decks(
-                page=1, page_size=20, level=None, locale="en", db=db, current_user=user
+                request=_make_request(),
+                page=1,
+                page_size=20,
+                level=None,
+                locale="en",
+                db=db,
+                current_user=user,
             )
 
         # RED: 2 calls pre-impl (no caching); post-impl must be 1 (or 0 if factory-lazy)
@@ -201,7 +250,13 @@ class TestListDecksCacheRed:
         ):
             mock_repo = _wire_repo_empty(mock_repo_cls)
             result = await list_decks(
-                page=1, page_size=20, level=None, locale="en", db=db, current_user=user
+                request=_make_request(),
+                page=1,
+                page_size=20,
+                level=None,
+                locale="en",
+                db=db,
+                current_user=user,
             )
 
         # Must return valid DeckListResponse (no exception)
@@ -250,6 +305,7 @@ class TestListDecksCacheRed:
 
             # Call 1: level=A1, locale=ru, page=2, page_size=5
             await list_decks(
+                request=_make_request(),
                 page=2,
                 page_size=5,
                 level=DeckLevel.A1,
@@ -259,6 +315,7 @@ class TestListDecksCacheRed:
             )
             # Call 2: level=None (→ "all"), locale=ru, page=1, page_size=20
             await list_decks(
+                request=_make_request(),
                 page=1,
                 page_size=20,
                 level=None,
@@ -347,6 +404,7 @@ class TestListDecksNoneGuardSurfacesRealError:
 
             with pytest.raises(RuntimeError, match="simulated DB failure") as exc_info:
                 await list_decks(
+                    request=_make_request(),
                     page=1,
                     page_size=20,
                     level=None,
@@ -533,7 +591,13 @@ class TestListDecksCorruptCacheFallback:
         ):
             mock_repo = _wire_repo_empty(mock_repo_cls)
             result = await list_decks(
-                page=1, page_size=20, level=None, locale="en", db=db, current_user=user
+                request=_make_request(),
+                page=1,
+                page_size=20,
+                level=None,
+                locale="en",
+                db=db,
+                current_user=user,
             )
 
         # Must return a valid DeckListResponse (fallback recompute ran)
@@ -56,8 +56,12 @@ def _valid_review_body(card_record_id=None) -> dict:
 class TestSubmitV2Review:
     @pytest.mark.asyncio
     async def test_404_for_nonexistent_card_record(self, client, auth_headers):
-        with patch("src.api.v1.reviews_v2.CardRecordRepository") as mock_repo_cls:
+        with (
+            patch("src.api.v1.reviews_v2.CardRecordRepository") as mock_repo_cls,
+            patch("src.api.v1.reviews_v2.settings") as mock_settings,
+        ):
             mock_repo_cls.return_value.get = AsyncMock(return_value=None)
+            mock_settings.review_fused_write_path = False
             response = await client.post(
                 "/api/v1/reviews/v2",
                 json=_valid_review_body(),
@@ -107,6 +111,7 @@ class TestSubmitV2Review:
             )
             mock_service_cls.return_value.persist_review = AsyncMock()
             mock_settings.feature_background_tasks = False
+            mock_settings.review_fused_write_path = False
 
             response = await client.post(
                 "/api/v1/reviews/v2",
@@ -136,6 +141,7 @@ class TestSubmitV2Review:
                 return_value=(_make_v2_review_result(), _make_review_context())
             )
             mock_settings.feature_background_tasks = True
+            mock_settings.review_fused_write_path = False
 
             response = await client.post(
                 "/api/v1/reviews/v2",
@@ -164,6 +170,7 @@ class TestSubmitV2Review:
             )
             mock_service_cls.return_value.persist_review = AsyncMock()
             mock_settings.feature_background_tasks = False
+            mock_settings.review_fused_write_path = False
 
             response = await client.post(
                 "/api/v1/reviews/v2",
@@ -183,8 +190,10 @@ class TestSubmitV2Review:
         with (
             patch("src.api.v1.reviews_v2.CardRecordRepository") as mock_repo_cls,
             patch("src.api.v1.reviews_v2.check_premium_deck_access") as mock_premium,
+            patch("src.api.v1.reviews_v2.settings") as mock_settings,
         ):
             mock_repo_cls.return_value.get = AsyncMock(return_value=mock_card_record)
+            mock_settings.review_fused_write_path = False
             mock_premium.side_effect = FastAPIHTTPException(
                 status_code=403, detail="Premium required"
             )
@@ -219,6 +228,7 @@ class TestSubmitV2Review:
                 return_value=(_make_v2_review_result(), _make_review_context())
             )
             mock_settings.feature_background_tasks = True
+            mock_settings.review_fused_write_path = False
 
             response = await client.post(
                 "/api/v1/reviews/v2",
@@ -251,6 +261,7 @@ class TestSubmitV2Review:
             )
             mock_service_cls.return_value.persist_review = AsyncMock()
             mock_settings.feature_background_tasks = False
+            mock_settings.review_fused_write_path = False
 
             response = await client.post(
                 "/api/v1/reviews/v2",
@@ -297,6 +308,7 @@ class TestSubmitV2Review:
                 return_value=(_make_v2_review_result(), review_ctx)
             )
             mock_settings.feature_background_tasks = True
+            mock_settings.review_fused_write_path = False
 
             response = await client.post(
                 "/api/v1/reviews/v2",
@@ -317,3 +329,38 @@ class TestSubmitV2Review:
         assert call_kwargs.get("cache_type") == "progress"
         assert call_kwargs.get("user_id") == test_user.id
         assert call_kwargs.get("entity_id") == UUID(deck_id_str)
+
+
+@pytest.mark.unit
+@pytest.mark.api
+class TestSubmitV2ReviewFused:
+    @pytest.mark.asyncio
+    async def test_fused_path_dispatches_coalesced_reconcile(self, client, auth_headers, test_user):
+        from src.tasks import check_achievements_task
+
+        state = MagicMock(deck_id=uuid4())
+
+        with (
+            patch("src.api.v1.reviews_v2.ReviewPipeline") as mock_pipeline_cls,
+            patch("src.api.v1.reviews_v2.persist_deck_review_task") as mock_persist_task,
+            patch("src.api.v1.reviews_v2.settings") as mock_settings,
+            patch("starlette.background.BackgroundTasks.add_task") as mock_add_task,
+        ):
+            mock_pipeline_cls.return_value.submit = AsyncMock(
+                return_value=(_make_v2_review_result(), state)
+            )
+            mock_settings.review_fused_write_path = True
+            mock_settings.feature_background_tasks = True
+            mock_settings.job_queue_enabled = False
+
+            response = await client.post(
+                "/api/v1/reviews/v2",
+                json=_valid_review_body(),
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        scheduled = {call.args[0]: call.kwargs for call in mock_add_task.call_args_list}
+        assert mock_persist_task not in scheduled
+        assert scheduled[check_achievements_task] == {"user_id": test_user.id}
+        assert scheduled[invalidate_cache_task]["entity_id"] == state.deck_id
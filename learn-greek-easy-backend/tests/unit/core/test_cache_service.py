@@ -13,6 +13,7 @@ import pytest
 from src.core.cache import (
     _SINGLE_FLIGHT_RELEASE_LUA,
     CacheService,
+    ExpiringLRU,
     cached,
     get_cache,
     reset_cache,
@@ -1376,3 +1377,49 @@ class TestGlobalCacheInstance:
         assert cache is not None
         assert isinstance(cache, CacheService)
         reset_cache()
+
+
+class TestExpiringLRU:
+    """Test suite for the in-process ExpiringLRU."""
+
+    def test_get_returns_value_until_expiry(self):
+        lru: ExpiringLRU[str] = ExpiringLRU(max_size=4)
+        lru.set("a", "value", time.time() + 60)
+
+        assert lru.get("a") == "value"
+
+        with patch("src.core.cache.time.time", return_value=time.time() + 61):
+            assert lru.get("a") is None
+        assert len(lru) == 0
+
+    def test_evicts_least_recently_used(self):
+        lru: ExpiringLRU[int] = ExpiringLRU(max_size=2)
+        expires_at = time.time() + 60
+        lru.set("a", 1, expires_at)
+        lru.set("b", 2, expires_at)
+        lru.get("a")
+        lru.set("c", 3, expires_at)
+
+        assert lru.get("b") is None
+        assert (lru.get("a"), lru.get("c")) == (1, 3)
+
+    def test_already_expired_and_zero_size_are_not_stored(self):
+        lru: ExpiringLRU[int] = ExpiringLRU(max_size=2)
+        lru.set("a", 1, time.time() - 1)
+        disabled: ExpiringLRU[int] = ExpiringLRU(max_size=0)
+        disabled.set("a", 1, time.time() + 60)
+
+        assert len(lru) == 0
+        assert len(disabled) == 0
+
+    def test_pop_and_clear(self):
+        lru: ExpiringLRU[int] = ExpiringLRU(max_size=2)
+        expires_at = time.time() + 60
+        lru.set("a", 1, expires_at)
+        lru.set("b", 2, expires_at)
+
+        lru.pop("a")
+        lru.pop("missing")
+        assert lru.get("a") is None
+        lru.clear()
+        assert len(lru) == 0
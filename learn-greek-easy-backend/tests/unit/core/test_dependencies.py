@@ -4,6 +4,7 @@ Tests cover:
 - get_current_user: Supabase token verification + auto-provisioning
 - get_current_superuser: Superuser privilege check
 - get_current_user_optional: Optional authentication for mixed endpoints
+- get_current_principal: snapshot fast path for read-only endpoints
 - get_or_create_user (cache): read-through cache over supabase_id resolution (PERF-05-05)
 """
 
@@ -17,12 +18,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
 from src.core.dependencies import (
+    get_current_principal,
     get_current_superuser,
     get_current_user,
     get_current_user_optional,
     get_or_create_user,
 )
 from src.core.exceptions import ForbiddenException, UnauthorizedException
+from src.core.principal import Principal, forget_principal, get_principal_snapshot
 from src.core.supabase_auth import SupabaseUserClaims
 
 
@@ -265,6 +268,72 @@ class TestGetCurrentUser:
         assert mock_request.state.current_user is mock_user
 
 
+class TestGetCurrentPrincipal:
+    """Tests for get_current_principal dependency."""
+
+    @pytest.mark.asyncio
+    async def test_miss_resolves_user_and_snapshots_principal(
+        self, mock_request, valid_credentials, valid_claims, mock_user
+    ):
+        """A first request goes through get_or_create_user and remembers the principal."""
+        mock_user.supabase_id = valid_claims.supabase_id
+
+        with (
+            patch("src.core.dependencies.verify_supabase_token", return_value=valid_claims),
+            patch("src.core.dependencies.get_or_create_user") as mock_get_or_create,
+        ):
+            mock_get_or_create.return_value = mock_user
+            principal = await get_current_principal(mock_request, valid_credentials, AsyncMock())
+
+        assert principal == Principal.from_user(mock_user)
+        assert get_principal_snapshot(valid_claims.supabase_id) == principal
+        forget_principal(valid_claims.supabase_id)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_hit_skips_user_lookup(
+        self, mock_request, valid_credentials, valid_claims, mock_user
+    ):
+        """A fresh snapshot answers without get_or_create_user or the session."""
+        mock_user.supabase_id = valid_claims.supabase_id
+        snapshot = Principal.from_user(mock_user)
+        mock_db = AsyncMock()
+
+        with (
+            patch("src.core.dependencies.verify_supabase_token", return_value=valid_claims),
+            patch("src.core.dependencies.get_principal_snapshot", return_value=snapshot),
+            patch("src.core.dependencies.get_or_create_user") as mock_get_or_create,
+        ):
+            principal = await get_current_principal(mock_request, valid_credentials, mock_db)
+
+        assert principal is snapshot
+        assert mock_request.state.current_principal is snapshot
+        assert mock_request.state.user_email == snapshot.email
+        mock_get_or_create.assert_not_called()
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_credentials_raises_401(self, mock_request):
+        """Missing credentials are rejected before any snapshot lookup."""
+        with pytest.raises(UnauthorizedException):
+            await get_current_principal(mock_request, None, AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_is_not_snapshotted(
+        self, mock_request, valid_credentials, valid_claims, mock_inactive_user
+    ):
+        """A deactivated account is rejected and leaves no snapshot behind."""
+        mock_inactive_user.supabase_id = valid_claims.supabase_id
+
+        with (
+            patch("src.core.dependencies.verify_supabase_token", return_value=valid_claims),
+            patch("src.core.dependencies.get_or_create_user", return_value=mock_inactive_user),
+        ):
+            with pytest.raises(UnauthorizedException):
+                await get_current_principal(mock_request, valid_credentials, AsyncMock())
+
+        assert get_principal_snapshot(valid_claims.supabase_id) is None
+
+
 # ============================================================================
 # get_current_user_optional Tests
 # ============================================================================
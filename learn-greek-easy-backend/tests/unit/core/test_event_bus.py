@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
 import pytest
 
-from src.core.event_bus import NotificationEvent, NotificationEventBus
+from src.core.event_bus import RELAY_CHANNEL, NotificationEvent, NotificationEventBus
 
 
 def _make_event(user_id: UUID, event_type: str = "unread_count") -> NotificationEvent:
@@ -99,3 +101,64 @@ class TestNotificationEventBus:
 
         await asyncio.gather(*[sub_unsub() for _ in range(50)])
         assert user_id not in bus._subscribers
+
+
+class TestNotificationEventBusRelay:
+    """Cross-worker delivery through the Redis relay."""
+
+    @pytest.mark.asyncio
+    async def test_signal_publishes_when_relay_running(self) -> None:
+        bus = NotificationEventBus()
+        redis = MagicMock()
+        redis.publish = AsyncMock()
+        bus._relay_redis = redis
+        user_id = uuid4()
+
+        await bus.signal(user_id, _make_event(user_id))
+
+        channel, data = redis.publish.await_args.args
+        assert channel == RELAY_CHANNEL
+        assert json.loads(data)["user_id"] == str(user_id)
+
+    @pytest.mark.asyncio
+    async def test_relayed_event_reaches_local_subscriber(self) -> None:
+        publisher, receiver = NotificationEventBus(), NotificationEventBus()
+        redis = MagicMock()
+        redis.publish = AsyncMock()
+        publisher._relay_redis = redis
+        user_id = uuid4()
+        queue = await receiver.subscribe(user_id)
+
+        await publisher.signal(user_id, _make_event(user_id))
+        await receiver.handle_relay_message(redis.publish.await_args.args[1])
+
+        event = queue.get_nowait()
+        assert event.user_id == user_id
+        assert event.payload == {"count": 1}
+
+    @pytest.mark.asyncio
+    async def test_own_relayed_event_is_not_delivered_twice(self) -> None:
+        bus = NotificationEventBus()
+        redis = MagicMock()
+        redis.publish = AsyncMock()
+        bus._relay_redis = redis
+        user_id = uuid4()
+        queue = await bus.subscribe(user_id)
+
+        await bus.signal(user_id, _make_event(user_id))
+        await bus.handle_relay_message(redis.publish.await_args.args[1])
+
+        assert queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_drops_subscribers_and_relay(self) -> None:
+        bus = NotificationEventBus()
+        await bus.subscribe(uuid4())
+        bus._relay_redis = MagicMock()
+        origin = bus._origin
+
+        bus.reset()
+
+        assert bus._subscribers == {}
+        assert bus._relay_redis is None
+        assert bus._origin != origin
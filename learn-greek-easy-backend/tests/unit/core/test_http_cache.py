@@ -0,0 +1,222 @@
+"""Unit tests for conditional GET on catalog endpoints (src.core.http_cache).
+
+Tests cover:
+- ETag derivation from path, query, locale, user and content version
+- If-None-Match matching (lists, weak tags, wildcard)
+- 304 before the endpoint body runs, with ETag and Cache-Control
+- Loader opt-out (None) and the settings kill switch
+- Version statements compile to one SELECT
+- Deck detail loader skips decks the user cannot read
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import Depends, FastAPI, Request, Response, status
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from src.api.v1.decks import _deck_detail_version
+from src.config import settings
+from src.core.dependencies import get_current_user
+from src.core.http_cache import (
+    NotModified,
+    compute_etag,
+    conditional_get,
+    content_etag,
+    if_none_match,
+    version_statement,
+)
+from src.db.dependencies import get_db
+from src.db.models import ChangelogEntry, Deck
+
+
+def _request(path: str = "/decks", query: bytes = b"", headers: list | None = None) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query,
+            "headers": headers or [],
+        }
+    )
+
+
+class TestComputeEtag:
+    def test_quoted_and_stable(self):
+        first = compute_etag(_request(), (3, "2026-01-01"))
+        assert first.startswith('"') and first.endswith('"')
+        assert first == compute_etag(_request(), (3, "2026-01-01"))
+
+    def test_varies_with_version_query_locale_and_user(self):
+        base = compute_etag(_request(), (3,))
+        assert compute_etag(_request(), (4,)) != base
+        assert compute_etag(_request(query=b"page=2"), (3,)) != base
+        assert compute_etag(_request(headers=[(b"accept-language", b"el")]), (3,)) != base
+        assert compute_etag(_request(), (3,), user_id=uuid4()) != base
+
+    def test_query_order_does_not_matter(self):
+        assert compute_etag(_request(query=b"a=1&b=2"), (1,)) == compute_etag(
+            _request(query=b"b=2&a=1"), (1,)
+        )
+
+    def test_rotates_with_epoch(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "http_etag_rotation_seconds", 60)
+        monkeypatch.setattr("src.core.http_cache.time.time", lambda: 100.0)
+        before = compute_etag(_request(), (1,))
+        monkeypatch.setattr("src.core.http_cache.time.time", lambda: 130.0)
+        assert compute_etag(_request(), (1,)) != before
+
+
+class TestIfNoneMatch:
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (None, False),
+            ("", False),
+            ('"abc"', True),
+            ('"x", "abc"', True),
+            ('W/"abc"', True),
+            ("*", True),
+            ('"other"', False),
+        ],
+    )
+    def test_matching(self, header, expected):
+        assert if_none_match(header, '"abc"') is expected
+
+
+class TestConditionalGet:
+    @pytest.fixture
+    def state(self) -> SimpleNamespace:
+        return SimpleNamespace(version=(1, "v1"), body_calls=0)
+
+    @pytest.fixture
+    def client(self, state: SimpleNamespace) -> TestClient:
+        user = SimpleNamespace(id=uuid4())
+
+        async def loader(request: Request, db, current_user):
+            return state.version
+
+        app = FastAPI()
+
+        @app.exception_handler(NotModified)
+        async def not_modified(request: Request, exc: NotModified) -> Response:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
+        @app.get(
+            "/catalog",
+            dependencies=[Depends(conditional_get(loader, cache_control="private, max-age=60"))],
+        )
+        async def catalog(request: Request):
+            state.body_calls += 1
+            state.content_etag = content_etag(request)
+            return {"items": [1, 2, 3]}
+
+        async def _db():
+            yield None
+
+        app.dependency_overrides[get_db] = _db
+        app.dependency_overrides[get_current_user] = lambda: user
+        return TestClient(app)
+
+    def test_first_request_sets_headers(self, client: TestClient, state: SimpleNamespace):
+        response = client.get("/catalog")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Cache-Control"] == "private, max-age=60"
+        assert response.headers["Vary"] == "Accept-Language"
+        assert state.body_calls == 1
+        assert state.content_etag == response.headers["ETag"]
+
+    def test_matching_etag_skips_body(self, client: TestClient, state: SimpleNamespace):
+        etag = client.get("/catalog").headers["ETag"]
+
+        response = client.get("/catalog", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "private, max-age=60"
+        assert state.body_calls == 1
+
+    def test_changed_version_serves_body(self, client: TestClient, state: SimpleNamespace):
+        etag = client.get("/catalog").headers["ETag"]
+        state.version = (2, "v2")
+
+        response = client.get("/catalog", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert state.body_calls == 2
+
+    def test_loader_none_skips_conditional(self, client: TestClient, state: SimpleNamespace):
+        state.version = None
+
+        response = client.get("/catalog", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+    def test_disabled_by_setting(
+        self, client: TestClient, state: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+    ):
+        etag = client.get("/catalog").headers["ETag"]
+        monkeypatch.setattr(settings, "http_conditional_get", False)
+
+        response = client.get("/catalog", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+
+class TestVersionStatement:
+    def test_single_select_with_count_and_max_per_model(self):
+        sql = str(version_statement((Deck, ChangelogEntry)).compile(dialect=postgresql.dialect()))
+
+        assert sql.count("count(*)") == 2
+        assert "max(decks.updated_at)" in sql
+        assert "max(changelog_entries.updated_at)" in sql
+
+
+class TestDeckDetailVersion:
+    """The deck detail loader must not answer 304 for a deck the user cannot read."""
+
+    @staticmethod
+    def _db(row):
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    async def test_system_deck_has_version(self):
+        deck_id = uuid4()
+        request = _request(path=f"/decks/{deck_id}")
+        request.scope["path_params"] = {"deck_id": str(deck_id)}
+        row = MagicMock(is_active=True, owner_id=None)
+        row.__iter__.return_value = iter(("2026-01-01", True, None, 3, "2026-01-02"))
+
+        version = await _deck_detail_version(request, self._db(row), SimpleNamespace(id=uuid4()))
+
+        assert version == ("2026-01-01", True, None, 3, "2026-01-02")
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            None,
+            MagicMock(is_active=False, owner_id=None),
+            MagicMock(is_active=True, owner_id=uuid4()),
+        ],
+    )
+    async def test_unreadable_deck_skips(self, row):
+        deck_id = uuid4()
+        request = _request(path=f"/decks/{deck_id}")
+        request.scope["path_params"] = {"deck_id": str(deck_id)}
+
+        version = await _deck_detail_version(request, self._db(row), SimpleNamespace(id=uuid4()))
+
+        assert version is None
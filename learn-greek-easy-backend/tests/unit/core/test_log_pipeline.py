@@ -0,0 +1,219 @@
+"""Unit tests for the asynchronous, sampled log pipeline (src.core.log_pipeline).
+
+Tests cover:
+- Records are written as loguru-shaped JSON by the writer thread
+- Level and route sampling below WARNING, never at WARNING and above
+- Rate-limited dedup per request scope, suppressed count carried on the next window
+- Queue-full drops are counted instead of blocking
+- Drop counters are reported as a JSON line
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from src.core import log_pipeline
+from src.core.log_pipeline import LogPipeline, _request_scope
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def attach():
+    """Attach pipelines to loguru for one test; remove and stop them afterwards."""
+    attached: list[tuple[int, LogPipeline]] = []
+
+    def _attach(pipeline: LogPipeline, *, start: bool = True) -> LogPipeline:
+        handler_id = logger.add(
+            pipeline.enqueue, filter=pipeline.admit, format="{message}", level="DEBUG"
+        )
+        attached.append((handler_id, pipeline))
+        if start:
+            pipeline.start()
+        return pipeline
+
+    yield _attach
+    for handler_id, pipeline in attached:
+        logger.remove(handler_id)
+        pipeline.stop()
+
+
+def _lines(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestWriter:
+    def test_writes_loguru_serialize_shape(self, attach):
+        stream = io.StringIO()
+        pipeline = attach(LogPipeline(stream, queue_size=100))
+
+        logger.bind(request_id="abc").info("hello {}", "world")
+        pipeline.stop()
+
+        (line,) = _lines(stream)
+        assert line["record"]["message"] == "hello world"
+        assert line["record"]["level"]["name"] == "INFO"
+        assert line["record"]["extra"] == {"request_id": "abc"}
+        assert " | INFO     | " in line["text"]
+        assert line["text"].endswith("hello world\n")
+        assert pipeline.stats().written == 1
+
+    def test_exception_is_flagged(self, attach):
+        stream = io.StringIO()
+        pipeline = attach(LogPipeline(stream, queue_size=100))
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        pipeline.stop()
+
+        (line,) = _lines(stream)
+        assert line["record"]["exception"]["type"] == "ValueError"
+        assert "Traceback" in line["text"]
+
+    def test_full_queue_drops_without_blocking(self, attach):
+        stream = io.StringIO()
+        pipeline = attach(LogPipeline(stream, queue_size=2), start=False)
+
+        for i in range(5):
+            logger.info("record {}", i)
+
+        stats = pipeline.stats()
+        assert stats.enqueued == 2
+        assert stats.dropped_queue_full == 3
+        pipeline.start()
+        pipeline.stop()
+        assert len(_lines(stream)) == 2
+
+    def test_reports_drop_counters(self, attach):
+        stream = io.StringIO()
+        pipeline = attach(
+            LogPipeline(stream, queue_size=100, level_rates={"DEBUG": 0.0}, report_seconds=60)
+        )
+
+        logger.debug("sampled out")
+        pipeline.stop()
+
+        (report,) = _lines(stream)
+        assert report["log_pipeline"]["dropped_sampled"] == 1
+
+
+class TestSampling:
+    def test_level_rate(self, attach):
+        stream = io.StringIO()
+        pipeline = attach(LogPipeline(stream, queue_size=100, level_rates={"info": 0.0}))
+
+        logger.info("dropped")
+        logger.debug("kept")
+        logger.warning("kept")
+        pipeline.stop()
+
+        assert [line["record"]["level"]["name"] for line in _lines(stream)] == [
+            "DEBUG",
+            "WARNING",
+        ]
+        assert pipeline.stats().dropped_sampled == 1
+
+    def test_unsampled_request_keeps_warnings_only(self, attach):
+        stream = io.StringIO()
+        pipeline = attach(LogPipeline(stream, queue_size=100))
+
+        token = _request_scope.set((False, 1))
+        try:
+            logger.info("dropped")
+            logger.error("kept")
+        finally:
+            _request_scope.reset(token)
+        pipeline.stop()
+
+        assert [line["record"]["message"] for line in _lines(stream)] == ["kept"]
+
+    def test_route_rate_longest_prefix(self):
+        pipeline = LogPipeline(
+            io.StringIO(),
+            queue_size=1,
+            route_rates={"/api/v1": 0.5, "/api/v1/study": 0.1},
+        )
+
+        assert pipeline.route_rate("/api/v1/study/queue") == 0.1
+        assert pipeline.route_rate("/api/v1/decks") == 0.5
+        assert pipeline.route_rate("/health") == 1.0
+
+    def test_begin_request_sampling_uses_installed_pipeline(self, monkeypatch):
+        pipeline = LogPipeline(io.StringIO(), queue_size=1, route_rates={"/noisy": 0.0})
+        monkeypatch.setattr(log_pipeline, "_pipeline", pipeline)
+
+        token = log_pipeline.begin_request_sampling("/noisy/endpoint")
+        try:
+            assert _request_scope.get()[0] is False
+        finally:
+            log_pipeline.end_request_sampling(token)
+        assert _request_scope.get() == (True, 0)
+
+    def test_begin_request_sampling_without_pipeline(self, monkeypatch):
+        monkeypatch.setattr(log_pipeline, "_pipeline", None)
+
+        assert log_pipeline.begin_request_sampling("/anything") is None
+
+
+class TestDedup:
+    @staticmethod
+    def _record(message: str = "same", **extra: object) -> dict:
+        return {
+            "level": SimpleNamespace(no=20, name="INFO"),
+            "name": "mod",
+            "line": 1,
+            "message": message,
+            "extra": extra,
+        }
+
+    def test_suppresses_after_burst_and_carries_count(self):
+        clock = _Clock()
+        pipeline = LogPipeline(
+            io.StringIO(), queue_size=1, dedup_window_seconds=10, dedup_burst=2, clock=clock
+        )
+
+        admitted = [pipeline.admit(self._record()) for _ in range(5)]
+        assert admitted == [True, True, False, False, False]
+        assert pipeline.admit(self._record("other")) is True
+        assert pipeline.stats().suppressed_duplicates == 3
+
+        clock.now = 10.0
+        record = self._record()
+        assert pipeline.admit(record) is True
+        assert record["extra"]["suppressed_duplicates"] == 3
+
+    def test_scoped_per_request(self):
+        pipeline = LogPipeline(io.StringIO(), queue_size=1, dedup_window_seconds=10, dedup_burst=1)
+
+        for scope in (1, 2, 3):
+            token = _request_scope.set((True, scope))
+            try:
+                assert pipeline.admit(self._record()) is True
+                assert pipeline.admit(self._record()) is False
+            finally:
+                _request_scope.reset(token)
+
+    def test_extras_are_part_of_the_key(self):
+        pipeline = LogPipeline(io.StringIO(), queue_size=1, dedup_window_seconds=10, dedup_burst=1)
+
+        assert all(
+            pipeline.admit(self._record("ANALYTICS: review_completed", user_id=str(i)))
+            for i in range(50)
+        )
+        assert pipeline.admit(self._record("ANALYTICS: review_completed", user_id="1")) is False
+
+    def test_disabled_with_zero_burst(self):
+        pipeline = LogPipeline(io.StringIO(), queue_size=1, dedup_burst=0)
+
+        assert all(pipeline.admit(self._record()) for _ in range(100))
@@ -0,0 +1,106 @@
+"""Unit tests for the vectorized SM-2 engine (src.core.sm2_batch).
+
+The batch functions must match the scalar ones in src.core.sm2 exactly —
+same floats, same rounding — for single steps and for replayed histories
+with interleaved cards.
+"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from src.core.sm2 import DEFAULT_EASINESS_FACTOR, calculate_sm2
+from src.core.sm2_batch import (
+    STATUS_BY_CODE,
+    STATUS_NEW,
+    SM2BatchState,
+    calculate_sm2_batch,
+    replay_reviews,
+)
+from src.db.models import CardStatus
+
+
+def _scalar_replay(history: list[int]) -> tuple[float, int, int, CardStatus]:
+    ef, interval, reps, status = DEFAULT_EASINESS_FACTOR, 0, 0, CardStatus.NEW
+    for quality in history:
+        result = calculate_sm2(ef, interval, reps, quality)
+        ef, interval, reps = result.new_easiness_factor, result.new_interval, result.new_repetitions
+        status = result.new_status
+    return ef, interval, reps, status
+
+
+@pytest.mark.unit
+@pytest.mark.sm2
+class TestCalculateSM2Batch:
+    def test_matches_scalar_on_every_input_combination(self):
+        grid = list(
+            itertools.product(
+                [1.3, 1.7, 2.1, 2.3, 2.36, 2.5, 2.8], [0, 1, 6, 15, 20, 21, 37], range(6), range(6)
+            )
+        )
+        ef, interval, reps, quality = (np.array(column) for column in zip(*grid))
+
+        new_ef, new_interval, new_reps, status = calculate_sm2_batch(ef, interval, reps, quality)
+
+        for i, args in enumerate(grid):
+            expected = calculate_sm2(*args)
+            assert float(new_ef[i]) == expected.new_easiness_factor
+            assert int(new_interval[i]) == expected.new_interval
+            assert int(new_reps[i]) == expected.new_repetitions
+            assert STATUS_BY_CODE[status[i]] == expected.new_status
+
+    def test_rounds_half_to_even_like_round(self):
+        # 5 * 2.5 = 12.5 and 7 * 2.5 = 17.5: round() gives 12 and 18
+        _, interval, _, _ = calculate_sm2_batch(
+            np.array([2.4, 2.4]), np.array([5, 7]), np.array([2, 2]), np.array([5, 5])
+        )
+
+        assert interval.tolist() == [round(5 * 2.5), round(7 * 2.5)]
+
+    def test_rejects_out_of_range_quality(self):
+        with pytest.raises(ValueError, match="Quality must be 0-5, got 6"):
+            calculate_sm2_batch(np.array([2.5]), np.array([0]), np.array([0]), np.array([6]))
+
+
+@pytest.mark.unit
+@pytest.mark.sm2
+class TestReplayReviews:
+    def test_matches_scalar_replay_with_interleaved_cards(self):
+        rng = random.Random(7)
+        histories = [[rng.randint(0, 5) for _ in range(rng.randint(0, 30))] for _ in range(500)]
+        reviews = [
+            (day * 1000 + card, card, quality)
+            for card, history in enumerate(histories)
+            for day, quality in enumerate(history)
+        ]
+        reviews.sort()  # by time: cards interleave
+        _, card_index, quality = (np.array(column) for column in zip(*reviews))
+
+        state = replay_reviews(card_index, quality, np.zeros_like(card_index), len(histories))
+
+        for card, history in enumerate(histories):
+            ef, interval, reps, status = _scalar_replay(history)
+            assert float(state.easiness_factor[card]) == ef
+            assert int(state.interval[card]) == interval
+            assert int(state.repetitions[card]) == reps
+            assert state.statuses()[card] == status
+
+    def test_tracks_last_review_day_and_leaves_unreviewed_cards_new(self):
+        state = replay_reviews(
+            np.array([0, 2, 0]), np.array([4, 5, 4]), np.array([10, 11, 12]), num_cards=3
+        )
+
+        assert state.last_review_day.tolist() == [12, -1, 11]
+        assert state.status[2] != STATUS_NEW
+        assert state.status[1] == STATUS_NEW
+        assert float(state.easiness_factor[1]) == DEFAULT_EASINESS_FACTOR
+
+    def test_does_not_modify_initial_state(self):
+        initial = SM2BatchState.new(1)
+
+        state = replay_reviews(np.array([0]), np.array([5]), np.array([1]), 1, initial=initial)
+
+        assert int(initial.repetitions[0]) == 0
+        assert int(state.repetitions[0]) == 1
@@ -8,6 +8,7 @@ Tests cover:
 - JWKS endpoint failures (timeout, error)
 - Key rotation and retry logic
 - Cache behavior (hit, miss, expiry, invalidate)
+- Verified-token cache and unknown-kid refresh
 - Email extraction from token claims
 """
 
@@ -22,6 +23,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
+from src.core import supabase_auth
 from src.core.exceptions import TokenExpiredException, TokenInvalidException
 from src.core.supabase_auth import SupabaseUserClaims, invalidate_jwks_cache, verify_supabase_token
 
@@ -573,3 +575,85 @@ class TestJWKSCache:
 
             # Should call JWKS endpoint twice
             assert mock_client.return_value.__aenter__.return_value.get.call_count == 2
+
+
+class TestVerifiedTokenCache:
+    """Tests for the verified-token LRU and kid-based key lookup."""
+
+    @staticmethod
+    def _sign(private_key, payload, kid="test-key-id"):
+        private_key_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        return jwt.encode({"alg": "RS256", "kid": kid}, payload, private_key_pem)
+
+    @staticmethod
+    def _jwks_client(mock_client, *responses):
+        mocked = []
+        for body in responses:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = body
+            mocked.append(mock_response)
+        get = AsyncMock(side_effect=mocked)
+        mock_client.return_value.__aenter__.return_value.get = get
+        return get
+
+    @pytest.mark.asyncio
+    async def test_repeat_verification_skips_decode(
+        self, mock_settings, valid_token_payload, mock_jwks_response, rsa_keys
+    ):
+        """The same token verified twice is decoded once."""
+        private_key, _ = rsa_keys
+        token = self._sign(private_key, valid_token_payload)
+
+        with (
+            patch("src.core.supabase_auth.httpx.AsyncClient") as mock_client,
+            patch(
+                "src.core.supabase_auth._decode_token", wraps=supabase_auth._decode_token
+            ) as mock_decode,
+        ):
+            self._jwks_client(mock_client, mock_jwks_response)
+
+            first = await verify_supabase_token(token)
+            second = await verify_supabase_token(token)
+
+        assert first == second
+        assert first.expires_at == valid_token_payload["exp"]
+        assert mock_decode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refreshes_jwks(
+        self, mock_settings, valid_token_payload, mock_jwks_response, rsa_keys
+    ):
+        """A token signed with a kid missing from the cached set triggers one refresh."""
+        private_key, public_key_jwk = rsa_keys
+        stale = {"keys": [{**public_key_jwk, "kid": "old-key-id"}]}
+
+        with patch("src.core.supabase_auth.httpx.AsyncClient") as mock_client:
+            get = self._jwks_client(mock_client, stale, mock_jwks_response)
+
+            await verify_supabase_token(self._sign(private_key, valid_token_payload, "old-key-id"))
+            claims = await verify_supabase_token(self._sign(private_key, valid_token_payload))
+
+        assert claims.supabase_id == valid_token_payload["sub"]
+        assert get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_not_remembered(
+        self, mock_settings, valid_token_payload, mock_jwks_response, rsa_keys
+    ):
+        """A failed verification leaves no entry behind."""
+        private_key, _ = rsa_keys
+        valid_token_payload["aud"] = "someone-else"
+        token = self._sign(private_key, valid_token_payload)
+
+        with patch("src.core.supabase_auth.httpx.AsyncClient") as mock_client:
+            self._jwks_client(mock_client, mock_jwks_response)
+
+            with pytest.raises(TokenInvalidException):
+                await verify_supabase_token(token)
+
+        assert len(supabase_auth._verified_tokens) == 0
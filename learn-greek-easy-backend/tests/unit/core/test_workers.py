@@ -0,0 +1,48 @@
+"""Tests for src/core/workers.py — pre-fork worker support."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.api.v1 import admin
+from src.core.event_bus import notification_event_bus
+from src.core.workers import reset_worker_state, warm_shared_models, worker_memory
+from src.services import s3_service
+
+
+@pytest.mark.unit
+class TestWorkers:
+    def test_warm_shared_models_reports_each_model(self):
+        with (
+            patch("src.services.morphology_service.get_morphology_service"),
+            patch(
+                "src.services.spellcheck_service.get_spellcheck_service",
+                side_effect=RuntimeError("no dictionary"),
+            ),
+        ):
+            report = warm_shared_models()
+
+        assert report["morphology_ok"] is True
+        assert report["spellcheck_ok"] is False
+
+    def test_reset_worker_state_clears_inherited_state(self):
+        admin._REGENERATE_IDEMPOTENCY_CACHE[(uuid4(), "k")] = (
+            datetime.now(timezone.utc),
+            MagicMock(),
+        )
+        notification_event_bus._subscribers[uuid4()] = set()
+        s3_service._s3_service = MagicMock()
+
+        reset_worker_state()
+
+        assert admin._REGENERATE_IDEMPOTENCY_CACHE == {}
+        assert notification_event_bus._subscribers == {}
+        assert s3_service._s3_service is None
+
+    def test_worker_memory_reports_megabytes(self):
+        memory = worker_memory()
+
+        assert memory["rss_mb"] > 0
+        assert set(memory) == {"pid", "rss_mb", "shared_mb", "private_mb"}
@@ -0,0 +1,257 @@
+"""Tests for the monthly activity-table partition helpers.
+
+The SQL and maintenance tests use a stub session. ``TestAgainstDatabase``
+builds a scratch partitioned table inside the test transaction (the test
+database's activity tables are plain ``create_all`` tables) and runs the
+helpers against it.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import User
+from src.db.partitioning import (
+    CARD_RECORD_REVIEWS,
+    NOTIFICATIONS,
+    PARTITION_SCHEMA,
+    PartitionedTable,
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    default_partition_name,
+    drop_partition_sql,
+    drop_partitions_before,
+    ensure_partitions,
+    maintain_partitions,
+    month_start,
+    monthly_partitions,
+    partition_name,
+)
+
+
+def _result(scalar=None, rows=None):
+    result = MagicMock()
+    result.scalar.return_value = scalar
+    result.fetchall.return_value = rows or []
+    return result
+
+
+def _partitioned_db(*relnames: str) -> AsyncMock:
+    """Session whose catalog reports a partitioned parent with ``relnames`` attached."""
+    db = AsyncMock()
+    catalog = [_result(scalar=1), _result(rows=[(name,) for name in relnames])]
+
+    async def execute(statement, params=None):
+        return catalog.pop(0) if catalog else _result()
+
+    db.execute = AsyncMock(side_effect=execute)
+    return db
+
+
+def _sql(db: AsyncMock) -> list[str]:
+    return [str(call.args[0]) for call in db.execute.await_args_list]
+
+
+@pytest.mark.unit
+class TestPartitionSql:
+    def test_add_months_crosses_years(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_create_moves_default_rows_then_attaches_utc_bounds(self):
+        statements = create_partition_sql(CARD_RECORD_REVIEWS, date(2026, 12, 1))
+
+        assert partition_name(CARD_RECORD_REVIEWS, date(2026, 12, 1)) in statements[0]
+        assert "DELETE FROM partitions.card_record_reviews_default" in statements[1]
+        assert (
+            "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+            in statements[2]
+        )
+        assert statements[3].endswith("ENABLE ROW LEVEL SECURITY")
+
+    def test_drop_rolls_up_only_when_requested_and_supported(self):
+        month = date(2025, 1, 1)
+
+        rolled = drop_partition_sql(CARD_RECORD_REVIEWS, month, rollup=True)
+        assert "activity_month_rollups" in rolled[0]
+        assert rolled[-1] == "DROP TABLE partitions.card_record_reviews_p202501"
+
+        assert len(drop_partition_sql(CARD_RECORD_REVIEWS, month, rollup=False)) == 1
+        assert len(drop_partition_sql(NOTIFICATIONS, month, rollup=True)) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMaintenance:
+    async def test_unpartitioned_table_is_left_alone(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result(scalar=None))
+
+        assert await ensure_partitions(db, NOTIFICATIONS, date(2026, 10, 18), 3) == []
+        assert db.execute.await_count == 1
+
+    async def test_creates_only_missing_months(self):
+        db = _partitioned_db(
+            "notifications_default", "notifications_p202610", "notifications_p202611"
+        )
+
+        created = await ensure_partitions(db, NOTIFICATIONS, date(2026, 10, 18), 2)
+
+        assert created == [date(2026, 12, 1)]
+        assert any("ATTACH PARTITION partitions.notifications_p202612" in s for s in _sql(db))
+
+    async def test_retention_drops_whole_expired_months(self):
+        tables = {
+            "notifications": ["notifications_p202606", "notifications_p202607"],
+        }
+        db = AsyncMock()
+
+        async def execute(statement, params=None):
+            sql = str(statement)
+            parent = (params or {}).get("parent", "").removeprefix("public.")
+            if "pg_partitioned_table" in sql:
+                return _result(scalar=1 if parent in tables else None)
+            if "pg_inherits" in sql:
+                return _result(rows=[(name,) for name in tables[parent]])
+            return _result()
+
+        db.execute = AsyncMock(side_effect=execute)
+
+        summary = await maintain_partitions(
+            db,
+            date(2026, 10, 18),
+            months_ahead=0,
+            retention_months={"notifications": 3},
+            rollup=True,
+        )
+
+        statements = _sql(db)
+        assert "DROP TABLE partitions.notifications_p202606" in statements
+        assert "DROP TABLE partitions.notifications_p202607" not in statements
+        assert summary["notifications"] == {"created": 1, "dropped": 1}
+        assert summary["card_record_reviews"] == {"created": 0, "dropped": 0}
+        db.commit.assert_not_awaited()
+
+
+# =============================================================================
+# Real partitions
+# =============================================================================
+
+_PROBE = PartitionedTable(
+    "partition_probe",
+    "created_at",
+    rollup="count(*), count(*) FILTER (WHERE quality >= 3), COALESCE(sum(time_taken), 0)",
+)
+
+
+def _at(month: date, delta: timedelta = timedelta(0)) -> datetime:
+    return datetime.combine(month, datetime.min.time(), tzinfo=timezone.utc) + delta
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAgainstDatabase:
+    @pytest.fixture(autouse=True)
+    async def probe_table(self, db_session: AsyncSession):
+        """Partitioned parent plus default partition; rolled back with the test."""
+        await db_session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {PARTITION_SCHEMA}"))
+        await db_session.execute(
+            text(
+                f"CREATE TABLE public.{_PROBE.name} ("
+                "user_id uuid NOT NULL, quality integer NOT NULL, "
+                "time_taken integer NOT NULL, created_at timestamptz NOT NULL"
+                ") PARTITION BY RANGE (created_at)"
+            )
+        )
+        for statement in create_default_partition_sql(_PROBE):
+            await db_session.execute(text(statement))
+
+    @staticmethod
+    async def _insert(db: AsyncSession, user: User, created_at: datetime, quality: int = 4):
+        await db.execute(
+            text(
+                f"INSERT INTO public.{_PROBE.name} (user_id, quality, time_taken, created_at) "
+                "VALUES (:user_id, :quality, 10, :created_at)"
+            ),
+            {"user_id": user.id, "quality": quality, "created_at": created_at},
+        )
+
+    @staticmethod
+    async def _placement(db: AsyncSession) -> list[tuple[str, datetime]]:
+        rows = await db.execute(
+            text(
+                f"SELECT tableoid::regclass::text, created_at FROM public.{_PROBE.name} "
+                "ORDER BY created_at"
+            )
+        )
+        return [tuple(row) for row in rows.all()]
+
+    async def test_create_the_next_partitions_and_route_rows_across_the_boundary(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        today = date.today()
+        current, upcoming = month_start(today), add_months(month_start(today), 1)
+        # Arrives before its month has a partition: kept in the default partition
+        early = _at(upcoming, timedelta(days=3))
+        await self._insert(db_session, test_user, early)
+
+        created = await ensure_partitions(db_session, _PROBE, today, months_ahead=1)
+
+        assert created == [current, upcoming]
+        assert await monthly_partitions(db_session, _PROBE) == [current, upcoming]
+        assert await ensure_partitions(db_session, _PROBE, today, months_ahead=1) == []
+        last_moment, first_moment = _at(upcoming, -timedelta(microseconds=1)), _at(upcoming)
+        await self._insert(db_session, test_user, last_moment)
+        await self._insert(db_session, test_user, first_moment)
+        assert await self._placement(db_session) == [
+            (partition_name(_PROBE, current), last_moment),
+            (partition_name(_PROBE, upcoming), first_moment),
+            (partition_name(_PROBE, upcoming), early),
+        ]
+
+        # A month past the last partition still lands in the default partition
+        beyond = _at(add_months(upcoming, 1))
+        await self._insert(db_session, test_user, beyond)
+        assert (await self._placement(db_session))[-1] == (default_partition_name(_PROBE), beyond)
+
+    async def test_expired_partition_is_rolled_up_and_dropped(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        today = date.today()
+        current = month_start(today)
+        expired = add_months(current, -2)
+        await ensure_partitions(db_session, _PROBE, today, months_ahead=0)
+        for statement in create_partition_sql(_PROBE, expired):
+            await db_session.execute(text(statement))
+        await self._insert(db_session, test_user, _at(expired, timedelta(days=1)), quality=5)
+        await self._insert(db_session, test_user, _at(expired, timedelta(days=2)), quality=1)
+        await self._insert(db_session, test_user, _at(current, timedelta(hours=1)))
+
+        dropped = await drop_partitions_before(
+            db_session, _PROBE, add_months(current, -1), rollup=True
+        )
+
+        assert dropped == [expired]
+        assert await monthly_partitions(db_session, _PROBE) == [current]
+        gone = await db_session.execute(
+            text("SELECT to_regclass(:name)"), {"name": partition_name(_PROBE, expired)}
+        )
+        assert gone.scalar() is None
+        assert [part for part, _ in await self._placement(db_session)] == [
+            partition_name(_PROBE, current)
+        ]
+        rollup = await db_session.execute(
+            text(
+                "SELECT month, event_count, correct_count, time_seconds "
+                "FROM activity_month_rollups WHERE user_id = :user_id AND source = :source"
+            ),
+            {"user_id": test_user.id, "source": _PROBE.name},
+        )
+        assert [tuple(row) for row in rollup.all()] == [(expired, 2, 1, 20)]
+
+    async def test_create_all_tables_are_left_alone(self, db_session: AsyncSession):
+        assert await monthly_partitions(db_session, CARD_RECORD_REVIEWS) is None
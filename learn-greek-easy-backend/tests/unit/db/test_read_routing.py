@@ -0,0 +1,124 @@
+"""Unit tests for read-replica routing (lag threshold and read-your-writes)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+import src.db.session as session_module
+from src.db.dependencies import get_read_db
+
+
+@pytest.fixture(autouse=True)
+def replica_state():
+    """Primary and replica factories as sentinels; restore module state afterwards."""
+    saved = (
+        session_module._session_factory,
+        session_module._read_session_factory,
+        session_module._read_engine,
+        session_module._replica_lag_seconds,
+    )
+    session_module._session_factory = MagicMock(name="primary")
+    session_module._read_session_factory = MagicMock(name="replica")
+    session_module._replica_lag_seconds = 0.5
+    session_module._recent_writes.clear()
+    try:
+        yield
+    finally:
+        (
+            session_module._session_factory,
+            session_module._read_session_factory,
+            session_module._read_engine,
+            session_module._replica_lag_seconds,
+        ) = saved
+        session_module._recent_writes.clear()
+
+
+def _disabled_cache() -> MagicMock:
+    cache = MagicMock()
+    cache.enabled = False
+    return cache
+
+
+@pytest.mark.unit
+class TestFactorySelection:
+    def test_fresh_replica_serves_reads(self):
+        assert session_module.get_read_session_factory() is session_module._read_session_factory
+
+    def test_lag_above_threshold_falls_back_to_primary(self):
+        session_module._replica_lag_seconds = 30.0
+        assert session_module.get_read_session_factory() is session_module._session_factory
+
+    def test_unknown_lag_falls_back_to_primary(self):
+        session_module._replica_lag_seconds = None
+        assert session_module.get_read_session_factory() is session_module._session_factory
+
+    def test_recent_write_falls_back_to_primary(self):
+        factory = session_module.get_read_session_factory(recent_write=True)
+        assert factory is session_module._session_factory
+
+    def test_no_replica_configured_uses_primary(self):
+        session_module._read_session_factory = None
+        assert session_module.get_read_session_factory() is session_module._session_factory
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLagMeasurement:
+    async def test_failed_probe_marks_lag_unknown(self):
+        engine = MagicMock()
+        engine.connect.side_effect = OSError("replica down")
+        session_module._read_engine = engine
+
+        assert await session_module.refresh_replica_lag() is None
+        assert session_module.replica_lag_seconds() is None
+        assert not session_module.replica_usable()
+
+    async def test_probe_stores_lag(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=2.5)))
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+        session_module._read_engine = engine
+
+        assert await session_module.refresh_replica_lag() == 2.5
+        assert session_module.replica_usable()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReadYourWrites:
+    async def test_marker_falls_back_to_process_when_cache_disabled(self):
+        user_id = uuid4()
+        with patch("src.core.cache.get_cache", return_value=_disabled_cache()):
+            assert not await session_module.has_recent_write(user_id)
+            await session_module.mark_recent_write(user_id)
+            assert await session_module.has_recent_write(user_id)
+            assert not await session_module.has_recent_write(uuid4())
+
+    async def test_marker_uses_shared_cache_when_enabled(self):
+        user_id = uuid4()
+        cache = MagicMock(enabled=True)
+        cache.set = AsyncMock(return_value=True)
+        cache.exists = AsyncMock(return_value=True)
+        with patch("src.core.cache.get_cache", return_value=cache):
+            await session_module.mark_recent_write(user_id)
+            assert await session_module.has_recent_write(user_id)
+
+        cache.set.assert_awaited_once()
+        assert cache.set.await_args.args[0] == f"ryw:{user_id}"
+        assert session_module._recent_writes == {}
+
+    async def test_get_read_db_routes_recent_writer_to_primary(self):
+        user = MagicMock(id=uuid4())
+        request = MagicMock()
+        request.state.current_principal = user
+        with patch("src.core.cache.get_cache", return_value=_disabled_cache()):
+            await session_module.mark_recent_write(user.id)
+            gen = get_read_db(request)
+            await gen.__anext__()
+            await gen.aclose()
+
+        session_module._session_factory.assert_called_once()
+        session_module._read_session_factory.assert_not_called()
@@ -720,6 +720,7 @@ class TestWarmMinOverride:
                         mock_settings.database_pool_size = 5
                         mock_settings.database_max_overflow = 10
                         mock_settings.database_pool_timeout = 30
+                        mock_settings.database_read_replica_url = None
                         with patch("asyncio.create_task"):
                             # No warm_min arg → implementation must read from settings.
                             await session_module.init_db()
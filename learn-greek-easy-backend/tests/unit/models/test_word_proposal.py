@@ -62,8 +62,9 @@ class TestWordProposalModel:
         assert WordProposal.__table__.schema is None
 
     def test_has_all_columns(self):
-        # 18 columns total = 16 own + created_at/updated_at from TimestampMixin.
-        # LEXGEN-09-01 adds generated_content (nullable JSONB) bringing own from 15→16.
+        # 19 columns total = 17 own + created_at/updated_at from TimestampMixin.
+        # LEXGEN-09-01 adds generated_content (nullable JSONB) bringing own from 15→16;
+        # stage_timings (nullable JSONB, diagnostic) brings it to 17.
         # RED before LEXGEN-09-01 executor run: generated_content column is absent
         # → columns == 17-item set → assertion fails (set mismatch + len != 18).
         columns = set(WordProposal.__table__.columns.keys())
@@ -86,9 +87,10 @@ class TestWordProposalModel:
             "created_at",
             "updated_at",
             "generated_content",  # LEXGEN-09-01: nullable JSONB for lexical content
+            "stage_timings",  # per-stage pipeline wall time (diagnostic)
         }
         assert columns == expected
-        assert len(columns) == 18  # 16 own columns + created_at/updated_at mixin
+        assert len(columns) == 19  # 17 own columns + created_at/updated_at mixin
 
     # =========================================================================
     # POS-neutrality (schema half)
@@ -441,3 +441,71 @@ class TestDeleteAllByUser:
         count = await repo.delete_all_by_user(notif_user.id)
 
         assert count == 2
+
+
+# =============================================================================
+# TestUnreadCounter
+# =============================================================================
+
+
+class TestUnreadCounter:
+    """Tests for the denormalized users.unread_notification_count."""
+
+    @pytest.mark.asyncio
+    async def test_repair_fixes_drift(
+        self,
+        db_session: AsyncSession,
+        notif_user: User,
+    ):
+        """Rows added outside the repository are picked up by repair_unread_counts."""
+        await _create_notification(db_session, notif_user.id, read=False)
+        await _create_notification(db_session, notif_user.id, read=False)
+        await _create_notification(db_session, notif_user.id, read=True)
+        repo = NotificationRepository(db_session)
+
+        assert await repo.get_unread_count(notif_user.id) == 0
+        assert await repo.repair_unread_counts([notif_user.id]) == 1
+        assert await repo.get_unread_count(notif_user.id) == 2
+        assert await repo.repair_unread_counts([notif_user.id]) == 0
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_counter_in_step(
+        self,
+        db_session: AsyncSession,
+        notif_user: User,
+    ):
+        """mark_as_read and delete_by_id adjust the counter and remember the new value."""
+        first = await _create_notification(db_session, notif_user.id, read=False)
+        second = await _create_notification(db_session, notif_user.id, read=False)
+        read = await _create_notification(db_session, notif_user.id, read=True)
+        repo = NotificationRepository(db_session)
+        await repo.repair_unread_counts([notif_user.id])
+
+        await repo.mark_as_read(first.id, notif_user.id)
+        assert repo.unread_counts[notif_user.id] == 1
+
+        await repo.delete_by_id(read.id, notif_user.id)
+        assert await repo.get_unread_count(notif_user.id) == 1
+
+        await repo.delete_by_id(second.id, notif_user.id)
+        assert repo.unread_counts[notif_user.id] == 0
+        assert await repo.get_unread_count(notif_user.id) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_older_than_decrements_unread(
+        self,
+        db_session: AsyncSession,
+        notif_user: User,
+    ):
+        """Expired unread notifications are subtracted from the owner's counter."""
+        old_ts = datetime.now(UTC) - timedelta(days=10)
+        await _create_notification(db_session, notif_user.id, read=False, created_at=old_ts)
+        await _create_notification(db_session, notif_user.id, read=True, created_at=old_ts)
+        await _create_notification(db_session, notif_user.id, read=False)
+        repo = NotificationRepository(db_session)
+        await repo.repair_unread_counts([notif_user.id])
+
+        count = await repo.delete_older_than(days=5)
+
+        assert count >= 2
+        assert await repo.get_unread_count(notif_user.id) == 1
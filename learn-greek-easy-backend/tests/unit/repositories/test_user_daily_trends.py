@@ -0,0 +1,471 @@
+"""Tests for the user_daily_trends series deltas, statements and stored rows.
+
+The delta and statement tests need no database; ``TestAgainstDatabase`` seeds
+reviews, answers and statistics relative to today (``db_session``) and checks
+the append, the rebuild, the progress-reset delete, and the learning trends
+read from the series against the same trends computed from the source tables.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.db.models import (
+    CardRecord,
+    CardRecordReview,
+    CardRecordStatistics,
+    CardStatus,
+    CardType,
+    CultureAnswerHistory,
+    CultureDeck,
+    CultureQuestion,
+    CultureQuestionStats,
+    Deck,
+    PartOfSpeech,
+    User,
+    UserDailyTrends,
+    WordEntry,
+)
+from src.repositories.user_daily_trends import (
+    COUNTER_COLUMNS,
+    UserDailyTrendsRepository,
+    culture_answer_deltas,
+    delta_upserts,
+    vocab_review_deltas,
+)
+from src.services.progress_service import ProgressService
+from src.services.user_progress_reset_service import UserProgressResetService
+
+_TODAY = date(2026, 10, 18)
+_EARLIER = date(2026, 10, 11)
+
+
+def _compile(statement) -> tuple[str, dict]:
+    compiled = statement.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.mark.unit
+class TestVocabReviewDeltas:
+    def test_review_moves_card_out_of_its_previous_day(self):
+        deltas = vocab_review_deltas(
+            day=_TODAY,
+            quality=4,
+            time_taken=9,
+            previous_status=CardStatus.LEARNING,
+            previous_day=_EARLIER,
+            new_status=CardStatus.MASTERED,
+        )
+
+        assert deltas == {
+            _TODAY: {
+                "vocab_reviews": 1,
+                "vocab_correct": 1,
+                "vocab_quality_sum": 4,
+                "vocab_study_time_seconds": 9,
+                "vocab_mastered": 1,
+            },
+            _EARLIER: {"vocab_learning": -1},
+        }
+
+    def test_same_day_review_nets_the_bucket(self):
+        deltas = vocab_review_deltas(
+            day=_TODAY,
+            quality=2,
+            time_taken=3,
+            previous_status=CardStatus.LEARNING,
+            previous_day=_TODAY,
+            new_status=CardStatus.REVIEW,
+        )
+
+        assert list(deltas) == [_TODAY]
+        assert deltas[_TODAY]["vocab_learning"] == 0
+        assert deltas[_TODAY]["vocab_correct"] == 0
+
+    def test_new_card_has_no_previous_bucket(self):
+        deltas = vocab_review_deltas(
+            day=_TODAY,
+            quality=0,
+            time_taken=1,
+            previous_status=CardStatus.NEW,
+            previous_day=_EARLIER,
+            new_status=CardStatus.NEW,
+        )
+
+        assert list(deltas) == [_TODAY]
+        assert "vocab_learning" not in deltas[_TODAY]
+
+
+@pytest.mark.unit
+class TestCultureAnswerDeltas:
+    def test_history_only(self):
+        deltas = culture_answer_deltas(
+            day=_TODAY, is_correct=False, previous_status=None, previous_day=None, new_status=None
+        )
+
+        assert deltas == {_TODAY: {"culture_answers": 1, "culture_correct": 0}}
+
+    def test_statistics_only(self):
+        deltas = culture_answer_deltas(
+            day=_TODAY,
+            is_correct=None,
+            previous_status=CardStatus.MASTERED,
+            previous_day=_EARLIER,
+            new_status=CardStatus.LEARNING,
+        )
+
+        assert deltas == {
+            _EARLIER: {"culture_mastered": -1},
+            _TODAY: {"culture_learning": 1},
+        }
+
+
+@pytest.mark.unit
+class TestDeltaUpserts:
+    def test_one_upsert_per_day_and_decrements_floor_at_zero(self):
+        user_id = uuid4()
+        statements = delta_upserts(
+            user_id,
+            {_TODAY: {"vocab_reviews": 1, "vocab_mastered": 1}, _EARLIER: {"vocab_learning": -1}},
+        )
+
+        (earlier_sql, earlier_params), (today_sql, today_params) = map(_compile, statements)
+        assert "ON CONFLICT (user_id, day) DO UPDATE" in today_sql
+        assert "vocab_reviews = (user_daily_trends.vocab_reviews" in today_sql
+        assert today_params["vocab_reviews"] == 1
+        assert "greatest(user_daily_trends.vocab_learning + " in earlier_sql
+        assert earlier_params["vocab_learning"] == 0
+        assert earlier_params["day"] == _EARLIER
+
+    def test_zero_deltas_write_nothing(self):
+        assert delta_upserts(uuid4(), {_TODAY: {"vocab_learning": 0}}) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRepository:
+    async def test_apply_executes_each_upsert(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        await UserDailyTrendsRepository(db).apply(
+            uuid4(), {_TODAY: {"culture_answers": 1}, _EARLIER: {"culture_learning": -1}}
+        )
+
+        assert db.execute.await_count == 2
+
+    async def test_refresh_recounts_all_sources_in_scope(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=5))
+
+        written = await UserDailyTrendsRepository(db).refresh(
+            user_ids=[uuid4()], days=[_EARLIER, _TODAY]
+        )
+
+        assert written == 5
+        delete_sql, insert_sql = (_compile(c.args[0])[0] for c in db.execute.await_args_list)
+        assert delete_sql.startswith("DELETE FROM user_daily_trends")
+        assert "user_daily_trends.user_id IN" in delete_sql
+        assert "user_daily_trends.day IN" in delete_sql
+        for table in (
+            "card_record_reviews",
+            "card_record_statistics",
+            "culture_answer_history",
+            "culture_question_stats",
+        ):
+            assert f"FROM {table}" in insert_sql
+            assert f"{table}.user_id IN" in insert_sql
+        assert "UNION ALL" in insert_sql
+        assert "ON CONFLICT (user_id, day) DO UPDATE" in insert_sql
+
+
+# =============================================================================
+# Stored series
+# =============================================================================
+
+
+def _days_ago(days: int) -> datetime:
+    """Midday UTC ``days`` days ago, clear of any day boundary."""
+    return datetime.combine(date.today() - timedelta(days=days), time(12), tzinfo=timezone.utc)
+
+
+def _point(**counters: int) -> tuple[int, ...]:
+    return tuple(counters.get(column, 0) for column in COUNTER_COLUMNS)
+
+
+async def _series(db: AsyncSession, user_id: UUID) -> dict[date, tuple[int, ...]]:
+    columns = [UserDailyTrends.__table__.c[column] for column in COUNTER_COLUMNS]
+    rows = await db.execute(
+        select(UserDailyTrends.day, *columns)
+        .where(UserDailyTrends.user_id == user_id)
+        .order_by(UserDailyTrends.day)
+    )
+    return {row[0]: tuple(row[1:]) for row in rows.all()}
+
+
+@pytest_asyncio.fixture
+async def card_records(db_session: AsyncSession, test_deck: Deck) -> list[CardRecord]:
+    entry = WordEntry(
+        owner_id=None,
+        lemma="σπίτι",
+        part_of_speech=PartOfSpeech.NOUN,
+        translation_en="house",
+        is_active=True,
+    )
+    db_session.add(entry)
+    await db_session.flush()
+    records = [
+        CardRecord(
+            word_entry_id=entry.id,
+            deck_id=test_deck.id,
+            card_type=card_type,
+            variant_key="default",
+            front_content={"card_type": card_type.value, "prompt": "Translate", "main": "x"},
+            back_content={"card_type": card_type.value, "answer": "x"},
+        )
+        for card_type in (CardType.MEANING_EL_TO_EN, CardType.MEANING_EN_TO_EL, CardType.CLOZE)
+    ]
+    db_session.add_all(records)
+    await db_session.flush()
+    return records
+
+
+@pytest_asyncio.fixture
+async def culture_question(db_session: AsyncSession) -> CultureQuestion:
+    deck = CultureDeck(name_el="Ιστορία", name_en="History", name_ru="История", category="history")
+    db_session.add(deck)
+    await db_session.flush()
+    question = CultureQuestion(
+        deck_id=deck.id,
+        question_text={"el": "Πρώτη πρωτεύουσα;", "en": "First capital?", "ru": "Столица?"},
+        option_a={"el": "Αθήνα", "en": "Athens", "ru": "Афины"},
+        option_b={"el": "Ναύπλιο", "en": "Nafplio", "ru": "Нафплион"},
+        correct_option=2,
+        order_index=0,
+    )
+    db_session.add(question)
+    await db_session.flush()
+    return question
+
+
+@pytest_asyncio.fixture
+async def activity(
+    db_session: AsyncSession,
+    test_user: User,
+    card_records: list[CardRecord],
+    culture_question: CultureQuestion,
+) -> User:
+    """Vocabulary and culture activity spread over the last 60 days."""
+    reviews = [(0, 0, 4, 10), (0, 1, 2, 5), (3, 0, 5, 20), (20, 1, 3, 8), (60, 2, 4, 12)]
+    for days, card, quality, time_taken in reviews:
+        db_session.add(
+            CardRecordReview(
+                user_id=test_user.id,
+                card_record_id=card_records[card].id,
+                quality=quality,
+                time_taken=time_taken,
+                reviewed_at=_days_ago(days),
+            )
+        )
+    for card, status, days in ((0, CardStatus.LEARNING, 3), (1, CardStatus.MASTERED, 20)):
+        db_session.add(
+            CardRecordStatistics(
+                user_id=test_user.id,
+                card_record_id=card_records[card].id,
+                easiness_factor=2.5,
+                interval=1,
+                repetitions=1,
+                next_review_date=date.today(),
+                status=status,
+                updated_at=_days_ago(days),
+            )
+        )
+    db_session.add(
+        CardRecordStatistics(
+            user_id=test_user.id,
+            card_record_id=card_records[2].id,
+            easiness_factor=2.5,
+            interval=6,
+            repetitions=2,
+            next_review_date=date.today(),
+            status=CardStatus.REVIEW,
+            updated_at=_days_ago(0),
+        )
+    )
+    for days, is_correct in ((3, True), (60, False)):
+        db_session.add(
+            CultureAnswerHistory(
+                user_id=test_user.id,
+                question_id=culture_question.id,
+                language="en",
+                is_correct=is_correct,
+                selected_option=2 if is_correct else 1,
+                time_taken_seconds=15,
+                deck_category="history",
+                created_at=_days_ago(days),
+            )
+        )
+    db_session.add(
+        CultureQuestionStats(
+            user_id=test_user.id,
+            question_id=culture_question.id,
+            easiness_factor=2.6,
+            interval=30,
+            repetitions=5,
+            next_review_date=date.today(),
+            status=CardStatus.MASTERED,
+            updated_at=_days_ago(3),
+        )
+    )
+    await db_session.flush()
+    return test_user
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAgainstDatabase:
+    async def test_refresh_rebuilds_the_series_from_the_sources(
+        self, db_session: AsyncSession, activity: User
+    ):
+        await UserDailyTrendsRepository(db_session).refresh(user_ids=[activity.id])
+
+        series = await _series(db_session, activity.id)
+        assert {(date.today() - day).days: point for day, point in series.items()} == {
+            60: _point(
+                vocab_reviews=1,
+                vocab_correct=1,
+                vocab_quality_sum=4,
+                vocab_study_time_seconds=12,
+                culture_answers=1,
+            ),
+            20: _point(
+                vocab_reviews=1,
+                vocab_correct=1,
+                vocab_quality_sum=3,
+                vocab_study_time_seconds=8,
+                vocab_mastered=1,
+            ),
+            3: _point(
+                vocab_reviews=1,
+                vocab_correct=1,
+                vocab_quality_sum=5,
+                vocab_study_time_seconds=20,
+                vocab_learning=1,
+                culture_answers=1,
+                culture_correct=1,
+                culture_mastered=1,
+            ),
+            0: _point(
+                vocab_reviews=2,
+                vocab_correct=1,
+                vocab_quality_sum=6,
+                vocab_study_time_seconds=15,
+                vocab_learning=1,
+            ),
+        }
+
+    async def test_appended_review_matches_a_rebuild(
+        self, db_session: AsyncSession, activity: User, card_records: list[CardRecord]
+    ):
+        repo = UserDailyTrendsRepository(db_session)
+        await repo.refresh(user_ids=[activity.id])
+        first_update = await repo.latest_update(activity.id)
+
+        # Card 0 (learning since 3 days ago) is reviewed to mastered today
+        reviewed_at = datetime.now(timezone.utc)
+        db_session.add(
+            CardRecordReview(
+                user_id=activity.id,
+                card_record_id=card_records[0].id,
+                quality=5,
+                time_taken=9,
+                reviewed_at=reviewed_at,
+            )
+        )
+        await db_session.execute(
+            update(CardRecordStatistics)
+            .where(
+                CardRecordStatistics.user_id == activity.id,
+                CardRecordStatistics.card_record_id == card_records[0].id,
+            )
+            .values(status=CardStatus.MASTERED, updated_at=func.now())
+        )
+        await repo.apply(
+            activity.id,
+            vocab_review_deltas(
+                day=reviewed_at.date(),
+                quality=5,
+                time_taken=9,
+                previous_status=CardStatus.LEARNING,
+                previous_day=_days_ago(3).date(),
+                new_status=CardStatus.MASTERED,
+            ),
+        )
+
+        appended = await _series(db_session, activity.id)
+        today, three_days_ago = date.today(), date.today() - timedelta(days=3)
+        assert appended[three_days_ago][COUNTER_COLUMNS.index("vocab_learning")] == 0
+        assert appended[today] == _point(
+            vocab_reviews=3,
+            vocab_correct=2,
+            vocab_quality_sum=11,
+            vocab_study_time_seconds=24,
+            vocab_learning=1,
+            vocab_mastered=1,
+        )
+        assert await repo.latest_update(activity.id) >= first_update
+
+        await repo.refresh(user_ids=[activity.id])
+        assert await _series(db_session, activity.id) == appended
+
+    async def test_progress_reset_deletes_only_the_users_series(
+        self, db_session: AsyncSession, activity: User
+    ):
+        repo = UserDailyTrendsRepository(db_session)
+        await repo.refresh(user_ids=[activity.id])
+        other = User(email="other-trends@example.com", full_name="Other", is_active=True)
+        db_session.add(other)
+        await db_session.flush()
+        await repo.apply(
+            other.id,
+            vocab_review_deltas(
+                day=date.today(),
+                quality=4,
+                time_taken=6,
+                previous_status=None,
+                previous_day=None,
+                new_status=CardStatus.LEARNING,
+            ),
+        )
+
+        result = await UserProgressResetService(db_session).reset_all_progress(activity.id)
+
+        assert result is not None
+        assert await _series(db_session, activity.id) == {}
+        assert await repo.latest_update(activity.id) is None
+        assert list(await _series(db_session, other.id)) == [date.today()]
+
+    @pytest.mark.parametrize("period", ["week", "month", "quarter"])
+    async def test_series_trends_match_the_source_tables(
+        self, db_session: AsyncSession, activity: User, monkeypatch, period: str
+    ):
+        await UserDailyTrendsRepository(db_session).refresh(user_ids=[activity.id])
+        cache = MagicMock()
+        cache.get_or_set = AsyncMock(return_value=None)
+        service = ProgressService(db_session)
+
+        with patch("src.services.progress_service.get_cache", return_value=cache):
+            monkeypatch.setattr(settings, "daily_trends_series", False)
+            legacy = await service.get_learning_trends(activity.id, period=period)
+            monkeypatch.setattr(settings, "daily_trends_series", True)
+            series = await service.get_learning_trends(activity.id, period=period)
+
+        assert series.model_dump() == legacy.model_dump()
+        assert series.summary.total_reviews > 0
@@ -0,0 +1,373 @@
+"""Tests for the user_deck_progress counter statements and stored counters.
+
+The statement tests compile SQL only; ``TestAgainstDatabase`` writes real
+statistics, reviews and card records (``db_session``) and checks the counters
+that ``refresh``, ``review_delta_upsert`` and card (de)activation store.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    CardRecord,
+    CardRecordReview,
+    CardRecordStatistics,
+    CardStatus,
+    CardType,
+    Deck,
+    PartOfSpeech,
+    User,
+    UserDeckProgress,
+    WordEntry,
+)
+from src.repositories.card_record import CardRecordRepository
+from src.repositories.user_deck_progress import UserDeckProgressRepository, review_delta_upsert
+
+_REVIEWED_AT = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+def _compile(statement) -> tuple[str, dict]:
+    compiled = statement.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def _upsert(**overrides):
+    values = {
+        "user_id": uuid4(),
+        "deck_id": uuid4(),
+        "previous_status": CardStatus.LEARNING,
+        "new_status": CardStatus.REVIEW,
+        "easiness_factor_delta": 0.1,
+        "quality": 4,
+        "time_taken": 12,
+        "reviewed_at": _REVIEWED_AT,
+    }
+    values.update(overrides)
+    return review_delta_upsert(**values)
+
+
+@pytest.mark.unit
+class TestReviewDeltaUpsert:
+    def test_status_transition_moves_one_card(self):
+        sql, params = _compile(_upsert())
+
+        assert "ON CONFLICT (user_id, deck_id) DO UPDATE" in sql
+        assert "cards_learning = (user_deck_progress.cards_learning" in sql
+        assert "cards_review = (user_deck_progress.cards_review" in sql
+        assert "cards_new = (" not in sql
+        assert "cards_mastered = (" not in sql
+        assert params["cards_learning"] == 0  # a brand-new row never starts negative
+        assert params["cards_review"] == 1
+        assert params["total_reviews"] == 1
+        assert params["quality_sum"] == 4
+
+    def test_first_review_adds_the_card_without_a_decrement(self):
+        sql, params = _compile(
+            _upsert(previous_status=None, new_status=CardStatus.LEARNING, easiness_factor_delta=2.6)
+        )
+
+        assert "cards_learning = (user_deck_progress.cards_learning" in sql
+        assert "cards_new = (" not in sql
+        assert params["cards_learning"] == 1
+        assert params["easiness_factor_sum"] == 2.6
+
+    def test_same_status_only_moves_totals(self):
+        sql, _ = _compile(_upsert(previous_status=CardStatus.REVIEW, new_status=CardStatus.REVIEW))
+
+        assert "cards_review = (" not in sql
+        assert "total_reviews = (user_deck_progress.total_reviews" in sql
+        assert "greatest(user_deck_progress.last_studied_at" in sql
+
+    def test_inactive_card_skips_status_buckets(self):
+        sql, params = _compile(_upsert(counts_status=False))
+
+        assert "cards_learning = (" not in sql and "cards_review = (" not in sql
+        assert "easiness_factor_sum = (" not in sql
+        assert params["total_study_time_seconds"] == 12
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRefresh:
+    async def _refresh(self, **scope) -> list[str]:
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+
+        written = await UserDeckProgressRepository(db).refresh(**scope)
+
+        assert written == 3
+        return [_compile(call.args[0])[0] for call in db.execute.await_args_list]
+
+    async def test_deck_scope_recounts_from_statistics_and_reviews(self):
+        delete_sql, insert_sql = await self._refresh(deck_id=uuid4())
+
+        assert delete_sql.startswith("DELETE FROM user_deck_progress")
+        assert "user_deck_progress.deck_id =" in delete_sql
+        assert "FULL OUTER JOIN" in insert_sql
+        assert "card_records.is_active IS true" in insert_sql
+        assert "FROM card_record_reviews JOIN card_records" in insert_sql
+        assert "ON CONFLICT (user_id, deck_id) DO UPDATE" in insert_sql
+
+    async def test_user_scope_filters_both_sources(self):
+        delete_sql, insert_sql = await self._refresh(user_ids=[uuid4(), uuid4()])
+
+        assert "user_deck_progress.user_id IN" in delete_sql
+        assert "card_record_statistics.user_id IN" in insert_sql
+        assert "card_record_reviews.user_id IN" in insert_sql
+
+
+# =============================================================================
+# Stored counters
+# =============================================================================
+
+
+@pytest_asyncio.fixture
+async def card_records(db_session: AsyncSession, test_deck: Deck) -> list[CardRecord]:
+    """Two active records on separate word entries, and an inactive one."""
+    entries = [
+        WordEntry(
+            owner_id=None,
+            lemma=lemma,
+            part_of_speech=PartOfSpeech.NOUN,
+            translation_en=translation,
+            is_active=True,
+        )
+        for lemma, translation in (("σπίτι", "house"), ("νερό", "water"))
+    ]
+    db_session.add_all(entries)
+    await db_session.flush()
+    records = [
+        CardRecord(
+            word_entry_id=entry.id,
+            deck_id=test_deck.id,
+            card_type=card_type,
+            variant_key="default",
+            front_content={"card_type": card_type.value, "prompt": "Translate", "main": "x"},
+            back_content={"card_type": card_type.value, "answer": "x"},
+            is_active=is_active,
+        )
+        for entry, card_type, is_active in (
+            (entries[0], CardType.MEANING_EL_TO_EN, True),
+            (entries[1], CardType.MEANING_EL_TO_EN, True),
+            (entries[1], CardType.MEANING_EN_TO_EL, False),
+        )
+    ]
+    db_session.add_all(records)
+    await db_session.flush()
+    return records
+
+
+async def _add_stats(
+    db: AsyncSession, user: User, record: CardRecord, status: CardStatus, ef: float
+) -> None:
+    db.add(
+        CardRecordStatistics(
+            user_id=user.id,
+            card_record_id=record.id,
+            easiness_factor=ef,
+            interval=1,
+            repetitions=1,
+            next_review_date=date.today(),
+            status=status,
+        )
+    )
+    await db.flush()
+
+
+async def _add_review(
+    db: AsyncSession, user: User, record: CardRecord, quality: int, time_taken: int, at: datetime
+) -> None:
+    db.add(
+        CardRecordReview(
+            user_id=user.id,
+            card_record_id=record.id,
+            quality=quality,
+            time_taken=time_taken,
+            reviewed_at=at,
+        )
+    )
+    await db.flush()
+
+
+async def _counters(db: AsyncSession, user_id: UUID, deck_id: UUID) -> dict[str, Any] | None:
+    row = (
+        (
+            await db.execute(
+                select(UserDeckProgress.__table__).where(
+                    UserDeckProgress.user_id == user_id, UserDeckProgress.deck_id == deck_id
+                )
+            )
+        )
+        .mappings()
+        .one_or_none()
+    )
+    if row is None:
+        return None
+    counters = {k: v for k, v in row.items() if k not in ("user_id", "deck_id", "updated_at")}
+    counters["easiness_factor_sum"] = round(counters["easiness_factor_sum"], 6)
+    return counters
+
+
+def _expected(**overrides: Any) -> dict[str, Any]:
+    counters: dict[str, Any] = {
+        "cards_new": 0,
+        "cards_learning": 0,
+        "cards_review": 0,
+        "cards_mastered": 0,
+        "easiness_factor_sum": 0.0,
+        "total_reviews": 0,
+        "quality_sum": 0,
+        "total_study_time_seconds": 0,
+        "first_studied_at": None,
+        "last_studied_at": None,
+    }
+    counters.update(overrides)
+    return counters
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAgainstDatabase:
+    async def test_refresh_recounts_active_statistics_and_all_reviews(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_deck: Deck,
+        card_records: list[CardRecord],
+    ):
+        first, second, inactive = card_records
+        at = datetime(2026, 10, 1, 9, tzinfo=timezone.utc)
+        await _add_stats(db_session, test_user, first, CardStatus.LEARNING, 2.5)
+        await _add_stats(db_session, test_user, second, CardStatus.MASTERED, 2.7)
+        await _add_stats(db_session, test_user, inactive, CardStatus.REVIEW, 2.1)
+        await _add_review(db_session, test_user, first, 4, 10, at)
+        await _add_review(db_session, test_user, inactive, 3, 5, at + timedelta(hours=2))
+        repo = UserDeckProgressRepository(db_session)
+
+        assert await repo.refresh(user_ids=[test_user.id], deck_id=test_deck.id) == 1
+
+        assert await _counters(db_session, test_user.id, test_deck.id) == _expected(
+            cards_learning=1,
+            cards_mastered=1,
+            easiness_factor_sum=5.2,
+            total_reviews=2,
+            quality_sum=7,
+            total_study_time_seconds=15,
+            first_studied_at=at,
+            last_studied_at=at + timedelta(hours=2),
+        )
+
+        # A user left with no statistics or reviews for the deck loses the row
+        await db_session.execute(
+            delete(CardRecordReview).where(CardRecordReview.user_id == test_user.id)
+        )
+        await db_session.execute(
+            delete(CardRecordStatistics).where(CardRecordStatistics.user_id == test_user.id)
+        )
+        await repo.refresh(deck_id=test_deck.id)
+        assert await _counters(db_session, test_user.id, test_deck.id) is None
+
+    async def test_review_increments_agree_with_a_refresh(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_deck: Deck,
+        card_records: list[CardRecord],
+    ):
+        first, _, inactive = card_records
+        at = datetime(2026, 10, 1, 9, tzinfo=timezone.utc)
+        reviews = [
+            # (record, previous status, new status, EF delta, quality, time, counts_status)
+            (first, None, CardStatus.LEARNING, 2.6, 4, 10, True),
+            (first, CardStatus.LEARNING, CardStatus.REVIEW, -0.1, 5, 5, True),
+            (inactive, None, CardStatus.LEARNING, 2.5, 3, 7, False),
+        ]
+        for i, (record, previous, new, ef_delta, quality, time_taken, active) in enumerate(reviews):
+            reviewed_at = at + timedelta(minutes=i)
+            await db_session.execute(
+                review_delta_upsert(
+                    user_id=test_user.id,
+                    deck_id=test_deck.id,
+                    previous_status=previous,
+                    new_status=new,
+                    easiness_factor_delta=ef_delta,
+                    quality=quality,
+                    time_taken=time_taken,
+                    reviewed_at=reviewed_at,
+                    counts_status=active,
+                )
+            )
+            await _add_review(db_session, test_user, record, quality, time_taken, reviewed_at)
+
+        incremented = await _counters(db_session, test_user.id, test_deck.id)
+        assert incremented == _expected(
+            cards_review=1,
+            easiness_factor_sum=2.5,
+            total_reviews=3,
+            quality_sum=12,
+            total_study_time_seconds=22,
+            first_studied_at=at,
+            last_studied_at=at + timedelta(minutes=2),
+        )
+
+        # The statistics rows the reviews left behind recount to the same values
+        await _add_stats(db_session, test_user, first, CardStatus.REVIEW, 2.5)
+        await _add_stats(db_session, test_user, inactive, CardStatus.LEARNING, 2.5)
+        await UserDeckProgressRepository(db_session).refresh(user_ids=[test_user.id])
+        assert await _counters(db_session, test_user.id, test_deck.id) == incremented
+
+    async def test_deactivating_and_reactivating_a_card_recounts_the_deck(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_deck: Deck,
+        card_records: list[CardRecord],
+    ):
+        first, second, _ = card_records
+        at = datetime(2026, 10, 1, 9, tzinfo=timezone.utc)
+        await _add_stats(db_session, test_user, first, CardStatus.LEARNING, 2.4)
+        await _add_stats(db_session, test_user, second, CardStatus.REVIEW, 2.6)
+        await _add_review(db_session, test_user, first, 4, 10, at)
+        await UserDeckProgressRepository(db_session).refresh(deck_id=test_deck.id)
+        reviews = {
+            "total_reviews": 1,
+            "quality_sum": 4,
+            "total_study_time_seconds": 10,
+            "first_studied_at": at,
+            "last_studied_at": at,
+        }
+        both_active = _expected(
+            cards_learning=1, cards_review=1, easiness_factor_sum=5.0, **reviews
+        )
+        assert await _counters(db_session, test_user.id, test_deck.id) == both_active
+        records = CardRecordRepository(db_session)
+
+        assert await records.deactivate_by_word_entry(first.word_entry_id) == 1
+        assert await _counters(db_session, test_user.id, test_deck.id) == _expected(
+            cards_review=1, easiness_factor_sum=2.6, **reviews
+        )
+
+        _, created, updated = await records.bulk_upsert(
+            [
+                {
+                    "word_entry_id": first.word_entry_id,
+                    "deck_id": test_deck.id,
+                    "card_type": first.card_type,
+                    "variant_key": first.variant_key,
+                    "tier": None,
+                    "front_content": first.front_content,
+                    "back_content": first.back_content,
+                    "is_active": True,
+                }
+            ]
+        )
+        assert (created, updated) == (0, 1)
+        assert await _counters(db_session, test_user.id, test_deck.id) == both_active
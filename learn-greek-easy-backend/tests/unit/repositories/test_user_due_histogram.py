@@ -0,0 +1,326 @@
+"""Tests for the user_due_histograms slot logic, statements and stored rows.
+
+The statement tests compile SQL only; ``TestAgainstDatabase`` runs the
+shifts, rebuild and drift repair against real rows (``db_session``).
+"""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    CardRecord,
+    CardRecordStatistics,
+    CardStatus,
+    CardType,
+    Deck,
+    PartOfSpeech,
+    User,
+    UserDueHistogram,
+    WordEntry,
+)
+from src.repositories.user_due_histogram import (
+    UserDueHistogramRepository,
+    build_counts,
+    due_shift_update,
+    due_window,
+)
+
+_BASE = date(2026, 10, 18)
+
+
+def _compile(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+class TestBuildCounts:
+    def test_places_dates_in_overdue_day_and_beyond_slots(self):
+        counts = build_counts(
+            {
+                _BASE - timedelta(days=9): 2,
+                _BASE - timedelta(days=1): 1,
+                _BASE: 4,
+                _BASE + timedelta(days=2): 3,
+                _BASE + timedelta(days=5): 1,
+                _BASE + timedelta(days=50): 6,
+            },
+            _BASE,
+            horizon=5,
+        )
+
+        assert counts == [3, 4, 0, 3, 0, 0, 7]
+
+
+@pytest.mark.unit
+class TestDueWindow:
+    def test_folds_slots_before_a_later_start_into_overdue(self):
+        counts = [3, 4, 0, 3, 0, 0, 7]
+
+        assert due_window(counts, _BASE, _BASE, 3) == (3, [4, 0, 3])
+        assert due_window(counts, _BASE, _BASE + timedelta(days=2), 3) == (7, [3, 0, 0])
+
+    def test_window_outside_the_histogram_is_none(self):
+        counts = [0] * 7
+
+        assert due_window(counts, _BASE, _BASE - timedelta(days=1), 1) is None
+        assert due_window(counts, _BASE, _BASE + timedelta(days=1), 5) is None
+
+
+@pytest.mark.unit
+class TestDueShiftUpdate:
+    def test_unchanged_date_is_a_no_op(self):
+        assert due_shift_update(uuid4(), _BASE, _BASE) is None
+
+    def test_moves_one_card_between_slots_in_place(self):
+        sql = _compile(due_shift_update(uuid4(), _BASE, _BASE + timedelta(days=6)))
+
+        assert sql.startswith("UPDATE user_due_histograms SET counts[")
+        assert sql.count("counts[") >= 4
+        assert "greatest(user_due_histograms.counts[" not in sql
+        assert "user_due_histograms.counts[" in sql and " - " in sql
+        assert "cardinality(user_due_histograms.counts)" in sql
+        assert "!=" in sql
+
+    def test_new_statistics_row_only_increments(self):
+        sql = _compile(due_shift_update(uuid4(), None, _BASE + timedelta(days=1)))
+
+        assert "greatest(user_due_histograms.counts[" not in sql
+        assert "!=" not in sql
+
+    def test_vocabulary_card_moves_only_while_active(self):
+        sql = _compile(
+            due_shift_update(uuid4(), _BASE, _BASE + timedelta(days=1), card_record_id=uuid4())
+        )
+
+        assert "EXISTS (SELECT * \nFROM card_records" in sql
+        assert "card_records.is_active IS true" in sql
+
+
+@pytest.mark.unit
+class TestRepository:
+    async def test_due_by_date_sums_vocab_and_culture(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.all.return_value = [(_BASE, 2), (_BASE, 1), (_BASE + timedelta(days=3), 5)]
+        db.execute = AsyncMock(return_value=result)
+
+        due = await UserDueHistogramRepository(db).due_by_date(uuid4())
+
+        assert due == {_BASE: 3, _BASE + timedelta(days=3): 5}
+        sql = _compile(db.execute.await_args.args[0])
+        assert "UNION ALL" in sql
+        assert "card_records.is_active IS true" in sql
+
+    async def test_invalidate_drifted_drops_rows_off_their_card_total(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        assert await UserDueHistogramRepository(db).invalidate_drifted() == 2
+        sql = str(db.execute.await_args.args[0])
+        assert "DELETE FROM user_due_histograms" in sql
+        assert "r.is_active" in sql
+        assert "culture_question_stats" in sql
+
+    async def test_rebuild_upserts_the_dense_array(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.all.return_value = [(_BASE + timedelta(days=1), 2)]
+        db.execute = AsyncMock(return_value=result)
+
+        counts = await UserDueHistogramRepository(db).rebuild(uuid4(), _BASE, horizon=3)
+
+        assert counts == [0, 0, 2, 0, 0]
+        sql = _compile(db.execute.await_args_list[-1].args[0])
+        assert "INSERT INTO user_due_histograms" in sql
+        assert "ON CONFLICT (user_id) DO UPDATE" in sql
+
+
+# =============================================================================
+# Stored rows
+# =============================================================================
+
+_HORIZON = 5
+
+
+@pytest_asyncio.fixture
+async def card_records(db_session: AsyncSession, test_deck: Deck) -> list[CardRecord]:
+    entry = WordEntry(
+        owner_id=None,
+        lemma="σπίτι",
+        part_of_speech=PartOfSpeech.NOUN,
+        translation_en="house",
+        is_active=True,
+    )
+    db_session.add(entry)
+    await db_session.flush()
+    records = [
+        CardRecord(
+            word_entry_id=entry.id,
+            deck_id=test_deck.id,
+            card_type=card_type,
+            variant_key="default",
+            front_content={"card_type": card_type.value, "prompt": "Translate", "main": "σπίτι"},
+            back_content={"card_type": card_type.value, "answer": "house"},
+        )
+        for card_type in (CardType.MEANING_EL_TO_EN, CardType.MEANING_EN_TO_EL)
+    ]
+    db_session.add_all(records)
+    await db_session.flush()
+    return records
+
+
+async def _add_stats(
+    db_session: AsyncSession, user: User, record: CardRecord, next_review_date: date
+) -> CardRecordStatistics:
+    stats = CardRecordStatistics(
+        user_id=user.id,
+        card_record_id=record.id,
+        easiness_factor=2.5,
+        interval=1,
+        repetitions=1,
+        next_review_date=next_review_date,
+        status=CardStatus.LEARNING,
+    )
+    db_session.add(stats)
+    await db_session.flush()
+    return stats
+
+
+async def _stored(db_session: AsyncSession, user_id: UUID) -> tuple[date, list[int]] | None:
+    row = (
+        await db_session.execute(
+            select(UserDueHistogram.base_date, UserDueHistogram.counts).where(
+                UserDueHistogram.user_id == user_id
+            )
+        )
+    ).one_or_none()
+    return None if row is None else (row.base_date, list(row.counts))
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAgainstDatabase:
+    async def test_rebuild_stores_the_statistics_tables(
+        self, db_session: AsyncSession, test_user: User, card_records: list[CardRecord]
+    ):
+        today = date.today()
+        await _add_stats(db_session, test_user, card_records[0], today - timedelta(days=3))
+        await _add_stats(db_session, test_user, card_records[1], today + timedelta(days=2))
+        repo = UserDueHistogramRepository(db_session)
+
+        counts = await repo.rebuild(test_user.id, today, _HORIZON)
+
+        assert counts == [1, 0, 0, 1, 0, 0, 0]
+        assert await _stored(db_session, test_user.id) == (today, counts)
+        assert await repo.due_by_date(test_user.id) == {
+            today - timedelta(days=3): 1,
+            today + timedelta(days=2): 1,
+        }
+
+    async def test_moving_a_review_date_shifts_one_card(
+        self, db_session: AsyncSession, test_user: User, card_records: list[CardRecord]
+    ):
+        today = date.today()
+        record = card_records[0]
+        await _add_stats(db_session, test_user, record, today)
+        repo = UserDueHistogramRepository(db_session)
+        await repo.rebuild(test_user.id, today, _HORIZON)
+
+        await repo.shift(test_user.id, today, today + timedelta(days=3), card_record_id=record.id)
+        assert await _stored(db_session, test_user.id) == (today, [0, 0, 0, 0, 1, 0, 0])
+
+        # Past the horizon lands in the last slot; a move inside it is a no-op
+        await repo.shift(
+            test_user.id,
+            today + timedelta(days=3),
+            today + timedelta(days=40),
+            card_record_id=record.id,
+        )
+        await repo.shift(
+            test_user.id,
+            today + timedelta(days=40),
+            today + timedelta(days=90),
+            card_record_id=record.id,
+        )
+        assert await _stored(db_session, test_user.id) == (today, [0, 0, 0, 0, 0, 0, 1])
+
+        # A new statistics row only increments
+        await repo.shift(test_user.id, None, today - timedelta(days=1))
+        assert await _stored(db_session, test_user.id) == (today, [1, 0, 0, 0, 0, 0, 1])
+
+    async def test_deactivated_card_does_not_move(
+        self, db_session: AsyncSession, test_user: User, card_records: list[CardRecord]
+    ):
+        today = date.today()
+        record = card_records[0]
+        await _add_stats(db_session, test_user, record, today)
+        repo = UserDueHistogramRepository(db_session)
+        await repo.rebuild(test_user.id, today, _HORIZON)
+        await db_session.execute(
+            update(CardRecord).where(CardRecord.id == record.id).values(is_active=False)
+        )
+
+        await repo.shift(test_user.id, today, today + timedelta(days=1), card_record_id=record.id)
+
+        assert await _stored(db_session, test_user.id) == (today, [0, 1, 0, 0, 0, 0, 0])
+        assert await repo.rebuild(test_user.id, today, _HORIZON) == [0] * (_HORIZON + 2)
+
+    async def test_missed_decrement_leaves_a_negative_slot(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        today = date.today()
+        repo = UserDueHistogramRepository(db_session)
+        await repo.rebuild(test_user.id, today, _HORIZON)
+
+        await repo.shift(test_user.id, today + timedelta(days=1), today + timedelta(days=2))
+
+        _, counts = await _stored(db_session, test_user.id)
+        assert counts == [0, 0, -1, 1, 0, 0, 0]
+
+    async def test_base_date_rolled_past_today(
+        self, db_session: AsyncSession, test_user: User, card_records: list[CardRecord]
+    ):
+        today = date.today()
+        base = today - timedelta(days=3)
+        await _add_stats(db_session, test_user, card_records[0], base)
+        await _add_stats(db_session, test_user, card_records[1], today + timedelta(days=1))
+        repo = UserDueHistogramRepository(db_session)
+        counts = await repo.rebuild(test_user.id, base, _HORIZON)
+        assert counts == [0, 1, 0, 0, 0, 1, 0]
+
+        # Days between base_date and today fold into overdue
+        assert due_window(counts, base, today, 2) == (1, [0, 1])
+        # The window now runs past the horizon; the reader re-anchors
+        assert due_window(counts, base, today, 3) is None
+        counts = await repo.rebuild(test_user.id, today, _HORIZON)
+        assert await _stored(db_session, test_user.id) == (today, [1, 0, 1, 0, 0, 0, 0])
+
+        # Shifts against the old anchor's dates still land in the right slots
+        await repo.shift(
+            test_user.id, base, today + timedelta(days=2), card_record_id=card_records[0].id
+        )
+        assert await _stored(db_session, test_user.id) == (today, [0, 0, 1, 1, 0, 0, 0])
+
+    async def test_invalidate_drifted_drops_only_drifted_rows(
+        self, db_session: AsyncSession, test_user: User, card_records: list[CardRecord]
+    ):
+        today = date.today()
+        await _add_stats(db_session, test_user, card_records[0], today)
+        repo = UserDueHistogramRepository(db_session)
+        await repo.rebuild(test_user.id, today, _HORIZON)
+
+        assert await repo.invalidate_drifted() == 0
+        assert await _stored(db_session, test_user.id) is not None
+
+        await db_session.execute(
+            update(CardRecord).where(CardRecord.id == card_records[0].id).values(is_active=False)
+        )
+        assert await repo.invalidate_drifted() == 1
+        assert await _stored(db_session, test_user.id) is None
@@ -0,0 +1,66 @@
+"""Unit tests for the API load harness (statistics, report format, driver)."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.scripts.bench_api import (
+    Endpoint,
+    EndpointResult,
+    baseline_document,
+    drive,
+    format_report,
+    percentile,
+)
+
+
+@pytest.mark.unit
+class TestPercentile:
+    def test_nearest_rank(self) -> None:
+        samples = [float(n) for n in range(1, 101)]
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile(samples, 100) == 100.0
+
+    def test_small_and_empty(self) -> None:
+        assert percentile([], 95) == 0.0
+        assert percentile([7.0], 1) == 7.0
+        assert percentile([1.0, 2.0], 95) == 2.0
+
+
+@pytest.mark.unit
+def test_baseline_document_uses_k6_schema() -> None:
+    result = EndpointResult(Endpoint("study_queue", "/study/queue/v2"), [10.0, 20.0, 30.4])
+    result.db_roundtrips = 4
+
+    doc = baseline_document([result], "abc123")
+
+    assert doc["commit"] == "abc123"
+    assert doc["metrics"] == {
+        "bench_study_queue_time": {"p95": 30, "p50": 20, "p99": 30, "db_roundtrips": 4}
+    }
+    assert "-" in format_report([EndpointResult(Endpoint("me", "/auth/me"))])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_drive_issues_exact_request_count_and_counts_errors() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(500 if len(seen) % 5 == 0 else 200)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        result = await drive(
+            client, Endpoint("me", "/auth/me"), ["a", "b"], requests=20, concurrency=3
+        )
+
+    assert len(seen) == 20
+    assert set(seen) == {"Bearer a", "Bearer b"}
+    assert result.errors == 4
+    assert len(result.samples_ms) == 16
+    assert result.throughput > 0
@@ -0,0 +1,139 @@
+"""Unit tests for the synthetic population generator.
+
+Row generation is pure Python; the COPY path is checked against a mock cursor.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.scripts.generate_synthetic_dataset import (
+    TABLES,
+    ContentPool,
+    Population,
+    SyntheticBatch,
+    activity_calendar,
+    email_pattern,
+    generate_user,
+    write_batch,
+)
+
+TODAY = date(2026, 6, 1)
+
+
+@pytest.fixture
+def pool() -> ContentPool:
+    return ContentPool(
+        card_record_ids=[uuid4() for _ in range(40)],
+        culture_questions=[(uuid4(), 1 + n % 4, "history") for n in range(20)],
+        exercise_ids=[uuid4() for _ in range(10)],
+    )
+
+
+def _population(**overrides: int) -> Population:
+    values = dict(
+        users=1,
+        cards_per_user=25,
+        reviews_per_user=300,
+        history_days=90,
+        culture_answers_per_user=50,
+        exercises_per_user=5,
+    )
+    values.update(overrides)
+    return Population(**values, tag="t")  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestActivityCalendar:
+    def test_days_are_unique_oldest_first_and_in_range(self) -> None:
+        days = activity_calendar(random.Random(1), 200, 0.5)
+        assert days == sorted(set(days), reverse=True)
+        assert all(0 <= d < 200 for d in days)
+
+    def test_produces_multi_day_streaks(self) -> None:
+        days = activity_calendar(random.Random(3), 365, 0.8)
+        consecutive = sum(1 for a, b in zip(days, days[1:]) if a - b == 1)
+        assert consecutive > len(days) / 2
+
+    def test_never_empty(self) -> None:
+        assert activity_calendar(random.Random(0), 1, 0.0) == [0]
+
+
+@pytest.mark.unit
+class TestGenerateUser:
+    def test_row_counts_follow_population(self, pool: ContentPool) -> None:
+        batch = SyntheticBatch()
+        generate_user(batch, _population(), pool, 0, TODAY)
+
+        assert len(batch.rows["users"]) == 1
+        assert len(batch.rows["card_record_statistics"]) == 25
+        assert len(batch.rows["card_record_reviews"]) == 300
+        assert len(batch.rows["culture_answer_history"]) == 50
+        assert len(batch.rows["exercise_records"]) == 5
+        assert batch.rows["users"][0][1] == "t+0000000@perf.invalid"
+
+    def test_deterministic_per_user_index(self, pool: ContentPool) -> None:
+        first, second = SyntheticBatch(), SyntheticBatch()
+        generate_user(first, _population(), pool, 7, TODAY)
+        generate_user(second, _population(), pool, 7, TODAY)
+        assert first.rows == second.rows
+
+    def test_card_state_is_consistent_with_reviews(self, pool: ContentPool) -> None:
+        batch = SyntheticBatch()
+        generate_user(batch, _population(), pool, 1, TODAY)
+
+        reviewed = {row[1] for row in batch.rows["card_record_reviews"]}
+        for _, card, ef, interval, reps, due, status in batch.rows["card_record_statistics"]:
+            assert ef >= 1.3
+            if card not in reviewed:
+                assert (status, interval, reps, due) == ("NEW", 0, 0, TODAY)
+            else:
+                assert status in {"LEARNING", "REVIEW", "MASTERED"}
+                assert due <= TODAY + timedelta(days=interval)
+
+    def test_reviews_are_chronological_and_in_history(self, pool: ContentPool) -> None:
+        batch = SyntheticBatch()
+        generate_user(batch, _population(), pool, 2, TODAY)
+
+        times = [row[4] for row in batch.rows["card_record_reviews"]]
+        assert times == sorted(times)
+        assert TODAY - timedelta(days=90) <= times[0].date() and times[-1].date() <= TODAY
+
+    def test_wrong_culture_answers_pick_another_option(self, pool: ContentPool) -> None:
+        correct = {qid: option for qid, option, _ in pool.culture_questions}
+        batch = SyntheticBatch()
+        generate_user(batch, _population(), pool, 3, TODAY)
+
+        for _, qid, language, is_correct, selected, *_ in batch.rows["culture_answer_history"]:
+            assert language in {"en", "el", "ru"}
+            assert (selected == correct[qid]) is is_correct
+
+    def test_empty_optional_pools(self) -> None:
+        batch = SyntheticBatch()
+        generate_user(batch, _population(), ContentPool([uuid4()], [], []), 0, TODAY)
+        assert not batch.rows["culture_answer_history"]
+        assert not batch.rows["exercise_records"]
+
+
+@pytest.mark.unit
+def test_write_batch_copies_in_fk_order(pool: ContentPool) -> None:
+    batch = SyntheticBatch()
+    generate_user(batch, _population(), pool, 0, TODAY)
+    cursor = MagicMock()
+    cursor.copy_expert.side_effect = lambda sql, reader: reader.read()
+
+    written = write_batch(cursor, batch)
+
+    tables = [call.args[0].split()[1] for call in cursor.copy_expert.call_args_list]
+    assert tables == [table for table, _ in TABLES if batch.rows.get(table)]
+    assert written == batch.count()
+
+
+@pytest.mark.unit
+def test_email_pattern_matches_generated_emails() -> None:
+    assert email_pattern("heavy") == "heavy+%@perf.invalid"
@@ -423,7 +423,7 @@ class TestLoadDataHelpers:
 
         with patch.object(sys, "argv", ["load_wiktionary_morphology", "--force"]):
             main()
-        mock_load_data.assert_called_once_with(force=True, pos="noun")
+        mock_load_data.assert_called_once_with(force=True, pos="noun", workers=1)
 
     @patch("src.scripts.load_wiktionary_morphology.load_data")
     def test_main_default_no_force(self, mock_load_data):
@@ -431,7 +431,7 @@ class TestLoadDataHelpers:
 
         with patch.object(sys, "argv", ["load_wiktionary_morphology"]):
             main()
-        mock_load_data.assert_called_once_with(force=False, pos="noun")
+        mock_load_data.assert_called_once_with(force=False, pos="noun", workers=1)
 
     @patch("src.scripts.load_wiktionary_morphology.psycopg2")
     @patch("src.scripts.load_wiktionary_morphology.settings")
@@ -533,8 +533,6 @@ class TestPosFilterAndBundleOutput:
         RED because _parse_entries does not yet accept `pos` (TypeError), and
         even if it did, forms are still flat dicts today.
         """
-        import psycopg2.extras
-
         lines = [_make_entry("κόσμος", pos="noun")]
         rows, _filtered, _merged = _call_parse_entries(lines, pos="noun")
 
@@ -550,31 +548,32 @@ class TestPosFilterAndBundleOutput:
             assert "case" in features, f"Bundle features missing 'case': {features}"
             assert "number" in features, f"Bundle features missing 'number': {features}"
 
-        # Also verify via _insert_rows: the Json payload carries a list.
+        # Also verify via _insert_rows: the COPY payload carries a list.
         from src.scripts.load_wiktionary_morphology import _insert_rows
+        from src.scripts.streaming_ingest import encode_copy_value
 
         mock_cursor = MagicMock()
         captured_batches: list[list[tuple]] = []
 
-        def capture_execute_values(cursor, sql, batch):
+        def capture_copy_rows(cursor, table, columns, batch):
             captured_batches.append(list(batch))
+            return len(captured_batches[-1])
 
         with patch(
-            "src.scripts.load_wiktionary_morphology.psycopg2.extras.execute_values",
-            side_effect=capture_execute_values,
+            "src.scripts.load_wiktionary_morphology.copy_rows",
+            side_effect=capture_copy_rows,
         ):
             _insert_rows(mock_cursor, rows)
 
-        assert captured_batches, "No batches were flushed to execute_values"
-        # The forms column (index 2 of the VALUES tuple) is a Json wrapper.
+        assert captured_batches, "No batches were flushed to COPY"
+        # The forms column (index 2 of the row tuple) is the bundle list.
         first_tuple = captured_batches[0][0]
-        json_wrapper = first_tuple[2]
-        assert isinstance(json_wrapper, psycopg2.extras.Json)
-        # The Json payload must be a list (bundle list), not a dict.
-        payload = json_wrapper.adapted
+        payload = first_tuple[2]
+        # The payload must be a list (bundle list), not a dict, and encode as a JSON array.
         assert isinstance(
             payload, list
-        ), f"Expected bundle list in Json payload, got {type(payload)}: {payload}"
+        ), f"Expected bundle list in COPY payload, got {type(payload)}: {payload}"
+        assert json.loads(encode_copy_value(payload)) == payload
 
     # ------------------------------------------------------------------
     # AC-3  pos column written explicitly (default = "noun")
@@ -668,7 +667,7 @@ class TestPosFilterAndBundleOutput:
     # ------------------------------------------------------------------
 
     def test_insert_sql_includes_pos_column_and_value(self):
-        """AC-5: _insert_rows builds INSERT SQL with 'pos' in the column list
+        """AC-5: _insert_rows COPYs with 'pos' in the column list
         and each VALUES tuple carries the configured pos string (not relying on
         the DB server_default).
 
@@ -701,37 +700,29 @@ class TestPosFilterAndBundleOutput:
         ]
 
         mock_cursor = MagicMock()
-        captured_sqls: list[str] = []
+        captured_columns: list[tuple[str, ...]] = []
         captured_batches: list[list[tuple]] = []
 
-        def capture_execute_values(cursor, sql, batch):
-            captured_sqls.append(sql)
+        def capture_copy_rows(cursor, table, columns, batch):
+            captured_columns.append(tuple(columns))
             captured_batches.append(list(batch))
+            return len(captured_batches[-1])
 
         with patch(
-            "src.scripts.load_wiktionary_morphology.psycopg2.extras.execute_values",
-            side_effect=capture_execute_values,
+            "src.scripts.load_wiktionary_morphology.copy_rows",
+            side_effect=capture_copy_rows,
         ):
             _insert_rows(mock_cursor, rows)
 
-        assert captured_sqls, "execute_values was never called"
-        insert_sql = captured_sqls[0]
+        assert captured_columns, "copy_rows was never called"
 
-        # AC-5a: 'pos' must appear in the INSERT column list.
-        assert "pos" in insert_sql, f"'pos' not found in INSERT SQL. Got:\n{insert_sql}"
+        # AC-5a: 'pos' must appear in the COPY column list.
+        col_names = list(captured_columns[0])
+        assert "pos" in col_names, f"'pos' not in COPY column list: {col_names}"
 
-        # AC-5b: each VALUES tuple must carry pos == "noun" (not left to server_default).
+        # AC-5b: each row tuple must carry pos == "noun" (not left to server_default).
         assert captured_batches, "No batches captured"
         first_tuple = captured_batches[0][0]
-
-        # Determine pos position from the SQL column order.
-        # Extract the column list from the INSERT statement (between the parens after TABLE).
-        import re as _re
-
-        col_match = _re.search(r"INSERT INTO[^(]+\(([^)]+)\)", insert_sql)
-        assert col_match, f"Could not parse column list from INSERT SQL:\n{insert_sql}"
-        col_names = [c.strip() for c in col_match.group(1).split(",")]
-        assert "pos" in col_names, f"'pos' not in parsed column list: {col_names}"
         pos_index = col_names.index("pos")
 
         actual_pos_value = first_tuple[pos_index]
@@ -797,8 +788,6 @@ class TestPosFilterAndBundleOutputAdversarial:
         """
         import io as _io
 
-        import psycopg2.extras as _psycopg2_extras
-
         # Entry with no declension forms (empty forms list in JSONL).
         entry: dict = {
             "word": "κόσμος",
@@ -821,24 +810,25 @@ class TestPosFilterAndBundleOutputAdversarial:
             rows[0]["forms"] == []
         ), f"Expected empty bundle list [] for entry with no forms, got: {rows[0]['forms']}"
 
-        # Also verify _insert_rows wraps [] as Json([]), not Json({}).
+        # Also verify _insert_rows COPYs [] as a JSON array, not {}.
+        from src.scripts.streaming_ingest import encode_copy_value
+
         captured_batches: list[list[tuple]] = []
 
-        def capture(cursor, sql, batch):
+        def capture(cursor, table, columns, batch):
             captured_batches.append(list(batch))
+            return len(captured_batches[-1])
 
         with patch(
-            "src.scripts.load_wiktionary_morphology.psycopg2.extras.execute_values",
+            "src.scripts.load_wiktionary_morphology.copy_rows",
             side_effect=capture,
         ):
             _insert_rows(MagicMock(), rows)
 
         assert captured_batches
-        forms_col = captured_batches[0][0][2]  # index 2 = forms in VALUES tuple
-        assert isinstance(forms_col, _psycopg2_extras.Json)
-        assert (
-            forms_col.adapted == []
-        ), f"Expected Json([]) for empty forms, got: {forms_col.adapted!r}"
+        forms_col = captured_batches[0][0][2]  # index 2 = forms in the row tuple
+        assert forms_col == [], f"Expected [] for empty forms, got: {forms_col!r}"
+        assert encode_copy_value(forms_col) == "[]"
 
     def test_values_tuple_pos_position_matches_sql_column_list(self):
         """(c) Off-by-one guard: the value at the SQL 'pos' column position in the
@@ -849,8 +839,6 @@ class TestPosFilterAndBundleOutputAdversarial:
         any positional shift would surface as a type / value mismatch rather than a
         silent pass through the real 'noun' string.
         """
-        import re as _re
-
         from src.core.lexgen_forms import flat_to_bundles
         from src.scripts.load_wiktionary_morphology import _insert_rows
 
@@ -867,22 +855,22 @@ class TestPosFilterAndBundleOutputAdversarial:
             }
         ]
 
-        captured_sqls: list[str] = []
+        captured_columns: list[tuple[str, ...]] = []
         captured_batches: list[list[tuple]] = []
 
-        def capture(cursor, sql, batch):
-            captured_sqls.append(sql)
+        def capture(cursor, table, columns, batch):
+            captured_columns.append(tuple(columns))
             captured_batches.append(list(batch))
+            return len(captured_batches[-1])
 
         with patch(
-            "src.scripts.load_wiktionary_morphology.psycopg2.extras.execute_values",
+            "src.scripts.load_wiktionary_morphology.copy_rows",
             side_effect=capture,
         ):
             _insert_rows(MagicMock(), rows)
 
-        assert captured_sqls and captured_batches
-        col_match = _re.search(r"INSERT INTO[^(]+\(([^)]+)\)", captured_sqls[0])
-        col_names = [c.strip() for c in col_match.group(1).split(",")]
+        assert captured_columns and captured_batches
+        col_names = list(captured_columns[0])
         pos_idx = col_names.index("pos")
         actual = captured_batches[0][0][pos_idx]
         assert actual == sentinel_pos, (
@@ -0,0 +1,83 @@
+"""Unit tests for the micro-benchmark runner and its case inputs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.scripts.microbench import (
+    Measurement,
+    compare,
+    main,
+    measure,
+    run_document,
+    summarize,
+)
+from src.scripts.microbench_cases import BenchCase, build_cases
+
+
+def _doc(**medians: float) -> dict:
+    return {"cases": {name: {"median_ns": ns} for name, ns in medians.items()}}
+
+
+@pytest.mark.unit
+def test_every_case_runs_on_its_inputs() -> None:
+    cases = build_cases()
+    assert len({case.name for case in cases}) == len(cases)
+    for case in cases:
+        case.func()
+
+
+@pytest.mark.unit
+class TestStatistics:
+    def test_summarize_per_call(self) -> None:
+        m = summarize("x", 10, [0.001, 0.002, 0.003, 0.004, 0.005])
+        assert m.min_ns == pytest.approx(100_000)
+        assert m.median_ns == pytest.approx(300_000)
+        assert m.iqr_ns > 0
+        assert m.noise == pytest.approx(m.iqr_ns / m.median_ns)
+
+    def test_measure_calibrates_loop_count(self) -> None:
+        m = measure(BenchCase("noop", lambda: None, ""), repeat=3, min_sample_ms=1.0)
+        assert m.number > 1
+        assert m.median_ns > 0
+
+    def test_run_document_shape(self) -> None:
+        doc = run_document([Measurement("a", 4, 10.0, 9.0, 1.0)])
+        assert doc["cases"] == {"a": {"number": 4, "median_ns": 10.0, "min_ns": 9.0, "iqr_ns": 1.0}}
+
+
+@pytest.mark.unit
+class TestCompare:
+    def test_statuses(self) -> None:
+        results = compare(
+            _doc(same=100, slow=100, fast=100, gone=100),
+            _doc(same=110, slow=130, fast=50, added=5),
+            threshold=0.15,
+        )
+        assert {r.name: r.status for r in results} == {
+            "same": "ok",
+            "slow": "regressed",
+            "fast": "improved",
+            "added": "new",
+            "gone": "missing",
+        }
+        assert next(r for r in results if r.name == "slow").change == pytest.approx(0.3)
+
+    def test_cli_exit_code(self, tmp_path: Path) -> None:
+        base, cur = tmp_path / "base.json", tmp_path / "cur.json"
+        base.write_text(json.dumps(_doc(a=100)))
+        cur.write_text(json.dumps(_doc(a=140)))
+
+        assert main(["compare", str(base), str(cur)]) == 1
+        assert main(["compare", str(base), str(cur), "--threshold", "0.5"]) == 0
+
+    def test_run_save_and_compare(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        args = ["run", "--filter", "streak.longest", "--repeat", "3", "--min-sample-ms", "1"]
+
+        assert main([*args, "--save", str(baseline)]) == 0
+        assert list(json.loads(baseline.read_text())["cases"]) == ["streak.longest"]
+        assert main([*args, "--compare", str(baseline), "--threshold", "10"]) == 0
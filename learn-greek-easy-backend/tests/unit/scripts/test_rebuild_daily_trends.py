@@ -0,0 +1,70 @@
+"""Unit tests for the rebuild_daily_trends CLI (no database)."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.scripts.rebuild_daily_trends import _build_parser, days_since, rebuild
+
+_PATCH_REPO = "src.scripts.rebuild_daily_trends.UserDailyTrendsRepository"
+
+
+def _session(*user_batches) -> MagicMock:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    results = [
+        MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=b))))
+        for b in user_batches
+    ]
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRebuild:
+    async def test_user_scope_is_one_refresh(self):
+        session = _session()
+        user_ids = [uuid4()]
+
+        with patch(_PATCH_REPO) as repo_cls:
+            repo_cls.return_value.refresh = AsyncMock(return_value=12)
+            written = await rebuild(session, user_ids=user_ids)
+
+        assert written == 12
+        repo_cls.return_value.refresh.assert_awaited_once_with(user_ids=user_ids, days=None)
+        session.commit.assert_awaited_once()
+
+    async def test_full_rebuild_commits_per_user_batch(self):
+        first, second = [uuid4(), uuid4()], [uuid4()]
+        session = _session(first, second, [])
+
+        with patch(_PATCH_REPO) as repo_cls:
+            repo_cls.return_value.refresh = AsyncMock(side_effect=[30, 2])
+            written = await rebuild(session, batch_size=2)
+
+        assert written == 32
+        assert [c.kwargs["user_ids"] for c in repo_cls.return_value.refresh.await_args_list] == [
+            first,
+            second,
+        ]
+        assert session.commit.await_count == 2
+
+
+@pytest.mark.unit
+def test_days_since_is_inclusive():
+    assert days_since(date(2026, 10, 16), today=date(2026, 10, 18)) == [
+        date(2026, 10, 16),
+        date(2026, 10, 17),
+        date(2026, 10, 18),
+    ]
+
+
+@pytest.mark.unit
+def test_parser_parses_since():
+    args = _build_parser().parse_args(["--since", "2026-07-01"])
+
+    assert args.since == date(2026, 7, 1)
+    assert args.user_ids is None
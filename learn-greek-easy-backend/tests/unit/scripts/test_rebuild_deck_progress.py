@@ -0,0 +1,63 @@
+"""Unit tests for the rebuild_deck_progress CLI (no database)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.scripts.rebuild_deck_progress import _build_parser, rebuild
+
+_PATCH_REPO = "src.scripts.rebuild_deck_progress.UserDeckProgressRepository"
+
+
+def _session(*user_batches) -> MagicMock:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    results = [
+        MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=b))))
+        for b in user_batches
+    ]
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRebuild:
+    async def test_scoped_rebuild_is_one_refresh(self):
+        session = _session()
+        deck_id = uuid4()
+
+        with patch(_PATCH_REPO) as repo_cls:
+            repo_cls.return_value.refresh = AsyncMock(return_value=7)
+            written = await rebuild(session, deck_id=deck_id)
+
+        assert written == 7
+        repo_cls.return_value.refresh.assert_awaited_once_with(user_ids=None, deck_id=deck_id)
+        session.commit.assert_awaited_once()
+
+    async def test_full_rebuild_commits_per_user_batch(self):
+        first, second = [uuid4(), uuid4()], [uuid4()]
+        session = _session(first, second, [])
+
+        with patch(_PATCH_REPO) as repo_cls:
+            repo_cls.return_value.refresh = AsyncMock(side_effect=[4, 1])
+            written = await rebuild(session, batch_size=2)
+
+        assert written == 5
+        assert [c.kwargs["user_ids"] for c in repo_cls.return_value.refresh.await_args_list] == [
+            first,
+            second,
+        ]
+        assert session.commit.await_count == 2
+
+
+@pytest.mark.unit
+def test_parser_accepts_repeated_user_ids():
+    user_ids = [uuid4(), uuid4()]
+    args = _build_parser().parse_args(
+        ["--user-id", str(user_ids[0]), "--user-id", str(user_ids[1])]
+    )
+
+    assert args.user_ids == user_ids
+    assert args.deck_id is None
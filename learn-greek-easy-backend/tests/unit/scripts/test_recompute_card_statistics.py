@@ -0,0 +1,158 @@
+"""Unit tests for the recompute_card_statistics CLI (no database)."""
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.sm2 import calculate_sm2
+from src.scripts.recompute_card_statistics import (
+    STREAM_ROWS,
+    _build_parser,
+    _replay_streamed,
+    recompute,
+    replay_rows,
+)
+
+_PATCH_PROGRESS = "src.scripts.recompute_card_statistics.UserDeckProgressRepository"
+_PATCH_TRENDS = "src.scripts.recompute_card_statistics.UserDailyTrendsRepository"
+_PATCH_HISTOGRAM = "src.scripts.recompute_card_statistics.UserDueHistogramRepository"
+_PATCH_STREAM_ROWS = "src.scripts.recompute_card_statistics.STREAM_ROWS"
+_PATCH_REPLAY = "src.scripts.recompute_card_statistics.replay_rows"
+
+
+def _review(user_id, card_id, quality, day):
+    return SimpleNamespace(
+        user_id=user_id,
+        card_record_id=card_id,
+        quality=quality,
+        reviewed_at=datetime(2026, 9, 1, 12, tzinfo=timezone.utc) + timedelta(days=day),
+    )
+
+
+@pytest.mark.unit
+class TestReplayRows:
+    def test_replays_each_card_like_calculate_sm2(self):
+        user_id, first, second = uuid4(), uuid4(), uuid4()
+        rows = [
+            _review(user_id, first, 4, 0),
+            _review(user_id, first, 5, 1),
+            _review(user_id, first, 5, 7),
+            _review(user_id, second, 2, 3),
+        ]
+
+        values = {v["card_record_id"]: v for v in replay_rows(rows)}
+
+        one = calculate_sm2(2.5, 0, 0, 4)
+        two = calculate_sm2(one.new_easiness_factor, one.new_interval, one.new_repetitions, 5)
+        three = calculate_sm2(two.new_easiness_factor, two.new_interval, two.new_repetitions, 5)
+        assert values[first]["easiness_factor"] == three.new_easiness_factor
+        assert values[first]["interval"] == three.new_interval
+        assert values[first]["repetitions"] == three.new_repetitions
+        assert values[first]["status"] == three.new_status
+        assert values[first]["next_review_date"] == date(2026, 9, 8) + timedelta(
+            days=three.new_interval
+        )
+        assert (values[second]["interval"], values[second]["repetitions"]) == (1, 0)
+
+    def test_no_reviews_no_values(self):
+        assert replay_rows([]) == []
+
+
+class _Streamed:
+    """Stand-in for the ``AsyncResult`` of ``session.stream``."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def __aiter__(self):
+        for row in self.rows:
+            yield row
+
+
+def _session(reviews, *results) -> MagicMock:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.stream = AsyncMock(return_value=_Streamed(reviews))
+    session.execute = AsyncMock(side_effect=list(results))
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplayStreamed:
+    async def test_slices_cut_at_card_boundaries_match_one_replay(self):
+        user_id, first, second, third = uuid4(), uuid4(), uuid4(), uuid4()
+        rows = [
+            _review(user_id, first, 4, 0),
+            _review(user_id, first, 5, 1),
+            _review(user_id, first, 5, 7),
+            _review(user_id, second, 2, 3),
+            _review(user_id, second, 4, 4),
+            _review(user_id, third, 3, 5),
+        ]
+
+        with (
+            patch(_PATCH_STREAM_ROWS, 2),
+            patch(_PATCH_REPLAY, wraps=replay_rows) as replay,
+        ):
+            reviews, values = await _replay_streamed(_Streamed(rows))
+
+        assert reviews == len(rows)
+        assert values == replay_rows(rows)
+        slices = [call.args[0] for call in replay.call_args_list]
+        assert slices == [rows[:3], rows[3:5], rows[5:]]
+
+    async def test_no_rows_no_replay(self):
+        assert await _replay_streamed(_Streamed([])) == (0, [])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRecompute:
+    async def test_writes_and_recounts_derived_tables_per_chunk(self):
+        user_id = uuid4()
+        session = _session([_review(user_id, uuid4(), 4, 0)], MagicMock())
+
+        with (
+            patch(_PATCH_PROGRESS) as progress_cls,
+            patch(_PATCH_TRENDS) as trends_cls,
+            patch(_PATCH_HISTOGRAM) as histogram_cls,
+        ):
+            progress_cls.return_value.refresh = AsyncMock()
+            trends_cls.return_value.refresh = AsyncMock()
+            histogram_cls.return_value.invalidate = AsyncMock()
+            summary = await recompute(session, user_ids=[user_id])
+
+        assert (summary.users, summary.cards, summary.reviews) == (1, 1, 1)
+        read = session.stream.await_args.args[0]
+        assert read.get_execution_options()["yield_per"] == STREAM_ROWS
+        assert session.execute.await_count == 1  # one upsert
+        progress_cls.return_value.refresh.assert_awaited_once_with(user_ids=[user_id])
+        trends_cls.return_value.refresh.assert_awaited_once_with(user_ids=[user_id])
+        histogram_cls.return_value.invalidate.assert_awaited_once_with(user_ids=[user_id])
+        session.commit.assert_awaited_once()
+
+    async def test_dry_run_reads_but_never_writes(self):
+        user_id = uuid4()
+        session = _session([_review(user_id, uuid4(), 4, 0)])
+
+        summary = await recompute(session, user_ids=[user_id], dry_run=True)
+
+        assert summary.cards == 1
+        session.stream.assert_awaited_once()
+        session.execute.assert_not_awaited()
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_parser_defaults():
+    args = _build_parser().parse_args([])
+
+    assert args.user_ids is None
+    assert args.dry_run is False
+    assert args.allow_truncated_history is False
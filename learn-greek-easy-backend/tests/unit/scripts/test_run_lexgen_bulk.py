@@ -0,0 +1,39 @@
+"""Unit tests for src/scripts/run_lexgen_bulk.py (lemma list reading)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.scripts.run_lexgen_bulk import read_lemmas
+
+
+@pytest.mark.unit
+class TestReadLemmas:
+    def test_reads_export_deck_lemmas_csv(self, tmp_path: Path) -> None:
+        path = tmp_path / "deck_export.csv"
+        path.write_text(
+            "lemma,level,source\nσπίτι,A1,deck_export\nδρόμος,A2,deck_export\n",
+            encoding="utf-8",
+        )
+        assert read_lemmas(path) == ["σπίτι", "δρόμος"]
+
+    def test_csv_level_filter(self, tmp_path: Path) -> None:
+        path = tmp_path / "deck_export.csv"
+        path.write_text(
+            "lemma,level,source\nσπίτι,A1,deck_export\nδρόμος,A2,deck_export\n",
+            encoding="utf-8",
+        )
+        assert read_lemmas(path, "A2") == ["δρόμος"]
+
+    def test_reads_plain_list_skipping_blanks_and_comments(self, tmp_path: Path) -> None:
+        path = tmp_path / "lemmas.txt"
+        path.write_text("# A1 nouns\nσπίτι\n\n  δρόμος  \n", encoding="utf-8")
+        assert read_lemmas(path) == ["σπίτι", "δρόμος"]
+
+    def test_level_filter_rejected_for_plain_list(self, tmp_path: Path) -> None:
+        path = tmp_path / "lemmas.txt"
+        path.write_text("σπίτι\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="--level"):
+            read_lemmas(path, "A1")
@@ -0,0 +1,187 @@
+"""Unit tests for src/scripts/streaming_ingest.py (shared load_* ingest helpers)."""
+
+from __future__ import annotations
+
+import io
+import json
+from functools import partial
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.scripts.streaming_ingest import (
+    CopyRowReader,
+    Throughput,
+    batched,
+    bump_dataset_stamp,
+    copy_rows,
+    create_staging_table,
+    encode_copy_value,
+    iter_jsonl,
+    iter_jsonl_lines,
+    parse_chunks,
+    swap_from_staging,
+)
+
+
+def _double_chunk(lines: list[str], offset: int = 0) -> list[int]:
+    """Module-level so ProcessPoolExecutor can pickle it."""
+    return [int(line) * 2 + offset for line in lines]
+
+
+def _fake_path(content: str) -> MagicMock:
+    fake_path = MagicMock(spec=Path)
+    fake_path.open.return_value.__enter__ = lambda s: io.StringIO(content)
+    fake_path.open.return_value.__exit__ = MagicMock(return_value=False)
+    return fake_path
+
+
+@pytest.mark.unit
+class TestJsonlReading:
+    def test_iter_jsonl_lines_skips_blank_lines(self):
+        path = _fake_path('{"a": 1}\n\n   \n{"b": 2}\n')
+        assert list(iter_jsonl_lines(path)) == ['{"a": 1}', '{"b": 2}']
+
+    def test_iter_jsonl_skips_invalid_json(self):
+        path = _fake_path('{"a": 1}\nnot json\n{"b": 2}\n')
+        assert list(iter_jsonl(path)) == [{"a": 1}, {"b": 2}]
+
+    def test_iter_jsonl_is_lazy(self):
+        path = _fake_path('{"a": 1}\n{"b": 2}\n')
+        iterator = iter_jsonl(path)
+        assert next(iterator) == {"a": 1}
+
+    def test_batched_splits_and_keeps_remainder(self):
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(batched([], 3)) == []
+
+
+@pytest.mark.unit
+class TestParseChunks:
+    def test_inline_preserves_order(self):
+        lines = [str(i) for i in range(7)]
+        results = list(parse_chunks(lines, _double_chunk, workers=1, chunk_size=3))
+        assert results == [[0, 2, 4], [6, 8, 10], [12]]
+
+    def test_process_pool_matches_inline(self):
+        lines = [str(i) for i in range(50)]
+        parse = partial(_double_chunk, offset=1)
+        inline = list(parse_chunks(lines, parse, workers=1, chunk_size=4))
+        pooled = list(parse_chunks(lines, parse, workers=2, chunk_size=4))
+        assert pooled == inline
+
+
+@pytest.mark.unit
+class TestCopyEncoding:
+    def test_none_is_null_marker(self):
+        assert encode_copy_value(None) == "\\N"
+
+    def test_special_characters_are_escaped(self):
+        assert encode_copy_value("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+
+    def test_json_values_are_serialized_unescaped_unicode(self):
+        encoded = encode_copy_value([{"form": "κόσμος"}])
+        assert json.loads(encoded) == [{"form": "κόσμος"}]
+        assert "κόσμος" in encoded
+
+    def test_bool_and_numbers(self):
+        assert encode_copy_value(True) == "t"
+        assert encode_copy_value(False) == "f"
+        assert encode_copy_value(3) == "3"
+
+    def test_reader_encodes_rows_on_demand(self):
+        consumed: list[int] = []
+
+        def rows():
+            for i in range(3):
+                consumed.append(i)
+                yield (i, f"w{i}")
+
+        reader = CopyRowReader(rows())
+        first = reader.read(4)
+        assert first == "0\tw0"
+        assert consumed == [0]
+        rest = reader.read()
+        assert first + rest == "0\tw0\n1\tw1\n2\tw2\n"
+        assert reader.row_count == 3
+
+    def test_copy_rows_streams_into_copy_expert(self):
+        cursor = MagicMock()
+        captured: dict[str, str] = {}
+
+        def fake_copy_expert(sql, reader):
+            captured["sql"] = sql
+            captured["data"] = reader.read()
+
+        cursor.copy_expert.side_effect = fake_copy_expert
+
+        count = copy_rows(cursor, "stage", ("lemma", "rank"), iter([("α", 1), ("β", None)]))
+
+        assert count == 2
+        assert captured["sql"] == "COPY stage (lemma, rank) FROM STDIN"
+        assert captured["data"] == "α\t1\nβ\t\\N\n"
+
+
+@pytest.mark.unit
+class TestStagingSwap:
+    def test_create_staging_table_is_transaction_scoped(self):
+        cursor = MagicMock()
+        create_staging_table(cursor, "stage", "reference.t", ("a", "b"))
+        sql = cursor.execute.call_args[0][0]
+        assert "CREATE TEMP TABLE stage ON COMMIT DROP" in sql
+        assert "SELECT a, b FROM reference.t WITH NO DATA" in sql
+
+    def test_swap_replace_scoped_deletes_before_insert(self):
+        cursor = MagicMock()
+        cursor.rowcount = 5
+        inserted = swap_from_staging(
+            cursor,
+            "reference.t",
+            "stage",
+            ("a", "b"),
+            replace=True,
+            scope_sql="source = %s",
+            scope_params=("kaikki",),
+        )
+        calls = cursor.execute.call_args_list
+        assert calls[0][0] == ("DELETE FROM reference.t WHERE source = %s", ("kaikki",))
+        assert calls[1][0][0] == "INSERT INTO reference.t (a, b) SELECT a, b FROM stage"
+        assert inserted == 5
+
+    def test_swap_without_replace_only_inserts(self):
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        swap_from_staging(
+            cursor,
+            "reference.t",
+            "stage",
+            ("a",),
+            replace=False,
+            on_conflict="ON CONFLICT DO NOTHING",
+        )
+        assert cursor.execute.call_count == 1
+        sql = cursor.execute.call_args[0][0]
+        assert sql.endswith("FROM stage ON CONFLICT DO NOTHING")
+
+
+@pytest.mark.unit
+def test_bump_dataset_stamp_upserts_and_increments():
+    cursor = MagicMock()
+
+    bump_dataset_stamp(cursor, "frequency_rank")
+
+    sql, params = cursor.execute.call_args[0]
+    assert "INSERT INTO reference.dataset_stamp" in sql
+    assert "ON CONFLICT (dataset) DO UPDATE" in sql
+    assert "version = reference.dataset_stamp.version + 1" in sql
+    assert params == ("frequency_rank",)
+
+
+@pytest.mark.unit
+def test_throughput_reports_rate():
+    meter = Throughput("phase")
+    meter.add(10)
+    meter.add(5)
+    assert meter.rows == 15
+    assert meter.rate >= 0.0
@@ -0,0 +1,127 @@
+"""Unit tests for DeckImportService (whole-deck manifest import).
+
+DB-free: the deck and word-entry repositories and CardGeneratorService are
+mocks, so these tests pin the import contract — up-front validation, chunked
+set-wise writes, one generator call per card type per chunk, and the
+per-phase timing report.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import settings
+from src.core.exceptions import ConflictException, NotFoundException
+from src.db.models import PartOfSpeech
+from src.schemas.word_entry import DeckImportRequest
+from src.services.deck_import_service import DeckImportService
+
+
+def _manifest(count: int, **kwargs) -> DeckImportRequest:
+    return DeckImportRequest(
+        word_entries=[
+            {"lemma": f"λέξη{i}", "part_of_speech": "noun", "translation_en": f"word {i}"}
+            for i in range(count)
+        ],
+        **kwargs,
+    )
+
+
+def _db(linked_rows: list | None = None) -> MagicMock:
+    db = MagicMock()
+    result = MagicMock()
+    result.all.return_value = linked_rows or []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _service(db: MagicMock, *, deck_active: bool | None = True) -> DeckImportService:
+    service = DeckImportService(db)
+    deck = None if deck_active is None else SimpleNamespace(is_active=deck_active)
+    service.deck_repo = MagicMock(get=AsyncMock(return_value=deck))
+
+    async def bulk_upsert(owner_id, entries_data):
+        return [SimpleNamespace(id=uuid4()) for _ in entries_data], len(entries_data), 0
+
+    service.word_entry_repo = MagicMock(
+        bulk_upsert=AsyncMock(side_effect=bulk_upsert),
+        link_many_to_deck=AsyncMock(side_effect=lambda ids, deck_id: len(ids)),
+    )
+    return service
+
+
+@pytest.mark.unit
+class TestDeckImportRequest:
+    def test_rejects_duplicate_lemma_pos_gender(self):
+        entry = {"lemma": "σπίτι", "part_of_speech": "noun", "translation_en": "house"}
+        with pytest.raises(ValidationError, match="Duplicate entry"):
+            DeckImportRequest(word_entries=[entry, entry])
+
+    def test_defaults_to_every_card_type(self):
+        assert set(_manifest(1).card_types) == {
+            "meaning",
+            "plural_form",
+            "article",
+            "sentence_translation",
+            "declension",
+        }
+
+
+@pytest.mark.unit
+class TestImportManifest:
+    async def test_writes_in_chunks_with_one_generator_call_per_type(self, monkeypatch):
+        monkeypatch.setattr(settings, "deck_import_chunk_size", 2)
+        service = _service(_db())
+        meaning = AsyncMock(return_value=(4, 0))
+        article = AsyncMock(return_value=(1, 1))
+        with (
+            patch.object(service.card_service, "generate_meaning_cards", meaning),
+            patch.object(service.card_service, "generate_article_cards", article),
+        ):
+            result = await service.import_manifest(
+                uuid4(), _manifest(5, card_types=["meaning", "article"])
+            )
+
+        chunk_sizes = [
+            len(call.kwargs["entries_data"])
+            for call in service.word_entry_repo.bulk_upsert.await_args_list
+        ]
+        assert chunk_sizes == [2, 2, 1]
+        assert service.word_entry_repo.link_many_to_deck.await_count == 3
+        assert meaning.await_count == article.await_count == 3
+        assert (result.created_count, result.updated_count, result.linked_count) == (5, 0, 5)
+        assert (result.cards_created, result.cards_updated) == (15, 3)
+        assert set(result.timings) == {
+            "validate_ms",
+            "upsert_entries_ms",
+            "link_ms",
+            "generate_cards_ms",
+        }
+
+    async def test_missing_deck_fails_before_any_write(self):
+        service = _service(_db(), deck_active=None)
+
+        with pytest.raises(NotFoundException):
+            await service.import_manifest(uuid4(), _manifest(1))
+
+        service.word_entry_repo.bulk_upsert.assert_not_called()
+
+    async def test_inactive_deck_is_a_conflict(self):
+        service = _service(_db(), deck_active=False)
+
+        with pytest.raises(ConflictException, match="not active"):
+            await service.import_manifest(uuid4(), _manifest(1))
+
+    async def test_clash_with_linked_owned_entry_is_reported_up_front(self):
+        linked = [SimpleNamespace(lemma="λέξη1", part_of_speech=PartOfSpeech.NOUN, gender=None)]
+        service = _service(_db(linked))
+
+        with pytest.raises(ConflictException, match="λέξη1"):
+            await service.import_manifest(uuid4(), _manifest(3))
+
+        service.word_entry_repo.bulk_upsert.assert_not_called()
@@ -0,0 +1,143 @@
+"""Unit tests for the versioned exercise content cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.db.models import DeckLevel, ExerciseModality, ExerciseType
+from src.services.exercise_content_cache import ExerciseContentCache
+from src.services.exercise_sm2_service import ExerciseSM2Service
+from src.services.picture_match_service import DescriptionRef, PictureRef
+
+
+def _description_exercise(audio_key: str = "b1/audio.mp3") -> MagicMock:
+    desc = MagicMock()
+    desc.text_el = "Ο Γιάννης."
+    desc.audio_s3_key = audio_key
+    desc.audio_duration_seconds = 10.0
+    desc.word_timestamps = [{"word": "Ο", "start": 0.0, "end": 0.2}]
+
+    de = MagicMock()
+    de.modality = ExerciseModality.LISTENING
+    de.audio_level = DeckLevel.B1
+    de.description = desc
+    de.items = []
+    de.exercise_type = ExerciseType.FILL_GAPS
+
+    exercise = MagicMock()
+    exercise.id = uuid4()
+    exercise.description_exercise = de
+    return exercise
+
+
+class _Db:
+    """Session stub: version statements return ``version``, loads return ``exercises``."""
+
+    def __init__(self, exercises: list) -> None:
+        self.version: tuple = (1, "t0")
+        self.loads = 0
+        self.execute = AsyncMock(side_effect=self._execute)
+        self._exercises = exercises
+
+    async def _execute(self, statement, params=None):
+        result = MagicMock()
+        if "count(*)" in str(statement):
+            result.one.return_value = self.version
+        else:
+            self.loads += 1
+            result.scalars.return_value.all.return_value = self._exercises
+        return result
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExerciseContentCache:
+    async def test_second_read_is_served_from_cache(self):
+        exercise = _description_exercise()
+        db = _Db([exercise])
+        cache = ExerciseContentCache()
+
+        first = await cache.descriptions(db, [exercise.id])
+        second = await cache.descriptions(db, [exercise.id])
+
+        assert first == second
+        assert first[exercise.id].audio_key == "b1/audio.mp3"
+        assert db.loads == 1
+
+    async def test_version_change_reloads_after_recheck_interval(self):
+        exercise = _description_exercise()
+        db = _Db([exercise])
+        cache = ExerciseContentCache()
+        await cache.descriptions(db, [exercise.id])
+
+        db.version = (1, "t1")
+        await cache.descriptions(db, [exercise.id])
+        assert db.loads == 1  # version not re-read inside the interval
+
+        with patch("src.services.exercise_content_cache.time.monotonic", return_value=1e12):
+            await cache.descriptions(db, [exercise.id])
+        assert db.loads == 2
+
+    async def test_zero_ttl_disables_cache(self):
+        exercise = _description_exercise()
+        db = _Db([exercise])
+        cache = ExerciseContentCache()
+
+        with patch("src.services.exercise_content_cache.settings") as mock_settings:
+            mock_settings.exercise_content_cache_ttl = 0
+            await cache.descriptions(db, [exercise.id])
+            await cache.descriptions(db, [exercise.id])
+
+        assert db.loads == 2
+
+    async def test_pool_is_detached_and_cached_per_type(self):
+        sp = MagicMock(situation_id=uuid4(), image_s3_key="img.png")
+        sd = MagicMock(situation_id=sp.situation_id, text_el="κείμενο")
+        db = _Db([])
+        cache = ExerciseContentCache()
+
+        with patch(
+            "src.services.exercise_content_cache.load_distractor_pool",
+            AsyncMock(return_value=[(sp, sd)]),
+        ) as mock_pool:
+            first = await cache.distractor_pool(db, ExerciseType.SELECT_PICTURE_FROM_DESCRIPTION)
+            await cache.distractor_pool(db, ExerciseType.SELECT_PICTURE_FROM_DESCRIPTION)
+
+        assert first == [
+            (
+                PictureRef(situation_id=sp.situation_id, image_s3_key="img.png"),
+                DescriptionRef(situation_id=sp.situation_id, text_el="κείμενο"),
+            )
+        ]
+        mock_pool.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPresignAtTheEdge:
+    async def test_cached_content_is_presigned_on_every_call(self, mock_db_session):
+        exercise = _description_exercise()
+        db = _Db([exercise])
+        mock_db_session.execute = db.execute
+        service = ExerciseSM2Service(mock_db_session)
+
+        with patch("src.services.exercise_sm2_service.get_s3_service") as mock_s3:
+            mock_s3.return_value.generate_presigned_url.side_effect = ["https://u/1", "https://u/2"]
+            first = await service.load_description_enrichment([exercise.id])
+            second = await service.load_description_enrichment([exercise.id])
+
+        assert first[exercise.id]["description_audio_url"] == "https://u/1"
+        assert second[exercise.id]["description_audio_url"] == "https://u/2"
+        assert db.loads == 1
+
+    async def test_summary_skips_presigning(self, mock_db_session):
+        exercise = _description_exercise()
+        mock_db_session.execute = _Db([exercise]).execute
+        service = ExerciseSM2Service(mock_db_session)
+
+        with patch("src.services.exercise_sm2_service.get_s3_service") as mock_s3:
+            result = await service.load_description_enrichment([exercise.id], presign=False)
+
+        assert result[exercise.id]["description_audio_url"] is None
+        mock_s3.assert_not_called()
@@ -460,14 +460,14 @@ class TestGetStudyQueueSummaryMode:
 
         # load_picture_match_enrichment's own bulk-load query: return the
         # picture exercise with its picture_exercise relation populated so
-        # the code proceeds to (and fails inside) assemble_picture_match_payload.
+        # the code proceeds to (and fails inside) build_picture_match_payload.
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = [picture_source_exercise]
         mock_db_session.execute = AsyncMock(return_value=mock_result)
 
         with patch(
-            "src.services.exercise_sm2_service.assemble_picture_match_payload",
-            AsyncMock(side_effect=InsufficientDistractorPoolError()),
+            "src.services.exercise_sm2_service.build_picture_match_payload",
+            MagicMock(side_effect=InsufficientDistractorPoolError()),
         ):
             queue_full = await service.get_study_queue(user_id, summary=False)
             queue_summary = await service.get_study_queue(user_id, summary=True)
@@ -0,0 +1,198 @@
+"""Unit tests for the bulk LEXGEN runner (lexgen_bulk_service).
+
+DB-free: the session factory, evidence prefetch, resume query and
+LexgenPipelineService are all replaced with mocks, so these tests pin the
+runner's scheduling contract — dedupe, resume skip, bounded concurrency,
+rate-limit backoff + retry, and per-lemma failure isolation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.exceptions import OpenRouterRateLimitError
+from src.db.models import WordProposalOrigin
+from src.services.evidence_assembly_service import EvidencePrefetch
+from src.services.lexgen_bulk_service import (
+    AdaptiveConcurrency,
+    LexgenBulkRunner,
+    dedupe_lemmas,
+)
+
+
+def _session_factory() -> MagicMock:
+    @asynccontextmanager
+    async def _session():
+        yield MagicMock()
+
+    return MagicMock(side_effect=_session)
+
+
+def _patch_prefetch():
+    async def fake_prefetch(db, lemmas, pos):
+        lemmas = frozenset(lemmas)
+        return EvidencePrefetch(pos=pos, lemmas=lemmas)
+
+    return patch(
+        "src.services.lexgen_bulk_service.prefetch_evidence", AsyncMock(side_effect=fake_prefetch)
+    )
+
+
+def _patch_normalize():
+    return patch(
+        "src.services.lexgen_bulk_service.normalize_lemma_input", side_effect=lambda lemma: lemma
+    )
+
+
+def _patch_pipeline(run_for_lemma: AsyncMock):
+    pipeline = MagicMock()
+    pipeline.run_for_lemma = run_for_lemma
+    return patch("src.services.lexgen_bulk_service.LexgenPipelineService", return_value=pipeline)
+
+
+def _make_runner(**kwargs) -> LexgenBulkRunner:
+    kwargs.setdefault("resume", False)
+    kwargs.setdefault("limiter", AdaptiveConcurrency(2, base_delay=0.0))
+    return LexgenBulkRunner(_session_factory(), **kwargs)
+
+
+@pytest.mark.unit
+def test_dedupe_lemmas_strips_and_preserves_order() -> None:
+    assert dedupe_lemmas([" σπίτι", "", "δρόμος", "σπίτι ", "  "]) == ["σπίτι", "δρόμος"]
+
+
+@pytest.mark.unit
+class TestAdaptiveConcurrency:
+    def test_rate_limit_halves_limit_and_backs_off_exponentially(self) -> None:
+        limiter = AdaptiveConcurrency(8, base_delay=1.0, max_delay=3.0)
+
+        assert limiter.record_rate_limit() == 1.0
+        assert limiter.limit == 4
+        assert limiter.record_rate_limit() == 2.0
+        assert limiter.limit == 2
+        assert limiter.record_rate_limit() == 3.0  # capped at max_delay
+        assert limiter.record_rate_limit() == 3.0
+        assert limiter.limit == 1
+
+    def test_success_grows_limit_back_to_max(self) -> None:
+        limiter = AdaptiveConcurrency(3, base_delay=0.0)
+        limiter.record_rate_limit()
+        assert limiter.limit == 1
+
+        limiter.record_success()
+        assert limiter.limit == 2
+        limiter.record_success()
+        limiter.record_success()
+        assert limiter.limit == 3
+        for _ in range(10):
+            limiter.record_success()
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight(self) -> None:
+        limiter = AdaptiveConcurrency(2)
+        peak = 0
+
+        async def work() -> None:
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+
+@pytest.mark.unit
+class TestLexgenBulkRunner:
+    @pytest.mark.asyncio
+    async def test_runs_each_unique_lemma_as_batch_origin(self) -> None:
+        run_for_lemma = AsyncMock(side_effect=[(MagicMock(), "queued"), (MagicMock(), "rejected")])
+        runner = _make_runner()
+
+        with _patch_prefetch() as prefetch, _patch_normalize(), _patch_pipeline(run_for_lemma):
+            summary = await runner.run(["σπίτι", "δρόμος", "σπίτι"])
+
+        assert (summary.total, summary.queued, summary.rejected) == (2, 1, 1)
+        assert summary.failed == {}
+        prefetch.assert_awaited_once()
+        for call in run_for_lemma.await_args_list:
+            assert call.kwargs["origin"] == WordProposalOrigin.BATCH
+            assert call.kwargs["prefetch"].covers(call.args[0], "noun")
+
+    @pytest.mark.asyncio
+    async def test_prefetches_once_per_batch(self) -> None:
+        run_for_lemma = AsyncMock(return_value=(MagicMock(), "queued"))
+        runner = _make_runner(batch_size=2)
+
+        with _patch_prefetch() as prefetch, _patch_normalize(), _patch_pipeline(run_for_lemma):
+            summary = await runner.run(["α", "β", "γ", "δ", "ε"])
+
+        assert summary.queued == 5
+        assert prefetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_already_proposed(self) -> None:
+        run_for_lemma = AsyncMock(return_value=(MagicMock(), "queued"))
+        runner = _make_runner(resume=True)
+
+        with (
+            _patch_prefetch(),
+            _patch_normalize(),
+            _patch_pipeline(run_for_lemma),
+            patch.object(runner, "_already_proposed", AsyncMock(return_value={"σπίτι"})),
+        ):
+            summary = await runner.run(["σπίτι", "δρόμος"])
+
+        assert summary.skipped == 1
+        assert summary.queued == 1
+        assert [c.args[0] for c in run_for_lemma.await_args_list] == ["δρόμος"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backs_off_and_retries(self) -> None:
+        run_for_lemma = AsyncMock(
+            side_effect=[OpenRouterRateLimitError("429"), (MagicMock(), "queued")]
+        )
+        limiter = AdaptiveConcurrency(4, base_delay=0.0)
+        runner = _make_runner(limiter=limiter)
+
+        with _patch_prefetch(), _patch_normalize(), _patch_pipeline(run_for_lemma):
+            summary = await runner.run(["σπίτι"])
+
+        assert summary.queued == 1
+        assert run_for_lemma.await_count == 2
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_exhaustion_marks_failed(self) -> None:
+        run_for_lemma = AsyncMock(side_effect=OpenRouterRateLimitError("429"))
+        runner = _make_runner()
+
+        with (
+            _patch_prefetch(),
+            _patch_normalize(),
+            _patch_pipeline(run_for_lemma),
+            patch("src.services.lexgen_bulk_service.settings") as mock_settings,
+        ):
+            mock_settings.lexgen_bulk_max_attempts = 2
+            summary = await runner.run(["σπίτι"])
+
+        assert run_for_lemma.await_count == 2
+        assert "OpenRouterRateLimitError" in summary.failed["σπίτι"]
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_fails_only_that_lemma(self) -> None:
+        run_for_lemma = AsyncMock(side_effect=[RuntimeError("boom"), (MagicMock(), "queued")])
+        runner = _make_runner(limiter=AdaptiveConcurrency(1, base_delay=0.0))
+
+        with _patch_prefetch(), _patch_normalize(), _patch_pipeline(run_for_lemma):
+            summary = await runner.run(["σπίτι", "δρόμος"])
+
+        assert summary.failed == {"σπίτι": "RuntimeError: boom"}
+        assert summary.queued == 1
@@ -816,3 +816,38 @@ class TestJudgeToleratesCheckERegenKey:
 
         with pytest.raises(ValidationError):
             await svc.judge(proposal)
+
+
+# ---------------------------------------------------------------------------
+# Judges run concurrently
+# ---------------------------------------------------------------------------
+
+
+class TestJudgesRunConcurrently:
+    """The two judge calls overlap instead of running back to back."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_judge_calls_overlap(self, mock_openrouter: AsyncMock) -> None:
+        import asyncio  # noqa: PLC0415
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_complete(*args, **kwargs) -> OpenRouterResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _rubric_response(_PERFECT_RUBRIC_DICT)
+
+        mock_openrouter.complete.side_effect = slow_complete
+        proposal = _make_proposal()
+        svc = _make_service(mock_openrouter)
+
+        outcome = await svc.judge(proposal)
+
+        assert peak == 2
+        assert [j.model for j in outcome.judges] == [_JUDGE_MODEL_A, _JUDGE_MODEL_B]
+        assert proposal.status == WordProposalState.NEEDS_REVIEW
@@ -0,0 +1,51 @@
+"""Unit tests for lexgen_pipeline_service.record_stage_timing."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.db.models import WordProposal, WordProposalOrigin, WordProposalState
+from src.services.lexgen_pipeline_service import record_stage_timing
+
+
+def _make_proposal() -> WordProposal:
+    return WordProposal(
+        lemma_input="βιβλίο",
+        pos="noun",
+        origin=WordProposalOrigin.ADMIN,
+        status=WordProposalState.GENERATING,
+    )
+
+
+@pytest.mark.unit
+class TestRecordStageTiming:
+    def test_records_stage_ms_and_keeps_earlier_stages(self) -> None:
+        proposal = _make_proposal()
+        proposal.stage_timings = {"assemble_ms": 3}
+
+        with record_stage_timing(proposal, "generate"):
+            pass
+
+        assert proposal.stage_timings["assemble_ms"] == 3
+        assert isinstance(proposal.stage_timings["generate_ms"], int)
+        assert proposal.stage_timings["generate_ms"] >= 0
+
+    def test_reassigns_dict_for_jsonb_change_detection(self) -> None:
+        proposal = _make_proposal()
+        original = {"assemble_ms": 1}
+        proposal.stage_timings = original
+
+        with record_stage_timing(proposal, "verify"):
+            pass
+
+        assert proposal.stage_timings is not original
+        assert original == {"assemble_ms": 1}
+
+    def test_records_timing_when_stage_raises(self) -> None:
+        proposal = _make_proposal()
+
+        with pytest.raises(RuntimeError):
+            with record_stage_timing(proposal, "judge"):
+                raise RuntimeError("boom")
+
+        assert "judge_ms" in proposal.stage_timings
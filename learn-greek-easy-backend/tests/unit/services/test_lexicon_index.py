@@ -0,0 +1,166 @@
+"""Unit tests for the memory-mapped lexicon index (lexicon_index.py) and the
+LexiconService fast path that reads it.
+
+Index files are written to tmp_path; no database is needed. The expected
+results mirror the ORDER BY / DISTINCT ON semantics of the LexiconService
+queries.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.lexicon_index import LexiconIndex, LexiconIndexError, write_lexicon_index
+from src.services.lexicon_service import (
+    LexiconEntry,
+    LexiconService,
+    _open_lexicon_index,
+    lexicon_index_snapshot,
+)
+
+_ROWS = [
+    # form, lemma, pos, gender, ptosi, number — deliberately not in preference order
+    ("σπίτια", "σπίτι", "NOUN", "Neut", "Nom", "Plur"),
+    ("σπιτιού", "σπίτι", "NOUN", "Neut", "Gen", "Sing"),
+    ("σπίτι", "σπίτι", "NOUN", "Neut", "Acc", "Sing"),
+    ("σπίτι", "σπίτι", "NOUN", "Neut", "Nom", "Sing"),
+    ("σύζυγος", "σύζυγος", "NOUN", "Masc", "Nom", "Sing"),
+    ("σύζυγος", "σύζυγος", "NOUN", "Fem", "Nom", "Sing"),
+    ("σύζυγος", "σύζυγος", "X", None, None, None),
+    ("καλός", "καλός", "ADJ", "Masc", "Nom", "Sing"),
+]
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> Iterator[LexiconIndex]:
+    path = tmp_path / "lexicon.idx"
+    write_lexicon_index(_ROWS, path, dataset_version=7)
+    mapped = LexiconIndex(path)
+    yield mapped
+    mapped.close()
+
+
+@pytest.mark.unit
+class TestLexiconIndex:
+    def test_header(self, index: LexiconIndex) -> None:
+        assert len(index) == len(_ROWS)
+        assert index.dataset_version == 7
+
+    def test_lookup_prefers_nominative_singular(self, index: LexiconIndex) -> None:
+        assert index.lookup("σπίτι") == LexiconEntry(
+            "σπίτι", "σπίτι", "NOUN", "Neut", "Nom", "Sing"
+        )
+
+    def test_lookup_filters(self, index: LexiconIndex) -> None:
+        assert index.lookup("σύζυγος", pos="NOUN", gender="Fem").gender == "Fem"
+        assert index.lookup("καλός", pos="NOUN") is None
+        assert index.lookup("καλός", pos="VERB") is None  # pos never seen
+        assert index.lookup("άγνωστο") is None
+
+    def test_declensions_in_sing_then_case_order(self, index: LexiconIndex) -> None:
+        forms = [(e.form, e.ptosi, e.number) for e in index.get_declensions("σπίτι")]
+        assert forms == [
+            ("σπίτι", "Nom", "Sing"),
+            ("σπιτιού", "Gen", "Sing"),
+            ("σπίτι", "Acc", "Sing"),
+            ("σπίτια", "Nom", "Plur"),
+        ]
+        assert index.get_declensions("σπίτι", gender="Masc") == []
+        assert index.get_declensions("καλός") == []  # ADJ, default pos NOUN
+
+    def test_all_genders_one_per_gender_null_last(self, index: LexiconIndex) -> None:
+        genders = [e.gender for e in index.lookup_all_genders("σύζυγος")]
+        assert genders == ["Fem", "Masc", None]
+        assert [e.gender for e in index.lookup_all_genders("σύζυγος", pos="NOUN")] == [
+            "Fem",
+            "Masc",
+        ]
+
+    def test_open_missing_or_unset_returns_none(self, tmp_path: Path) -> None:
+        assert LexiconIndex.open(None) is None
+        assert LexiconIndex.open(tmp_path / "absent.idx") is None
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "junk.idx"
+        path.write_bytes(b"not an index at all")
+        with pytest.raises(LexiconIndexError):
+            LexiconIndex(path)
+
+    def test_retire_waits_for_in_flight_readers(self, index: LexiconIndex) -> None:
+        assert index.acquire()
+        index.retire()
+
+        assert not index.acquire()
+        assert index.lookup("σπίτι") is not None
+        index.release()
+        assert index._mmap.closed
+
+
+@pytest.mark.unit
+class TestLexiconServiceMappedIndex:
+    @pytest.fixture(autouse=True)
+    def _reset(self) -> Iterator[None]:
+        lexicon_index_snapshot.reset()
+        yield
+        lexicon_index_snapshot.reset()
+
+    @staticmethod
+    def _stamp_session(version: int) -> MagicMock:
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = version
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    @pytest.mark.asyncio
+    async def test_current_index_serves_lookups(self, tmp_path: Path) -> None:
+        path = tmp_path / "lexicon.idx"
+        write_lexicon_index(_ROWS, path, dataset_version=3)
+        db = self._stamp_session(3)
+
+        with patch("src.services.lexicon_service.settings") as mock_settings:
+            mock_settings.lexicon_index_path = str(path)
+            service = LexiconService(db)
+            entry = await service.lookup("σπιτιού")
+            declensions = await service.get_declensions("σπίτι")
+
+        assert entry is not None and entry.lemma == "σπίτι"
+        assert len(declensions) == 4
+        # Only the snapshot stamp check and the loader's version check hit the DB.
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reload_closes_the_replaced_mapping(self, tmp_path: Path) -> None:
+        path = tmp_path / "lexicon.idx"
+        write_lexicon_index(_ROWS, path, dataset_version=3)
+
+        with patch("src.services.lexicon_service.settings") as mock_settings:
+            mock_settings.lexicon_index_path = str(path)
+            first = await lexicon_index_snapshot.get(self._stamp_session(3))
+            lexicon_index_snapshot.reset()
+            second = await lexicon_index_snapshot.get(self._stamp_session(3))
+
+        assert first.index is not None and first.index._mmap.closed
+        assert second.index is not None and not second.index._mmap.closed
+
+    @pytest.mark.asyncio
+    async def test_stale_index_falls_back_to_database(self, tmp_path: Path) -> None:
+        path = tmp_path / "lexicon.idx"
+        write_lexicon_index(_ROWS, path, dataset_version=3)
+
+        with patch("src.services.lexicon_service.settings") as mock_settings:
+            mock_settings.lexicon_index_path = str(path)
+            mapped = await _open_lexicon_index(self._stamp_session(4))
+
+        assert mapped.index is None
+        assert mapped.mtime is not None
+
+    @pytest.mark.asyncio
+    async def test_unset_path_uses_database(self) -> None:
+        with patch("src.services.lexicon_service.settings") as mock_settings:
+            mock_settings.lexicon_index_path = None
+            assert await LexiconService(MagicMock())._mapped_index() is None
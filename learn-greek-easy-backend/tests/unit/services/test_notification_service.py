@@ -39,6 +39,8 @@ def mock_repo():
     repo.delete_by_id = AsyncMock(return_value=True)
     repo.delete_all_by_user = AsyncMock(return_value=10)
     repo.delete_older_than = AsyncMock(return_value=100)
+    repo.adjust_unread_count = AsyncMock(return_value=1)
+    repo.unread_counts = {}
     return repo
 
 
@@ -579,7 +581,7 @@ class TestEventBusSignals:
 
         service.repo = MagicMock()
         service.repo.create = AsyncMock(return_value=mock_notification)
-        service.repo.get_unread_count = AsyncMock(return_value=3)
+        service.repo.adjust_unread_count = AsyncMock(return_value=3)
         mock_db_session.flush = AsyncMock()
 
         with patch("src.services.notification_service.notification_event_bus") as mock_bus:
@@ -624,3 +626,15 @@ class TestEventBusSignals:
             calls = mock_bus.signal.call_args_list
             payloads = [call.args[1].payload for call in calls]
             assert any(p.get("count") == 0 for p in payloads)
+
+    @pytest.mark.asyncio
+    async def test_mark_as_read_pushes_count_from_write_path(self, service, mock_repo) -> None:
+        user_id = uuid4()
+        mock_repo.unread_counts = {user_id: 4}
+
+        with patch("src.services.notification_service.notification_event_bus") as mock_bus:
+            mock_bus.signal = AsyncMock()
+            await service.mark_as_read(uuid4(), user_id)
+
+        mock_repo.get_unread_count.assert_not_awaited()
+        assert mock_bus.signal.call_args.args[1].payload == {"count": 4}
@@ -0,0 +1,190 @@
+"""Unit tests for the persistent OpenRouter response cache (openrouter_cache.py).
+
+Uses the disk store (tmp_path) and an AsyncMock inner service, so no database
+or network is needed. The Postgres store shares the CachingOpenRouter logic.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.exceptions import OpenRouterCacheMissError
+from src.schemas.nlp import OpenRouterResponse
+from src.services.openrouter_cache import (
+    CachingOpenRouter,
+    DiskResponseStore,
+    bypass_response_cache,
+    request_cache_key,
+    wrap_with_response_cache,
+)
+
+_MESSAGES = [{"role": "user", "content": "Translate βιβλίο"}]
+
+
+def _response(content: str = "book") -> OpenRouterResponse:
+    return OpenRouterResponse(content=content, model="m/x", usage=None, latency_ms=900.0)
+
+
+def _make_cache(tmp_path: Path, mode: str, ttl_seconds: int = 3600):
+    inner = MagicMock()
+    inner.complete = AsyncMock(return_value=_response())
+    cache = CachingOpenRouter(
+        inner, DiskResponseStore(tmp_path), mode=mode, ttl_seconds=ttl_seconds
+    )
+    return cache, inner
+
+
+@pytest.mark.unit
+class TestRequestCacheKey:
+    def _key(self, **overrides) -> str:
+        params = {
+            "model": "m/x",
+            "messages": _MESSAGES,
+            "temperature": 0.0,
+            "max_tokens": 1024,
+            "response_format": {"type": "json_object"},
+            "reasoning": None,
+        }
+        params.update(overrides)
+        return request_cache_key(**params)
+
+    def test_stable_for_identical_requests(self) -> None:
+        assert self._key() == self._key()
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"model": "m/y"},
+            {"messages": [{"role": "user", "content": "Translate δρόμος"}]},
+            {"temperature": 0.3},
+            {"max_tokens": 512},
+            {"response_format": None},
+            {"reasoning": {"type": "disabled"}},
+        ],
+    )
+    def test_every_request_field_changes_the_key(self, override: dict) -> None:
+        assert self._key(**override) != self._key()
+
+
+@pytest.mark.unit
+class TestCachingOpenRouter:
+    @pytest.mark.asyncio
+    async def test_read_write_serves_repeat_from_cache(self, tmp_path: Path) -> None:
+        cache, inner = _make_cache(tmp_path, "read_write")
+
+        first = await cache.complete(_MESSAGES, model="m/x", temperature=0.0)
+        second = await cache.complete(_MESSAGES, model="m/x", temperature=0.0)
+
+        assert inner.complete.await_count == 1
+        assert second.content == first.content
+        assert second.latency_ms < first.latency_ms
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache, inner = _make_cache(tmp_path, "read_write", ttl_seconds=60)
+        await cache.complete(_MESSAGES, model="m/x")
+
+        with patch("src.services.openrouter_cache.time.time", return_value=10**12):
+            await cache.complete(_MESSAGES, model="m/x")
+
+        assert inner.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_never_expires(self, tmp_path: Path) -> None:
+        cache, inner = _make_cache(tmp_path, "read_write", ttl_seconds=0)
+        await cache.complete(_MESSAGES, model="m/x")
+
+        with patch("src.services.openrouter_cache.time.time", return_value=10**12):
+            await cache.complete(_MESSAGES, model="m/x")
+
+        assert inner.complete.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_skips_read_but_refreshes_entry(self, tmp_path: Path) -> None:
+        cache, inner = _make_cache(tmp_path, "read_write")
+        await cache.complete(_MESSAGES, model="m/x")
+        inner.complete.return_value = _response("volume")
+
+        with bypass_response_cache():
+            fresh = await cache.complete(_MESSAGES, model="m/x")
+        cached = await cache.complete(_MESSAGES, model="m/x")
+
+        assert fresh.content == "volume"
+        assert cached.content == "volume"
+        assert inner.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_record_always_calls_and_stores(self, tmp_path: Path) -> None:
+        recorder, inner = _make_cache(tmp_path, "record")
+        await recorder.complete(_MESSAGES, model="m/x")
+        await recorder.complete(_MESSAGES, model="m/x")
+        assert inner.complete.await_count == 2
+
+        replayer, replay_inner = _make_cache(tmp_path, "replay")
+        replayed = await replayer.complete(_MESSAGES, model="m/x")
+        assert replayed.content == "book"
+        replay_inner.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_raises_without_calling_api(self, tmp_path: Path) -> None:
+        cache, inner = _make_cache(tmp_path, "replay")
+
+        with pytest.raises(OpenRouterCacheMissError):
+            with bypass_response_cache():
+                await cache.complete(_MESSAGES, model="m/x")
+
+        inner.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_store_failure_falls_back_to_api(self) -> None:
+        store = MagicMock()
+        store.get = AsyncMock(side_effect=RuntimeError("db down"))
+        store.put = AsyncMock(side_effect=RuntimeError("db down"))
+        inner = MagicMock()
+        inner.complete = AsyncMock(return_value=_response())
+        cache = CachingOpenRouter(inner, store, mode="read_write", ttl_seconds=60)
+
+        response = await cache.complete(_MESSAGES, model="m/x")
+
+        assert response.content == "book"
+        inner.complete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_methods_delegate_to_inner(self, tmp_path: Path) -> None:
+        cache, inner = _make_cache(tmp_path, "read_write")
+        inner.generate_image = AsyncMock(return_value="img")
+
+        assert await cache.generate_image("prompt") == "img"
+
+    def test_disk_entry_is_plain_json(self, tmp_path: Path) -> None:
+        store = DiskResponseStore(tmp_path)
+        store._write("ab" + "0" * 62, "m/x", _response(), 0)
+
+        entry = json.loads((tmp_path / "ab" / ("ab" + "0" * 62 + ".json")).read_text())
+        assert entry["response"]["content"] == "book"
+        assert entry["expires_at"] is None
+
+
+@pytest.mark.unit
+class TestWrapWithResponseCache:
+    def test_off_returns_service_unchanged(self) -> None:
+        service = MagicMock()
+        with patch("src.services.openrouter_cache.settings") as mock_settings:
+            mock_settings.openrouter_cache_mode = "off"
+            assert wrap_with_response_cache(service) is service
+
+    def test_disk_backend_wraps(self, tmp_path: Path) -> None:
+        service = MagicMock()
+        with patch("src.services.openrouter_cache.settings") as mock_settings:
+            mock_settings.openrouter_cache_mode = "replay"
+            mock_settings.openrouter_cache_backend = "disk"
+            mock_settings.openrouter_cache_dir = str(tmp_path)
+            mock_settings.openrouter_cache_ttl_seconds = 0
+            wrapped = wrap_with_response_cache(service)
+
+        assert isinstance(wrapped, CachingOpenRouter)
+        assert wrapped.mode == "replay"
@@ -51,6 +51,7 @@ def mock_settings_configured():
         mock.openrouter_default_model = "google/gemini-2.5-flash-lite"
         mock.openrouter_base_url = "https://openrouter.ai/api/v1"
         mock.openrouter_timeout = 60
+        mock.openrouter_max_concurrency = 8
         yield mock
 
 
@@ -624,6 +625,51 @@ class TestClientReuse:
             mock_cls.assert_called_once()
 
 
+class TestConcurrencyLimiter:
+    """Tests for the process-wide OpenRouter concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limiter_is_shared_within_a_loop(self, mock_settings_configured: None) -> None:
+        """Every caller on the same loop gets the same semaphore."""
+        from src.services.openrouter_service import _get_concurrency_limiter
+
+        assert _get_concurrency_limiter() is _get_concurrency_limiter()
+
+    @pytest.mark.asyncio
+    async def test_complete_caps_in_flight_requests(self, mock_settings_configured) -> None:
+        """No more than openrouter_max_concurrency posts are in flight at once."""
+        import asyncio
+
+        import src.services.openrouter_service as openrouter_module
+
+        mock_settings_configured.openrouter_max_concurrency = 2
+        openrouter_module._limiter = None
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_success_response()
+
+        service = OpenRouterService()
+        service._client = AsyncMock()
+        service._client.post.side_effect = slow_post
+
+        try:
+            await asyncio.gather(
+                *(service.complete([{"role": "user", "content": str(i)}]) for i in range(6))
+            )
+        finally:
+            openrouter_module._limiter = None
+
+        assert service._client.post.call_count == 6
+        assert peak == 2
+
+
 # ============================================================================
 # TestFinishReasonCheck — finish_reason=length handling
 # ============================================================================
@@ -7,11 +7,26 @@ from uuid import uuid4
 
 import pytest
 
+from src.config import settings
 from src.core.cache import CacheService
+from src.db.models import UserDailyTrends, UserDeckProgress, UserDueHistogram
+from src.repositories.user_daily_trends import COUNTER_COLUMNS
 from src.schemas.progress import DailyStats, DashboardStatsResponse, DeckProgressListResponse
 from src.services.progress_service import ProgressService
 
 
+@pytest.fixture(autouse=True)
+def aggregate_deck_progress(monkeypatch):
+    """Most tests here pin the GROUP BY aggregate path; TestDeckProgressCounters opts back in."""
+    monkeypatch.setattr(settings, "deck_progress_counters", False)
+
+
+@pytest.fixture(autouse=True)
+def status_count_cards_due(monkeypatch):
+    """Dashboard tests pin cards_due to the status counts; TestDueHistogram opts back in."""
+    monkeypatch.setattr(settings, "due_histogram", False)
+
+
 @pytest.fixture
 def mock_db():
     db = MagicMock()
@@ -1542,3 +1557,376 @@ class TestNoneGuardSurfacesRealError:
         assert not isinstance(
             exc_info.value, pydantic.ValidationError
         ), "None-guard must surface the original RuntimeError, not wrap it in ValidationError"
+
+
+# ============================================================================
+# user_deck_progress counter path
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestDeckProgressCounters:
+    """get_deck_progress_list/detail served from the user_deck_progress counters."""
+
+    @pytest.fixture(autouse=True)
+    def counters_enabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "deck_progress_counters", True)
+
+    @staticmethod
+    def _row(deck_id, **counts):
+        values = {
+            "cards_new": 0,
+            "cards_learning": 0,
+            "cards_review": 0,
+            "cards_mastered": 0,
+            "easiness_factor_sum": 0.0,
+            "total_reviews": 0,
+            "quality_sum": 0,
+            "total_study_time_seconds": 0,
+        }
+        values.update(counts)
+        return UserDeckProgress(deck_id=deck_id, **values)
+
+    async def test_list_hydrates_page_from_counters(self, mock_db, mock_user_id):
+        deck_id = uuid4()
+        now = datetime.now(tz=timezone.utc)
+        deck = MagicMock(id=deck_id, name_en="Deck", level=MagicMock(value="A2"))
+
+        with (
+            patch("src.services.progress_service.CardRecordStatisticsRepository") as stats_cls,
+            patch("src.services.progress_service.UserDeckProgressRepository") as progress_cls,
+            patch("src.services.progress_service.DeckRepository") as deck_cls,
+            patch("src.services.progress_service.CardRecordRepository") as card_rec_cls,
+        ):
+            progress_cls.return_value.get_by_decks = AsyncMock(
+                return_value={
+                    deck_id: self._row(
+                        deck_id,
+                        cards_new=2,
+                        cards_learning=3,
+                        cards_review=1,
+                        cards_mastered=4,
+                        easiness_factor_sum=25.0,
+                    )
+                }
+            )
+            stats_cls.return_value.count_due_by_decks = AsyncMock(return_value={deck_id: 3})
+            deck_cls.return_value.get_by_ids = AsyncMock(return_value=[deck])
+            card_rec_cls.return_value.count_active_by_decks = AsyncMock(return_value={deck_id: 20})
+            _wire_phase_a(mock_db, rows=[_phase_a_row(deck_id, "vocabulary", now)], total=1)
+
+            result = await ProgressService(mock_db)._compute_deck_progress_list(mock_user_id)
+
+        summary = result.decks[0]
+        assert (summary.cards_studied, summary.cards_mastered, summary.cards_due) == (8, 4, 3)
+        assert summary.average_easiness_factor == 2.5
+        assert summary.mastery_percentage == 20.0
+        assert summary.last_studied_at == now
+        stats_cls.return_value.get_deck_progress_summaries.assert_not_called()
+        ordering_sql = str(mock_db.execute.await_args_list[0].args[0])
+        assert "user_deck_progress" in ordering_sql
+        assert "card_record_reviews" not in ordering_sql
+
+    async def test_detail_reads_counters_and_due(self, mock_db, mock_user_id):
+        deck_id = uuid4()
+        first = datetime(2026, 9, 1, tzinfo=timezone.utc)
+        last = datetime(2026, 9, 10, tzinfo=timezone.utc)
+        row = self._row(
+            deck_id,
+            cards_learning=2,
+            cards_mastered=3,
+            total_reviews=8,
+            quality_sum=30,
+            total_study_time_seconds=400,
+            first_studied_at=first,
+            last_studied_at=last,
+        )
+
+        patches = _make_full_repo_patches()
+        with (
+            patches[0] as stats_cls,
+            patches[1] as review_cls,
+            patches[5] as deck_cls,
+            patches[6] as card_rec_cls,
+            patch("src.services.progress_service.UserDeckProgressRepository") as progress_cls,
+        ):
+            _setup_deck_detail_mocks(stats_cls, review_cls, deck_cls, card_rec_cls)
+            card_rec_cls.return_value.count_by_deck = AsyncMock(return_value=10)
+            progress_cls.return_value.get_for_deck = AsyncMock(return_value=row)
+            stats_cls.return_value.count_due_by_decks = AsyncMock(return_value={deck_id: 1})
+
+            result = await ProgressService(mock_db).get_deck_progress_detail(mock_user_id, deck_id)
+
+        assert result.progress.cards_studied == 5
+        assert result.progress.cards_due == 1
+        assert result.statistics.total_reviews == 8
+        assert result.statistics.average_quality == 3.75
+        assert result.statistics.total_study_time_seconds == 400
+        assert result.timeline.days_active == 10
+        stats_cls.return_value.count_by_status.assert_not_called()
+        review_cls.return_value.get_deck_review_stats.assert_not_called()
+
+    async def test_detail_for_unstudied_deck_is_zero(self, mock_db, mock_user_id):
+        patches = _make_full_repo_patches()
+        with (
+            patches[0] as stats_cls,
+            patches[1] as review_cls,
+            patches[5] as deck_cls,
+            patches[6] as card_rec_cls,
+            patch("src.services.progress_service.UserDeckProgressRepository") as progress_cls,
+        ):
+            _setup_deck_detail_mocks(stats_cls, review_cls, deck_cls, card_rec_cls)
+            progress_cls.return_value.get_for_deck = AsyncMock(return_value=None)
+            stats_cls.return_value.count_due_by_decks = AsyncMock(return_value={})
+
+            result = await ProgressService(mock_db).get_deck_progress_detail(mock_user_id, uuid4())
+
+        assert result.progress.cards_studied == 0
+        assert result.statistics.total_reviews == 0
+        assert result.timeline.first_studied_at is None
+
+
+# ============================================================================
+# user_daily_trends series path
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestLearningTrendsSeries:
+    """get_learning_trends served as slices of the cached user_daily_trends series."""
+
+    @pytest.fixture(autouse=True)
+    def series_enabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "daily_trends_series", True)
+
+    @staticmethod
+    def _row(day, **counts):
+        values = {column: 0 for column in COUNTER_COLUMNS}
+        values.update(counts)
+        return UserDailyTrends(day=day, **values)
+
+    async def test_period_is_a_slice_of_the_series(self, mock_db, mock_user_id):
+        today = date.today()
+        rows = [
+            self._row(
+                today - timedelta(days=40),
+                vocab_reviews=50,
+                vocab_quality_sum=200,
+                vocab_mastered=9,
+            ),
+            self._row(
+                today - timedelta(days=1),
+                vocab_reviews=4,
+                vocab_correct=3,
+                vocab_quality_sum=14,
+                vocab_study_time_seconds=120,
+                vocab_learning=2,
+                vocab_mastered=1,
+                culture_answers=5,
+                culture_correct=4,
+                culture_mastered=1,
+            ),
+        ]
+        with (
+            patch("src.services.progress_service.UserDailyTrendsRepository") as repo_cls,
+            patch("src.services.progress_service.CardRecordReviewRepository") as review_cls,
+        ):
+            repo_cls.return_value.latest_update = AsyncMock(
+                return_value=datetime.now(tz=timezone.utc)
+            )
+            repo_cls.return_value.get_range = AsyncMock(return_value=rows)
+
+            service = ProgressService(mock_db)
+            week = await service.get_learning_trends(mock_user_id, period="week")
+            quarter = await service.get_learning_trends(mock_user_id, period="quarter")
+
+        review_cls.return_value.get_daily_vocab_combined_stats.assert_not_called()
+        assert len(week.daily_stats) == 7
+        day = week.daily_stats[-2]
+        assert day.date == today - timedelta(days=1)
+        assert (day.reviews_count, day.study_time_seconds, day.average_quality) == (4, 120, 3.5)
+        assert (day.cards_learning, day.cards_mastered) == (2, 2)
+        assert (day.vocab_accuracy, day.culture_accuracy, day.combined_accuracy) == (
+            75.0,
+            80.0,
+            77.8,
+        )
+        assert week.summary.total_reviews == 4
+        assert week.summary.cards_mastered == 1
+        assert week.summary.best_day == today - timedelta(days=1)
+        assert quarter.summary.total_reviews == 54
+        assert quarter.summary.cards_mastered == 10
+
+    async def test_user_without_series_skips_the_range_read(self, mock_db, mock_user_id):
+        with patch("src.services.progress_service.UserDailyTrendsRepository") as repo_cls:
+            repo_cls.return_value.latest_update = AsyncMock(return_value=None)
+            repo_cls.return_value.get_range = AsyncMock()
+
+            result = await ProgressService(mock_db).get_learning_trends(mock_user_id, "month")
+
+        repo_cls.return_value.get_range.assert_not_called()
+        assert len(result.daily_stats) == 30
+        assert result.summary.total_reviews == 0
+        assert result.summary.best_day is None
+
+    async def test_cache_key_carries_the_series_version(self, mock_db, mock_user_id):
+        updated_at = datetime(2026, 10, 18, 9, 30, tzinfo=timezone.utc)
+        cache = MagicMock()
+        cache.get_or_set = AsyncMock(return_value=[])
+        with (
+            patch("src.services.progress_service.UserDailyTrendsRepository") as repo_cls,
+            patch("src.services.progress_service.get_cache", return_value=cache),
+        ):
+            repo_cls.return_value.latest_update = AsyncMock(return_value=updated_at)
+
+            await ProgressService(mock_db).get_learning_trends(mock_user_id, "week")
+
+        key = cache.get_or_set.await_args.args[0]
+        assert key.startswith(f"progress:user:{mock_user_id}:trends:{date.today().isoformat()}:")
+        assert key.endswith(str(updated_at.timestamp()))
+
+
+# ============================================================================
+# user_due_histograms path
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestDueHistogram:
+    """Review forecast and dashboard cards_due served from the due histogram."""
+
+    @pytest.fixture(autouse=True)
+    def histogram_enabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "due_histogram", True)
+
+    @staticmethod
+    def _histogram(base_date, counts):
+        return UserDueHistogram(base_date=base_date, counts=counts)
+
+    @staticmethod
+    def _counts(*slots, horizon=100):
+        counts = [0] * (horizon + 2)
+        counts[: len(slots)] = slots
+        return counts
+
+    async def test_forecast_is_read_from_the_stored_histogram(self, mock_db, mock_user_id):
+        yesterday = date.today() - timedelta(days=1)
+        # before yesterday: 2, yesterday: 3, today: 4, tomorrow: 5
+        histogram = self._histogram(yesterday, self._counts(2, 3, 4, 5))
+        with (
+            patch("src.services.progress_service.UserDueHistogramRepository") as repo_cls,
+            patch.object(ProgressService, "_rebuild_due_histogram") as rebuild,
+        ):
+            repo_cls.return_value.get = AsyncMock(return_value=histogram)
+
+            result = await ProgressService(mock_db).get_review_forecast(mock_user_id, days=3)
+
+        rebuild.assert_not_called()
+        assert result.start_date == date.today()
+        assert result.end_date == date.today() + timedelta(days=2)
+        assert result.overdue_count == 5
+        assert [(d.date, d.due_count) for d in result.days] == [
+            (date.today(), 4),
+            (date.today() + timedelta(days=1), 5),
+            (date.today() + timedelta(days=2), 0),
+        ]
+        assert result.total_due == 14
+
+    async def test_missing_histogram_is_rebuilt(self, mock_db, mock_user_id):
+        with (
+            patch("src.services.progress_service.UserDueHistogramRepository") as repo_cls,
+            patch.object(
+                ProgressService,
+                "_rebuild_due_histogram",
+                AsyncMock(return_value=self._counts(1, 6)),
+            ) as rebuild,
+        ):
+            repo_cls.return_value.get = AsyncMock(return_value=None)
+
+            result = await ProgressService(mock_db).get_review_forecast(mock_user_id, days=30)
+
+        rebuild.assert_awaited_once_with(mock_user_id, date.today())
+        assert (result.overdue_count, result.days[0].due_count, len(result.days)) == (1, 6, 30)
+
+    async def test_forecast_rebuilds_a_histogram_with_a_negative_slot(self, mock_db, mock_user_id):
+        # A decrement found nothing to move out of the slot two days ahead
+        histogram = self._histogram(date.today(), self._counts(1, 1, 0, 1, -1))
+        with (
+            patch("src.services.progress_service.UserDueHistogramRepository") as repo_cls,
+            patch.object(
+                ProgressService,
+                "_rebuild_due_histogram",
+                AsyncMock(return_value=self._counts(1, 1, 0, 1)),
+            ) as rebuild,
+        ):
+            repo_cls.return_value.get = AsyncMock(return_value=histogram)
+
+            result = await ProgressService(mock_db).get_review_forecast(mock_user_id, days=3)
+
+        rebuild.assert_awaited_once_with(mock_user_id, date.today())
+        assert [d.due_count for d in result.days] == [1, 0, 1]
+
+    async def test_window_past_the_horizon_re_anchors(self, mock_db, mock_user_id):
+        stale = self._histogram(date.today() - timedelta(days=80), self._counts(horizon=100))
+        with (
+            patch("src.services.progress_service.UserDueHistogramRepository") as repo_cls,
+            patch.object(
+                ProgressService, "_rebuild_due_histogram", AsyncMock(return_value=self._counts())
+            ) as rebuild,
+        ):
+            repo_cls.return_value.get = AsyncMock(return_value=stale)
+
+            await ProgressService(mock_db).get_review_forecast(mock_user_id, days=30)
+
+        rebuild.assert_awaited_once()
+
+    async def test_dashboard_cards_due_is_read_from_the_histogram(self, mock_db, mock_user_id):
+        patches = _make_full_repo_patches()
+        with (
+            patches[0] as s_cls,
+            patches[1] as r_cls,
+            patches[2] as cs_cls,
+            patches[3] as ca_cls,
+            patches[4] as me_cls,
+            patches[5],
+            patches[6],
+            patches[7],
+            patches[8] as ex_cls,
+            patch("src.services.progress_service.UserDueHistogramRepository") as repo_cls,
+            patch.object(ProgressService, "_rebuild_due_histogram") as rebuild,
+        ):
+            _setup_dashboard_mocks(
+                s_cls,
+                r_cls,
+                cs_cls,
+                ca_cls,
+                me_cls,
+                ex_cls,
+                vocab_status={"new": 0, "due": 7},
+                culture_status={"new": 0, "due": 3},
+            )
+            repo_cls.return_value.get = AsyncMock(
+                return_value=self._histogram(date.today(), self._counts(6, 3))
+            )
+
+            result = await ProgressService(mock_db).get_dashboard_stats(mock_user_id)
+
+        rebuild.assert_not_called()
+        assert result.today.cards_due == 9
+
+    async def test_flag_off_counts_from_the_statistics_tables(
+        self, mock_db, mock_user_id, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "due_histogram", False)
+        today = date.today()
+        with patch("src.services.progress_service.UserDueHistogramRepository") as repo_cls:
+            repo_cls.return_value.due_by_date = AsyncMock(
+                return_value={today - timedelta(days=3): 2, today + timedelta(days=1): 1}
+            )
+            repo_cls.return_value.get = AsyncMock()
+
+            result = await ProgressService(mock_db).get_review_forecast(mock_user_id, days=7)
+
+        repo_cls.return_value.get.assert_not_called()
+        assert result.overdue_count == 2
+        assert [d.due_count for d in result.days] == [0, 1, 0, 0, 0, 0, 0]
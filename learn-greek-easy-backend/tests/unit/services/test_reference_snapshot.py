@@ -0,0 +1,184 @@
+"""Unit tests for the process-wide reference snapshots (reference_snapshot.py).
+
+Covers the stamp-versioned ReferenceSnapshot cache and the snapshot fast paths
+of FrequencyService, CefrVocabularyService and TranslationLookupService. The
+session is mocked: the first ``execute`` of a (re)load is the stamp query.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.cefr_vocabulary_service import CefrVocabularyService, cefr_snapshot
+from src.services.frequency_service import FrequencyService, frequency_snapshot
+from src.services.reference_snapshot import (
+    _REGISTRY,
+    ReferenceSnapshot,
+    approx_size_bytes,
+    reset_reference_snapshots,
+)
+from src.services.translation_service import (
+    TranslationEntry,
+    TranslationLookupService,
+    translation_snapshot,
+)
+
+
+def _stamp_session(*versions: int | None) -> MagicMock:
+    """Session whose successive execute() calls return the given stamp versions."""
+    results = []
+    for version in versions:
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = version
+        results.append(result)
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _snapshot_settings() -> Iterator[MagicMock]:
+    reset_reference_snapshots()
+    with patch("src.services.reference_snapshot.settings") as mock_settings:
+        mock_settings.reference_snapshot_check_seconds = 60.0
+        yield mock_settings
+    reset_reference_snapshots()
+
+
+@pytest.fixture
+def _local_snapshot() -> Iterator[tuple[ReferenceSnapshot, AsyncMock]]:
+    loader = AsyncMock(side_effect=lambda db: {"load": loader.await_count})
+    snapshot = ReferenceSnapshot("test_dataset", loader)
+    yield snapshot, loader
+    _REGISTRY.remove(snapshot)
+
+
+@pytest.mark.unit
+class TestReferenceSnapshot:
+    @pytest.mark.asyncio
+    async def test_loads_once_within_check_interval(self, _local_snapshot) -> None:
+        snapshot, loader = _local_snapshot
+        db = _stamp_session(1)
+
+        first = await snapshot.get(db)
+        second = await snapshot.get(db)
+
+        assert first is second
+        assert loader.await_count == 1
+        assert db.execute.await_count == 1
+        assert snapshot.version == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_stamp_keeps_value(self, _local_snapshot, _snapshot_settings) -> None:
+        snapshot, loader = _local_snapshot
+        _snapshot_settings.reference_snapshot_check_seconds = 0
+        db = _stamp_session(3, 3)
+
+        first = await snapshot.get(db)
+        second = await snapshot.get(db)
+
+        assert first is second
+        assert loader.await_count == 1
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bumped_stamp_reloads(self, _local_snapshot, _snapshot_settings) -> None:
+        snapshot, loader = _local_snapshot
+        _snapshot_settings.reference_snapshot_check_seconds = 0
+        db = _stamp_session(3, 4)
+
+        await snapshot.get(db)
+        reloaded = await snapshot.get(db)
+
+        assert reloaded == {"load": 2}
+        assert snapshot.version == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_stamp_is_version_zero(self, _local_snapshot) -> None:
+        snapshot, _ = _local_snapshot
+        await snapshot.get(_stamp_session(None))
+        assert snapshot.version == 0
+        assert snapshot.footprint_bytes > 0
+
+    def test_approx_size_counts_nested_values(self) -> None:
+        small = approx_size_bytes({"a": 1})
+        nested = approx_size_bytes({"a": (TranslationEntry("a", "en", 0, "x" * 500, None, "k"),)})
+        assert nested > small + 500
+
+
+@pytest.mark.unit
+class TestServiceSnapshotPaths:
+    @pytest.fixture(autouse=True)
+    def _enabled(self) -> Iterator[None]:
+        targets = [
+            "src.services.frequency_service.settings",
+            "src.services.cefr_vocabulary_service.settings",
+            "src.services.translation_service.settings",
+        ]
+        patchers = [patch(target) for target in targets]
+        for patcher in patchers:
+            patcher.start().reference_snapshots_enabled = True
+        yield
+        for patcher in patchers:
+            patcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_frequency_reads_snapshot(self) -> None:
+        with patch.object(frequency_snapshot, "get", AsyncMock(return_value={"σπίτι": 120})) as get:
+            service = FrequencyService(MagicMock())
+            assert await service.get_frequency_rank("σπίτι") == 120
+            assert await service.get_frequency_band("άγνωστο") is None
+        assert get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cefr_returns_copy_of_precomputed_level(self) -> None:
+        allowed = {"A1": frozenset({"και"}), "A2": frozenset({"και", "σπίτι"}), "B1": frozenset()}
+        with patch.object(cefr_snapshot, "get", AsyncMock(return_value=allowed)):
+            result = await CefrVocabularyService(MagicMock()).allowed_lemmas("A2")
+            unknown = await CefrVocabularyService(MagicMock()).allowed_lemmas("C2")
+
+        assert result == {"και", "σπίτι"} and isinstance(result, set)
+        assert unknown == set()  # unknown level falls back to B1
+
+    @pytest.mark.asyncio
+    async def test_cefr_loader_builds_cumulative_levels(self) -> None:
+        from src.services.cefr_vocabulary_service import _load_cefr_snapshot
+
+        result = MagicMock()
+        result.all.return_value = [
+            ("σπίτι", "A1", False),
+            ("δρόμος", "A2", False),
+            ("βιβλίο", "B1", False),
+            ("και", "C1", True),
+            ("σπάνιο", "C1", False),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        allowed = await _load_cefr_snapshot(db)
+
+        assert allowed["A1"] == {"σπίτι", "και"}
+        assert allowed["A2"] == {"σπίτι", "δρόμος", "και"}
+        assert allowed["B1"] == {"σπίτι", "δρόμος", "βιβλίο", "και"}
+
+    @pytest.mark.asyncio
+    async def test_translation_prefers_pos_then_falls_back(self) -> None:
+        entries = (
+            TranslationEntry("αετός", "en", 0, "eagle", "NOUN", "kaikki"),
+            TranslationEntry("αετός", "en", 1, "kite", "NOUN", "freedict"),
+            TranslationEntry("αετός", "en", 0, "aquiline", "ADJ", "pivot"),
+        )
+        snapshot = {("αετός", "en"): entries}
+        with patch.object(translation_snapshot, "get", AsyncMock(return_value=snapshot)):
+            service = TranslationLookupService(MagicMock())
+            noun = await service.lookup("αετός", "en", pos="NOUN")
+            verb = await service.lookup("αετός", "en", pos="VERB")
+            missing = await service.lookup("αετός", "ru")
+
+        assert noun.combined_text == "eagle, kite"
+        assert noun.source == "dictionary"
+        assert [e.translation for e in verb.translations] == ["eagle", "kite"]
+        assert missing.source == "none"
@@ -1,10 +1,16 @@
 """Unit tests for ReverseLookupService."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.services.reverse_lookup_service import ReverseLookupService
+from src.services.reverse_lookup_service import (
+    ReverseLookupIndex,
+    ReverseLookupService,
+    _load_reverse_lookup_index,
+    noun_gender_snapshot,
+    reverse_lookup_snapshot,
+)
 
 
 def _make_translation(
@@ -369,3 +375,105 @@ class TestReverseLookupServiceSearch:
         assert all(r.pos == "NOUN" for r in results)
         assert len(results) == 1
         assert results[0].lemma == "δρόμος"
+
+
+def _make_index(rows: list[tuple[str, str]]) -> ReverseLookupIndex:
+    """Index NOUN rows given as (lemma, translation), already in lookup order."""
+    index = ReverseLookupIndex()
+    for lemma, translation in rows:
+        index.add(lemma, translation)
+    return index
+
+
+class TestReverseLookupIndexSearch:
+    """In-memory engine (reference_snapshots_enabled): same tiers, no SQL per query."""
+
+    async def _search(
+        self,
+        query: str,
+        rows: list[tuple[str, str]],
+        genders: dict[str, str] | None = None,
+        language: str = "en",
+    ):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        with (
+            patch("src.services.reverse_lookup_service.settings") as mock_settings,
+            patch.object(
+                reverse_lookup_snapshot, "get", AsyncMock(return_value={"en": _make_index(rows)})
+            ),
+            patch.object(noun_gender_snapshot, "get", AsyncMock(return_value=genders or {})),
+        ):
+            mock_settings.reference_snapshots_enabled = True
+            results = await ReverseLookupService(db).search(query, language)
+        db.execute.assert_not_awaited()
+        return results
+
+    @pytest.mark.asyncio
+    async def test_full_match_with_lexicon_gender(self) -> None:
+        results = await self._search("House", [("σπίτι", "house")], {"σπίτι": "Neut"})
+        assert len(results) == 1
+        assert results[0].match_type == "full"
+        assert results[0].score == 3.0
+        assert results[0].article == "το"
+        assert results[0].inferred_gender is False
+
+    @pytest.mark.asyncio
+    async def test_substring_incidental_and_word_boundaries(self) -> None:
+        long_text = "a large building used for storing agricultural produce and house tools"
+        results = await self._search(
+            "house",
+            [
+                ("αποθήκη", long_text),  # incidental only — dropped
+                ("μονοκατοικία", "detached house"),  # substring
+                ("σπιτάκι", "doghouses"),  # no word-boundary match
+            ],
+        )
+        assert [(r.lemma, r.match_type, r.score) for r in results] == [
+            ("μονοκατοικία", "substring", 2.0)
+        ]
+        assert results[0].inferred_gender is True
+
+    @pytest.mark.asyncio
+    async def test_multi_word_query_requires_contiguous_tokens(self) -> None:
+        results = await self._search(
+            "ice cream",
+            [("παγωτό", "ice cream"), ("κρέμα", "cream made with ice")],
+        )
+        assert [r.lemma for r in results] == ["παγωτό"]
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_rows_join_qualifying_groups_only(self) -> None:
+        results = await self._search(
+            "household",
+            [
+                ("νοικοκυριό", "household"),
+                ("νοικοκυριό", "households"),  # fuzzy (similarity 0.75), same group → kept
+                ("οικογένεια", "households"),  # fuzzy only → group dropped
+            ],
+        )
+        assert [r.lemma for r in results] == ["νοικοκυριό"]
+        assert results[0].translations == ["household", "households"]
+        assert results[0].match_type == "full"
+
+    @pytest.mark.asyncio
+    async def test_unknown_language_returns_empty(self) -> None:
+        assert await self._search("дом", [("σπίτι", "house")], language="ru") == []
+
+    @pytest.mark.asyncio
+    async def test_loader_groups_rows_per_language(self) -> None:
+        result = MagicMock()
+        result.all.return_value = [
+            ("en", "σπίτι", "house"),
+            ("en", "σπίτι", "home"),
+            ("en", "σκύλος", "dog"),
+            ("ru", "σπίτι", "дом"),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        indexes = await _load_reverse_lookup_index(db)
+
+        assert set(indexes) == {"en", "ru"}
+        assert indexes["en"].group_bounds == [(0, 2), (2, 3)]
+        assert list(indexes["en"].tokens["home"]) == [1]
@@ -0,0 +1,392 @@
+"""Tests for the fused V2 review write path (src/services/review_pipeline.py).
+
+``TestAgainstDatabase`` runs one user through ``ReviewPipeline.apply`` and
+another through the legacy ``persist_deck_review_task`` on real rows and
+compares everything each path wrote.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config import settings
+from src.core.exceptions import NotFoundException
+from src.db.models import (
+    CardRecord,
+    CardRecordReview,
+    CardRecordStatistics,
+    CardStatus,
+    CardType,
+    Deck,
+    PartOfSpeech,
+    User,
+    UserDailyTrends,
+    UserDeckProgress,
+    UserDueHistogram,
+    UserXP,
+    WordEntry,
+    XPTransaction,
+)
+from src.repositories.user_due_histogram import UserDueHistogramRepository
+from src.services.review_pipeline import ReviewPipeline, ReviewState, count_statements
+from src.services.v2_sm2_service import V2SM2Service
+from src.services.xp_constants import LEVELS, XP_FLASHCARD_CORRECT
+from src.tasks.background import persist_deck_review_task
+
+
+def _card_record() -> MagicMock:
+    card_record = MagicMock()
+    card_record.id = uuid4()
+    card_record.deck_id = uuid4()
+    card_record.card_type = CardType.MEANING_EL_TO_EN
+    card_record.deck.is_premium = False
+    return card_record
+
+
+def _state(**overrides) -> ReviewState:
+    values = {
+        "card_record": _card_record(),
+        "stats_id": uuid4(),
+        "easiness_factor": 2.5,
+        "interval": 0,
+        "repetitions": 0,
+        "status": CardStatus.NEW,
+        "stats_created_at": datetime(2026, 10, 1, tzinfo=timezone.utc),
+        "daily_goal": 20,
+        "reviews_today": 3,
+        "culture_answers_today": 0,
+    }
+    values.update(overrides)
+    return ReviewState(**values)
+
+
+def _db(*rows) -> MagicMock:
+    """Session stub returning ``rows`` in order from execute(...).one()/one_or_none()."""
+    db = MagicMock()
+    results = [
+        MagicMock(one=MagicMock(return_value=r), one_or_none=MagicMock(return_value=r))
+        for r in rows
+    ]
+    db.execute = AsyncMock(side_effect=results)
+    db.begin_nested.return_value.__aenter__ = AsyncMock()
+    db.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    return db
+
+
+@asynccontextmanager
+async def _no_counting(session):
+    yield []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLoadState:
+    async def test_missing_card_record_returns_none(self):
+        assert await ReviewPipeline(_db(None)).load_state(uuid4(), uuid4()) is None
+
+    async def test_unreviewed_card_uses_new_card_defaults(self):
+        card_record = _card_record()
+        row = (card_record, None, None, None, None, None, None, 20, 4, 1, None, None)
+
+        state = await ReviewPipeline(_db(row)).load_state(uuid4(), card_record.id)
+
+        assert state.stats_id is None
+        assert (state.easiness_factor, state.interval, state.repetitions) == (2.5, 0, 0)
+        assert state.status == CardStatus.NEW
+        assert (state.daily_goal, state.reviews_today, state.culture_answers_today) == (20, 4, 1)
+
+    async def test_state_is_loaded_in_one_statement(self):
+        db = _db(None)
+        await ReviewPipeline(db).load_state(uuid4(), uuid4())
+
+        assert db.execute.await_count == 1
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "LEFT OUTER JOIN card_record_statistics" in sql
+        assert "LEFT OUTER JOIN decks" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestApply:
+    async def test_all_rows_written_in_one_statement(self):
+        db = _db((XP_FLASHCARD_CORRECT + 7, 1))
+        user = MagicMock(id=uuid4())
+
+        result = await ReviewPipeline(db).apply(user, _state(), quality=4, time_taken=10)
+
+        assert db.execute.await_count == 1
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_user_card_record DO UPDATE" in sql
+        assert "INSERT INTO card_record_reviews" in sql
+        assert "INSERT INTO xp_transactions" in sql
+        assert "INSERT INTO user_deck_progress" in sql
+        assert "INSERT INTO user_daily_trends" in sql
+        assert "UPDATE user_due_histograms SET counts[" in sql
+        assert "INSERT INTO user_xp" in sql and "ON CONFLICT (user_id) DO UPDATE" in sql
+        assert result.previous_status == CardStatus.NEW
+        assert result.new_status == CardStatus.LEARNING
+        assert result.message == "Good start!"
+        db.begin_nested.assert_not_called()
+
+    async def test_crossing_daily_goal_notifies(self):
+        db = _db((50, 1))
+        user = MagicMock(id=uuid4())
+
+        with (
+            patch("src.core.redis.get_redis", return_value=None),
+            patch("src.services.notification_service.NotificationService") as mock_service,
+        ):
+            mock_service.return_value.notify_daily_goal_complete = AsyncMock()
+            await ReviewPipeline(db).apply(
+                user, _state(reviews_today=15, culture_answers_today=4), quality=4, time_taken=5
+            )
+
+        mock_service.return_value.notify_daily_goal_complete.assert_awaited_once_with(
+            user_id=user.id, reviews_completed=20
+        )
+
+    async def test_level_up_detected_from_returned_total(self):
+        threshold = LEVELS[1].total_xp
+        db = _db((threshold, LEVELS[1].level))
+        user = MagicMock(id=uuid4())
+
+        with patch("src.services.notification_service.NotificationService") as mock_service:
+            mock_service.return_value.notify_level_up = AsyncMock()
+            await ReviewPipeline(db).apply(user, _state(), quality=4, time_taken=5)
+
+        mock_service.return_value.notify_level_up.assert_awaited_once()
+        assert mock_service.return_value.notify_level_up.await_args.kwargs["new_level"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSubmit:
+    async def test_missing_card_record_raises_not_found(self):
+        with patch("src.services.review_pipeline.count_statements", _no_counting):
+            with pytest.raises(NotFoundException):
+                await ReviewPipeline(_db(None)).submit(MagicMock(id=uuid4()), uuid4(), 4, 10)
+
+    async def test_logs_statement_count(self):
+        card_record = _card_record()
+        row = (card_record, uuid4(), 2.5, 1, 1, CardStatus.LEARNING, None, 20, 0, 0, None, None)
+        db = _db(row, (10, 1))
+        user = MagicMock(id=uuid4())
+
+        @asynccontextmanager
+        async def _two_statements(session):
+            yield ["SELECT", "WITH"]
+
+        with (
+            patch("src.services.review_pipeline.count_statements", _two_statements),
+            patch("src.services.review_pipeline.settings") as mock_settings,
+            patch("src.services.review_pipeline.logger") as mock_logger,
+        ):
+            mock_settings.feature_background_tasks = True
+            result, state = await ReviewPipeline(db).submit(user, card_record.id, 4, 10)
+
+        assert state.deck_id == card_record.deck_id
+        assert result.previous_status == CardStatus.LEARNING
+        persisted = [
+            c for c in mock_logger.info.call_args_list if c.args[0] == "V2 review persisted (fused)"
+        ]
+        assert persisted[0].kwargs["extra"]["statements"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_count_statements_counts_only_inside_block():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with AsyncSession(engine) as session:
+            async with count_statements(session) as statements:
+                await session.execute(text("SELECT 1"))
+                await session.execute(text("SELECT 2"))
+            await session.execute(text("SELECT 3"))
+    finally:
+        await engine.dispose()
+
+    assert statements == ["SELECT 1", "SELECT 2"]
+
+
+# =============================================================================
+# Fused vs legacy path on real rows
+# =============================================================================
+
+# Written at different instants by the two paths; everything else must match.
+_VOLATILE_COLUMNS = {"user_id", "updated_at", "first_studied_at", "last_studied_at"}
+
+
+@pytest_asyncio.fixture
+async def card_record(db_session: AsyncSession, test_deck: Deck) -> CardRecord:
+    entry = WordEntry(
+        owner_id=None,
+        lemma="σπίτι",
+        part_of_speech=PartOfSpeech.NOUN,
+        translation_en="house",
+        is_active=True,
+    )
+    db_session.add(entry)
+    await db_session.flush()
+    record = CardRecord(
+        word_entry_id=entry.id,
+        deck_id=test_deck.id,
+        card_type=CardType.MEANING_EL_TO_EN,
+        variant_key="default",
+        front_content={"card_type": "meaning_el_to_en", "prompt": "Translate", "main": "σπίτι"},
+        back_content={"card_type": "meaning_el_to_en", "answer": "house"},
+    )
+    db_session.add(record)
+    await db_session.flush()
+    return record
+
+
+def _plain(row: Any) -> tuple:
+    """Row as a tuple, floats rounded (deltas and recounts sum in different orders)."""
+    return tuple(round(v, 6) if isinstance(v, float) else v for v in row)
+
+
+async def _rows(db: AsyncSession, *columns: Any, where: Any, order_by: Any = None) -> list[tuple]:
+    query = select(*columns).where(where)
+    if order_by is not None:
+        query = query.order_by(order_by)
+    return [_plain(row) for row in (await db.execute(query)).all()]
+
+
+async def _written(db: AsyncSession, user_id: UUID) -> dict[str, list[tuple]]:
+    """Every row a review writes for ``user_id``, without ids and timestamps."""
+
+    def stable(model: Any) -> list[Any]:
+        return [c for c in model.__table__.c if c.name not in _VOLATILE_COLUMNS]
+
+    return {
+        "statistics": await _rows(
+            db,
+            CardRecordStatistics.card_record_id,
+            CardRecordStatistics.easiness_factor,
+            CardRecordStatistics.interval,
+            CardRecordStatistics.repetitions,
+            CardRecordStatistics.status,
+            CardRecordStatistics.next_review_date,
+            where=CardRecordStatistics.user_id == user_id,
+        ),
+        "reviews": await _rows(
+            db,
+            CardRecordReview.card_record_id,
+            CardRecordReview.quality,
+            CardRecordReview.time_taken,
+            where=CardRecordReview.user_id == user_id,
+            order_by=CardRecordReview.reviewed_at,
+        ),
+        "user_xp": await _rows(
+            db, UserXP.total_xp, UserXP.current_level, where=UserXP.user_id == user_id
+        ),
+        "xp_transactions": await _rows(
+            db,
+            XPTransaction.amount,
+            XPTransaction.reason,
+            XPTransaction.source_id,
+            where=XPTransaction.user_id == user_id,
+            order_by=XPTransaction.earned_at,
+        ),
+        "deck_progress": await _rows(
+            db, *stable(UserDeckProgress), where=UserDeckProgress.user_id == user_id
+        ),
+        "daily_trends": await _rows(
+            db, *stable(UserDailyTrends), where=UserDailyTrends.user_id == user_id
+        ),
+        "due_histogram": await _rows(
+            db,
+            UserDueHistogram.base_date,
+            UserDueHistogram.counts,
+            where=UserDueHistogram.user_id == user_id,
+        ),
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAgainstDatabase:
+    @pytest.fixture(autouse=True)
+    def legacy_task_on_the_test_session(self, db_session: AsyncSession, monkeypatch):
+        """Run the background task's sessions on ``db_session``; its commits only flush."""
+
+        @asynccontextmanager
+        async def _shared():
+            yield db_session
+
+        monkeypatch.setattr(db_session, "commit", db_session.flush)
+        with (
+            patch("src.tasks.background.get_session_factory", return_value=_shared),
+            patch("src.tasks.background.is_background_tasks_enabled", return_value=True),
+            patch("src.tasks.background.running_as_job", return_value=False),
+            patch("src.tasks.background._check_daily_goal_for_review", AsyncMock()),
+            patch("src.tasks.background._check_achievements_for_review", AsyncMock()),
+            patch("src.core.redis.get_redis", return_value=None),
+        ):
+            yield
+
+    async def test_fused_review_writes_what_the_legacy_task_writes(
+        self, db_session: AsyncSession, test_user: User, card_record: CardRecord
+    ):
+        fused_user = User(email="fused@example.com", full_name="Fused Path", is_active=True)
+        db_session.add(fused_user)
+        await db_session.flush()
+        histograms = UserDueHistogramRepository(db_session)
+        for user in (fused_user, test_user):
+            await histograms.rebuild(user.id, date.today(), settings.due_histogram_horizon_days)
+        pipeline = ReviewPipeline(db_session)
+
+        # First review creates the statistics row, the second updates it.
+        for quality in (4, 5):
+            state = await pipeline.load_state(fused_user.id, card_record.id)
+            result = await pipeline.apply(fused_user, state, quality, time_taken=7)
+
+            _, context = await V2SM2Service(db_session).compute_review(
+                user_id=test_user.id, card_record=card_record, quality=quality, time_taken=7
+            )
+            await persist_deck_review_task(**context, reviews_before=0, user_email=None)
+
+        fused = await _written(db_session, fused_user.id)
+        assert fused == await _written(db_session, test_user.id)
+
+        today = date.today()
+        assert fused["statistics"] == [
+            (
+                card_record.id,
+                round(result.easiness_factor, 6),
+                result.interval,
+                2,
+                result.new_status,
+                result.next_review_date,
+            )
+        ]
+        assert fused["reviews"] == [(card_record.id, 4, 7), (card_record.id, 5, 7)]
+        assert (
+            fused["xp_transactions"]
+            == [(XP_FLASHCARD_CORRECT, "flashcard_review", card_record.id)] * 2
+        )
+        assert fused["user_xp"][0][0] == 2 * XP_FLASHCARD_CORRECT
+        (progress,) = await db_session.execute(
+            select(UserDeckProgress).where(UserDeckProgress.user_id == fused_user.id)
+        )
+        assert (progress[0].total_reviews, progress[0].quality_sum) == (2, 9)
+        assert progress[0].total_study_time_seconds == 14
+        (trends,) = await db_session.execute(
+            select(UserDailyTrends).where(
+                UserDailyTrends.user_id == fused_user.id, UserDailyTrends.day == today
+            )
+        )
+        assert (trends[0].vocab_reviews, trends[0].vocab_correct) == (2, 2)
+        assert trends[0].vocab_quality_sum == 9
+        ((base_date, counts),) = fused["due_histogram"]
+        assert base_date == today
+        assert sum(counts) == 1
+        assert counts[(result.next_review_date - today).days + 1] == 1
@@ -46,6 +46,7 @@ def mock_settings_can_seed():
     with patch("src.services.seed_service.settings") as mock_settings:
         mock_settings.can_seed_database.return_value = True
         mock_settings.get_seed_validation_errors.return_value = []
+        mock_settings.seed_snapshot_enabled = False
         yield mock_settings
 
 
@@ -435,6 +436,19 @@ class TestSeedServiceNotifications:
 
         assert result["unread_count"] == 3
 
+    @pytest.mark.asyncio
+    async def test_recounts_the_unread_counter(self, mock_db_with_ids, mock_settings_can_seed):
+        """Seeded rows bypass the repository, so the user's counter is recounted."""
+        user_id = uuid4()
+
+        with patch(
+            "src.services.seed_service.NotificationRepository.repair_unread_counts",
+            new_callable=AsyncMock,
+        ) as repair:
+            await SeedService(mock_db_with_ids).seed_notifications(user_id)
+
+        repair.assert_awaited_once_with([user_id])
+
     @pytest.mark.asyncio
     async def test_creates_notifications_with_various_types(
         self, mock_db_with_ids, mock_settings_can_seed
@@ -0,0 +1,253 @@
+"""Tests for the seed_all in-database snapshot.
+
+The store tests check the statements against a mocked session;
+``TestAgainstDatabase`` captures and restores real rows through ``db_session``.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import Notification, NotificationType, Translation, User
+from src.services.seed_service import SeedService
+from src.services.seed_snapshot import (
+    META_TABLE,
+    SeedSnapshotStore,
+    snapshot_key,
+    snapshot_table,
+)
+
+TABLES = ["notifications", "users", "reference.translations"]
+
+
+def _result(scalar=None, rows=None):
+    result = MagicMock()
+    result.scalar.return_value = scalar
+    result.scalar_one_or_none.return_value = scalar
+    result.fetchall.return_value = rows or []
+    return result
+
+
+def _sql(db: AsyncMock) -> list[str]:
+    return [str(call.args[0]) for call in db.execute.await_args_list]
+
+
+@pytest.mark.unit
+class TestSnapshotKey:
+    def test_every_input_changes_the_key(self):
+        base = snapshot_key("rev1", None, "2026-10-18")
+        assert base == snapshot_key("rev1", None, "2026-10-18")
+        assert base != snapshot_key("rev2", None, "2026-10-18")
+        assert base != snapshot_key("rev1", 42, "2026-10-18")
+        assert base != snapshot_key("rev1", None, "2026-10-19")
+
+    def test_seed_source_change_changes_the_key(self):
+        with patch("src.services.seed_snapshot.seed_source_digest", return_value="other"):
+            changed = snapshot_key("rev1", None, "2026-10-18")
+        assert changed != snapshot_key("rev1", None, "2026-10-18")
+
+    def test_schema_qualified_table_names(self):
+        assert snapshot_table("users") == 'seed_snapshot."users"'
+        assert snapshot_table("reference.translations") == 'seed_snapshot."reference__translations"'
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSeedSnapshotStore:
+    async def test_restore_misses_without_snapshot_schema(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result(scalar=None))
+
+        assert await SeedSnapshotStore(db).restore("k", TABLES) is None
+        assert db.execute.await_count == 1
+
+    async def test_restore_misses_on_other_key(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(scalar=META_TABLE), _result(scalar=None)])
+
+        assert await SeedSnapshotStore(db).restore("k", TABLES) is None
+        assert not any("TRUNCATE" in sql for sql in _sql(db))
+
+    async def test_restore_inserts_parents_first_and_resets_sequences(self):
+        layout = [
+            ("public.notifications", "id", None),
+            ("public.users", "id", None),
+            ("public.users", "email", None),
+            ("reference.translations", "id", "reference.translations_id_seq"),
+        ]
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[
+                _result(scalar=META_TABLE),
+                _result(scalar='{"success": true}'),
+                _result(),  # TRUNCATE
+                _result(rows=layout),
+                *[_result() for _ in range(4)],
+            ]
+        )
+
+        restored = await SeedSnapshotStore(db).restore("abc" * 20, TABLES)
+
+        assert restored == {"success": True, "snapshot": {"restored": True, "key": "abcabcabcabc"}}
+        statements = _sql(db)
+        assert statements[2].startswith(
+            "TRUNCATE TABLE notifications, users, reference.translations"
+        )
+        inserts = [s.split()[2] for s in statements if s.startswith("INSERT")]
+        assert inserts == ["reference.translations", "users", "notifications"]
+        assert '("id", "email")' in statements[5]
+        assert "setval" in statements[-1]
+        db.commit.assert_not_awaited()
+
+    async def test_capture_copies_tables_and_result(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result())
+
+        await SeedSnapshotStore(db).capture("k", TABLES, {"success": True})
+
+        statements = _sql(db)
+        assert statements[0] == "DROP SCHEMA IF EXISTS seed_snapshot CASCADE"
+        copies = [s for s in statements if " AS SELECT * FROM " in s]
+        assert len(copies) == len(TABLES)
+        assert db.execute.await_args_list[-1].args[1] == {"key": "k", "result": '{"success": true}'}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_seed_all_returns_restored_snapshot_without_seeding():
+    db = AsyncMock()
+    restored = {"success": True, "snapshot": {"restored": True, "key": "k"}}
+    with (
+        patch("src.services.seed_service.settings") as mock_settings,
+        patch("src.services.seed_service.SeedSnapshotStore") as store_cls,
+    ):
+        mock_settings.can_seed_database.return_value = True
+        mock_settings.seed_snapshot_enabled = True
+        store_cls.return_value.key_for = AsyncMock(return_value="k")
+        store_cls.return_value.restore = AsyncMock(return_value=restored)
+        service = SeedService(db)
+        service.truncate_tables = AsyncMock()  # type: ignore[method-assign]
+
+        result = await service.seed_all()
+
+    assert result == restored
+    service.truncate_tables.assert_not_awaited()
+    db.commit.assert_awaited_once()
+
+
+# =============================================================================
+# Against the database
+# =============================================================================
+
+
+async def _rows(db: AsyncSession) -> dict[str, list[tuple]]:
+    users = await db.execute(select(User.id, User.email, User.full_name).order_by(User.email))
+    notifications = await db.execute(
+        select(Notification.id, Notification.user_id, Notification.title).order_by(
+            Notification.title
+        )
+    )
+    translations = await db.execute(
+        select(Translation.id, Translation.lemma, Translation.translation).order_by(Translation.id)
+    )
+    return {
+        "users": [tuple(row) for row in users.all()],
+        "notifications": [tuple(row) for row in notifications.all()],
+        "translations": [tuple(row) for row in translations.all()],
+    }
+
+
+@pytest.fixture
+async def seeded(db_session: AsyncSession, test_user: User) -> dict[str, list[tuple]]:
+    """One user with two notifications and two translations, as captured."""
+    for title in ("Welcome", "Streak"):
+        db_session.add(
+            Notification(
+                user_id=test_user.id,
+                type=NotificationType.ADMIN_ANNOUNCEMENT,
+                title=title,
+                message=f"{title} message",
+            )
+        )
+    for lemma, translation in (("σπίτι", "house"), ("νερό", "water")):
+        db_session.add(
+            Translation(
+                lemma=lemma,
+                language="en",
+                sense_index=0,
+                translation=translation,
+                source="kaikki",
+            )
+        )
+    await db_session.flush()
+    return await _rows(db_session)
+
+
+@pytest.mark.integration
+@pytest.mark.db
+class TestAgainstDatabase:
+    async def test_restore_brings_back_the_captured_rows(
+        self, db_session: AsyncSession, test_user: User, seeded: dict[str, list[tuple]]
+    ):
+        store = SeedSnapshotStore(db_session)
+        await store.capture("key-one", TABLES, {"success": True, "users": 1})
+
+        await db_session.execute(
+            update(User).where(User.id == test_user.id).values(full_name="Changed")
+        )
+        await db_session.execute(delete(Notification).where(Notification.title == "Welcome"))
+        db_session.add(
+            User(email="after-capture@example.com", full_name="Late User", is_active=True)
+        )
+        db_session.add(
+            Translation(
+                lemma="ψωμί",
+                language="en",
+                sense_index=0,
+                translation="bread",
+                source="kaikki",
+            )
+        )
+        await db_session.flush()
+        assert await _rows(db_session) != seeded
+
+        result = await store.restore("key-one", TABLES)
+
+        assert result == {
+            "success": True,
+            "users": 1,
+            "snapshot": {"restored": True, "key": "key-one"},
+        }
+        assert await _rows(db_session) == seeded
+
+    async def test_restore_resets_identity_sequences_past_the_restored_rows(
+        self, db_session: AsyncSession, seeded: dict[str, list[tuple]]
+    ):
+        store = SeedSnapshotStore(db_session)
+        await store.capture("key-one", TABLES, {"success": True})
+        await store.restore("key-one", TABLES)
+
+        added = Translation(
+            lemma="ψωμί", language="en", sense_index=0, translation="bread", source="kaikki"
+        )
+        db_session.add(added)
+        await db_session.flush()
+
+        assert added.id == max(row[0] for row in seeded["translations"]) + 1
+
+    async def test_other_key_misses_and_leaves_rows_alone(
+        self, db_session: AsyncSession, test_user: User, seeded: dict[str, list[tuple]]
+    ):
+        store = SeedSnapshotStore(db_session)
+        assert await store.restore("key-one", TABLES) is None
+
+        await store.capture("key-one", TABLES, {"success": True})
+        await db_session.execute(delete(Notification).where(Notification.user_id == test_user.id))
+        await db_session.flush()
+        changed = await _rows(db_session)
+
+        assert await store.restore("key-two", TABLES) is None
+        assert await _rows(db_session) == changed
+        assert changed["notifications"] == []
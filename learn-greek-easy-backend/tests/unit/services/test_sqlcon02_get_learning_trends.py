@@ -46,6 +46,7 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db.models import CardRecord, CardRecordStatistics, CardStatus, CardType
 from src.repositories.card_record_review import CardRecordReviewRepository
 from src.repositories.card_record_statistics import CardRecordStatisticsRepository
@@ -70,6 +71,12 @@ _RANGE_END = date(2024, 3, 16)
 _TODAY_FIXED = date(2024, 3, 16)
 
 
+@pytest.fixture(autouse=True)
+def query_learning_trends(monkeypatch):
+    """These golden tests cover the grouped range queries, not the user_daily_trends series."""
+    monkeypatch.setattr(settings, "daily_trends_series", False)
+
+
 # =============================================================================
 # Merge A — repository level
 # =============================================================================
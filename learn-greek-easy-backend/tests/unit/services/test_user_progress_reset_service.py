@@ -49,6 +49,9 @@ class TestResetAllProgress:
         service.culture_stats_repo.delete_all_by_user_id = AsyncMock(return_value=3)
         service.mock_exam_repo.delete_all_by_user_id = AsyncMock(return_value=(2, 8))
         service.notification_repo.delete_all_by_user = AsyncMock(return_value=5)
+        service.deck_progress_repo.delete_all_by_user_id = AsyncMock(return_value=2)
+        service.due_histogram_repo.invalidate = AsyncMock()
+        service.daily_trends_repo.delete_all_by_user_id = AsyncMock(return_value=4)
 
         # Mock direct SQLAlchemy deletes (XP transactions and achievements)
         mock_result = MagicMock()
@@ -71,6 +74,11 @@ class TestResetAllProgress:
         service.mock_exam_repo.delete_all_by_user_id.assert_awaited_once_with(user_id)
         service.notification_repo.delete_all_by_user.assert_awaited_once_with(user_id)
 
+        # Derived per-user counters are cleared with the rows they summarize
+        service.deck_progress_repo.delete_all_by_user_id.assert_awaited_once_with(user_id)
+        service.due_histogram_repo.invalidate.assert_awaited_once_with(user_ids=[user_id])
+        service.daily_trends_repo.delete_all_by_user_id.assert_awaited_once_with(user_id)
+
         # Verify direct SQLAlchemy executes were called (for XP, achievements, and XP reset)
         assert mock_db_session.execute.await_count >= 2  # At least XP transactions + achievements
 
@@ -88,6 +96,9 @@ class TestResetAllProgress:
         service.culture_stats_repo.delete_all_by_user_id = AsyncMock(return_value=3)
         service.mock_exam_repo.delete_all_by_user_id = AsyncMock(return_value=(2, 8))
         service.notification_repo.delete_all_by_user = AsyncMock(return_value=5)
+        service.deck_progress_repo.delete_all_by_user_id = AsyncMock(return_value=2)
+        service.due_histogram_repo.invalidate = AsyncMock()
+        service.daily_trends_repo.delete_all_by_user_id = AsyncMock(return_value=4)
 
         # Mock XP transactions and achievements deletions
         xp_result = MagicMock()
@@ -222,6 +233,9 @@ class TestResetAllProgress:
         service.culture_stats_repo.delete_all_by_user_id = AsyncMock(return_value=4)
         service.mock_exam_repo.delete_all_by_user_id = AsyncMock(return_value=(3, 12))
         service.notification_repo.delete_all_by_user = AsyncMock(return_value=6)
+        service.deck_progress_repo.delete_all_by_user_id = AsyncMock(return_value=2)
+        service.due_histogram_repo.invalidate = AsyncMock()
+        service.daily_trends_repo.delete_all_by_user_id = AsyncMock(return_value=4)
 
         xp_result = MagicMock()
         xp_result.rowcount = 7
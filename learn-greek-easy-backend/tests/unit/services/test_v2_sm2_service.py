@@ -575,6 +575,7 @@ def _make_mock_stats(status: CardStatus = CardStatus.NEW) -> MagicMock:
     stats.interval = 1
     stats.repetitions = 0
     stats.created_at = None
+    stats.updated_at = None
     return stats
 
 
@@ -607,6 +608,7 @@ class TestV2SM2ServiceComputeReview:
         "time_taken",
         "stats_id",
         "stats_created_at_iso",
+        "stats_updated_at_iso",
         "new_ef",
         "new_interval",
         "new_repetitions",
@@ -17,6 +17,7 @@ def _make_mock_stats(status: CardStatus = CardStatus.NEW) -> MagicMock:
     stats.interval = 0
     stats.repetitions = 0
     stats.created_at = None
+    stats.updated_at = None
     return stats
 
 
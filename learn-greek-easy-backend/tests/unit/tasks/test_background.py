@@ -72,6 +72,10 @@ class TestModuleImports:
             "log_analytics_task",
             "persist_culture_answer_task",
             "process_answer_side_effects_task",
+            # Durable job queue
+            "dispatch_task",
+            "enqueue_job",
+            "get_job_store",
             # Scheduler (dedicated service)
             "get_scheduler",
             "setup_scheduler",
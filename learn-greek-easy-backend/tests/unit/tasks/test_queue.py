@@ -0,0 +1,247 @@
+"""Unit tests for the durable job queue (src/tasks/queue.py)."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.tasks.background import invalidate_cache_task
+from src.tasks.queue import (
+    DEAD,
+    PENDING,
+    InMemoryJobStore,
+    JobWorker,
+    PostgresJobStore,
+    decode_payload,
+    dispatch_task,
+    encode_payload,
+    running_as_job,
+)
+
+
+def _store_with_worker() -> tuple[InMemoryJobStore, JobWorker]:
+    store = InMemoryJobStore()
+    return store, JobWorker(store, batch_size=10, poll_seconds=0.01)
+
+
+@pytest.mark.unit
+class TestPayloadEncoding:
+    def test_round_trips_uuid_and_dates(self):
+        payload = {
+            "user_id": uuid4(),
+            "when": datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc),
+            "day": date(2026, 10, 18),
+            "ids": [uuid4(), uuid4()],
+            "plain": {"quality": 4, "status": "learning"},
+        }
+        assert decode_payload(encode_payload(payload)) == payload
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInMemoryStore:
+    async def test_pending_jobs_coalesce_by_key(self):
+        store = InMemoryJobStore()
+
+        results = [
+            await store.enqueue("check_achievements_task", {"user_id": 1}, coalesce_key="u1")
+            for _ in range(20)
+        ]
+
+        assert results.count(True) == 1
+        assert (await store.depth())[PENDING] == 1
+
+    async def test_running_job_does_not_block_a_new_one(self):
+        store = InMemoryJobStore()
+        await store.enqueue("check_achievements_task", {}, coalesce_key="u1")
+        await store.claim(10)
+
+        assert await store.enqueue("check_achievements_task", {}, coalesce_key="u1")
+
+    async def test_delayed_job_is_not_claimed_early(self):
+        store = InMemoryJobStore()
+        await store.enqueue("check_achievements_task", {}, delay_seconds=60)
+
+        assert await store.claim(10) == []
+
+    async def test_stale_running_jobs_are_requeued(self):
+        store = InMemoryJobStore()
+        await store.enqueue("invalidate_cache_task", {})
+        await store.claim(10)
+
+        assert await store.requeue_stale(0) == 1
+        assert len(await store.claim(10)) == 1
+
+    async def test_stale_jobs_sharing_a_key_requeue_once(self):
+        store = InMemoryJobStore()
+        await store.enqueue("check_achievements_task", {}, coalesce_key="u1")
+        await store.claim(10)
+        await store.enqueue("check_achievements_task", {}, coalesce_key="u1")
+        await store.claim(10)
+
+        assert await store.requeue_stale(0) == 2
+        assert len(await store.claim(10)) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestJobWorker:
+    async def test_success_removes_job_and_runs_as_job(self):
+        seen = {}
+
+        async def task(user_id):
+            seen["user_id"] = user_id
+            seen["as_job"] = running_as_job()
+
+        store, worker = _store_with_worker()
+        user_id = uuid4()
+        await store.enqueue("t", {"user_id": user_id})
+
+        with patch("src.tasks.queue.job_tasks", return_value={"t": task}):
+            assert await worker.run_once() == 1
+
+        assert seen == {"user_id": user_id, "as_job": True}
+        assert store.entries == {}
+        assert worker.counters["processed"] == 1
+        assert not running_as_job()
+
+    async def test_failures_retry_then_dead_letter(self):
+        task = AsyncMock(side_effect=RuntimeError("db down"))
+        store, worker = _store_with_worker()
+
+        with (
+            patch("src.tasks.queue.job_tasks", return_value={"t": task}),
+            patch("src.tasks.queue.settings") as mock_settings,
+        ):
+            mock_settings.job_queue_max_attempts = 3
+            mock_settings.job_queue_retry_base_seconds = 0
+            await store.enqueue("t", {})
+            for _ in range(5):
+                await worker.run_once()
+
+        assert task.await_count == 3
+        (entry,) = store.entries.values()
+        assert entry.status == DEAD
+        assert "db down" in entry.last_error
+        assert worker.counters == {"processed": 0, "retried": 2, "dead": 1}
+
+    async def test_unknown_task_is_failed_not_crashed(self):
+        store, worker = _store_with_worker()
+        await store.enqueue("gone", {})
+
+        with patch("src.tasks.queue.job_tasks", return_value={}):
+            await worker.run_once()
+
+        assert worker.counters["retried"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDispatch:
+    async def test_disabled_queue_uses_background_tasks(self):
+        background_tasks = MagicMock()
+        task = AsyncMock()
+
+        with patch("src.tasks.queue.settings") as mock_settings:
+            mock_settings.job_queue_enabled = False
+            await dispatch_task(background_tasks, task, cache_type="deck", entity_id=None)
+
+        background_tasks.add_task.assert_called_once_with(task, cache_type="deck", entity_id=None)
+
+    async def test_enabled_queue_enqueues_in_callers_session(self):
+        background_tasks = MagicMock()
+        session = MagicMock()
+
+        with (
+            patch("src.tasks.queue.settings") as mock_settings,
+            patch("src.tasks.queue.enqueue_job", AsyncMock()) as mock_enqueue,
+        ):
+            mock_settings.job_queue_enabled = True
+            await dispatch_task(
+                background_tasks, invalidate_cache_task, session=session, cache_type="deck"
+            )
+
+        background_tasks.add_task.assert_not_called()
+        mock_enqueue.assert_awaited_once_with(
+            "invalidate_cache_task",
+            {"cache_type": "deck"},
+            coalesce_key=None,
+            delay_seconds=0,
+            session=session,
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAchievementCoalescing:
+    async def test_worker_debounces_achievement_checks(self):
+        from src.tasks import background
+
+        store = InMemoryJobStore()
+        user_id = uuid4()
+
+        with (
+            patch("src.tasks.queue.get_job_store", return_value=store),
+            patch("src.tasks.queue.job_tasks", return_value={"check_achievements_task": None}),
+            patch.object(background, "running_as_job", return_value=True),
+            patch.object(background, "check_achievements_task", AsyncMock()) as direct,
+        ):
+            for _ in range(20):
+                await background._check_achievements_for_review(user_id)
+
+        direct.assert_not_awaited()
+        (entry,) = store.entries.values()
+        assert entry.job.task == "check_achievements_task"
+        assert entry.job.coalesce_key == f"check_achievements:{user_id}"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPostgresStatements:
+    async def test_claim_uses_skip_locked(self):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+        factory = MagicMock()
+        factory.begin.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        await PostgresJobStore(factory).claim(5)
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+
+    async def test_enqueue_conflicts_only_on_pending_key(self):
+        session = MagicMock()
+        session.execute = AsyncMock(
+            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+        )
+
+        inserted = await PostgresJobStore().enqueue(
+            "check_achievements_task", {}, coalesce_key="k", session=session
+        )
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (coalesce_key) WHERE status = 'pending'" in sql
+        assert "DO NOTHING" in sql
+        assert inserted is False
+
+    async def test_requeue_stale_keeps_one_job_per_key(self):
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+        factory = MagicMock()
+        factory.begin.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        assert await PostgresJobStore(factory).requeue_stale(60) == 3
+
+        superseded, duplicates, requeue = (
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.await_args_list
+        )
+        assert superseded.startswith("DELETE") and "EXISTS" in superseded
+        assert "DISTINCT ON (background_jobs.coalesce_key)" in duplicates
+        assert "NOT IN" in duplicates
+        assert requeue.startswith("UPDATE background_jobs SET status")
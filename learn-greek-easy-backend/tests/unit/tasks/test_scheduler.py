@@ -96,9 +96,10 @@ class TestSchedulerSetup:
 
             setup_scheduler()
 
-            # Should have 6 add_job calls (4 original + gamification reconcile + heartbeat)
+            # Should have 9 add_job calls (4 original + gamification reconcile + heartbeat
+            # + partition maintenance + notification counter repair + due histogram repair)
             # OPS-01-02: heartbeat_task added on IntervalTrigger(minutes=5) → 5 → 6.
-            assert mock_scheduler_instance.add_job.call_count == 6
+            assert mock_scheduler_instance.add_job.call_count == 9
 
             # Verify all job IDs are registered
             job_ids = [call[1]["id"] for call in mock_scheduler_instance.add_job.call_args_list]
@@ -107,6 +108,9 @@ class TestSchedulerSetup:
             assert "stats_aggregate" in job_ids
             assert "trial_expiration" in job_ids
             assert "gamification_reconcile_active_users" in job_ids
+            assert "partition_maintenance" in job_ids
+            assert "notification_counter_repair" in job_ids
+            assert "due_histogram_repair" in job_ids
 
             # Verify the new gamification job uses CronTrigger(hour=3, minute=0)
             from apscheduler.triggers.cron import CronTrigger
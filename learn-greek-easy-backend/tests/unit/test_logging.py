@@ -2,6 +2,7 @@
 
 Tests cover:
 - setup_logging() configuration for production/development
+- setup_logging() routing production logs through the async pipeline
 - get_logger() name binding
 - InterceptHandler stdlib routing
 - intercept_standard_logging() handler installation
@@ -165,6 +166,36 @@ class TestSetupLogging:
             # Restore original handlers
             root_logger.handlers = original_handlers
 
+    def test_setup_logging_production_uses_async_pipeline(self, monkeypatch):
+        """In production the JSON sink is the log pipeline, not a stdout handler."""
+        from unittest.mock import MagicMock
+
+        from src.core import log_pipeline
+        from src.core.logging import setup_logging
+
+        stream = StringIO()
+        monkeypatch.setattr(sys, "stdout", stream)
+        monkeypatch.setattr(
+            "src.core.logging.settings",
+            MagicMock(is_production=True, log_async_pipeline=True, log_level="INFO"),
+        )
+        monkeypatch.setattr(log_pipeline, "_pipeline", None)
+
+        try:
+            setup_logging()
+            logger.info("Through the pipeline")
+            log_pipeline.shutdown_log_pipeline()
+
+            messages = [
+                json.loads(line)["record"]["message"] for line in stream.getvalue().splitlines()
+            ]
+            assert "Through the pipeline" in messages
+            assert log_pipeline.get_log_pipeline_stats().written == len(messages)
+        finally:
+            log_pipeline.shutdown_log_pipeline()
+            logger.remove()
+            logger.add(sys.stderr)
+
 
 class TestGetLogger:
     """Tests for get_logger() function."""
@@ -35,6 +35,7 @@ class TestStartupSeeding:
             mock_settings.seed_on_deploy = True
             mock_settings.can_seed_database.return_value = True
             mock_settings.app_version = "0.1.0"
+            mock_settings.web_concurrency = 1
             mock_settings.validate_cors_for_production.return_value = []
 
             with patch("src.main.init_db", new_callable=AsyncMock):
@@ -67,6 +68,7 @@ class TestStartupSeeding:
             mock_settings.seed_on_deploy = False
             mock_settings.can_seed_database.return_value = True
             mock_settings.app_version = "0.1.0"
+            mock_settings.web_concurrency = 1
             mock_settings.validate_cors_for_production.return_value = []
 
             with patch("src.main.init_db", new_callable=AsyncMock):
@@ -95,6 +97,7 @@ class TestStartupSeeding:
             mock_settings.seed_on_deploy = True
             mock_settings.can_seed_database.return_value = False
             mock_settings.app_version = "0.1.0"
+            mock_settings.web_concurrency = 1
             mock_settings.validate_cors_for_production.return_value = []
 
             with patch("src.main.init_db", new_callable=AsyncMock):
@@ -131,6 +134,7 @@ class TestStartupSeeding:
             mock_settings.seed_on_deploy = True
             mock_settings.can_seed_database.return_value = True
             mock_settings.app_version = "0.1.0"
+            mock_settings.web_concurrency = 1
             mock_settings.validate_cors_for_production.return_value = []
 
             with patch("src.main.init_db", new_callable=AsyncMock):
@@ -174,6 +178,7 @@ class TestStartupSeeding:
             mock_settings.seed_on_deploy = True
             mock_settings.can_seed_database.return_value = True
             mock_settings.app_version = "0.1.0"
+            mock_settings.web_concurrency = 1
             mock_settings.validate_cors_for_production.return_value = []
 
             with patch("src.main.init_db", new_callable=AsyncMock):